@@ -7,7 +7,10 @@ from django.shortcuts import redirect
 from django.urls import reverse
 from django.contrib.auth import logout
 
+from deltacrown.metrics import middleware_timer
+
 from .models import AccountDeletionRequest
+from .request_principal import get_principal
 
 
 class BlockScheduledDeletionMiddleware:
@@ -20,14 +23,19 @@ class BlockScheduledDeletionMiddleware:
       - Return 403 for API requests
       - Redirect to login for web requests with message
     - Allow access to cancellation endpoint
+
+    The cached request principal answers "is deletion scheduled?", so only
+    users who have scheduled deletion hit the database here.
     """
     
     def __init__(self, get_response):
         self.get_response = get_response
     
     def __call__(self, request):
-        # Skip if user is not authenticated
-        if not request.user.is_authenticated:
+        # Skip if user is not authenticated or has no deletion scheduled
+        with middleware_timer('deletion_block'):
+            blocked = request.user.is_authenticated and get_principal(request).deletion_scheduled
+        if not blocked:
             return self.get_response(request)
         
         # Check for scheduled deletion
@@ -0,0 +1,140 @@
+"""
+Request principal — per-user snapshot of what middleware needs per request.
+
+UserPlatformPrefsMiddleware and BlockScheduledDeletionMiddleware each read
+the database before any view runs: the user's profile for platform
+preferences, and the AccountDeletionRequest row for the deletion block.
+Every API call paid for both, including 15-second hub polls.
+
+RequestPrincipalMiddleware now loads one snapshot per request:
+
+- platform preferences (language, timezone, time format, currency)
+- whether account deletion is scheduled
+- staff / superuser flags (read from request.user, already loaded by
+  AuthenticationMiddleware, never cached)
+
+The snapshot is cached per user under the ``principal:{user_id}`` cache
+tag; a hit is one cache round trip (see ``cache_tags.get_stamped``). Saves
+and deletes of UserProfile and AccountDeletionRequest bump the tag, so the
+next request rebuilds it. Anonymous requests use defaults without
+touching the cache.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.common import cache_tags
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = 'principal:snapshot:{user_id}'
+
+
+@dataclass(frozen=True)
+class RequestPrincipal:
+    """Who is making the request, as far as global middleware cares."""
+
+    user_id: Optional[int]
+    prefs: Dict[str, str] = field(default_factory=dict)
+    deletion_scheduled: bool = False
+    is_staff: bool = False
+    is_superuser: bool = False
+
+    @property
+    def is_authenticated(self) -> bool:
+        return self.user_id is not None
+
+    @property
+    def timezone(self) -> str:
+        return self.prefs['timezone']
+
+    @property
+    def language(self) -> str:
+        return self.prefs['preferred_language']
+
+
+def _ttl() -> int:
+    return int(getattr(settings, 'REQUEST_PRINCIPAL_TTL_SECONDS', 600))
+
+
+def _build_snapshot(user) -> Dict[str, Any]:
+    from apps.accounts.models import AccountDeletionRequest
+    from apps.user_profile.models import UserProfile
+    from apps.user_profile.services.platform_prefs_service import get_user_platform_prefs
+
+    profile = (
+        UserProfile.objects.filter(user_id=user.pk)
+        .only('id', 'user_id', 'preferred_language', 'timezone_pref', 'time_format', 'system_settings')
+        .first()
+    )
+    return {
+        'prefs': get_user_platform_prefs(profile),
+        'deletion_scheduled': AccountDeletionRequest.objects.filter(
+            user_id=user.pk,
+            status=AccountDeletionRequest.Status.SCHEDULED,
+        ).exists(),
+    }
+
+
+def load_principal(user) -> RequestPrincipal:
+    """Return the principal for ``user`` (a cache hit unless something changed)."""
+    from apps.user_profile.services.platform_prefs_service import DEFAULT_PREFS
+    from deltacrown.metrics import request_principal_cache_total
+
+    if user is None or not user.is_authenticated:
+        request_principal_cache_total.labels(result='anonymous').inc()
+        return RequestPrincipal(user_id=None, prefs=DEFAULT_PREFS.copy())
+
+    key = CACHE_KEY.format(user_id=user.pk)
+    tags = [cache_tags.principal_tag(user.pk)]
+    snapshot, versions = cache_tags.get_stamped(key, tags)
+    if snapshot is None:
+        request_principal_cache_total.labels(result='miss').inc()
+        snapshot = _build_snapshot(user)
+        cache_tags.set_stamped(key, snapshot, _ttl(), versions)
+    else:
+        request_principal_cache_total.labels(result='hit').inc()
+
+    return RequestPrincipal(
+        user_id=user.pk,
+        prefs=dict(snapshot['prefs']),
+        deletion_scheduled=snapshot['deletion_scheduled'],
+        is_staff=bool(user.is_staff),
+        is_superuser=bool(user.is_superuser),
+    )
+
+
+def get_principal(request) -> RequestPrincipal:
+    """The request's principal, loading it if no middleware did."""
+    principal = getattr(request, 'principal', None)
+    if principal is None:
+        principal = load_principal(getattr(request, 'user', None))
+        request.principal = principal
+    return principal
+
+
+def invalidate_principal(user_id: Optional[int]) -> None:
+    """
+    Drop the user's cached snapshot.
+
+    Bumped now, so later reads in the same transaction (and tests) see the
+    change, and again after commit, so a snapshot rebuilt concurrently from
+    pre-commit rows is never served.
+    """
+    if not user_id:
+        return
+
+    def _bump():
+        try:
+            cache_tags.invalidate(cache_tags.principal_tag(user_id))
+        except Exception as exc:  # noqa: BLE001 — invalidation must never raise
+            logger.warning("principal_invalidate_failed user=%s err=%s", user_id, exc)
+
+    _bump()
+    transaction.on_commit(_bump)
@@ -6,6 +6,8 @@ from django.dispatch import receiver
 
 from django.contrib.auth import get_user_model
 
+from .models import AccountDeletionRequest
+from .request_principal import invalidate_principal
 from .roles import STAFF_GROUP_NAMES
 
 User = get_user_model()
@@ -83,3 +85,10 @@ def delete_auth_shadow(sender, instance: User, **_):
         return
     with connection.cursor() as cursor:
         cursor.execute("DELETE FROM auth_user WHERE id = %s", [instance.id])
+
+
+@receiver(post_save, sender=AccountDeletionRequest)
+@receiver(post_delete, sender=AccountDeletionRequest)
+def invalidate_principal_on_deletion_change(sender, instance: AccountDeletionRequest, **_):
+    """BlockScheduledDeletionMiddleware reads deletion status from the cached principal."""
+    invalidate_principal(instance.user_id)
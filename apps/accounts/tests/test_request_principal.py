@@ -0,0 +1,76 @@
+"""
+Request principal: cached per-user prefs / deletion snapshot read by the
+global middleware.
+"""
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.urls import reverse
+
+from apps.accounts.deletion_services import REQUIRED_CONFIRMATION_PHRASE, schedule_account_deletion
+from apps.accounts.request_principal import load_principal
+from apps.user_profile.models import UserProfile
+from apps.user_profile.services.platform_prefs_service import DEFAULT_PREFS, set_user_platform_prefs
+
+User = get_user_model()
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create_user(username='principal-user', email='principal@example.com', password='pass123')
+
+
+def test_cached_principal_needs_no_queries(user, django_assert_num_queries):
+    profile, _ = UserProfile.objects.get_or_create(user=user, defaults={'display_name': 'Principal'})
+    profile.timezone_pref = 'UTC'
+    profile.save()
+    first = load_principal(user)
+
+    with django_assert_num_queries(0):
+        second = load_principal(user)
+
+    assert second == first
+    assert second.timezone == 'UTC'
+    assert not second.deletion_scheduled
+
+
+def test_profile_save_invalidates_prefs(user):
+    profile, _ = UserProfile.objects.get_or_create(user=user, defaults={'display_name': 'Principal'})
+    load_principal(user)
+
+    set_user_platform_prefs(profile, {'timezone': 'Europe/London', 'time_format': '24h'})
+
+    principal = load_principal(user)
+    assert (principal.timezone, principal.prefs['time_format']) == ('Europe/London', '24h')
+
+
+def test_scheduling_deletion_blocks_next_request(client, user):
+    client.force_login(user)
+    client.get(reverse('accounts:deletion_status'))  # caches the principal
+    assert not load_principal(user).deletion_scheduled
+
+    schedule_account_deletion(user=user, password='pass123', confirmation_phrase=REQUIRED_CONFIRMATION_PHRASE)
+    client.force_login(user)
+    response = client.get('/api/notifications/', HTTP_ACCEPT='application/json')
+
+    assert response.status_code == 403
+    assert json.loads(response.content)['error'] == 'Account scheduled for deletion'
+
+
+def test_anonymous_principal_uses_defaults_without_cache():
+    principal = load_principal(AnonymousUser())
+
+    assert not principal.is_authenticated
+    assert principal.prefs == DEFAULT_PREFS
+    assert cache.get('principal:snapshot:None') is None
@@ -0,0 +1,213 @@
+"""
+Tag-based cache invalidation.
+
+Cached values are stored under a key that embeds the current generation of
+every tag they depend on::
+
+    key = cache_tags.tagged_key('hub:featured', [HUB_TAG, game_tag(3)])
+    # -> 'hub:featured@1718035200123.1718035200456'
+
+Invalidating a tag bumps its generation with a single ``incr``, so every
+key derived from it stops being read and simply ages out via its TTL. This
+replaces ``delete_pattern('team:*')`` keyspace scans with O(1) work per tag
+and works on every cache backend (Redis, LocMem, DB).
+
+Hot per-request reads can use ``get_stamped`` / ``set_stamped`` instead:
+the value lives under a fixed key together with the generations it was
+built under, so a hit costs one ``get_many`` rather than two round trips.
+
+Generations are seeded from the wall clock in milliseconds rather than 1,
+so a generation key lost to eviction never rewinds to a value that older
+cached entries were written under.
+
+All helpers are best-effort: cache failures are logged and never raised.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+_VERSION_KEY = 'cachetag:v:{tag}'
+
+HUB_TAG = 'hub'
+
+
+def team_tag(team_id: Any) -> str:
+    return f'team:{team_id}'
+
+
+def org_tag(org_slug: Any) -> str:
+    """Organizations are addressed by slug throughout the hub/detail views."""
+    return f'org:{org_slug}'
+
+
+def game_tag(game_id: Any) -> str:
+    return f'game:{game_id}'
+
+
+def user_tag(user_id: Any) -> str:
+    return f'user:{user_id}'
+
+
+def profile_tag(username: str) -> str:
+    return f'profile:{username}'
+
+
+def principal_tag(user_id: Any) -> str:
+    """Per-request principal snapshot (apps.accounts.request_principal)."""
+    return f'principal:{user_id}'
+
+
+def _seed() -> int:
+    return int(time.time() * 1000)
+
+
+def tag_versions(tags: Sequence[str]) -> Dict[str, int]:
+    """Return the current generation of each tag, creating missing ones."""
+    keys = {tag: _VERSION_KEY.format(tag=tag) for tag in tags}
+    try:
+        found = cache.get_many(list(keys.values()))
+    except Exception:
+        logger.warning("cache_tags: get_many failed for %s", list(tags), exc_info=True)
+        found = {}
+
+    versions: Dict[str, int] = {}
+    for tag, key in keys.items():
+        value = found.get(key)
+        if value is None:
+            seed = _seed()
+            try:
+                # add() is atomic: if another worker created the key first,
+                # read its value back instead of overwriting it.
+                if not cache.add(key, seed, timeout=None):
+                    value = cache.get(key, seed)
+                else:
+                    value = seed
+            except Exception:
+                value = seed
+        try:
+            versions[tag] = int(value)
+        except (TypeError, ValueError):
+            versions[tag] = _seed()
+    return versions
+
+
+def tagged_key(base_key: str, tags: Sequence[str]) -> str:
+    """Build ``base_key`` suffixed with the generations of ``tags``."""
+    if not tags:
+        return base_key
+    versions = tag_versions(tags)
+    return f"{base_key}@{'.'.join(str(versions[tag]) for tag in tags)}"
+
+
+def get(base_key: str, tags: Sequence[str], default: Any = None) -> Any:
+    try:
+        return cache.get(tagged_key(base_key, tags), default)
+    except Exception:
+        logger.warning("cache_tags: get failed for %s", base_key, exc_info=True)
+        return default
+
+
+def set(base_key: str, value: Any, timeout: Optional[int], tags: Sequence[str]) -> None:  # noqa: A001
+    try:
+        cache.set(tagged_key(base_key, tags), value, timeout)
+    except Exception:
+        logger.warning("cache_tags: set failed for %s", base_key, exc_info=True)
+
+
+def get_or_set(base_key: str, tags: Sequence[str], producer: Callable[[], Any], timeout: Optional[int]) -> Any:
+    """Return the cached value or compute, store and return ``producer()``."""
+    key = None
+    try:
+        key = tagged_key(base_key, tags)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    except Exception:
+        logger.warning("cache_tags: get failed for %s", base_key, exc_info=True)
+    value = producer()
+    if key is not None and value is not None:
+        try:
+            cache.set(key, value, timeout)
+        except Exception:
+            logger.warning("cache_tags: set failed for %s", base_key, exc_info=True)
+    return value
+
+
+def get_stamped(key: str, tags: Sequence[str]) -> Tuple[Any, Dict[str, int]]:
+    """
+    Read a value stored by ``set_stamped`` in one round trip.
+
+    Returns ``(value, versions)``; value is None when missing or built under
+    an older generation of any tag. Pass ``versions`` back to
+    ``set_stamped`` so a value computed across an invalidation is stored
+    already stale.
+    """
+    version_keys = {tag: _VERSION_KEY.format(tag=tag) for tag in tags}
+    try:
+        found = cache.get_many([key, *version_keys.values()])
+    except Exception:
+        logger.warning("cache_tags: get_many failed for %s", key, exc_info=True)
+        return None, {tag: _seed() for tag in tags}
+
+    missing = [tag for tag, version_key in version_keys.items() if found.get(version_key) is None]
+    versions = tag_versions(missing) if missing else {}
+    for tag, version_key in version_keys.items():
+        if tag not in versions:
+            try:
+                versions[tag] = int(found[version_key])
+            except (TypeError, ValueError):
+                versions[tag] = _seed()
+
+    entry = found.get(key)
+    if missing or not isinstance(entry, tuple) or len(entry) != 2 or entry[0] != versions:
+        return None, versions
+    return entry[1], versions
+
+
+def set_stamped(key: str, value: Any, timeout: Optional[int], versions: Dict[str, int]) -> None:
+    try:
+        cache.set(key, (versions, value), timeout)
+    except Exception:
+        logger.warning("cache_tags: set failed for %s", key, exc_info=True)
+
+
+def invalidate(*tags: str) -> Dict[str, int]:
+    """
+    Bump the generation of every tag. O(1) per tag, never raises.
+
+    Returns:
+        dict mapping tag -> new generation (best effort)
+    """
+    bumped: Dict[str, int] = {}
+    for tag in _unique(tags):
+        key = _VERSION_KEY.format(tag=tag)
+        try:
+            bumped[tag] = int(cache.incr(key))
+        except ValueError:
+            # Key missing: seed past any generation previously handed out.
+            seed = _seed()
+            try:
+                cache.set(key, seed, timeout=None)
+            except Exception:
+                logger.warning("cache_tags: seed failed for %s", tag, exc_info=True)
+            bumped[tag] = seed
+        except Exception:
+            logger.warning("cache_tags: invalidate failed for %s", tag, exc_info=True)
+    if bumped:
+        logger.debug("cache_tags: invalidated %s", list(bumped))
+    return bumped
+
+
+def _unique(tags: Iterable[str]) -> List[str]:
+    seen = []
+    for tag in tags:
+        if tag and tag not in seen:
+            seen.append(tag)
+    return seen
@@ -0,0 +1,71 @@
+"""
+Per-transaction batch buffers released on commit.
+
+Several write paths defer side effects until the surrounding transaction
+commits and then handle everything queued inside it as one batch: stats for
+the completed matches, realtime broadcasts, outbox relay wake-ups, mobile
+pushes.
+``OnCommitBuffer`` is that buffer::
+
+    _buffer = OnCommitBuffer(apply_completed_matches)
+
+    def queue_completed_match(event):
+        if not _buffer.add(event):          # no transaction open
+            apply_completed_matches([event])
+
+The first ``add`` inside a transaction registers one ``on_commit`` hook;
+later adds only append. On commit the hook takes the thread's items and
+passes them to ``release`` as a list. A rollback discards the hook together
+with its items, so the next ``add`` starts a fresh buffer. (A rolled-back
+*savepoint* inside a surviving outer transaction does not un-buffer items
+added within it.)
+
+Buffers are thread-local, matching Django's per-thread connections.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Iterable, List
+
+from django.db import transaction
+
+
+class OnCommitBuffer:
+    """Thread-local list of items released as one batch when the transaction commits."""
+
+    def __init__(self, release: Callable[[List[Any]], None]):
+        self._release = release
+        self._local = threading.local()
+        # One bound method, so the registered hook can be found by identity
+        self._hook = self._on_commit
+
+    def add(self, item: Any) -> bool:
+        """Buffer ``item``; returns False (and buffers nothing) outside a transaction."""
+        return self.extend([item])
+
+    def extend(self, items: Iterable[Any]) -> bool:
+        """Buffer ``items``; returns False (and buffers nothing) outside a transaction."""
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            return False
+        if not self.is_open():
+            self._local.items = []
+            transaction.on_commit(self._hook)
+        self._local.items.extend(items)
+        return True
+
+    def is_open(self) -> bool:
+        """Whether this thread's transaction already has a live buffer and hook."""
+        if getattr(self._local, "items", None) is None:
+            return False
+        connection = transaction.get_connection()
+        return any(entry[1] is self._hook for entry in connection.run_on_commit)
+
+    def __len__(self) -> int:
+        return len(getattr(self._local, "items", None) or [])
+
+    def _on_commit(self) -> None:
+        items = list(self._local.items or [])
+        self._local.items = None
+        self._release(items)
@@ -6,6 +6,7 @@ Event bus infrastructure for event-driven communication across apps.
 
 from .event_bus import Event, EventBus, event_handler, get_event_bus
 from .models import EventLog
+from .outbox import batched_outbox, flush_outbox
 
 __all__ = [
     "Event",
@@ -13,4 +14,6 @@ __all__ = [
     "event_handler",
     "get_event_bus",
     "EventLog",
+    "batched_outbox",
+    "flush_outbox",
 ]
@@ -21,6 +21,12 @@ Async Event Processing:
 - If Celery enqueue fails, events fall back to synchronous dispatch (no events lost).
 - When disabled (default), events dispatch synchronously in-process.
 
+Transactional Outbox:
+- Set `EVENTS_OUTBOX_ENABLED = True` to write events published inside
+  `transaction.atomic()` to EventLog within that transaction (bulk-inserted
+  under `batched_outbox()`) and dispatch them only after commit (see
+  apps.common.events.outbox).
+
 Reference: ROADMAP_AND_EPICS_PART_4.md - Phase 1, Epic 1.2
 """
 
@@ -154,6 +160,10 @@ class EventBus:
         If Celery enqueue fails when async mode is enabled, automatically falls
         back to synchronous dispatch to ensure no events are lost.
 
+        With `settings.EVENTS_OUTBOX_ENABLED` and an open transaction, the event
+        is written to the outbox in that transaction instead and dispatched
+        after commit by the outbox relay.
+
         TODO (Phase 8 - Advanced Event Infrastructure):
         - Implement dead letter queue for permanently failed events
         - Add event replay from EventLog
@@ -171,10 +181,16 @@ class EventBus:
             )
             bus.publish(event)
         """
+        # Outbox mode: write inside the open transaction, dispatch after commit
+        from apps.common.events import outbox
+        if outbox.enqueue(event):
+            return
+
         # Persist event to EventLog for audit trail and replay capability
         # Phase 8, Epic 8.1: Set status=PENDING for new events
         event_log_id = None
         try:
+            from django.utils import timezone
             from apps.common.events.models import EventLog
 
             event_log = EventLog.objects.create(
@@ -186,6 +202,8 @@ class EventBus:
                 metadata=event.metadata,
                 status=EventLog.STATUS_PENDING,  # Epic 8.1: Track processing status
                 retry_count=0,
+                aggregate_id=outbox.aggregate_id_for(event),
+                relayed_at=timezone.now(),  # dispatched right below, never via the outbox
             )
             event_log_id = event_log.id
             
@@ -12,6 +12,7 @@ Implementation Status:
   - ✅ Indexes for DLQ queries and event replay
   - ✅ Dead Letter Queue (DLQ) management
   - ✅ Event replay functionality
+- ✅ Transactional outbox: relayed_at / aggregate_id drive the outbox relay
 - ⏳ Cleanup/archival policies for old events (future)
 - ⏳ Partitioning strategy for high-volume events (future)
 
@@ -58,6 +59,9 @@ class EventLog(models.Model):
         retry_count: Number of processing attempts (0 on creation)
         last_error: Error message from most recent failed processing attempt
         last_error_at: Timestamp of most recent error
+        aggregate_id: Ordering key for the outbox relay (e.g. "tournament:12")
+        relayed_at: When the row's dispatch finished; NULL = still in the outbox
+        claimed_at: Relay lease; a row claimed longer ago than the lease is reclaimed
 
     Reference: CLEANUP_AND_TESTING_PART_6.md - §3.1 (Event-Driven Workflows)
     """
@@ -115,6 +119,24 @@ class EventLog(models.Model):
         null=True, blank=True, help_text="Timestamp of most recent error"
     )
 
+    # Transactional outbox (apps.common.events.outbox)
+    aggregate_id = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        help_text="Events sharing an aggregate id are relayed in publish order",
+    )
+    relayed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the event was dispatched (NULL = pending in outbox)",
+    )
+    claimed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When a relay run claimed the row; reclaimable once the lease expires",
+    )
+
     class Meta:
         app_label = "common"  # Explicit app_label since 'common' is not in INSTALLED_APPS
         ordering = ["-created_at"]
@@ -126,6 +148,11 @@ class EventLog(models.Model):
             models.Index(fields=["user_id", "-occurred_at"], name="evt_user_occurred"),
             models.Index(fields=["status", "-created_at"], name="evt_status_created"),
             models.Index(fields=["-occurred_at"], name="evt_occurred_desc"),
+            models.Index(
+                fields=["id"],
+                name="evt_outbox_pending",
+                condition=models.Q(relayed_at__isnull=True),
+            ),
         ]
 
     def __str__(self) -> str:
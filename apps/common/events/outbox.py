@@ -0,0 +1,344 @@
+"""
+Transactional outbox for the EventBus.
+
+When ``settings.EVENTS_OUTBOX_ENABLED`` is True, ``EventBus.publish`` called
+inside ``transaction.atomic()`` no longer dispatches each event on the spot.
+Instead:
+
+1. The event is written to EventLog with ``relayed_at = NULL`` inside the
+   publishing transaction, so it commits or rolls back together with the
+   business rows. A process that dies right after COMMIT leaves the rows
+   pending for the relay; nothing is held only in memory.
+2. Inside ``batched_outbox()`` (bracket generation, bulk result
+   finalization) events are collected instead and written with one
+   ``bulk_create`` when the block ends, still inside its transaction.
+3. After commit the relay is kicked once. It claims pending rows in id
+   order and dispatches them: inline when EVENTS_USE_CELERY is off, or as
+   one ``dispatch_event_batch_task`` per aggregate id when it is on.
+4. A claim only stamps ``claimed_at``. ``relayed_at`` is written by
+   ``dispatch_event_batch`` once the events have gone through the bus, so
+   a crash or broker error between claim and dispatch leaves the rows
+   pending; they are reclaimed when the lease
+   (EVENTS_OUTBOX_CLAIM_LEASE_SECONDS) runs out. Delivery is therefore
+   at-least-once.
+
+``on_commit`` is used only to wake the relay (apps.common.commit_buffer).
+A rollback discards the rows and the wake-up together, so handlers never
+observe uncommitted state and no task is enqueued for work that never
+happened. A nested ``batched_outbox()`` is a savepoint: if it raises, the
+events collected inside it are dropped with its rows. Rows left
+pending (crashed worker, broker outage, a kick that lost the relay lock
+race) are picked up by the periodic ``relay_event_outbox`` task.
+
+Ordering: events sharing an ``aggregate_id`` are dispatched in publish order.
+Within a batch they travel together; across batches, an aggregate with a
+claimed-but-undispatched row is skipped until that row is relayed, and the
+batch task kicks the relay again when it leaves later rows behind. The relay
+holds a cache lock so only one drains at a time. The aggregate id is ``event.metadata["aggregate_id"]`` when set,
+otherwise derived from the first id-like payload key
+(tournament_id, match_id, team_id, user_id).
+
+Publishing outside a transaction keeps the original immediate behaviour.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.common.commit_buffer import OnCommitBuffer
+
+logger = logging.getLogger("common.events.outbox")
+
+DEFAULT_RELAY_BATCH_SIZE = 500
+DEFAULT_CLAIM_LEASE_SECONDS = 300
+_RELAY_LOCK_KEY = "events:outbox:relay_lock"
+_RELAY_LOCK_TTL = 120
+
+AGGREGATE_KEYS = ("tournament_id", "match_id", "team_id", "user_id")
+
+
+def is_outbox_enabled() -> bool:
+    return getattr(settings, "EVENTS_OUTBOX_ENABLED", False) is True
+
+
+def aggregate_id_for(event) -> Optional[str]:
+    """Ordering key for ``event`` (see module docstring)."""
+    explicit = (event.metadata or {}).get("aggregate_id")
+    if explicit:
+        return str(explicit)[:64]
+    payload = event.payload or {}
+    for key in AGGREGATE_KEYS:
+        value = payload.get(key)
+        if value is not None:
+            return f"{key[:-3]}:{value}"[:64]
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Writing inside the transaction
+# ---------------------------------------------------------------------------
+
+_local = threading.local()
+
+
+def enqueue(event) -> bool:
+    """
+    Write ``event`` to the outbox of the open transaction.
+
+    Inside ``batched_outbox()`` the row is collected and written when the
+    block ends; otherwise it is INSERTed now. Returns False when the caller
+    should fall back to immediate publish (outbox disabled or not inside
+    ``transaction.atomic()``).
+    """
+    if not is_outbox_enabled():
+        return False
+    if not transaction.get_connection().in_atomic_block:
+        return False
+    batch = getattr(_local, "batch", None)
+    if batch is not None:
+        batch.append(event)
+    else:
+        _write_events([event])
+    _wake.add(event)
+    return True
+
+
+def pending_count() -> int:
+    """Events collected by the current ``batched_outbox()`` and not yet written."""
+    return len(getattr(_local, "batch", None) or [])
+
+
+def _write_events(events) -> int:
+    from apps.common.events.models import EventLog
+
+    rows = [
+        EventLog(
+            name=event.name,
+            payload=event.payload,
+            occurred_at=event.occurred_at,
+            user_id=event.user_id,
+            correlation_id=event.correlation_id,
+            metadata=event.metadata,
+            status=EventLog.STATUS_PENDING,
+            retry_count=0,
+            aggregate_id=aggregate_id_for(event),
+            relayed_at=None,
+        )
+        for event in events
+    ]
+    batch_size = getattr(settings, "EVENTS_OUTBOX_INSERT_BATCH_SIZE", 1000)
+    EventLog.objects.bulk_create(rows, batch_size=batch_size)
+    for event, row in zip(events, rows):
+        if row.id is not None:
+            event.metadata["event_log_id"] = row.id
+
+    logger.info(
+        f"Outbox flushed {len(rows)} events",
+        extra={"count": len(rows), "status": "outbox_flushed"},
+    )
+    return len(rows)
+
+
+def flush_outbox() -> int:
+    """
+    Write the events collected by the current ``batched_outbox()`` now
+    (one bulk INSERT). Returns the number of rows written; 0 outside a
+    batch, where every event is written as it is published.
+    """
+    batch = getattr(_local, "batch", None)
+    if not batch:
+        return 0
+    events = list(batch)
+    written = _write_events(events)
+    del batch[:len(events)]
+    return written
+
+
+@contextmanager
+def batched_outbox():
+    """
+    Collect the events published inside the block and write them with one
+    bulk INSERT when it ends, inside the block's own ``transaction.atomic()``.
+
+    Nested blocks are savepoints: an exception drops the events collected
+    inside them together with their rows, and only the outermost block
+    writes. Usable as a decorator.
+    """
+    batch = getattr(_local, "batch", None)
+    outermost = batch is None
+    if outermost:
+        batch = _local.batch = []
+    mark = len(batch)
+    try:
+        with transaction.atomic():
+            yield
+            if outermost:
+                flush_outbox()
+    except BaseException:
+        del batch[mark:]
+        raise
+    finally:
+        if outermost:
+            _local.batch = None
+
+
+def _wake_relay(events) -> None:
+    """on_commit: the rows are durable now; start the relay once."""
+    if events:
+        kick_relay()
+
+
+_wake = OnCommitBuffer(_wake_relay)
+
+
+# ---------------------------------------------------------------------------
+# Relay
+# ---------------------------------------------------------------------------
+
+
+def kick_relay() -> None:
+    """Start a relay run: one Celery task when async, otherwise inline."""
+    if getattr(settings, "EVENTS_USE_CELERY", False):
+        try:
+            from apps.common.events.tasks import relay_event_outbox
+
+            relay_event_outbox.apply_async(retry=False)
+            return
+        except Exception:
+            logger.warning("Outbox relay queuing failed (broker down?) — relaying inline")
+    relay_outbox()
+
+
+def relay_outbox(batch_size: Optional[int] = None, max_batches: Optional[int] = None) -> Dict[str, int]:
+    """
+    Drain pending outbox rows in id order.
+
+    Returns:
+        dict with relayed / batches / tasks counts (``skipped=1`` when another
+        relay holds the lock)
+    """
+    batch_size = batch_size or getattr(settings, "EVENTS_OUTBOX_RELAY_BATCH_SIZE", DEFAULT_RELAY_BATCH_SIZE)
+    stats = {"relayed": 0, "batches": 0, "tasks": 0, "skipped": 0}
+
+    if not cache.add(_RELAY_LOCK_KEY, 1, timeout=_RELAY_LOCK_TTL):
+        stats["skipped"] = 1
+        return stats
+    try:
+        while max_batches is None or stats["batches"] < max_batches:
+            rows = _claim_batch(batch_size)
+            if not rows:
+                break
+            stats["batches"] += 1
+            stats["relayed"] += len(rows)
+            stats["tasks"] += _dispatch_rows(rows)
+            if len(rows) < batch_size:
+                break
+    finally:
+        cache.delete(_RELAY_LOCK_KEY)
+
+    if stats["relayed"]:
+        logger.info(
+            f"Outbox relayed {stats['relayed']} events in {stats['batches']} batches",
+            extra={**stats, "status": "outbox_relayed"},
+        )
+    return stats
+
+
+def _claim_batch(batch_size: int) -> List:
+    """
+    Lease the next pending rows in id order.
+
+    Rows whose lease has expired are claimable again. Aggregates that still
+    have a leased row in flight are left out so their later events cannot
+    overtake it.
+    """
+    from apps.common.events.models import EventLog
+
+    now = timezone.now()
+    lease = getattr(settings, "EVENTS_OUTBOX_CLAIM_LEASE_SECONDS", DEFAULT_CLAIM_LEASE_SECONDS)
+    lease_cutoff = now - timedelta(seconds=lease)
+    pending = EventLog.objects.filter(relayed_at__isnull=True)
+
+    with transaction.atomic():
+        in_flight = (
+            pending.filter(claimed_at__gte=lease_cutoff, aggregate_id__isnull=False)
+            .values_list("aggregate_id", flat=True)
+            .distinct()
+        )
+        rows = list(
+            pending.select_for_update(skip_locked=True)
+            .filter(Q(claimed_at__isnull=True) | Q(claimed_at__lt=lease_cutoff))
+            .exclude(aggregate_id__in=list(in_flight))
+            .order_by("id")[:batch_size]
+        )
+        if rows:
+            EventLog.objects.filter(id__in=[row.id for row in rows]).update(claimed_at=now)
+    return rows
+
+
+def mark_relayed(event_log_ids: List[int]) -> bool:
+    """
+    Record that ``event_log_ids`` went through dispatch.
+
+    Returns True when rows of the same aggregates are still pending, i.e.
+    the relay held them back and should run again.
+    """
+    from apps.common.events.models import EventLog
+
+    if not event_log_ids:
+        return False
+    EventLog.objects.filter(id__in=event_log_ids).update(relayed_at=timezone.now())
+    aggregates = EventLog.objects.filter(id__in=event_log_ids, aggregate_id__isnull=False).values("aggregate_id")
+    return EventLog.objects.filter(relayed_at__isnull=True, aggregate_id__in=aggregates).exists()
+
+
+def _row_to_event_dict(row) -> dict:
+    metadata = dict(row.metadata or {})
+    metadata["event_log_id"] = row.id
+    return {
+        "name": row.name,
+        "payload": row.payload,
+        "occurred_at": row.occurred_at.isoformat(),
+        "user_id": row.user_id,
+        "correlation_id": row.correlation_id,
+        "metadata": metadata,
+    }
+
+
+def _dispatch_rows(rows) -> int:
+    """Dispatch one claimed batch. Returns the number of Celery tasks enqueued."""
+    from apps.common.events.tasks import dispatch_event_batch, dispatch_event_batch_task
+
+    groups: "OrderedDict[object, List[dict]]" = OrderedDict()
+    for row in rows:
+        # Events without an aggregate have no ordering constraint
+        key = row.aggregate_id or ("_event", row.id)
+        groups.setdefault(key, []).append(_row_to_event_dict(row))
+
+    if not getattr(settings, "EVENTS_USE_CELERY", False):
+        for events in groups.values():
+            dispatch_event_batch(events)
+        return 0
+
+    enqueued = 0
+    for events in groups.values():
+        try:
+            dispatch_event_batch_task.apply_async(args=[events], retry=False)
+            enqueued += 1
+        except Exception:
+            logger.warning(
+                f"Outbox batch queuing failed (broker down?) — dispatching {len(events)} events inline"
+            )
+            dispatch_event_batch(events)
+    return enqueued
@@ -17,7 +17,13 @@ Phase 8 Implementation (Epic 8.1 - Event System Hardening):
 - ✅ Retry metadata: retry_count, last_error, last_error_at
 - ✅ Metrics/logging hooks: event_processed, event_failed, event_dead_lettered
 - ⏳ Idempotency guards (duplicate event detection) (future)
-- ⏳ Circuit breaker patterns for failing handlers (future)Usage:
+- ⏳ Circuit breaker patterns for failing handlers (future)
+
+Transactional outbox (apps.common.events.outbox):
+- ✅ relay_event_outbox: drains pending EventLog rows in id order
+- ✅ dispatch_event_batch_task: one task per aggregate id, dispatched in order
+
+Usage:
     # Event bus automatically uses this task when settings.EVENTS_USE_CELERY = True
     from apps.common.events.event_bus import get_event_bus, Event
     
@@ -29,13 +35,31 @@ Reference: ROADMAP_AND_EPICS_PART_4.md - Phase 1, Epic 1.2
 
 import logging
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from celery import shared_task
 
 logger = logging.getLogger("common.events.tasks")
 
 
+def _event_from_dict(event_data: Dict[str, Any]):
+    """Rebuild an Event from ``Event.to_dict()`` output."""
+    from apps.common.events.event_bus import Event
+
+    # Parse ISO timestamp string back to datetime
+    occurred_at = event_data.get("occurred_at")
+    if isinstance(occurred_at, str):
+        occurred_at = datetime.fromisoformat(occurred_at)
+    return Event(
+        name=event_data["name"],
+        payload=event_data["payload"],
+        occurred_at=occurred_at,
+        user_id=event_data.get("user_id"),
+        correlation_id=event_data.get("correlation_id"),
+        metadata=event_data.get("metadata", {}),
+    )
+
+
 @shared_task(bind=True, max_retries=3, default_retry_delay=30)
 def dispatch_event_task(self, event_data: Dict[str, Any]) -> None:
     """
@@ -88,7 +112,7 @@ def dispatch_event_task(self, event_data: Dict[str, Any]) -> None:
     """
     # Reconstruct Event from serialized dict
     # EventBus uses lazy imports, so import here to avoid circular dependencies
-    from apps.common.events.event_bus import Event, get_event_bus
+    from apps.common.events.event_bus import get_event_bus
     from apps.common.events.models import EventLog
     from django.conf import settings
 
@@ -122,23 +146,8 @@ def dispatch_event_task(self, event_data: Dict[str, Any]) -> None:
                 }
             )
         
-        # Parse ISO timestamp string back to datetime
-        occurred_at_str = event_data.get("occurred_at")
-        if isinstance(occurred_at_str, str):
-            occurred_at = datetime.fromisoformat(occurred_at_str)
-        else:
-            # Already a datetime (shouldn't happen, but be defensive)
-            occurred_at = occurred_at_str
-
         # Reconstruct Event instance
-        event = Event(
-            name=event_data["name"],
-            payload=event_data["payload"],
-            occurred_at=occurred_at,
-            user_id=event_data.get("user_id"),
-            correlation_id=event_data.get("correlation_id"),
-            metadata=event_data.get("metadata", {}),
-        )
+        event = _event_from_dict(event_data)
 
         # Dispatch to all registered handlers via EventBus
         # This reuses the same error handling logic as synchronous dispatch
@@ -232,3 +241,85 @@ def dispatch_event_task(self, event_data: Dict[str, Any]) -> None:
             )
             # Re-raise to mark task as failed in Celery
             raise
+
+
+def dispatch_event_batch(events: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Dispatch outbox events in order and mark their EventLog rows PROCESSED.
+
+    Handler errors are logged by EventBus._dispatch_to_handlers(), as in the
+    single-event path. An event that cannot be rebuilt is handed to
+    dispatch_event_task so it gets the usual retry / DLQ handling; the rest
+    of the batch continues.
+
+    Rows are marked relayed only for events that got through (or were handed
+    off); if the batch dies part-way, the rest keep their outbox lease and
+    are reclaimed by a later relay run.
+
+    Returns:
+        dict with processed / handed_off counts, and ``more_pending=1`` when
+        later events of the same aggregates are still waiting in the outbox
+    """
+    from apps.common.events.event_bus import get_event_bus
+    from apps.common.events.models import EventLog
+    from apps.common.events.outbox import mark_relayed
+
+    bus = get_event_bus()
+    processed_ids = []
+    relayed_ids = []
+    handed_off = 0
+    more_pending = False
+    try:
+        for event_data in events:
+            event_log_id = (event_data.get("metadata") or {}).get("event_log_id")
+            try:
+                event = _event_from_dict(event_data)
+            except Exception as exc:
+                logger.warning(
+                    f"Outbox event could not be rebuilt, handing off to dispatch_event_task: {exc}",
+                    extra={"event_name": event_data.get("name"), "status": "outbox_handoff"},
+                )
+                dispatch_event_task.delay(event_data)
+                handed_off += 1
+            else:
+                bus._dispatch_to_handlers(event)
+                if event_log_id:
+                    processed_ids.append(event_log_id)
+            if event_log_id:
+                relayed_ids.append(event_log_id)
+    finally:
+        if processed_ids:
+            EventLog.objects.filter(id__in=processed_ids, status=EventLog.STATUS_PENDING).update(
+                status=EventLog.STATUS_PROCESSED
+            )
+        more_pending = mark_relayed(relayed_ids)
+    return {"processed": len(processed_ids), "handed_off": handed_off, "more_pending": int(more_pending)}
+
+
+@shared_task(ignore_result=True)
+def dispatch_event_batch_task(events: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Celery entry point for one aggregate's ordered outbox events.
+
+    Kicks the relay when it leaves the aggregate's later events behind, so
+    they do not wait for the periodic sweep.
+    """
+    from apps.common.events.outbox import kick_relay
+
+    stats = dispatch_event_batch(events)
+    if stats["more_pending"]:
+        kick_relay()
+    return stats
+
+
+@shared_task(ignore_result=True)
+def relay_event_outbox() -> Dict[str, int]:
+    """
+    Drain pending outbox rows (see apps.common.events.outbox).
+
+    Kicked after each outbox commit and scheduled periodically to pick up
+    rows whose kick was lost.
+    """
+    from apps.common.events.outbox import relay_outbox
+
+    return relay_outbox()
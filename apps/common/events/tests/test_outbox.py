@@ -0,0 +1,227 @@
+"""
+Tests for the EventBus transactional outbox.
+
+Covers in-transaction EventLog writes, batched bulk writes, post-commit
+relay (inline and Celery), rollback behaviour and per-aggregate grouping.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import transaction
+from django.test import override_settings
+
+from apps.common.events import outbox
+from apps.common.events.event_bus import Event, EventBus
+from apps.common.events.models import EventLog
+
+pytestmark = pytest.mark.django_db
+
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "outbox-tests"}}
+
+
+@pytest.fixture(autouse=True)
+def outbox_settings():
+    with override_settings(CACHES=LOCMEM, EVENTS_OUTBOX_ENABLED=True, EVENTS_USE_CELERY=False):
+        cache.clear()
+        yield
+
+
+@pytest.fixture
+def bus_with_recorder():
+    bus = EventBus()
+    received = []
+    bus.subscribe("OutboxTestEvent", received.append)
+    with patch("apps.common.events.event_bus.get_event_bus", return_value=bus):
+        yield bus, received
+
+
+def _event(**payload):
+    return Event(name="OutboxTestEvent", payload=payload)
+
+
+def test_events_are_written_in_the_transaction_and_dispatched_after_commit(
+    bus_with_recorder, django_capture_on_commit_callbacks,
+):
+    bus, received = bus_with_recorder
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            for i in range(5):
+                bus.publish(_event(tournament_id=1, seq=i))
+            assert received == []
+            assert EventLog.objects.filter(name="OutboxTestEvent", relayed_at__isnull=True).count() == 5
+
+    assert [event.payload["seq"] for event in received] == [0, 1, 2, 3, 4]
+    rows = EventLog.objects.filter(name="OutboxTestEvent")
+    assert rows.count() == 5
+    assert not rows.filter(relayed_at__isnull=True).exists()
+    assert set(rows.values_list("status", flat=True)) == {EventLog.STATUS_PROCESSED}
+    assert set(rows.values_list("aggregate_id", flat=True)) == {"tournament:1"}
+
+
+def test_events_survive_a_lost_commit_hook(bus_with_recorder, django_capture_on_commit_callbacks):
+    bus, received = bus_with_recorder
+
+    # The process dies between COMMIT and on_commit: the hook never runs
+    with django_capture_on_commit_callbacks(execute=False):
+        with transaction.atomic():
+            bus.publish(_event(match_id=4))
+
+    assert received == []
+    assert outbox.relay_outbox()["relayed"] == 1
+    assert len(received) == 1
+
+
+def test_rollback_discards_buffered_events(bus_with_recorder, django_capture_on_commit_callbacks):
+    bus, received = bus_with_recorder
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                bus.publish(_event(match_id=3))
+                raise RuntimeError("boom")
+
+    assert callbacks == []
+    assert received == []
+    assert not EventLog.objects.filter(name="OutboxTestEvent").exists()
+
+
+def test_batched_outbox_writes_once_inside_transaction(bus_with_recorder, django_capture_on_commit_callbacks):
+    bus, received = bus_with_recorder
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            with outbox.batched_outbox():
+                bus.publish(_event(tournament_id=2))
+                bus.publish(_event(tournament_id=2))
+                assert outbox.pending_count() == 2
+                assert not EventLog.objects.filter(name="OutboxTestEvent").exists()
+            pending = EventLog.objects.filter(name="OutboxTestEvent", relayed_at__isnull=True)
+            assert pending.count() == 2
+            assert received == []
+
+    assert len(received) == 2
+    assert all(event.metadata.get("event_log_id") for event in received)
+
+
+def test_failed_nested_batch_drops_only_its_events(bus_with_recorder, django_capture_on_commit_callbacks):
+    bus, received = bus_with_recorder
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with outbox.batched_outbox():
+            bus.publish(_event(tournament_id=3, seq=0))
+            with pytest.raises(RuntimeError):
+                with outbox.batched_outbox():
+                    bus.publish(_event(tournament_id=3, seq=1))
+                    raise RuntimeError("boom")
+            bus.publish(_event(tournament_id=3, seq=2))
+
+    assert [event.payload["seq"] for event in received] == [0, 2]
+    assert EventLog.objects.filter(name="OutboxTestEvent").count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_publish_outside_transaction_is_immediate(bus_with_recorder):
+    bus, received = bus_with_recorder
+
+    bus.publish(_event(team_id=9))
+
+    assert len(received) == 1
+    row = EventLog.objects.get(name="OutboxTestEvent")
+    assert row.relayed_at is not None
+    assert row.aggregate_id == "team:9"
+
+
+def test_celery_relay_enqueues_one_task_per_aggregate(django_capture_on_commit_callbacks):
+    bus = EventBus()
+    with override_settings(EVENTS_USE_CELERY=True), \
+            patch("apps.common.events.tasks.relay_event_outbox.apply_async", side_effect=lambda **kw: outbox.relay_outbox()), \
+            patch("apps.common.events.tasks.dispatch_event_batch_task.apply_async") as batch_task:
+        with django_capture_on_commit_callbacks(execute=True):
+            with transaction.atomic():
+                for i in range(3):
+                    bus.publish(_event(tournament_id=1, seq=i))
+                bus.publish(_event(tournament_id=2, seq=0))
+
+    assert batch_task.call_count == 2
+    first_group = batch_task.call_args_list[0].kwargs["args"][0]
+    assert [event["payload"]["seq"] for event in first_group] == [0, 1, 2]
+
+
+def test_relay_sweeps_pending_rows(bus_with_recorder):
+    bus, received = bus_with_recorder
+    from django.utils import timezone
+
+    EventLog.objects.create(
+        name="OutboxTestEvent",
+        payload={"tournament_id": 5},
+        occurred_at=timezone.now(),
+        aggregate_id="tournament:5",
+        relayed_at=None,
+    )
+
+    stats = outbox.relay_outbox()
+
+    assert stats["relayed"] == 1
+    assert len(received) == 1
+    assert outbox.relay_outbox()["relayed"] == 0
+
+
+def _pending_row(seq, aggregate_id="tournament:5"):
+    from django.utils import timezone
+
+    return EventLog.objects.create(
+        name="OutboxTestEvent",
+        payload={"tournament_id": 5, "seq": seq},
+        occurred_at=timezone.now(),
+        aggregate_id=aggregate_id,
+        relayed_at=None,
+    )
+
+
+def test_failed_dispatch_leaves_rows_for_a_later_run(bus_with_recorder):
+    bus, received = bus_with_recorder
+    row = _pending_row(0)
+
+    with patch("apps.common.events.tasks.dispatch_event_batch", side_effect=RuntimeError("broker gone")):
+        with pytest.raises(RuntimeError):
+            outbox.relay_outbox()
+
+    row.refresh_from_db()
+    assert row.relayed_at is None and row.claimed_at is not None
+    assert outbox.relay_outbox()["relayed"] == 0  # still leased
+
+    with override_settings(EVENTS_OUTBOX_CLAIM_LEASE_SECONDS=0):
+        assert outbox.relay_outbox()["relayed"] == 1
+    row.refresh_from_db()
+    assert row.relayed_at is not None
+    assert len(received) == 1
+
+
+def test_aggregate_in_flight_holds_back_its_later_events(bus_with_recorder):
+    from apps.common.events.tasks import dispatch_event_batch
+
+    bus, received = bus_with_recorder
+    first, second = _pending_row(0), _pending_row(1)
+
+    with override_settings(EVENTS_USE_CELERY=True), \
+            patch("apps.common.events.tasks.dispatch_event_batch_task.apply_async") as batch_task:
+        assert outbox.relay_outbox(batch_size=1, max_batches=1)["relayed"] == 1
+        assert outbox.relay_outbox(batch_size=1)["relayed"] == 0
+
+        stats = dispatch_event_batch(batch_task.call_args.kwargs["args"][0])
+        assert stats["more_pending"] == 1
+        assert outbox.relay_outbox(batch_size=1)["relayed"] == 1
+
+    assert [event["payload"]["seq"] for call in batch_task.call_args_list for event in call.kwargs["args"][0]] == [0, 1]
+    assert EventLog.objects.get(pk=first.pk).relayed_at is not None
+    assert EventLog.objects.get(pk=second.pk).relayed_at is None
+
+
+def test_aggregate_id_prefers_metadata():
+    event = Event(name="X", payload={"tournament_id": 1}, metadata={"aggregate_id": "bracket:7"})
+    assert outbox.aggregate_id_for(event) == "bracket:7"
+    assert outbox.aggregate_id_for(Event(name="X", payload={})) is None
@@ -0,0 +1,46 @@
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_relayed_at(apps, schema_editor):
+    """Rows written before the outbox existed were dispatched at publish time."""
+    EventLog = apps.get_model("common", "EventLog")
+    EventLog.objects.filter(relayed_at__isnull=True).update(relayed_at=F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eventlog",
+            name="aggregate_id",
+            field=models.CharField(
+                blank=True,
+                help_text="Events sharing an aggregate id are relayed in publish order",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventlog",
+            name="relayed_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the event was handed to dispatch (NULL = pending in outbox)",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(backfill_relayed_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="eventlog",
+            index=models.Index(
+                condition=models.Q(relayed_at__isnull=True),
+                fields=["id"],
+                name="evt_outbox_pending",
+            ),
+        ),
+    ]
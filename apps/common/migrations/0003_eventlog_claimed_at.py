@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0002_eventlog_outbox"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="eventlog",
+            name="relayed_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the event was dispatched (NULL = pending in outbox)",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventlog",
+            name="claimed_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When a relay run claimed the row; reclaimable once the lease expires",
+                null=True,
+            ),
+        ),
+    ]
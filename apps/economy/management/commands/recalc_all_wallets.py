@@ -4,6 +4,7 @@ Management Command: recalc_all_wallets
 Implements: MODULE_7.1_KICKOFF.md - Admin Integration (Step 5)
 
 Detects and corrects balance drift between wallet.cached_balance and ledger sum.
+Live runs also rebuild each wallet's running ledger totals (WalletLedgerTotals).
 
 Usage:
     python manage.py recalc_all_wallets [--dry-run]
@@ -21,6 +22,7 @@ import sys
 from django.core.management.base import BaseCommand
 from django.db.models import Sum
 from apps.economy.models import DeltaCrownWallet, DeltaCrownTransaction
+from apps.economy.services.ledger import rebuild_totals
 
 
 class Command(BaseCommand):
@@ -59,6 +61,9 @@ class Command(BaseCommand):
             
             cached = int(wallet.cached_balance)
             ledger = int(ledger_sum)
+
+            if not dry_run:
+                rebuild_totals(wallet.id)
             
             if cached != ledger:
                 drift_wallets.append((wallet.id, cached, ledger))
@@ -0,0 +1,80 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def backfill_totals(apps, schema_editor):
+    """Seed one totals row per wallet that has ledger lines."""
+    DeltaCrownTransaction = apps.get_model("economy", "DeltaCrownTransaction")
+    WalletLedgerTotals = apps.get_model("economy", "WalletLedgerTotals")
+
+    rows = (
+        DeltaCrownTransaction.objects.order_by()
+        .values("wallet_id")
+        .annotate(
+            total_credits=Sum("amount", filter=Q(amount__gt=0)),
+            total_debits=Sum("amount", filter=Q(amount__lt=0)),
+            credit_count=Count("id", filter=Q(amount__gt=0)),
+            debit_count=Count("id", filter=Q(amount__lt=0)),
+        )
+    )
+    WalletLedgerTotals.objects.bulk_create(
+        [
+            WalletLedgerTotals(
+                wallet_id=row["wallet_id"],
+                total_credits=row["total_credits"] or 0,
+                total_debits=abs(row["total_debits"] or 0),
+                credit_count=row["credit_count"],
+                debit_count=row["debit_count"],
+            )
+            for row in rows.iterator()
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("economy", "0015_remove_dailyrewardclaim_unique_daily_claim_per_user_per_day_and_more"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="deltacrowntransaction",
+            name="economy_del_wallet__a8652c_idx",
+        ),
+        migrations.AddIndex(
+            model_name="deltacrowntransaction",
+            index=models.Index(fields=["wallet", "created_at", "id"], name="economy_tx_wallet_ledger_idx"),
+        ),
+        migrations.CreateModel(
+            name="WalletLedgerTotals",
+            fields=[
+                (
+                    "wallet",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="ledger_totals",
+                        serialize=False,
+                        to="economy.deltacrownwallet",
+                    ),
+                ),
+                ("total_credits", models.BigIntegerField(default=0, help_text="Sum of positive ledger amounts.")),
+                (
+                    "total_debits",
+                    models.BigIntegerField(default=0, help_text="Sum of negative ledger amounts, stored positive."),
+                ),
+                ("credit_count", models.PositiveIntegerField(default=0)),
+                ("debit_count", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Wallet Ledger Totals",
+                "verbose_name_plural": "Wallet Ledger Totals",
+            },
+        ),
+        migrations.RunPython(backfill_totals, migrations.RunPython.noop),
+    ]
@@ -3,6 +3,7 @@
 # External code can continue using: from apps.economy.models import DeltaCrownWallet
 from .wallet import DeltaCrownWallet
 from .transaction import DeltaCrownTransaction
+from .ledger_totals import WalletLedgerTotals
 from .policy import CoinPolicy
 from .requests import TopUpRequest, WithdrawalRequest, PrizeClaim
 from .inventory import InventoryItem, UserInventoryItem
@@ -17,6 +18,7 @@ from .daily_reward import DailyRewardConfig, DailyRewardMilestone, DailyRewardCl
 __all__ = [
     "DeltaCrownWallet",
     "DeltaCrownTransaction",
+    "WalletLedgerTotals",
     "CoinPolicy",
     "TopUpRequest",
     "WithdrawalRequest",   # DEPRECATED — kept for migration/signal compatibility
@@ -0,0 +1,39 @@
+"""Per-wallet running ledger totals (data only — maintained by services.ledger)."""
+from django.db import models
+
+
+class WalletLedgerTotals(models.Model):
+    """
+    One row per wallet with lifetime credit/debit sums and counts.
+
+    Updated in the same statement sequence that inserts a ledger line, so
+    reading a wallet's totals is a primary-key lookup instead of an
+    aggregate over its whole history. Rebuilt from the ledger by
+    DeltaCrownWallet.recalc_and_save() and the recalc_all_wallets command.
+    """
+    wallet = models.OneToOneField(
+        "economy.DeltaCrownWallet",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="ledger_totals",
+    )
+    total_credits = models.BigIntegerField(default=0, help_text="Sum of positive ledger amounts.")
+    total_debits = models.BigIntegerField(default=0, help_text="Sum of negative ledger amounts, stored positive.")
+    credit_count = models.PositiveIntegerField(default=0)
+    debit_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Wallet Ledger Totals"
+        verbose_name_plural = "Wallet Ledger Totals"
+
+    def __str__(self):
+        return f"LedgerTotals[wallet={self.wallet_id}] +{self.total_credits} -{self.total_debits}"
+
+    @property
+    def transaction_count(self) -> int:
+        return self.credit_count + self.debit_count
+
+    @property
+    def net(self) -> int:
+        return self.total_credits - self.total_debits
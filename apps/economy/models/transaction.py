@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 
 from ..exceptions import InsufficientFunds, InvalidAmount
 from .wallet import DeltaCrownWallet
@@ -76,7 +76,7 @@ class DeltaCrownTransaction(models.Model):
         indexes = [
             models.Index(fields=["reason", "created_at"]),
             models.Index(fields=["wallet"]),
-            models.Index(fields=["wallet", "created_at"]),
+            models.Index(fields=["wallet", "created_at", "id"], name="economy_tx_wallet_ledger_idx"),
             models.Index(fields=["wallet", "id"]),
         ]
         constraints = [
@@ -139,7 +139,15 @@ class DeltaCrownTransaction(models.Model):
                 except DeltaCrownWallet.DoesNotExist:
                     pass
         
-        super().save(*args, **kwargs)
+        if is_create and self.wallet_id:
+            # Running totals move with the insert: both commit or neither does.
+            from ..services.ledger import apply_line
+
+            with transaction.atomic():
+                apply_line(self.wallet_id, self.amount)
+                super().save(*args, **kwargs)
+        else:
+            super().save(*args, **kwargs)
         
         # Maintain cached balance on create only
         if is_create:
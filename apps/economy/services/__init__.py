@@ -454,11 +454,23 @@ def get_balance(profile: Union[int, object]) -> int:
     return int(w.cached_balance) if w else 0
 
 
+def _transaction_dict(t: DeltaCrownTransaction) -> Dict[str, Any]:
+    return {
+        'id': t.id,
+        'amount': int(t.amount),
+        'balance_after': int(t.cached_balance_after) if t.cached_balance_after is not None else None,
+        'reason': t.reason,
+        'created_at': t.created_at,
+        'idempotency_key': t.idempotency_key,
+    }
+
+
 def get_transaction_history(
     wallet_or_profile: Union[DeltaCrownWallet, object],
     *,
     page: int = 1,
     page_size: int = 20,
+    cursor: Optional[str] = None,
     transaction_type: Optional[str] = None,
     reason: Optional[str] = None,
     start_date: Optional[Any] = None,
@@ -468,10 +480,16 @@ def get_transaction_history(
     """
     Get paginated transaction history with filtering.
     
+    Pages are read through the keyset ledger reader (services.ledger). Pass
+    the previous response's ``next_cursor`` as ``cursor`` to walk forward;
+    ``page`` > 1 without a cursor is still honoured for older callers but
+    costs an OFFSET scan.
+    
     Args:
         wallet_or_profile: DeltaCrownWallet instance or profile object
-        page: Page number (1-indexed)
+        page: Page number (1-indexed); ignored when cursor is given
         page_size: Number of transactions per page (default 20, max 100)
+        cursor: Opaque cursor from a previous page's next_cursor
         transaction_type: Filter by 'DEBIT' or 'CREDIT' (checks amount sign)
         reason: Filter by transaction reason
         start_date: Filter transactions >= this date
@@ -486,7 +504,10 @@ def get_transaction_history(
             - total_count: Total matching transactions
             - has_next: Boolean indicating more pages
             - has_prev: Boolean indicating previous pages
+            - next_cursor: Cursor for the next page (None on the last page)
     """
+    from . import ledger
+
     # Resolve wallet
     if isinstance(wallet_or_profile, DeltaCrownWallet):
         wallet = wallet_or_profile
@@ -500,70 +521,51 @@ def get_transaction_history(
                 'page_size': page_size,
                 'total_count': 0,
                 'has_next': False,
-                'has_prev': False
+                'has_prev': False,
+                'next_cursor': None,
             }
     
     # Validate and cap page_size
     page = max(1, int(page))
-    page_size = max(1, min(100, int(page_size)))
-    
-    # Build queryset
-    qs = DeltaCrownTransaction.objects.filter(wallet=wallet)
-    
-    # Apply filters
-    if transaction_type:
-        if transaction_type.upper() == 'DEBIT':
-            qs = qs.filter(amount__lt=0)
-        elif transaction_type.upper() == 'CREDIT':
-            qs = qs.filter(amount__gt=0)
-    
-    if reason:
-        qs = qs.filter(reason=reason)
-    
-    if start_date:
-        qs = qs.filter(created_at__gte=start_date)
-    
-    if end_date:
-        qs = qs.filter(created_at__lte=end_date)
-    
-    # Apply ordering
-    order_by = '-created_at' if order.lower() == 'desc' else 'created_at'
-    qs = qs.order_by(order_by)
-    
-    # Get total count
-    total_count = qs.count()
-    
-    # Calculate pagination
-    offset = (page - 1) * page_size
-    transactions_page = qs[offset:offset + page_size]
-    
-    # Build response
-    transactions = [
-        {
-            'id': t.id,
-            'amount': int(t.amount),
-            'balance_after': int(t.cached_balance_after) if hasattr(t, 'cached_balance_after') else None,
-            'reason': t.reason,
-            'created_at': t.created_at,
-            'idempotency_key': t.idempotency_key,
-        }
-        for t in transactions_page
-    ]
+    page_size = max(1, min(ledger.MAX_PAGE_SIZE, int(page_size)))
+    filters = {
+        'transaction_type': transaction_type,
+        'reason': reason,
+        'start_date': start_date,
+        'end_date': end_date,
+    }
+
+    # Unfiltered counts come from the running totals row
+    if any(filters.values()):
+        total_count = ledger.ledger_queryset(wallet, **filters).count()
+    else:
+        total_count = ledger.get_totals(wallet).transaction_count
+
+    if cursor or page == 1:
+        result = ledger.read_ledger(wallet, cursor=cursor, limit=page_size, order=order, **filters)
+        rows, has_next, next_cursor = result['transactions'], result['has_more'], result['next_cursor']
+    else:
+        offset = (page - 1) * page_size
+        rows = list(ledger.ledger_queryset(wallet, order=order, **filters)[offset:offset + page_size + 1])
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        next_cursor = ledger.encode_cursor(rows[-1]) if has_next else None
     
     return {
-        'transactions': transactions,
+        'transactions': [_transaction_dict(t) for t in rows],
         'page': page,
         'page_size': page_size,
         'total_count': total_count,
-        'has_next': offset + page_size < total_count,
-        'has_prev': page > 1
+        'has_next': has_next,
+        'has_prev': bool(cursor) or page > 1,
+        'next_cursor': next_cursor,
     }
 
 
 def get_transaction_history_cursor(
     wallet: DeltaCrownWallet,
     *,
-    cursor: Optional[int] = None,
+    cursor: Optional[str] = None,
     limit: int = 20
 ) -> Dict[str, Any]:
     """
@@ -571,45 +573,23 @@ def get_transaction_history_cursor(
     
     Args:
         wallet: DeltaCrownWallet instance
-        cursor: Transaction ID to start from (exclusive)
+        cursor: next_cursor from the previous page (a bare transaction ID is
+                also accepted)
         limit: Number of transactions to return
     
     Returns:
         Dict with:
             - transactions: List of transaction dictionaries
-            - next_cursor: Transaction ID for next page (None if last page)
+            - next_cursor: Cursor for next page (None if last page)
             - has_more: Boolean indicating more data available
     """
-    limit = max(1, min(100, int(limit)))
-    
-    # Build queryset (ordered by ID desc for stable cursor pagination)
-    qs = DeltaCrownTransaction.objects.filter(wallet=wallet).order_by('-id')
-    
-    if cursor:
-        qs = qs.filter(id__lt=cursor)
-    
-    transactions = list(qs[:limit + 1])  # Fetch one extra to check has_more
-    
-    has_more = len(transactions) > limit
-    if has_more:
-        transactions = transactions[:limit]
-    
-    next_cursor = transactions[-1].id if transactions and has_more else None
-    
+    from . import ledger
+
+    result = ledger.read_ledger(wallet, cursor=cursor, limit=limit)
     return {
-        'transactions': [
-            {
-                'id': t.id,
-                'amount': int(t.amount),
-                'balance_after': int(t.cached_balance_after) if hasattr(t, 'cached_balance_after') else None,
-                'reason': t.reason,
-                'created_at': t.created_at,
-                'idempotency_key': t.idempotency_key,
-            }
-            for t in transactions
-        ],
-        'next_cursor': next_cursor,
-        'has_more': has_more
+        'transactions': [_transaction_dict(t) for t in result['transactions']],
+        'next_cursor': result['next_cursor'],
+        'has_more': result['has_more'],
     }
 
 
@@ -622,6 +602,10 @@ def get_transaction_totals(
     """
     Get transaction totals and summary statistics.
     
+    Lifetime totals are read from the wallet's running totals row. A date
+    range aggregates only the matching slice of the (wallet, created_at, id)
+    index.
+    
     Args:
         wallet: DeltaCrownWallet instance
         start_date: Optional start date filter
@@ -636,32 +620,33 @@ def get_transaction_totals(
             - credits_count: Number of credit transactions
             - debits_count: Number of debit transactions
     """
-    from django.db.models import Sum, Count, Q
-    
-    qs = DeltaCrownTransaction.objects.filter(wallet=wallet)
-    
-    if start_date:
-        qs = qs.filter(created_at__gte=start_date)
-    
-    if end_date:
-        qs = qs.filter(created_at__lte=end_date)
-    
-    # Aggregate totals
-    aggregates = qs.aggregate(
-        total_credits=Sum('amount', filter=Q(amount__gt=0)),
-        total_debits=Sum('amount', filter=Q(amount__lt=0)),
-        transaction_count=Count('id'),
-        credits_count=Count('id', filter=Q(amount__gt=0)),
-        debits_count=Count('id', filter=Q(amount__lt=0))
-    )
+    from django.db.models import Sum, Q
+    from . import ledger
+
+    if start_date or end_date:
+        qs = ledger.ledger_queryset(wallet, start_date=start_date, end_date=end_date).order_by()
+        aggregates = qs.aggregate(
+            total_credits=Sum('amount', filter=Q(amount__gt=0)),
+            total_debits=Sum('amount', filter=Q(amount__lt=0)),
+            credits_count=Count('id', filter=Q(amount__gt=0)),
+            debits_count=Count('id', filter=Q(amount__lt=0))
+        )
+        total_credits = int(aggregates['total_credits'] or 0)
+        total_debits = abs(int(aggregates['total_debits'] or 0))  # Return as positive
+        credits_count = aggregates['credits_count']
+        debits_count = aggregates['debits_count']
+    else:
+        totals = ledger.get_totals(wallet)
+        total_credits, total_debits = totals.total_credits, totals.total_debits
+        credits_count, debits_count = totals.credit_count, totals.debit_count
     
     return {
         'current_balance': int(wallet.cached_balance),
-        'total_credits': int(aggregates['total_credits'] or 0),
-        'total_debits': abs(int(aggregates['total_debits'] or 0)),  # Return as positive
-        'transaction_count': aggregates['transaction_count'],
-        'credits_count': aggregates['credits_count'],
-        'debits_count': aggregates['debits_count']
+        'total_credits': total_credits,
+        'total_debits': total_debits,
+        'transaction_count': credits_count + debits_count,
+        'credits_count': credits_count,
+        'debits_count': debits_count
     }
 
 
@@ -710,6 +695,20 @@ def get_pending_holds_summary(wallet: DeltaCrownWallet) -> Dict[str, Any]:
     }
 
 
+_CSV_FIELDS = ['Date', 'Type', 'Amount', 'Balance After', 'Reason', 'ID']
+
+
+def _csv_row(txn: DeltaCrownTransaction) -> Dict[str, Any]:
+    return {
+        'Date': txn.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+        'Type': 'Credit' if txn.amount > 0 else 'Debit',
+        'Amount': int(txn.amount),
+        'Balance After': int(txn.cached_balance_after) if txn.cached_balance_after is not None else '',
+        'Reason': txn.reason,
+        'ID': txn.id
+    }
+
+
 def export_transactions_csv(
     wallet: DeltaCrownWallet,
     *,
@@ -722,6 +721,9 @@ def export_transactions_csv(
     """
     Export transaction history to CSV format.
     
+    Convenience wrapper that joins export_transactions_csv_streaming();
+    prefer the streaming form for responses.
+    
     Args:
         wallet: DeltaCrownWallet instance
         transaction_type: Filter by 'DEBIT' or 'CREDIT'
@@ -733,53 +735,14 @@ def export_transactions_csv(
     Returns:
         CSV string with BOM for Excel compatibility
     """
-    import csv
-    import io
-    
-    # Build queryset with filters
-    qs = DeltaCrownTransaction.objects.filter(wallet=wallet)
-    
-    if transaction_type:
-        if transaction_type.upper() == 'DEBIT':
-            qs = qs.filter(amount__lt=0)
-        elif transaction_type.upper() == 'CREDIT':
-            qs = qs.filter(amount__gt=0)
-    
-    if reason:
-        qs = qs.filter(reason=reason)
-    
-    if start_date:
-        qs = qs.filter(created_at__gte=start_date)
-    
-    if end_date:
-        qs = qs.filter(created_at__lte=end_date)
-    
-    # Order and limit
-    qs = qs.order_by('-created_at')[:max_rows]
-    
-    # Create CSV
-    output = io.StringIO()
-    # Add BOM for Excel compatibility
-    output.write('\ufeff')
-    
-    writer = csv.DictWriter(
-        output,
-        fieldnames=['Date', 'Type', 'Amount', 'Balance After', 'Reason', 'ID'],
-        quoting=csv.QUOTE_MINIMAL
-    )
-    writer.writeheader()
-    
-    for txn in qs:
-        writer.writerow({
-            'Date': txn.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-            'Type': 'Credit' if txn.amount > 0 else 'Debit',
-            'Amount': int(txn.amount),
-            'Balance After': int(txn.cached_balance_after) if hasattr(txn, 'cached_balance_after') else '',
-            'Reason': txn.reason,
-            'ID': txn.id
-        })
-    
-    return output.getvalue()
+    return ''.join(export_transactions_csv_streaming(
+        wallet,
+        transaction_type=transaction_type,
+        reason=reason,
+        start_date=start_date,
+        end_date=end_date,
+        max_rows=max_rows,
+    ))
 
 
 def export_transactions_csv_streaming(
@@ -789,11 +752,15 @@ def export_transactions_csv_streaming(
     reason: Optional[str] = None,
     start_date: Optional[Any] = None,
     end_date: Optional[Any] = None,
-    chunk_size: int = 1000
+    chunk_size: int = 1000,
+    max_rows: Optional[int] = None
 ):
     """
     Export transaction history as CSV generator for streaming large datasets.
     
+    Rows come from the keyset ledger reader, so each chunk is one index
+    range scan regardless of how deep into the history it is.
+    
     Args:
         wallet: DeltaCrownWallet instance
         transaction_type: Filter by 'DEBIT' or 'CREDIT'
@@ -801,71 +768,44 @@ def export_transactions_csv_streaming(
         start_date: Filter transactions >= this date
         end_date: Filter transactions <= this date
         chunk_size: Number of rows per chunk
+        max_rows: Optional cap on the number of rows
     
     Yields:
         CSV chunks as strings
     """
     import csv
     import io
-    
-    # Build queryset with filters
-    qs = DeltaCrownTransaction.objects.filter(wallet=wallet)
-    
-    if transaction_type:
-        if transaction_type.upper() == 'DEBIT':
-            qs = qs.filter(amount__lt=0)
-        elif transaction_type.upper() == 'CREDIT':
-            qs = qs.filter(amount__gt=0)
-    
-    if reason:
-        qs = qs.filter(reason=reason)
-    
-    if start_date:
-        qs = qs.filter(created_at__gte=start_date)
-    
-    if end_date:
-        qs = qs.filter(created_at__lte=end_date)
-    
-    # Order by created_at descending
-    qs = qs.order_by('-created_at')
+    from . import ledger
     
     # Yield header with BOM
     output = io.StringIO()
     output.write('\ufeff')
-    writer = csv.DictWriter(
-        output,
-        fieldnames=['Date', 'Type', 'Amount', 'Balance After', 'Reason', 'ID'],
-        quoting=csv.QUOTE_MINIMAL
-    )
+    writer = csv.DictWriter(output, fieldnames=_CSV_FIELDS, quoting=csv.QUOTE_MINIMAL)
     writer.writeheader()
     yield output.getvalue()
     
-    # Stream rows in chunks
-    offset = 0
-    while True:
-        chunk = list(qs[offset:offset + chunk_size])
-        if not chunk:
-            break
-        
-        output = io.StringIO()
-        writer = csv.DictWriter(
-            output,
-            fieldnames=['Date', 'Type', 'Amount', 'Balance After', 'Reason', 'ID'],
-            quoting=csv.QUOTE_MINIMAL
-        )
-        
-        for txn in chunk:
-            writer.writerow({
-                'Date': txn.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                'Type': 'Credit' if txn.amount > 0 else 'Debit',
-                'Amount': int(txn.amount),
-                'Balance After': int(txn.cached_balance_after) if hasattr(txn, 'cached_balance_after') else '',
-                'Reason': txn.reason,
-                'ID': txn.id
-            })
-        
+    rows = ledger.iter_ledger(
+        wallet,
+        chunk_size=chunk_size,
+        max_rows=max_rows,
+        transaction_type=transaction_type,
+        reason=reason,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=_CSV_FIELDS, quoting=csv.QUOTE_MINIMAL)
+    pending = 0
+    for txn in rows:
+        writer.writerow(_csv_row(txn))
+        pending += 1
+        if pending == chunk_size:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+            pending = 0
+    if pending:
         yield output.getvalue()
-        offset += chunk_size
 
 
 # ================================================================================
@@ -0,0 +1,289 @@
+"""
+Wallet ledger reader and running totals.
+
+Every ledger view — the wallet transaction page, the history API and the
+CSV exports — reads through ``read_ledger`` / ``iter_ledger``. Both walk the
+``(wallet, created_at, id)`` index with a keyset cursor, so page N costs the
+same as page 1 and an export of a 50k-line wallet never holds more than one
+chunk in memory.
+
+Lifetime totals live in ``WalletLedgerTotals``. ``apply_line`` adjusts them
+in the same transaction that inserts a ledger line; ``rebuild_totals``
+recomputes them from the ledger and is the repair path.
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Sum, Value, When
+
+from ..models import DeltaCrownTransaction, DeltaCrownWallet, WalletLedgerTotals
+
+__all__ = [
+    "encode_cursor",
+    "decode_cursor",
+    "ledger_queryset",
+    "read_ledger",
+    "iter_ledger",
+    "get_totals",
+    "apply_line",
+    "apply_lines",
+    "retract_line",
+    "rebuild_totals",
+]
+
+MAX_PAGE_SIZE = 100
+
+
+# ---- Cursors ----------------------------------------------------------------
+
+def encode_cursor(txn: DeltaCrownTransaction) -> str:
+    """Opaque cursor pointing just past ``txn`` in ledger order."""
+    raw = f"{txn.created_at.isoformat()}|{txn.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Any, wallet: DeltaCrownWallet) -> Tuple[datetime, int]:
+    """
+    Return the ``(created_at, id)`` position a cursor points at.
+
+    A bare transaction id (the older cursor format) is resolved with one
+    primary-key lookup. Raises ValueError for anything unrecognised.
+    """
+    if isinstance(cursor, int) or (isinstance(cursor, str) and cursor.isdigit()):
+        row = (
+            DeltaCrownTransaction.objects.filter(wallet=wallet, pk=int(cursor))
+            .values_list("created_at", "id")
+            .first()
+        )
+        if row is None:
+            raise ValueError(f"Unknown ledger cursor: {cursor!r}")
+        return row
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, _, txn_id = base64.urlsafe_b64decode(padded).decode().partition("|")
+        return datetime.fromisoformat(created_at), int(txn_id)
+    except (TypeError, ValueError, binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError(f"Malformed ledger cursor: {cursor!r}") from exc
+
+
+# ---- Reader -----------------------------------------------------------------
+
+def ledger_queryset(
+    wallet: DeltaCrownWallet,
+    *,
+    transaction_type: Optional[str] = None,
+    reason: Optional[str] = None,
+    start_date: Optional[Any] = None,
+    end_date: Optional[Any] = None,
+    order: str = "desc",
+):
+    """Filtered ledger lines for ``wallet`` in keyset order (``created_at``, ``id``)."""
+    qs = DeltaCrownTransaction.objects.filter(wallet=wallet)
+
+    if transaction_type:
+        if transaction_type.upper() == "DEBIT":
+            qs = qs.filter(amount__lt=0)
+        elif transaction_type.upper() == "CREDIT":
+            qs = qs.filter(amount__gt=0)
+    if reason:
+        qs = qs.filter(reason=reason)
+    if start_date:
+        qs = qs.filter(created_at__gte=start_date)
+    if end_date:
+        qs = qs.filter(created_at__lte=end_date)
+
+    if order.lower() == "asc":
+        return qs.order_by("created_at", "id")
+    return qs.order_by("-created_at", "-id")
+
+
+def _after(qs, position: Tuple[datetime, int], order: str):
+    created_at, txn_id = position
+    if order.lower() == "asc":
+        return qs.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=txn_id))
+    return qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=txn_id))
+
+
+def read_ledger(
+    wallet: DeltaCrownWallet,
+    *,
+    cursor: Optional[Any] = None,
+    limit: int = 20,
+    order: str = "desc",
+    **filters,
+) -> Dict[str, Any]:
+    """
+    One page of ledger lines after ``cursor``.
+
+    Returns a dict with ``transactions`` (model instances), ``next_cursor``
+    (None on the last page) and ``has_more``.
+    """
+    limit = max(1, min(MAX_PAGE_SIZE, int(limit)))
+    qs = ledger_queryset(wallet, order=order, **filters)
+    if cursor:
+        qs = _after(qs, decode_cursor(cursor, wallet), order)
+
+    rows = list(qs[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "transactions": rows,
+        "next_cursor": encode_cursor(rows[-1]) if has_more else None,
+        "has_more": has_more,
+    }
+
+
+def iter_ledger(
+    wallet: DeltaCrownWallet,
+    *,
+    order: str = "desc",
+    chunk_size: int = 1000,
+    max_rows: Optional[int] = None,
+    **filters,
+) -> Iterator[DeltaCrownTransaction]:
+    """Yield every matching ledger line, fetching ``chunk_size`` rows per keyset query."""
+    qs = ledger_queryset(wallet, order=order, **filters)
+    position = None
+    remaining = max_rows
+    while remaining is None or remaining > 0:
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        page = _after(qs, position, order) if position else qs
+        rows = list(page[:size])
+        yield from rows
+        if len(rows) < size:
+            return
+        position = (rows[-1].created_at, rows[-1].id)
+        if remaining is not None:
+            remaining -= len(rows)
+
+
+# ---- Running totals ---------------------------------------------------------
+
+def _ledger_aggregate(wallet_id: int) -> Dict[str, int]:
+    agg = DeltaCrownTransaction.objects.filter(wallet_id=wallet_id).aggregate(
+        total_credits=Sum("amount", filter=Q(amount__gt=0)),
+        total_debits=Sum("amount", filter=Q(amount__lt=0)),
+        credit_count=Count("id", filter=Q(amount__gt=0)),
+        debit_count=Count("id", filter=Q(amount__lt=0)),
+    )
+    return {
+        "total_credits": int(agg["total_credits"] or 0),
+        "total_debits": abs(int(agg["total_debits"] or 0)),
+        "credit_count": agg["credit_count"],
+        "debit_count": agg["debit_count"],
+    }
+
+
+def rebuild_totals(wallet_id: int) -> WalletLedgerTotals:
+    """Recompute a wallet's totals from its ledger (the repair path)."""
+    totals, _ = WalletLedgerTotals.objects.update_or_create(
+        wallet_id=wallet_id, defaults=_ledger_aggregate(wallet_id),
+    )
+    return totals
+
+
+def get_totals(wallet: DeltaCrownWallet) -> WalletLedgerTotals:
+    """The wallet's running totals, built from the ledger on first use."""
+    totals = WalletLedgerTotals.objects.filter(wallet_id=wallet.pk).first()
+    if totals is None:
+        totals = rebuild_totals(wallet.pk)
+    return totals
+
+
+def _shift(wallet_id: int, amount: int, sign: int) -> int:
+    if amount > 0:
+        changes = {"total_credits": F("total_credits") + sign * amount,
+                   "credit_count": F("credit_count") + sign}
+    else:
+        changes = {"total_debits": F("total_debits") + sign * -amount,
+                   "debit_count": F("debit_count") + sign}
+    return WalletLedgerTotals.objects.filter(wallet_id=wallet_id).update(**changes)
+
+
+def apply_line(wallet_id: int, amount: int) -> None:
+    """
+    Count a ledger line that is about to be inserted.
+
+    Call inside the insert's transaction, before the row exists: a wallet
+    without a totals row is seeded from its (pre-insert) ledger, then the
+    new line is added on top.
+    """
+    if _shift(wallet_id, amount, +1):
+        return
+    try:
+        with transaction.atomic():
+            WalletLedgerTotals.objects.create(wallet_id=wallet_id, **_ledger_aggregate(wallet_id))
+    except IntegrityError:
+        pass  # created concurrently; fall through to the update
+    _shift(wallet_id, amount, +1)
+
+
+def apply_lines(lines: Iterable[Tuple[int, int]]) -> None:
+    """
+    Count a batch of ``(wallet_id, amount)`` ledger lines about to be
+    bulk-inserted (``bulk_create`` skips ``save()``, so apply_line never runs).
+
+    Same contract as apply_line, in a fixed number of queries: wallets
+    without a totals row are seeded from one grouped aggregate, then every
+    wallet is adjusted by a single UPDATE.
+    """
+    deltas: Dict[int, Dict[str, int]] = defaultdict(
+        lambda: {"total_credits": 0, "total_debits": 0, "credit_count": 0, "debit_count": 0}
+    )
+    for wallet_id, amount in lines:
+        delta = deltas[wallet_id]
+        if amount > 0:
+            delta["total_credits"] += amount
+            delta["credit_count"] += 1
+        else:
+            delta["total_debits"] += -amount
+            delta["debit_count"] += 1
+    if not deltas:
+        return
+
+    missing = set(deltas) - set(
+        WalletLedgerTotals.objects.filter(wallet_id__in=deltas).values_list("wallet_id", flat=True)
+    )
+    if missing:
+        seeded = {wallet_id: {"total_credits": 0, "total_debits": 0, "credit_count": 0, "debit_count": 0}
+                  for wallet_id in missing}
+        rows = (
+            DeltaCrownTransaction.objects.filter(wallet_id__in=missing).order_by()
+            .values("wallet_id")
+            .annotate(
+                total_credits=Sum("amount", filter=Q(amount__gt=0)),
+                total_debits=Sum("amount", filter=Q(amount__lt=0)),
+                credit_count=Count("id", filter=Q(amount__gt=0)),
+                debit_count=Count("id", filter=Q(amount__lt=0)),
+            )
+        )
+        for row in rows:
+            seeded[row["wallet_id"]] = {
+                "total_credits": int(row["total_credits"] or 0),
+                "total_debits": abs(int(row["total_debits"] or 0)),
+                "credit_count": row["credit_count"],
+                "debit_count": row["debit_count"],
+            }
+        WalletLedgerTotals.objects.bulk_create(
+            [WalletLedgerTotals(wallet_id=wallet_id, **values) for wallet_id, values in seeded.items()],
+            ignore_conflicts=True,
+        )
+
+    changes = {}
+    for field in ("total_credits", "total_debits", "credit_count", "debit_count"):
+        whens = [When(wallet_id=wallet_id, then=Value(delta[field]))
+                 for wallet_id, delta in deltas.items() if delta[field]]
+        if whens:
+            changes[field] = F(field) + Case(*whens, default=Value(0), output_field=IntegerField())
+    WalletLedgerTotals.objects.filter(wallet_id__in=deltas).update(**changes)
+
+
+def retract_line(wallet_id: int, amount: int) -> None:
+    """Remove a deleted ledger line from the wallet's totals."""
+    _shift(wallet_id, amount, -1)
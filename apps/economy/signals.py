@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from django.apps import apps
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 # NOTE: Signal disabled - tournament app moved to legacy (Nov 2, 2025)
@@ -62,3 +62,15 @@ def sync_profile_on_transaction(sender, instance, created, **kwargs):
         # Never block transaction creation
         # Reconciliation command can fix any missed syncs
         pass
+
+
+@receiver(post_delete, sender='economy.DeltaCrownTransaction', dispatch_uid='economy_ledger_totals_on_delete')
+def retract_ledger_totals_on_delete(sender, instance, **kwargs):
+    """
+    Keep WalletLedgerTotals in step when ledger lines are purged (genesis
+    reset, test-data cleanup). Totals rows of deleted wallets cascade.
+    """
+    from apps.economy.services.ledger import retract_line
+
+    if instance.wallet_id:
+        retract_line(instance.wallet_id, instance.amount)
@@ -0,0 +1,89 @@
+import csv
+import io
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.economy.models import DeltaCrownTransaction, DeltaCrownWallet, WalletLedgerTotals
+from apps.economy.services import (
+    credit,
+    debit,
+    export_transactions_csv_streaming,
+    get_transaction_history,
+    get_transaction_totals,
+    ledger,
+)
+from apps.user_profile.models import UserProfile
+
+
+User = get_user_model()
+
+
+class LedgerReaderTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username="trader", email="trader@example.com", password="pass123")
+        self.profile, _ = UserProfile.objects.get_or_create(user=user)
+        self.wallet, _ = DeltaCrownWallet.objects.get_or_create(profile=self.profile)
+        for i in range(7):
+            credit(self.profile, 100, reason="manual_adjust", idempotency_key=f"trader_credit_{i}")
+        for i in range(3):
+            debit(self.profile, 40, reason="entry_fee_debit", idempotency_key=f"trader_debit_{i}")
+        self.wallet.refresh_from_db()
+
+    def test_cursor_walk_visits_every_line_once_newest_first(self):
+        seen, cursor = [], None
+        while True:
+            page = get_transaction_history(self.wallet, page_size=3, cursor=cursor)
+            seen.extend(t["id"] for t in page["transactions"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+
+        expected = list(
+            DeltaCrownTransaction.objects.filter(wallet=self.wallet)
+            .order_by("-created_at", "-id")
+            .values_list("id", flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_legacy_id_cursor_is_still_accepted(self):
+        first = get_transaction_history(self.wallet, page_size=4)
+        last_id = first["transactions"][-1]["id"]
+
+        by_id = ledger.read_ledger(self.wallet, cursor=last_id, limit=4)
+        by_token = ledger.read_ledger(self.wallet, cursor=first["next_cursor"], limit=4)
+
+        self.assertEqual([t.id for t in by_id["transactions"]], [t.id for t in by_token["transactions"]])
+        with self.assertRaises(ValueError):
+            ledger.read_ledger(self.wallet, cursor="not-a-cursor!", limit=4)
+
+    def test_lifetime_totals_need_one_query(self):
+        with self.assertNumQueries(1):
+            totals = get_transaction_totals(self.wallet)
+
+        self.assertEqual(
+            (totals["total_credits"], totals["total_debits"], totals["credits_count"], totals["debits_count"]),
+            (700, 120, 7, 3),
+        )
+        self.assertEqual(totals["total_credits"] - totals["total_debits"], self.wallet.cached_balance)
+
+    def test_totals_follow_inserts_deletes_and_rebuild(self):
+        extra = DeltaCrownTransaction.objects.create(
+            wallet=self.wallet, amount=-10, reason=DeltaCrownTransaction.Reason.MANUAL_ADJUST,
+        )
+        self.assertEqual(WalletLedgerTotals.objects.get(wallet=self.wallet).debit_count, 4)
+
+        extra.delete()
+        WalletLedgerTotals.objects.filter(wallet=self.wallet).update(total_credits=0)
+        totals = ledger.rebuild_totals(self.wallet.pk)
+
+        self.assertEqual((totals.total_credits, totals.total_debits, totals.transaction_count), (700, 120, 10))
+
+    def test_streaming_export_chunks_cover_filtered_rows(self):
+        chunks = list(export_transactions_csv_streaming(self.wallet, transaction_type="CREDIT", chunk_size=2))
+        rows = list(csv.DictReader(io.StringIO("".join(chunks).lstrip("\ufeff"))))
+
+        self.assertEqual(len(chunks), 1 + 4)  # header + ceil(7 / 2)
+        self.assertEqual(len(rows), 7)
+        self.assertTrue(all(row["Type"] == "Credit" for row in rows))
+        self.assertEqual(len({row["ID"] for row in rows}), 7)
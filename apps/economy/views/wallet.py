@@ -7,15 +7,14 @@ from typing import Optional
 
 from django.apps import apps
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator, EmptyPage
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.shortcuts import render, redirect
 from django.urls import reverse
 from django.contrib import messages
 from django.utils import timezone
 
 from apps.economy.models import DeltaCrownTransaction
-from apps.economy.services import wallet_for
+from apps.economy.services import ledger, wallet_for
 
 
 def _current_profile(user):
@@ -31,6 +30,21 @@ def _current_profile(user):
     return profile
 
 
+class _Echo:
+    """File-like object whose write() hands the CSV line back to the caller."""
+
+    def write(self, value):
+        return value
+
+
+def _day_bound(day: Optional[dt.date], *, end_of_day: bool = False) -> Optional[dt.datetime]:
+    """Inclusive datetime bound for a local calendar day, so the ledger index can be range-scanned."""
+    if day is None:
+        return None
+    moment = dt.datetime.combine(day, dt.time.max if end_of_day else dt.time.min)
+    return timezone.make_aware(moment)
+
+
 def _parse_date(val: Optional[str]) -> Optional[dt.date]:
     if not val:
         return None
@@ -62,68 +76,67 @@ def wallet_transactions_view(request: HttpRequest) -> HttpResponse:
       - reason: transaction reason (one of model choices)
       - start: YYYY-MM-DD (inclusive)
       - end: YYYY-MM-DD (inclusive)
-      - page: int (1-based)
-      - format=csv: export the filtered rows
+      - cursor: opaque position from the previous page's "Older" link
+      - format=csv: stream the filtered rows
     """
     profile = _current_profile(request.user)
     wallet = wallet_for(profile)
 
-    qs = (
-        DeltaCrownTransaction.objects.filter(wallet=wallet)
-        .select_related("tournament", "registration", "match")
-        .order_by("-created_at", "-id")
-    )
-
     # Filters
     reason = request.GET.get("reason") or ""
     reason_choices = [("", "All reasons")] + list(DeltaCrownTransaction.Reason.choices)
     valid_reasons = {k for k, _ in DeltaCrownTransaction.Reason.choices}
-    if reason and reason in valid_reasons:
-        qs = qs.filter(reason=reason)
+    if reason not in valid_reasons:
+        reason = ""
 
     start = _parse_date(request.GET.get("start"))
     end = _parse_date(request.GET.get("end"))
-    if start:
-        qs = qs.filter(created_at__date__gte=start)
-    if end:
-        qs = qs.filter(created_at__date__lte=end)
+    filters = {
+        "reason": reason or None,
+        "start_date": _day_bound(start),
+        "end_date": _day_bound(end, end_of_day=True),
+    }
 
     # CSV export
     if request.GET.get("format") == "csv":
-        resp = HttpResponse(content_type="text/csv; charset=utf-8")
+        def _rows():
+            buffer = _Echo()
+            writer = csv.writer(buffer)
+            yield writer.writerow(
+                ["created_at", "amount", "reason", "note", "tournament_id", "registration_id", "match_id", "idempotency_key"]
+            )
+            for tx in ledger.iter_ledger(wallet, **filters):
+                yield writer.writerow(
+                    [
+                        timezone.localtime(tx.created_at).strftime("%Y-%m-%d %H:%M"),
+                        tx.amount,
+                        tx.reason,
+                        tx.note or "",
+                        tx.tournament_id or "",
+                        tx.registration_id or "",
+                        tx.match_id or "",
+                        tx.idempotency_key or "",
+                    ]
+                )
+
+        resp = StreamingHttpResponse(_rows(), content_type="text/csv; charset=utf-8")
         filename = f"wallet_{profile.id}_{timezone.now().date().isoformat()}.csv"
         resp["Content-Disposition"] = f'attachment; filename="{filename}"'
-        writer = csv.writer(resp)
-        writer.writerow(
-            ["created_at", "amount", "reason", "note", "tournament", "registration_id", "match_id", "idempotency_key"]
-        )
-        for tx in qs.iterator():
-            writer.writerow(
-                [
-                    timezone.localtime(tx.created_at).strftime("%Y-%m-%d %H:%M"),
-                    tx.amount,
-                    tx.reason,
-                    tx.note or "",
-                    getattr(tx.tournament, "name", "") if tx.tournament_id else "",
-                    tx.registration_id or "",
-                    tx.match_id or "",
-                    tx.idempotency_key or "",
-                ]
-            )
         return resp
 
-    # Pagination
-    paginator = Paginator(qs, 20)
-    page_no = request.GET.get("page") or "1"
+    # Keyset pagination: an unknown or stale cursor starts from the newest line
+    cursor = request.GET.get("cursor") or None
     try:
-        page = paginator.page(page_no)
-    except EmptyPage:
-        page = paginator.page(paginator.num_pages or 1)
+        page = ledger.read_ledger(wallet, cursor=cursor, limit=20, **filters)
+    except ValueError:
+        cursor = None
+        page = ledger.read_ledger(wallet, limit=20, **filters)
 
     ctx = {
         "wallet": wallet,
-        "page_obj": page,
-        "paginator": paginator,
+        "transactions": page["transactions"],
+        "next_cursor": page["next_cursor"],
+        "is_first_page": cursor is None,
         "reason": reason,
         "reason_choices": reason_choices,
         "start": start.isoformat() if start else "",
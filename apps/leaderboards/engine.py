@@ -10,7 +10,8 @@ High-performance in-memory ranking computation with:
 Architecture:
     1. Compute rankings from Match results + LeaderboardEntry snapshots
     2. Track rank deltas (previous_rank â†’ current_rank)
-    3. Cache full rankings + deltas separately
+    3. Cache full rankings + deltas separately, packed into columnar blobs
+       (apps.leaderboards.packed) so hits decode only the rows they return
     4. Support partial updates (only affected participants after match/dispute)
 
 Feature Flags:
@@ -29,7 +30,7 @@ Performance Targets:
 IDs-Only Discipline:
     All outputs use participant_id, team_id, tournament_id (no PII).
 """
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Set, Tuple
 import logging
@@ -45,6 +46,7 @@ from apps.tournaments.models import Tournament, Match, Registration
 from apps.organizations.models import Team
 from apps.accounts.models import User
 from apps.leaderboards.metrics import record_leaderboard_request
+from apps.leaderboards.packed import PackedDeltas, PackedRankings
 
 
 logger = logging.getLogger(__name__)
@@ -143,7 +145,8 @@ class RankingResponseDTO:
     
     Attributes:
         scope: "tournament", "season", or "all_time"
-        rankings: List of ranked participants
+        rankings: List of ranked participants (a lazy PackedRankings
+            sequence on unlimited cache hits)
         deltas: List of rank changes (empty if no previous snapshot)
         metadata: Source, timing, counts
     """
@@ -221,6 +224,8 @@ class RankingEngine:
         compute_season_rankings(): Compute season leaderboard
         compute_all_time_rankings(): Compute all-time leaderboard
         compute_partial_update(): Recompute only affected participants
+        get_tournament_rank_window(): One rank range (e.g. top 50) from cache
+        get_tournament_rankings_around(): "Around me" rows from cache
         
     Ranking Rules (Battle Royale Tiebreakers):
         1. Points DESC (primary sort)
@@ -296,25 +301,24 @@ class RankingEngine:
         
         # Check cache first
         if use_cache and self.cache_enabled:
-            cache_key_rankings = _get_engine_cache_key_rankings("tournament", tournament_id)
-            cache_key_deltas = _get_engine_cache_key_deltas("tournament", tournament_id)
+            cached = self._read_cache("tournament", tournament_id)
             
-            cached_rankings = cache.get(cache_key_rankings)
-            cached_deltas = cache.get(cache_key_deltas)
-            
-            if cached_rankings and cached_deltas:
+            if cached:
+                cached_rankings, cached_deltas = cached
+                rankings, deltas = self._limit_cached(cached_rankings, cached_deltas, limit)
                 duration_ms = int((time.time() - start_time) * 1000)
                 logger.info(f"Engine V2 cache HIT for tournament {tournament_id} ({duration_ms}ms)")
                 
                 return RankingResponseDTO(
                     scope="tournament",
-                    rankings=[RankedParticipantDTO(**r) for r in cached_rankings],
-                    deltas=[RankDeltaDTO(**d) for d in cached_deltas],
+                    rankings=rankings,
+                    deltas=deltas,
                     metadata={
                         "tournament_id": tournament_id,
                         "source": "cache",
                         "cache_hit": True,
-                        "count": len(cached_rankings),
+                        "count": len(rankings),
+                        "total_count": len(cached_rankings),
                         "duration_ms": duration_ms,
                     }
                 )
@@ -351,6 +355,11 @@ class RankingEngine:
         # Compute deltas
         deltas = self._compute_deltas(rankings, previous_rankings)
         
+        # Write to cache (always the full board; limit only trims the response)
+        if self.cache_enabled:
+            self._write_cache("tournament", tournament_id, rankings, deltas, timeout=self.cache_ttl)
+            logger.info(f"Cached {len(rankings)} rankings + {len(deltas)} deltas (TTL={self.cache_ttl}s)")
+        
         # Apply limit if specified
         if limit:
             rankings = rankings[:limit]
@@ -363,23 +372,6 @@ class RankingEngine:
                 if (d.participant_id, d.team_id) in limited_ids
             ]
         
-        # Write to cache
-        if self.cache_enabled:
-            cache_key_rankings = _get_engine_cache_key_rankings("tournament", tournament_id)
-            cache_key_deltas = _get_engine_cache_key_deltas("tournament", tournament_id)
-            
-            cache.set(
-                cache_key_rankings,
-                [asdict(r) for r in rankings],
-                timeout=self.cache_ttl
-            )
-            cache.set(
-                cache_key_deltas,
-                [asdict(d) for d in deltas],
-                timeout=self.cache_ttl
-            )
-            logger.info(f"Cached {len(rankings)} rankings + {len(deltas)} deltas (TTL={self.cache_ttl}s)")
-        
         duration_ms = int((time.time() - start_time) * 1000)
         logger.info(f"Computed tournament {tournament_id} rankings in {duration_ms}ms ({len(rankings)} participants)")
         
@@ -456,26 +448,25 @@ class RankingEngine:
         # Check cache
         cache_key_id = f"{season_id}:{game_code}"
         if use_cache and self.cache_enabled:
-            cache_key_rankings = _get_engine_cache_key_rankings("season", cache_key_id)
-            cache_key_deltas = _get_engine_cache_key_deltas("season", cache_key_id)
-            
-            cached_rankings = cache.get(cache_key_rankings)
-            cached_deltas = cache.get(cache_key_deltas)
+            cached = self._read_cache("season", cache_key_id)
             
-            if cached_rankings and cached_deltas:
+            if cached:
+                cached_rankings, cached_deltas = cached
+                rankings, deltas = self._limit_cached(cached_rankings, cached_deltas, limit)
                 duration_ms = int((time.time() - start_time) * 1000)
                 logger.info(f"Engine V2 cache HIT for season {season_id}/{game_code} ({duration_ms}ms)")
                 
                 return RankingResponseDTO(
                     scope="season",
-                    rankings=[RankedParticipantDTO(**r) for r in cached_rankings],
-                    deltas=[RankDeltaDTO(**d) for d in cached_deltas],
+                    rankings=rankings,
+                    deltas=deltas,
                     metadata={
                         "season_id": season_id,
                         "game_code": game_code,
                         "source": "cache",
                         "cache_hit": True,
-                        "count": len(cached_rankings),
+                        "count": len(rankings),
+                        "total_count": len(cached_rankings),
                         "duration_ms": duration_ms,
                     }
                 )
@@ -494,21 +485,17 @@ class RankingEngine:
         # Compute deltas
         deltas = self._compute_deltas(rankings, previous_rankings)
         
+        # Write to cache (1-hour TTL for season; full board, limit trims the response)
+        if self.cache_enabled:
+            self._write_cache("season", cache_key_id, rankings, deltas, timeout=3600)
+            logger.info(f"Cached {len(rankings)} season rankings (TTL=3600s)")
+        
         # Apply limit
         if limit:
             rankings = rankings[:limit]
             limited_ids = {(r.participant_id, r.team_id) for r in rankings}
             deltas = [d for d in deltas if (d.participant_id, d.team_id) in limited_ids]
         
-        # Write to cache (1-hour TTL for season)
-        if self.cache_enabled:
-            cache_key_rankings = _get_engine_cache_key_rankings("season", cache_key_id)
-            cache_key_deltas = _get_engine_cache_key_deltas("season", cache_key_id)
-            
-            cache.set(cache_key_rankings, [asdict(r) for r in rankings], timeout=3600)
-            cache.set(cache_key_deltas, [asdict(d) for d in deltas], timeout=3600)
-            logger.info(f"Cached {len(rankings)} season rankings (TTL=3600s)")
-        
         duration_ms = int((time.time() - start_time) * 1000)
         logger.info(f"Computed season {season_id}/{game_code} rankings in {duration_ms}ms ({len(rankings)} participants)")
         
@@ -746,11 +733,7 @@ class RankingEngine:
         
         # Update cache
         if self.cache_enabled:
-            cache_key_rankings = _get_engine_cache_key_rankings("tournament", tournament_id)
-            cache_key_deltas = _get_engine_cache_key_deltas("tournament", tournament_id)
-            
-            cache.set(cache_key_rankings, [asdict(r) for r in rankings], timeout=self.cache_ttl)
-            cache.set(cache_key_deltas, [asdict(d) for d in deltas], timeout=self.cache_ttl)
+            self._write_cache("tournament", tournament_id, rankings, deltas, timeout=self.cache_ttl)
         
         duration_ms = int((time.time() - start_time) * 1000)
         logger.info(f"Partial update complete in {duration_ms}ms ({len(deltas)} affected participants)")
@@ -769,10 +752,118 @@ class RankingEngine:
             }
         )
     
+    def get_tournament_rank_window(
+        self,
+        tournament_id: int,
+        start_rank: int = 1,
+        end_rank: int = 50
+    ) -> List[RankedParticipantDTO]:
+        """
+        Return ranks ``start_rank..end_rank`` (inclusive) of a tournament.
+        
+        On a cache hit only the rows inside the window are materialized,
+        so page 1 of a 10k-row board builds 50 DTOs, not 10k.
+        
+        Examples:
+            >>> RankingEngine().get_tournament_rank_window(123, 1, 50)
+        """
+        packed = self._packed_tournament_rankings(tournament_id)
+        if packed is not None:
+            return packed.rank_range(start_rank, end_rank)
+        rankings = self.compute_tournament_rankings(tournament_id, use_cache=False).rankings
+        return [r for r in rankings if start_rank <= r.rank <= end_rank]
+    
+    def get_tournament_rankings_around(
+        self,
+        tournament_id: int,
+        participant_id: Optional[int] = None,
+        team_id: Optional[int] = None,
+        radius: int = 5
+    ) -> List[RankedParticipantDTO]:
+        """
+        Return a participant's (or team's) row plus ``radius`` rows either side.
+        
+        Uses the packed participant/team index (binary search) on a cache
+        hit. Returns [] when the participant is not ranked.
+        
+        Examples:
+            >>> RankingEngine().get_tournament_rankings_around(123, participant_id=456)
+        """
+        packed = self._packed_tournament_rankings(tournament_id)
+        if packed is not None:
+            return packed.around(participant_id=participant_id, team_id=team_id, radius=radius)
+        rankings = list(self.compute_tournament_rankings(tournament_id, use_cache=False).rankings)
+        for position, r in enumerate(rankings):
+            if (participant_id is not None and r.participant_id == participant_id) or (
+                participant_id is None and team_id is not None and r.team_id == team_id
+            ):
+                return rankings[max(0, position - radius):position + radius + 1]
+        return []
+    
     # ========================================================================
     # Internal Helper Methods
     # ========================================================================
     
+    def _read_cache(
+        self,
+        scope: str,
+        ref_id: Any
+    ) -> Optional[Tuple[PackedRankings, PackedDeltas]]:
+        """
+        Load packed rankings + deltas for a scope (no DTOs built).
+        
+        Returns None on a miss, on an empty board, or when the cached value
+        is not in the packed format (e.g. written by an older release).
+        """
+        cached = cache.get_many([
+            _get_engine_cache_key_rankings(scope, ref_id),
+            _get_engine_cache_key_deltas(scope, ref_id),
+        ])
+        rankings = PackedRankings.load(cached.get(_get_engine_cache_key_rankings(scope, ref_id)))
+        deltas = PackedDeltas.load(cached.get(_get_engine_cache_key_deltas(scope, ref_id)))
+        if not rankings or deltas is None:
+            return None
+        return rankings, deltas
+    
+    def _write_cache(
+        self,
+        scope: str,
+        ref_id: Any,
+        rankings: List[RankedParticipantDTO],
+        deltas: List[RankDeltaDTO],
+        timeout: int
+    ) -> None:
+        """Store rankings + deltas as packed columnar blobs."""
+        cache.set_many(
+            {
+                _get_engine_cache_key_rankings(scope, ref_id): PackedRankings.pack(rankings),
+                _get_engine_cache_key_deltas(scope, ref_id): PackedDeltas.pack(deltas),
+            },
+            timeout=timeout,
+        )
+    
+    def _limit_cached(
+        self,
+        rankings: PackedRankings,
+        deltas: PackedDeltas,
+        limit: Optional[int]
+    ):
+        """Apply ``limit`` to a cache hit, materializing only the kept rows."""
+        if not limit:
+            return rankings, deltas
+        limited = rankings[:limit]
+        max_rank = limited[-1].rank if limited else 0
+        return limited, deltas.up_to_rank(max_rank)
+    
+    def _packed_tournament_rankings(self, tournament_id: int) -> Optional[PackedRankings]:
+        if not self.engine_enabled:
+            return None
+        if self.cache_enabled:
+            cached = self._read_cache("tournament", tournament_id)
+            if cached:
+                return cached[0]
+        return None
+    
     def _aggregate_tournament_stats(
         self,
         tournament_id: int,
@@ -1083,15 +1174,12 @@ class RankingEngine:
         Returns:
             Dict mapping (participant_id, team_id) -> previous_rank
         """
-        # Try cache first
+        # Try cache first (rank column only, no DTOs built)
         cache_key = _get_engine_cache_key_rankings(scope, ref_id)
-        cached = cache.get(cache_key)
+        cached = PackedRankings.load(cache.get(cache_key))
         
         if cached:
-            return {
-                (r["participant_id"], r["team_id"]): r["rank"]
-                for r in cached
-            }
+            return cached.rank_map()
         
         # Fallback: Query latest snapshot
         filters = Q(leaderboard_type=scope)
@@ -8,8 +8,6 @@ Listens to MatchCompletedEvent and updates user/team statistics + match history
 """
 
 import logging
-from typing import Optional
-from django.utils import timezone
 
 from apps.common.events import event_handler, Event
 from apps.core.events.events import MatchCompletedEvent
@@ -22,11 +20,15 @@ def handle_match_completed_for_stats(event: MatchCompletedEvent):
     """
     Handle MatchCompletedEvent to update user and team stats + match history.
     
-    Extracts match data from event and updates:
+    Updates, via the batch applier in ``apps.leaderboards.stats_batch``:
     - User stats (Epic 8.2) - for individual matches
     - Team stats + ELO ratings (Epic 8.3) - for team matches
     - Match history (Epic 8.4) - timeline records for users and teams
     
+    Inside a transaction the match is buffered and applied together with the
+    transaction's other completed matches on commit. Re-delivered events for
+    an already recorded match are ignored.
+    
     Args:
         event: MatchCompletedEvent instance
         
@@ -35,317 +37,9 @@ def handle_match_completed_for_stats(event: MatchCompletedEvent):
     logger.info(f"Processing MatchCompletedEvent for stats: match_id={event.match_id}")
     
     try:
-        # Import service faÃ§ade and DTOs
-        from apps.tournament_ops.services.tournament_ops_service import get_tournament_ops_service
-        from apps.tournament_ops.dtos import MatchStatsUpdateDTO, TeamMatchStatsUpdateDTO
-        
-        # Extract match data from event
-        match_id = event.match_id
-        winner_id = event.winner_id
-        
-        # Get match details to extract participants and stats
-        # Method-level ORM import for match data
-        from apps.tournaments.models import Match
-        
-        try:
-            match = Match.objects.select_related('tournament', 'participant1', 'participant2').get(id=match_id)
-        except Match.DoesNotExist:
-            logger.error(f"Match {match_id} not found, cannot update stats")
-            return
-        
-        # Get game slug from tournament
-        game_slug = match.tournament.game_slug if hasattr(match.tournament, 'game_slug') else 'unknown'
-        
-        # Determine if this is a team match or individual match
-        is_team_match = False
-        team1_id = None
-        team2_id = None
-        
-        # Check if participants are teams
-        if match.participant1 and hasattr(match.participant1, 'captain_id'):
-            # Participant1 is a team
-            is_team_match = True
-            team1_id = match.participant1.id
-        
-        if match.participant2 and hasattr(match.participant2, 'captain_id'):
-            # Participant2 is a team
-            is_team_match = True
-            team2_id = match.participant2.id
-        
-        service = get_tournament_ops_service()
-        
-        # Determine winner/loser
-        is_draw = winner_id is None
-        
-        if is_team_match and team1_id and team2_id:
-            # ===== TEAM MATCH: Update team stats + ELO ratings =====
-            logger.info(f"Processing team match {match_id}: {team1_id} vs {team2_id}")
-            
-            team1_won = winner_id == match.participant1_id if not is_draw else False
-            team2_won = winner_id == match.participant2_id if not is_draw else False
-            
-            # Get current ELO ratings for both teams (needed for calculations)
-            team1_ranking = service.get_team_ranking(team1_id, game_slug)
-            team2_ranking = service.get_team_ranking(team2_id, game_slug)
-            
-            team1_elo = team1_ranking.elo_rating if team1_ranking else 1200
-            team2_elo = team2_ranking.elo_rating if team2_ranking else 1200
-            
-            # Create stats update DTOs for both teams
-            team1_update = TeamMatchStatsUpdateDTO(
-                team_id=team1_id,
-                game_slug=game_slug,
-                is_winner=team1_won,
-                is_draw=is_draw,
-                opponent_team_id=team2_id,
-                opponent_elo=team2_elo,
-                match_id=match_id,
-            )
-            
-            team2_update = TeamMatchStatsUpdateDTO(
-                team_id=team2_id,
-                game_slug=game_slug,
-                is_winner=team2_won,
-                is_draw=is_draw,
-                opponent_team_id=team1_id,
-                opponent_elo=team1_elo,
-                match_id=match_id,
-            )
-            
-            # Update team 1 stats + ELO
-            try:
-                result1 = service.update_team_stats_from_match(team1_update)
-                logger.info(
-                    f"Updated team {team1_id} stats: "
-                    f"ELO {team1_elo} â†’ {result1['ranking'].elo_rating} "
-                    f"({result1['elo_change']:+d})"
-                )
-            except Exception as e:
-                logger.error(f"Failed to update stats for team {team1_id}: {str(e)}")
-            
-            # Update team 2 stats + ELO
-            try:
-                result2 = service.update_team_stats_from_match(team2_update)
-                logger.info(
-                    f"Updated team {team2_id} stats: "
-                    f"ELO {team2_elo} â†’ {result2['ranking'].elo_rating} "
-                    f"({result2['elo_change']:+d})"
-                )
-            except Exception as e:
-                logger.error(f"Failed to update stats for team {team2_id}: {str(e)}")
-            
-            # ===== RECORD TEAM MATCH HISTORY (Epic 8.4) =====
-            try:
-                # Get opponent team names for history
-                team1_name = match.participant1.name if match.participant1 else "Unknown"
-                team2_name = match.participant2.name if match.participant2 else "Unknown"
-                
-                # Get score summary if available
-                score_summary = ""
-                if hasattr(match, 'final_score') and match.final_score:
-                    score_summary = match.final_score
-                
-                # Check if match had dispute
-                had_dispute = hasattr(match, 'had_dispute') and match.had_dispute
-                is_forfeit = hasattr(match, 'is_forfeit') and match.is_forfeit
-                
-                # Get completed_at timestamp
-                completed_at = match.completed_at if hasattr(match, 'completed_at') else timezone.now()
-                
-                # Record history for team 1
-                service.record_team_match_history(
-                    team_id=team1_id,
-                    match_id=match_id,
-                    tournament_id=match.tournament_id,
-                    game_slug=game_slug,
-                    is_winner=team1_won,
-                    is_draw=is_draw,
-                    opponent_team_id=team2_id,
-                    opponent_team_name=team2_name,
-                    score_summary=score_summary,
-                    elo_before=team1_elo,
-                    elo_after=result1['ranking'].elo_rating if 'result1' in locals() else None,
-                    elo_change=result1['elo_change'] if 'result1' in locals() else 0,
-                    had_dispute=had_dispute,
-                    is_forfeit=is_forfeit,
-                    completed_at=completed_at,
-                )
-                
-                # Record history for team 2
-                service.record_team_match_history(
-                    team_id=team2_id,
-                    match_id=match_id,
-                    tournament_id=match.tournament_id,
-                    game_slug=game_slug,
-                    is_winner=team2_won,
-                    is_draw=is_draw,
-                    opponent_team_id=team1_id,
-                    opponent_team_name=team1_name,
-                    score_summary=score_summary,
-                    elo_before=team2_elo,
-                    elo_after=result2['ranking'].elo_rating if 'result2' in locals() else None,
-                    elo_change=result2['elo_change'] if 'result2' in locals() else 0,
-                    had_dispute=had_dispute,
-                    is_forfeit=is_forfeit,
-                    completed_at=completed_at,
-                )
-                
-                logger.info(f"Successfully recorded match history for team match {match_id}")
-            except Exception as e:
-                logger.error(f"Failed to record match history for team match {match_id}: {str(e)}")
-            
-            logger.info(f"Successfully processed team match stats (match {match_id})")
-        
-        else:
-            # ===== INDIVIDUAL MATCH: Update user stats (Epic 8.2) =====
-            participant1_user_id = None
-            participant2_user_id = None
-            
-            # Extract user IDs from participants
-            if match.participant1:
-                if hasattr(match.participant1, 'id'):
-                    participant1_user_id = match.participant1.id
-            
-            if match.participant2:
-                if hasattr(match.participant2, 'id'):
-                    participant2_user_id = match.participant2.id
-            
-            if not participant1_user_id or not participant2_user_id:
-                logger.warning(f"Could not extract user IDs from match {match_id}, skipping stats update")
-                return
-            
-            participant1_won = winner_id == match.participant1_id if not is_draw else False
-            participant2_won = winner_id == match.participant2_id if not is_draw else False
-            
-            # Extract K/D stats if available (game-specific)
-            participant1_kills = 0
-            participant1_deaths = 0
-            participant2_kills = 0
-            participant2_deaths = 0
-            participant1_assists = 0
-            participant2_assists = 0
-            
-            if hasattr(match, 'result_data') and match.result_data:
-                result_data = match.result_data
-                if isinstance(result_data, dict):
-                    participant1_kills = result_data.get('participant1_kills', 0)
-                    participant1_deaths = result_data.get('participant1_deaths', 0)
-                    participant2_kills = result_data.get('participant2_kills', 0)
-                    participant2_deaths = result_data.get('participant2_deaths', 0)
-                    participant1_assists = result_data.get('participant1_assists', 0)
-                    participant2_assists = result_data.get('participant2_assists', 0)
-            
-            # Get completed_at timestamp
-            match_completed_at = match.completed_at if hasattr(match, 'completed_at') else timezone.now()
-            
-            # Create stats update DTOs for both participants
-            # Update participant 1 stats
-            update1 = MatchStatsUpdateDTO(
-                user_id=participant1_user_id,
-                game_slug=game_slug,
-                tournament_id=match.tournament_id,
-                match_id=match_id,
-                is_winner=participant1_won,
-                is_draw=is_draw,
-                kills=participant1_kills,
-                deaths=participant1_deaths,
-                match_completed_at=match_completed_at,
-            )
-            
-            try:
-                service.update_user_stats_from_match(update1)
-                logger.info(f"Updated stats for user {participant1_user_id} (match {match_id})")
-            except Exception as e:
-                logger.error(f"Failed to update stats for user {participant1_user_id}: {str(e)}")
-            
-            # Update participant 2 stats
-            update2 = MatchStatsUpdateDTO(
-                user_id=participant2_user_id,
-                game_slug=game_slug,
-                tournament_id=match.tournament_id,
-                match_id=match_id,
-                is_winner=participant2_won,
-                is_draw=is_draw,
-                kills=participant2_kills,
-                deaths=participant2_deaths,
-                match_completed_at=match_completed_at,
-            )
-            
-            try:
-                service.update_user_stats_from_match(update2)
-                logger.info(f"Updated stats for user {participant2_user_id} (match {match_id})")
-            except Exception as e:
-                logger.error(f"Failed to update stats for user {participant2_user_id}: {str(e)}")
-            
-            # ===== RECORD USER MATCH HISTORY (Epic 8.4) =====
-            try:
-                # Get opponent names for history
-                participant1_name = "Unknown"
-                participant2_name = "Unknown"
-                
-                if match.participant1 and hasattr(match.participant1, 'username'):
-                    participant1_name = match.participant1.username
-                elif match.participant1 and hasattr(match.participant1, 'get_username'):
-                    participant1_name = match.participant1.get_username()
-                
-                if match.participant2 and hasattr(match.participant2, 'username'):
-                    participant2_name = match.participant2.username
-                elif match.participant2 and hasattr(match.participant2, 'get_username'):
-                    participant2_name = match.participant2.get_username()
-                
-                # Get score summary if available
-                score_summary = ""
-                if hasattr(match, 'final_score') and match.final_score:
-                    score_summary = match.final_score
-                
-                # Check if match had dispute
-                had_dispute = hasattr(match, 'had_dispute') and match.had_dispute
-                is_forfeit = hasattr(match, 'is_forfeit') and match.is_forfeit
-                
-                # Record history for participant 1
-                service.record_user_match_history(
-                    user_id=participant1_user_id,
-                    match_id=match_id,
-                    tournament_id=match.tournament_id,
-                    game_slug=game_slug,
-                    is_winner=participant1_won,
-                    is_draw=is_draw,
-                    opponent_user_id=participant2_user_id,
-                    opponent_name=participant2_name,
-                    score_summary=score_summary,
-                    kills=participant1_kills,
-                    deaths=participant1_deaths,
-                    assists=participant1_assists,
-                    had_dispute=had_dispute,
-                    is_forfeit=is_forfeit,
-                    completed_at=match_completed_at,
-                )
-                
-                # Record history for participant 2
-                service.record_user_match_history(
-                    user_id=participant2_user_id,
-                    match_id=match_id,
-                    tournament_id=match.tournament_id,
-                    game_slug=game_slug,
-                    is_winner=participant2_won,
-                    is_draw=is_draw,
-                    opponent_user_id=participant1_user_id,
-                    opponent_name=participant1_name,
-                    score_summary=score_summary,
-                    kills=participant2_kills,
-                    deaths=participant2_deaths,
-                    assists=participant2_assists,
-                    had_dispute=had_dispute,
-                    is_forfeit=is_forfeit,
-                    completed_at=match_completed_at,
-                )
-                
-                logger.info(f"Successfully recorded match history for user match {match_id}")
-            except Exception as e:
-                logger.error(f"Failed to record match history for user match {match_id}: {str(e)}")
-            
-            logger.info(f"Successfully processed user match stats (match {match_id})")
+        from apps.leaderboards.stats_batch import queue_completed_match
         
+        queue_completed_match(event)
     except Exception as e:
         logger.error(f"Error processing MatchCompletedEvent for stats: {str(e)}", exc_info=True)
         # Don't raise - event handler failures should not break the event system
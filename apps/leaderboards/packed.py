@@ -0,0 +1,322 @@
+"""
+Packed (columnar) cache format for RankingEngine results.
+
+Engine V2 used to cache rankings and deltas as lists of ``asdict()`` dicts;
+every cache hit unpickled N dicts and rebuilt N DTOs even when the caller
+only needed the top 50. Here each field is one native-order int64 or
+int32 column in a single ``bytes`` blob (the web/worker fleet shares one
+architecture, so no byte swapping is done):
+
+    header (16 bytes) | int64 columns ... | int32 columns ...
+
+Wide columns come first so every column starts on its own item boundary.
+
+Reading wraps the blob in ``memoryview.cast`` views — no per-row decoding
+happens until a row is indexed — so a cache hit costs one memcpy of the
+blob plus whatever rows are actually materialized.
+
+- ``PackedRankings`` is a read-only Sequence of RankedParticipantDTO.
+  Ranks are ascending, so a rank range is located by bisection and only the
+  rows inside it are built. Two positional indexes sorted by participant_id
+  and team_id answer "where is player X" in O(log n) for "around me" views.
+- ``PackedDeltas`` is the same for RankDeltaDTO.
+
+Encoding conventions (IDs-only, no PII):
+    - ``None`` ids / previous ranks are stored as 0 (ids and ranks are >= 1)
+    - datetimes are stored as UTC microseconds since the epoch;
+      ``None`` is stored as INT64 min
+    - ``win_rate`` is not stored; it is derived from wins / matches_played
+      exactly as RankingEngine._apply_ranking_rules computes it
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import struct
+
+
+MAGIC = b"LBP1"
+KIND_RANKINGS = 1
+KIND_DELTAS = 2
+
+# magic, kind, 3 pad bytes, row count -> 16 bytes keeps the int64 columns aligned
+_HEADER = struct.Struct("<4sB3xQ")
+
+_ITEMSIZE = {typecode: array(typecode).itemsize for typecode in "qi"}
+
+NONE_ID = 0
+NONE_TIME = -(2 ** 63)
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+class PackedFormatError(ValueError):
+    """Raised when a cached blob is not a packed table of the expected kind."""
+
+
+@lru_cache(maxsize=1)
+def _dto_classes():
+    # engine.py imports this module, so resolve the DTOs lazily
+    from apps.leaderboards.engine import RankDeltaDTO, RankedParticipantDTO
+    return RankedParticipantDTO, RankDeltaDTO
+
+
+def _encode_time(value: Optional[datetime]) -> int:
+    if value is None:
+        return NONE_TIME
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_timezone.utc)
+    delta = value - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _decode_time(value: int) -> Optional[datetime]:
+    if value == NONE_TIME:
+        return None
+    return EPOCH + timedelta(microseconds=value)
+
+
+def _encode_id(value: Optional[int]) -> int:
+    return NONE_ID if value is None else int(value)
+
+
+def _decode_id(value: int) -> Optional[int]:
+    return None if value == NONE_ID else value
+
+
+class _PackedTable(Sequence):
+    """Read-only columnar table over a packed ``bytes`` blob."""
+
+    KIND: int = 0
+    # (column name, array typecode): 'q' (int64) columns before 'i' (int32)
+    COLUMNS: Tuple[Tuple[str, str], ...] = ()
+
+    def __init__(self, blob: bytes):
+        if not isinstance(blob, (bytes, bytearray, memoryview)) or len(blob) < _HEADER.size:
+            raise PackedFormatError("not a packed leaderboard table")
+        magic, kind, count = _HEADER.unpack_from(blob, 0)
+        if magic != MAGIC or kind != self.KIND:
+            raise PackedFormatError(f"unexpected packed table (magic={magic!r}, kind={kind})")
+        if len(blob) != _HEADER.size + count * self._row_width():
+            raise PackedFormatError("truncated packed leaderboard table")
+
+        self._blob = blob
+        self._count = count
+        view = memoryview(blob)
+        self._columns: Dict[str, memoryview] = {}
+        offset = _HEADER.size
+        for name, typecode in self.COLUMNS:
+            end = offset + count * _ITEMSIZE[typecode]
+            self._columns[name] = view[offset:end].cast(typecode)
+            offset = end
+
+    @classmethod
+    def _row_width(cls) -> int:
+        return sum(_ITEMSIZE[typecode] for _, typecode in cls.COLUMNS)
+
+    @classmethod
+    def _pack_columns(cls, count: int, columns: Dict[str, array]) -> bytes:
+        parts = [_HEADER.pack(MAGIC, cls.KIND, count)]
+        for name, typecode in cls.COLUMNS:
+            column = columns[name]
+            if column.typecode != typecode or len(column) != count:
+                raise PackedFormatError(f"column {name} does not match the table layout")
+            parts.append(column.tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def load(cls, blob: Any) -> Optional["_PackedTable"]:
+        """Wrap a cached value, or return None if it is missing / not packed."""
+        if blob is None:
+            return None
+        try:
+            return cls(blob)
+        except PackedFormatError:
+            return None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("packed table index out of range")
+        return self._row(index)
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._row(i)
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def column(self, name: str) -> memoryview:
+        """Raw column view (no DTOs built)."""
+        return self._columns[name]
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._blob)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._blob)
+
+    def _row(self, index: int):
+        raise NotImplementedError
+
+
+class PackedRankings(_PackedTable):
+    """Packed RankedParticipantDTO rows in rank order."""
+
+    KIND = KIND_RANKINGS
+    COLUMNS = (
+        ("participant_id", "q"),
+        ("team_id", "q"),
+        ("earliest_win", "q"),
+        ("last_updated", "q"),
+        ("rank", "i"),
+        ("points", "i"),
+        ("kills", "i"),
+        ("wins", "i"),
+        ("losses", "i"),
+        ("matches_played", "i"),
+        # positions sorted by participant_id / team_id ("around me" lookups)
+        ("by_participant", "i"),
+        ("by_team", "i"),
+    )
+
+    @classmethod
+    def pack(cls, rankings: Iterable[Any]) -> bytes:
+        """Pack RankedParticipantDTOs (already in rank order)."""
+        columns = {name: array(typecode) for name, typecode in cls.COLUMNS}
+        count = 0
+        for r in rankings:
+            columns["rank"].append(r.rank)
+            columns["participant_id"].append(_encode_id(r.participant_id))
+            columns["team_id"].append(_encode_id(r.team_id))
+            columns["points"].append(int(r.points or 0))
+            columns["kills"].append(int(r.kills or 0))
+            columns["wins"].append(int(r.wins or 0))
+            columns["losses"].append(int(r.losses or 0))
+            columns["matches_played"].append(int(r.matches_played or 0))
+            columns["earliest_win"].append(_encode_time(r.earliest_win))
+            columns["last_updated"].append(_encode_time(r.last_updated))
+            count += 1
+
+        participant_ids = columns["participant_id"]
+        team_ids = columns["team_id"]
+        columns["by_participant"] = array("i", sorted(range(count), key=participant_ids.__getitem__))
+        columns["by_team"] = array("i", sorted(range(count), key=team_ids.__getitem__))
+        return cls._pack_columns(count, columns)
+
+    def _row(self, index: int):
+        RankedParticipantDTO, _ = _dto_classes()
+        c = self._columns
+        wins = c["wins"][index]
+        matches_played = c["matches_played"][index]
+        return RankedParticipantDTO(
+            rank=c["rank"][index],
+            participant_id=_decode_id(c["participant_id"][index]),
+            team_id=_decode_id(c["team_id"][index]),
+            points=c["points"][index],
+            kills=c["kills"][index],
+            wins=wins,
+            losses=c["losses"][index],
+            matches_played=matches_played,
+            earliest_win=_decode_time(c["earliest_win"][index]),
+            win_rate=(wins / matches_played * 100) if matches_played > 0 else 0.0,
+            last_updated=_decode_time(c["last_updated"][index]),
+        )
+
+    def rank_range(self, start_rank: int, end_rank: int) -> List[Any]:
+        """DTOs with ``start_rank <= rank <= end_rank`` (inclusive)."""
+        ranks = self._columns["rank"]
+        lo = bisect_left(ranks, start_rank)
+        hi = bisect_right(ranks, end_rank, lo=lo)
+        return self[lo:hi]
+
+    def position_of(self, participant_id: Optional[int] = None, team_id: Optional[int] = None) -> Optional[int]:
+        """Row position of a participant/team, or None if not ranked."""
+        if participant_id is not None:
+            values, order, target = self._columns["participant_id"], self._columns["by_participant"], participant_id
+        elif team_id is not None:
+            values, order, target = self._columns["team_id"], self._columns["by_team"], team_id
+        else:
+            return None
+        i = bisect_left(order, int(target), key=lambda position: values[position])
+        if i < len(order) and values[order[i]] == target:
+            return order[i]
+        return None
+
+    def around(
+        self,
+        participant_id: Optional[int] = None,
+        team_id: Optional[int] = None,
+        radius: int = 5,
+    ) -> List[Any]:
+        """The participant's row plus ``radius`` rows above and below."""
+        position = self.position_of(participant_id=participant_id, team_id=team_id)
+        if position is None:
+            return []
+        return self[max(0, position - radius):position + radius + 1]
+
+    def rank_map(self) -> Dict[Tuple[Optional[int], Optional[int]], int]:
+        """(participant_id, team_id) -> rank without building DTOs."""
+        c = self._columns
+        participant_ids, team_ids, ranks = c["participant_id"].tolist(), c["team_id"].tolist(), c["rank"].tolist()
+        return {
+            (_decode_id(p), _decode_id(t)): rank
+            for p, t, rank in zip(participant_ids, team_ids, ranks)
+        }
+
+
+class PackedDeltas(_PackedTable):
+    """Packed RankDeltaDTO rows."""
+
+    KIND = KIND_DELTAS
+    COLUMNS = (
+        ("participant_id", "q"),
+        ("team_id", "q"),
+        ("last_updated", "q"),
+        ("previous_rank", "i"),
+        ("current_rank", "i"),
+        ("rank_change", "i"),
+        ("points", "i"),
+    )
+
+    @classmethod
+    def pack(cls, deltas: Iterable[Any]) -> bytes:
+        columns = {name: array(typecode) for name, typecode in cls.COLUMNS}
+        count = 0
+        for d in deltas:
+            columns["participant_id"].append(_encode_id(d.participant_id))
+            columns["team_id"].append(_encode_id(d.team_id))
+            columns["previous_rank"].append(_encode_id(d.previous_rank))
+            columns["current_rank"].append(d.current_rank)
+            columns["rank_change"].append(int(d.rank_change or 0))
+            columns["points"].append(int(d.points or 0))
+            columns["last_updated"].append(_encode_time(d.last_updated))
+            count += 1
+        return cls._pack_columns(count, columns)
+
+    def _row(self, index: int):
+        _, RankDeltaDTO = _dto_classes()
+        c = self._columns
+        return RankDeltaDTO(
+            participant_id=_decode_id(c["participant_id"][index]),
+            team_id=_decode_id(c["team_id"][index]),
+            previous_rank=_decode_id(c["previous_rank"][index]),
+            current_rank=c["current_rank"][index],
+            rank_change=c["rank_change"][index],
+            points=c["points"][index],
+            last_updated=_decode_time(c["last_updated"][index]),
+        )
+
+    def up_to_rank(self, max_rank: int) -> List[Any]:
+        """Deltas whose current rank is within the top ``max_rank``."""
+        current = self._columns["current_rank"]
+        return [self._row(i) for i in range(self._count) if current[i] <= max_rank]
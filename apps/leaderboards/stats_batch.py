@@ -0,0 +1,371 @@
+"""
+Batched application of completed matches to stats, ELO and match history.
+
+Phase 8, Epic 8.2/8.3/8.4 stats used to be applied one MatchCompletedEvent
+at a time: re-fetch the match, read both rankings, two stats/ELO updates
+(each a get_or_create plus F() writes plus a re-read) and two history
+get_or_creates. Confirming a 256-match round cost thousands of sequential
+queries.
+
+``apply_completed_matches(events)`` handles any number of matches with a
+fixed number of queries inside one transaction:
+
+1. Lock the matches (``SELECT ... FOR UPDATE`` in id order) and drop every
+   match that already has history rows — history is the per-match
+   idempotency marker, so replays and duplicate events are no-ops.
+2. Group the remaining matches by (team, game) or (user, game), make sure a
+   stats / ranking row exists for every key (``INSERT ... ON CONFLICT DO
+   NOTHING``) and load them all ``FOR UPDATE``.
+3. Apply the matches in memory in deterministic order (completed_at, then
+   match id). ELO for both sides is computed from the pre-match ratings,
+   as TeamStatsService.calculate_elo_change does for a single match, so a
+   batch produces exactly the ratings of applying the same matches one by
+   one in that order.
+4. Write everything back with one bulk statement per table.
+
+Team vs individual matches follow ``Tournament.participation_type``:
+participant ids are team ids for team tournaments and user ids otherwise.
+
+Inside a transaction, ``queue_completed_match`` buffers matches and applies
+them once on commit (apps.common.commit_buffer), so a
+bulk result confirmation publishing one event per match still results in a
+single batch.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.common.commit_buffer import OnCommitBuffer
+
+logger = logging.getLogger(__name__)
+
+_TWO_PLACES = Decimal("0.01")
+
+
+@dataclass
+class BatchStatsResult:
+    """Outcome of one ``apply_completed_matches`` call."""
+
+    applied: List[int] = field(default_factory=list)
+    already_applied: List[int] = field(default_factory=list)
+    skipped: List[int] = field(default_factory=list)
+
+
+def _completion(item: Any) -> Tuple[int, Optional[int]]:
+    """(match_id, winner_id) from an event, a payload dict or a bare id."""
+    data = getattr(item, "data", item)
+    if isinstance(data, dict):
+        return int(data["match_id"]), data.get("winner_id")
+    return int(data), None
+
+
+def _percent(numerator: int, denominator: int) -> Decimal:
+    if denominator <= 0:
+        return Decimal("0.00")
+    return (Decimal(numerator) * 100 / Decimal(denominator)).quantize(_TWO_PLACES)
+
+
+def _ratio(kills: int, deaths: int) -> Decimal:
+    if deaths <= 0:
+        return Decimal(kills).quantize(_TWO_PLACES)
+    return (Decimal(kills) / Decimal(deaths)).quantize(_TWO_PLACES)
+
+
+def _record(row, is_winner: bool, is_draw: bool, completed_at) -> None:
+    row.matches_played += 1
+    if is_draw:
+        row.matches_drawn += 1
+    elif is_winner:
+        row.matches_won += 1
+    else:
+        row.matches_lost += 1
+    row.win_rate = _percent(row.matches_won, row.matches_played)
+    row.last_match_at = completed_at
+
+
+def _kd(match, side: int) -> Tuple[int, int, int]:
+    result_data = getattr(match, "result_data", None)
+    if not isinstance(result_data, dict):
+        return 0, 0, 0
+    return (
+        int(result_data.get(f"participant{side}_kills", 0) or 0),
+        int(result_data.get(f"participant{side}_deaths", 0) or 0),
+        int(result_data.get(f"participant{side}_assists", 0) or 0),
+    )
+
+
+def _lock_rows(model, owner: str, keys: List[Tuple[int, str]]) -> Dict[Tuple[int, str], Any]:
+    """Ensure one row per (owner id, game_slug) exists, then load them all FOR UPDATE."""
+    model.objects.bulk_create(
+        [model(**{f"{owner}_id": owner_id, "game_slug": slug}) for owner_id, slug in keys],
+        ignore_conflicts=True,
+    )
+    owner_ids = {owner_id for owner_id, _ in keys}
+    slugs = {slug for _, slug in keys}
+    wanted = set(keys)
+    rows = (
+        model.objects.select_for_update()
+        .filter(**{f"{owner}_id__in": owner_ids, "game_slug__in": slugs})
+        .order_by("pk")
+    )
+    return {
+        key: row
+        for row in rows
+        for key in [(getattr(row, f"{owner}_id"), row.game_slug)]
+        if key in wanted
+    }
+
+
+def apply_completed_matches(events: Iterable[Any]) -> BatchStatsResult:
+    """
+    Apply completed matches to user/team stats, team ELO and match history.
+
+    Args:
+        events: MatchCompletedEvent instances, their ``data`` dicts
+            (``match_id`` and optional ``winner_id``) or bare match ids.
+            ``winner_id`` defaults to ``Match.winner_id``; a match with
+            neither is counted as a draw.
+
+    Returns:
+        BatchStatsResult listing applied, already-applied and skipped ids.
+    """
+    from django.contrib.auth import get_user_model
+
+    from apps.leaderboards.models import (
+        TeamMatchHistory,
+        TeamRanking,
+        TeamStats,
+        UserMatchHistory,
+        UserStats,
+    )
+    from apps.organizations.models import Team
+    from apps.tournament_ops.services.team_stats_service import TeamStatsService
+    from apps.tournaments.models import Match, Tournament
+
+    completions: Dict[int, Optional[int]] = OrderedDict()
+    for item in events:
+        match_id, winner_id = _completion(item)
+        completions[match_id] = winner_id
+
+    result = BatchStatsResult()
+    if not completions:
+        return result
+
+    User = get_user_model()
+    elo = TeamStatsService(team_stats_adapter=None, team_ranking_adapter=None)
+
+    with transaction.atomic():
+        matches = list(
+            Match.objects.select_for_update(of=("self",))
+            .select_related("tournament__game")
+            .filter(id__in=completions)
+            .order_by("id")
+        )
+        done = set(
+            UserMatchHistory.objects.filter(match_id__in=completions).values_list("match_id", flat=True)
+        ) | set(
+            TeamMatchHistory.objects.filter(match_id__in=completions).values_list("match_id", flat=True)
+        )
+        found = {match.id for match in matches}
+        result.skipped.extend(match_id for match_id in completions if match_id not in found)
+
+        now = timezone.now()
+        team_matches, user_matches = [], []
+        for match in matches:
+            if match.id in done:
+                result.already_applied.append(match.id)
+                continue
+            if not match.participant1_id or not match.participant2_id:
+                logger.warning(f"Match {match.id} is missing a participant, skipping stats update")
+                result.skipped.append(match.id)
+                continue
+            if match.tournament.participation_type == Tournament.TEAM:
+                team_matches.append(match)
+            else:
+                user_matches.append(match)
+
+        def participants(group):
+            return {pid for match in group for pid in (match.participant1_id, match.participant2_id)}
+
+        # Orphaned participant ids would fail the whole batch on FK checks
+        known_teams, known_users = set(), set()
+        if team_matches:
+            known_teams = set(
+                Team.objects.filter(id__in=participants(team_matches)).values_list("id", flat=True)
+            )
+        if user_matches:
+            known_users = set(
+                User.objects.filter(id__in=participants(user_matches)).values_list("id", flat=True)
+            )
+
+        def playable(group, known):
+            kept = []
+            for match in group:
+                if match.participant1_id in known and match.participant2_id in known:
+                    kept.append(match)
+                else:
+                    logger.warning(f"Match {match.id} references unknown participants, skipping stats update")
+                    result.skipped.append(match.id)
+            return sorted(kept, key=lambda m: (m.completed_at or now, m.id))
+
+        team_matches = playable(team_matches, known_teams)
+        user_matches = playable(user_matches, known_users)
+
+        def outcome(match):
+            winner_id = completions[match.id] or match.winner_id
+            is_draw = winner_id is None
+            return is_draw, (not is_draw and winner_id == match.participant1_id), (not is_draw and winner_id == match.participant2_id)
+
+        team_history, user_history = [], []
+
+        if team_matches:
+            keys = sorted({
+                (team_id, match.tournament.game.slug)
+                for match in team_matches
+                for team_id in (match.participant1_id, match.participant2_id)
+            })
+            stats = _lock_rows(TeamStats, "team", keys)
+            rankings = _lock_rows(TeamRanking, "team", keys)
+
+            for match in team_matches:
+                slug = match.tournament.game.slug
+                is_draw, won1, won2 = outcome(match)
+                completed_at = match.completed_at or now
+                sides = (
+                    (match.participant1_id, won1, match.participant2_id, match.participant2_name),
+                    (match.participant2_id, won2, match.participant1_id, match.participant1_name),
+                )
+                before = {team_id: rankings[(team_id, slug)].elo_rating for team_id, *_ in sides}
+                for team_id, won, opponent_id, opponent_name in sides:
+                    change = elo.calculate_elo_change(before[team_id], before[opponent_id], won, is_draw)
+                    ranking = rankings[(team_id, slug)]
+                    ranking.elo_rating = before[team_id] + change
+                    ranking.update_peak_elo()
+                    ranking.games_played += 1
+                    if is_draw:
+                        ranking.draws += 1
+                    elif won:
+                        ranking.wins += 1
+                    else:
+                        ranking.losses += 1
+                    _record(stats[(team_id, slug)], won, is_draw, completed_at)
+                    team_history.append(TeamMatchHistory(
+                        match_id=match.id,
+                        team_id=team_id,
+                        tournament_id=match.tournament_id,
+                        game_slug=slug,
+                        is_winner=won,
+                        is_draw=is_draw,
+                        opponent_team_id=opponent_id,
+                        opponent_team_name=opponent_name or "",
+                        score_summary=f"{match.participant1_score}-{match.participant2_score}",
+                        elo_before=before[team_id],
+                        elo_after=ranking.elo_rating,
+                        elo_change=change,
+                        completed_at=completed_at,
+                    ))
+                result.applied.append(match.id)
+
+            for row in stats.values():
+                row.updated_at = now
+            for row in rankings.values():
+                row.last_updated = now
+            TeamStats.objects.bulk_update(
+                list(stats.values()),
+                ["matches_played", "matches_won", "matches_lost", "matches_drawn",
+                 "win_rate", "last_match_at", "updated_at"],
+            )
+            TeamRanking.objects.bulk_update(
+                list(rankings.values()),
+                ["elo_rating", "peak_elo", "games_played", "wins", "losses", "draws", "last_updated"],
+            )
+            TeamMatchHistory.objects.bulk_create(team_history)
+
+        if user_matches:
+            keys = sorted({
+                (user_id, match.tournament.game.slug)
+                for match in user_matches
+                for user_id in (match.participant1_id, match.participant2_id)
+            })
+            stats = _lock_rows(UserStats, "user", keys)
+
+            for match in user_matches:
+                slug = match.tournament.game.slug
+                is_draw, won1, won2 = outcome(match)
+                completed_at = match.completed_at or now
+                sides = (
+                    (1, match.participant1_id, won1, match.participant2_id, match.participant2_name),
+                    (2, match.participant2_id, won2, match.participant1_id, match.participant1_name),
+                )
+                for side, user_id, won, opponent_id, opponent_name in sides:
+                    kills, deaths, assists = _kd(match, side)
+                    row = stats[(user_id, slug)]
+                    _record(row, won, is_draw, completed_at)
+                    row.total_kills += kills
+                    row.total_deaths += deaths
+                    row.kd_ratio = _ratio(row.total_kills, row.total_deaths)
+                    user_history.append(UserMatchHistory(
+                        match_id=match.id,
+                        user_id=user_id,
+                        tournament_id=match.tournament_id,
+                        game_slug=slug,
+                        is_winner=won,
+                        is_draw=is_draw,
+                        opponent_user_id=opponent_id,
+                        opponent_name=opponent_name or "",
+                        score_summary=f"{match.participant1_score}-{match.participant2_score}",
+                        kills=kills,
+                        deaths=deaths,
+                        assists=assists,
+                        completed_at=completed_at,
+                    ))
+                result.applied.append(match.id)
+
+            for row in stats.values():
+                row.updated_at = now
+            UserStats.objects.bulk_update(
+                list(stats.values()),
+                ["matches_played", "matches_won", "matches_lost", "matches_drawn", "win_rate",
+                 "total_kills", "total_deaths", "kd_ratio", "last_match_at", "updated_at"],
+            )
+            UserMatchHistory.objects.bulk_create(user_history)
+
+    logger.info(
+        f"Applied stats for {len(result.applied)} matches "
+        f"({len(result.already_applied)} already applied, {len(result.skipped)} skipped)"
+    )
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Per-transaction buffer
+# ---------------------------------------------------------------------------
+
+
+def _apply_buffered(events: List[Any]) -> None:
+    try:
+        apply_completed_matches(events)
+    except Exception as e:
+        logger.error(f"Batched stats update failed for {len(events)} matches: {e}", exc_info=True)
+
+
+_buffer = OnCommitBuffer(_apply_buffered)
+
+
+def queue_completed_match(event: Any) -> None:
+    """Apply ``event`` now, or with the rest of the transaction's matches on commit."""
+    if not _buffer.add(event):
+        apply_completed_matches([event])
+
+
+def pending_count() -> int:
+    """Completed matches buffered in the current transaction."""
+    return len(_buffer)
@@ -18,6 +18,7 @@ from django.utils import timezone
 from django.conf import settings
 import logging
 import time
+from typing import Optional
 
 from apps.leaderboards.services import get_leaderboard_service
 from apps.leaderboards.cache import get_leaderboard_cache
@@ -645,13 +646,210 @@ CELERY_BEAT_SCHEDULE = {
 # Phase 8, Epic 8.5: Analytics Background Jobs
 # ============================================================================
 
+ANALYTICS_CHECKPOINT_TTL = 2 * 24 * 3600  # long enough to resume the next day
+
+
+def _build_analytics_service():
+    from apps.tournament_ops.services.analytics_engine_service import AnalyticsEngineService
+    from apps.tournament_ops.adapters import (
+        AnalyticsAdapter,
+        UserStatsAdapter,
+        TeamStatsAdapter,
+        TeamRankingAdapter,
+        DjangoMatchHistoryAdapter,
+    )
+    
+    return AnalyticsEngineService(
+        analytics_adapter=AnalyticsAdapter(),
+        user_stats_adapter=UserStatsAdapter(),
+        team_stats_adapter=TeamStatsAdapter(),
+        team_ranking_adapter=TeamRankingAdapter(),
+        match_history_adapter=DjangoMatchHistoryAdapter(),
+    )
+
+
+def _publish_analytics_event(name: str, payload: dict) -> None:
+    from apps.common.events.event_bus import Event, get_event_bus
+    
+    try:
+        get_event_bus().publish(Event(name=name, payload=payload))
+    except Exception as e:
+        logger.warning(f"Could not publish {name}: {e}")
+
+
+def _analytics_run_key(run_id: str, subject: str, suffix: str) -> str:
+    return f"analytics:batch:{run_id}:{subject}:{suffix}"
+
+
+def _analytics_chunk_key(run_id: str, subject: str, game_slug: str, after_id: int) -> str:
+    return _analytics_run_key(run_id, subject, f"done:{game_slug}:{after_id}")
+
+
+def analytics_batch_progress(subject: str, run_id: str) -> dict:
+    """
+    Progress of a fanned-out analytics run (rows, chunks, rows/second).
+    
+    Counters are written by refresh_analytics_chunk as chunks finish.
+    """
+    from django.core.cache import cache
+    
+    keys = {name: _analytics_run_key(run_id, subject, name) for name in ("meta", "rows", "chunks")}
+    values = cache.get_many(list(keys.values()))
+    meta = values.get(keys["meta"]) or {}
+    rows = values.get(keys["rows"], 0)
+    elapsed = max(time.time() - meta.get("started_at", time.time()), 0.0)
+    return {
+        "run_id": run_id,
+        "rows": rows,
+        "chunks_done": values.get(keys["chunks"], 0),
+        "chunks_total": meta.get("chunks_total", 0),
+        "elapsed_s": round(elapsed, 1),
+        "rows_per_second": round(rows / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def _incr(cache, key: str, delta: int) -> int:
+    cache.add(key, 0, timeout=ANALYTICS_CHECKPOINT_TTL)
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        # Key expired between add() and incr(); start over
+        cache.set(key, delta, timeout=ANALYTICS_CHECKPOINT_TTL)
+        return delta
+
+
+@shared_task
+def refresh_analytics_chunk(subject: str, game_slug: str, after_id: int, upto_id: int, run_id: str) -> dict:
+    """
+    Refresh one id-ordered chunk of user or team analytics snapshots.
+    
+    Idempotent: a chunk already checkpointed for ``run_id`` is skipped, and
+    re-running a chunk just upserts the same snapshots again. The checkpoint
+    is only written after the bulk upsert, so a crashed chunk is retried by
+    the next coordinator run with the same ``run_id``.
+    
+    Args:
+        subject: "user" or "team"
+        game_slug: Game identifier
+        after_id: Exclusive lower stats row id
+        upto_id: Inclusive upper stats row id
+        run_id: Batch run identifier (default: the UTC date)
+    """
+    from django.core.cache import cache
+    
+    done_key = _analytics_chunk_key(run_id, subject, game_slug, after_id)
+    if cache.get(done_key):
+        return {"rows": 0, "skipped": True}
+    
+    service = _build_analytics_service()
+    refresh_chunk = (
+        service.refresh_user_analytics_chunk if subject == "user"
+        else service.refresh_team_analytics_chunk
+    )
+    result = refresh_chunk(game_slug, after_id=after_id, upto_id=upto_id, now=timezone.now())
+    
+    cache.set(done_key, result["rows"], timeout=ANALYTICS_CHECKPOINT_TTL)
+    _incr(cache, _analytics_run_key(run_id, subject, "rows"), result["rows"])
+    chunks_done = _incr(cache, _analytics_run_key(run_id, subject, "chunks"), 1)
+    
+    logger.info(
+        f"{subject} analytics chunk {game_slug} ({after_id}, {upto_id}]: "
+        f"{result['rows']} rows in {result['duration_ms']}ms ({result['rows_per_second']} rows/s)"
+    )
+    progress = analytics_batch_progress(subject, run_id)
+    if progress["chunks_total"] and chunks_done == progress["chunks_total"]:
+        logger.info(
+            f"{subject} analytics run {run_id} complete: {progress['rows']} rows "
+            f"in {progress['elapsed_s']}s ({progress['rows_per_second']} rows/s)"
+        )
+        _publish_analytics_event("analytics.job_completed", {
+            "job_type": f"{subject}_analytics_refresh",
+            "run_id": run_id,
+            **progress,
+        })
+    return result
+
+
+def _run_analytics_batch(subject: str, run_id: Optional[str] = None) -> dict:
+    """
+    Split every game's stats rows into chunks and fan them out.
+    
+    Chunks already checkpointed for ``run_id`` are not re-queued, so calling
+    this again with the same run_id resumes an interrupted run. If the
+    broker is unavailable the chunk runs inline.
+    """
+    from django.core.cache import cache
+    
+    start_time = time.time()
+    run_id = run_id or timezone.now().date().isoformat()
+    chunk_size = getattr(settings, "ANALYTICS_BATCH_CHUNK_SIZE", 500)
+    adapter = _build_analytics_service().analytics_adapter
+    
+    _publish_analytics_event("analytics.job_started", {
+        "job_type": f"{subject}_analytics_refresh",
+        "run_id": run_id,
+        "timestamp": timezone.now().isoformat(),
+    })
+    
+    chunks = []
+    for game_slug in adapter.list_stats_game_slugs(subject):
+        # Percentiles for every chunk of this run read this cached snapshot
+        adapter.get_elo_distribution(subject, game_slug, rebuild=True)
+        for after_id, upto_id in adapter.get_stats_chunk_bounds(subject, game_slug, chunk_size):
+            chunks.append((game_slug, after_id, upto_id))
+    
+    meta_key = _analytics_run_key(run_id, subject, "meta")
+    meta = cache.get(meta_key) or {"started_at": start_time}
+    meta["chunks_total"] = len(chunks)
+    cache.set(meta_key, meta, timeout=ANALYTICS_CHECKPOINT_TTL)
+    
+    done = cache.get_many([
+        _analytics_chunk_key(run_id, subject, game_slug, after_id)
+        for game_slug, after_id, _ in chunks
+    ])
+    # Chunks whose bounds shifted since an earlier attempt are simply redone
+    cache.set(_analytics_run_key(run_id, subject, "chunks"), len(done), timeout=ANALYTICS_CHECKPOINT_TTL)
+    
+    queued = inline = 0
+    for game_slug, after_id, upto_id in chunks:
+        if _analytics_chunk_key(run_id, subject, game_slug, after_id) in done:
+            continue
+        args = [subject, game_slug, after_id, upto_id, run_id]
+        try:
+            refresh_analytics_chunk.apply_async(args=args, retry=False)
+            queued += 1
+        except Exception:
+            logger.warning(f"Analytics chunk queuing failed (broker down?) — refreshing {game_slug} ({after_id}, {upto_id}] inline")
+            refresh_analytics_chunk(*args)
+            inline += 1
+    
+    duration_ms = int((time.time() - start_time) * 1000)
+    logger.info(
+        f"{subject} analytics run {run_id}: {len(chunks)} chunks, {len(done)} already done, "
+        f"{queued} queued, {inline} inline ({duration_ms}ms)"
+    )
+    return {
+        "run_id": run_id,
+        "chunks_total": len(chunks),
+        "chunks_resumed": len(done),
+        "chunks_queued": queued,
+        "chunks_inline": inline,
+        "duration_ms": duration_ms,
+    }
+
+
 @shared_task
-def nightly_user_analytics_refresh() -> dict:
+def nightly_user_analytics_refresh(run_id: Optional[str] = None) -> dict:
     """
     Refresh user analytics snapshots for all users (nightly job).
     
     Scheduled: Daily at 01:00 UTC
     
+    Fans the UserStats table out as id-ordered chunks of
+    ANALYTICS_BATCH_CHUNK_SIZE rows (one refresh_analytics_chunk task each).
+    Re-run with the same ``run_id`` to resume; progress and rows/second
+    are available from analytics_batch_progress("user", run_id).
+    
     Computes:
     - MMR/ELO snapshots
     - Win rates (overall + rolling 7d/30d)
@@ -662,119 +860,21 @@ def nightly_user_analytics_refresh() -> dict:
     - Percentile ranking
     
     Returns:
-        Dict with job metadata:
-        {
-            'users_refreshed': int,
-            'duration_ms': int,
-            'errors': int,
-        }
+        Dict with run_id, chunks_total, chunks_resumed, chunks_queued,
+        chunks_inline and duration_ms
     """
-    from apps.common.events.event_bus import EventBus
-    
-    start_time = time.time()
-    event_bus = EventBus()
-    
-    # Emit job started event
-    event_bus.publish(
-        event_type="analytics.job_started",
-        payload={"job_type": "user_analytics_refresh", "timestamp": timezone.now().isoformat()}
-    )
-    
-    try:
-        # Get all active games dynamically
-        from apps.games.models import Game
-        games = list(Game.objects.filter(is_active=True).values_list('slug', flat=True))
-        
-        users_refreshed = 0
-        errors = 0
-        
-        # Refresh analytics for each game
-        for game_slug in games:
-            try:
-                # Get all users with stats for this game
-                from apps.leaderboards.models import UserStats
-                user_stats_queryset = UserStats.objects.filter(game_slug=game_slug)
-                
-                logger.info(f"Refreshing user analytics for {user_stats_queryset.count()} users in {game_slug}")
-                
-                # Batch process users
-                for user_stats in user_stats_queryset:
-                    try:
-                        # Initialize analytics service
-                        from apps.tournament_ops.services.analytics_engine_service import AnalyticsEngineService
-                        from apps.tournament_ops.adapters import (
-                            AnalyticsAdapter,
-                            UserStatsAdapter,
-                            TeamStatsAdapter,
-                            TeamRankingAdapter,
-                            DjangoMatchHistoryAdapter,
-                        )
-                        
-                        analytics_service = AnalyticsEngineService(
-                            analytics_adapter=AnalyticsAdapter(),
-                            user_stats_adapter=UserStatsAdapter(),
-                            team_stats_adapter=TeamStatsAdapter(),
-                            team_ranking_adapter=TeamRankingAdapter(),
-                            match_history_adapter=DjangoMatchHistoryAdapter(),
-                        )
-                        
-                        # Compute and save analytics
-                        analytics_service.compute_user_analytics(user_stats.user_id, game_slug)
-                        users_refreshed += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Error refreshing analytics for user {user_stats.user_id} in {game_slug}: {e}")
-                        errors += 1
-                        
-            except Exception as e:
-                logger.error(f"Error processing game {game_slug}: {e}")
-                errors += 1
-        
-        duration_ms = int((time.time() - start_time) * 1000)
-        
-        # Emit job completed event
-        event_bus.publish(
-            event_type="analytics.job_completed",
-            payload={
-                "job_type": "user_analytics_refresh",
-                "users_refreshed": users_refreshed,
-                "duration_ms": duration_ms,
-                "errors": errors,
-            }
-        )
-        
-        logger.info(f"User analytics refresh completed: {users_refreshed} users, {errors} errors, {duration_ms}ms")
-        
-        return {
-            'users_refreshed': users_refreshed,
-            'duration_ms': duration_ms,
-            'errors': errors,
-        }
-        
-    except Exception as e:
-        duration_ms = int((time.time() - start_time) * 1000)
-        
-        # Emit job failed event
-        event_bus.publish(
-            event_type="analytics.job_failed",
-            payload={
-                "job_type": "user_analytics_refresh",
-                "error": str(e),
-                "duration_ms": duration_ms,
-            }
-        )
-        
-        logger.error(f"User analytics refresh failed: {e}")
-        raise
+    return _run_analytics_batch("user", run_id)
 
 
 @shared_task
-def nightly_team_analytics_refresh() -> dict:
+def nightly_team_analytics_refresh(run_id: Optional[str] = None) -> dict:
     """
     Refresh team analytics snapshots for all teams (nightly job).
     
     Scheduled: Daily at 01:30 UTC
     
+    Same chunked fan-out as nightly_user_analytics_refresh over TeamStats.
+    
     Computes:
     - Team ELO snapshots + volatility
     - Average member skill
@@ -785,110 +885,9 @@ def nightly_team_analytics_refresh() -> dict:
     - Percentile ranking
     
     Returns:
-        Dict with job metadata:
-        {
-            'teams_refreshed': int,
-            'duration_ms': int,
-            'errors': int,
-        }
+        Dict with run_id and chunk counts (see nightly_user_analytics_refresh)
     """
-    from apps.common.events.event_bus import EventBus
-    
-    start_time = time.time()
-    event_bus = EventBus()
-    
-    # Emit job started event
-    event_bus.publish(
-        event_type="analytics.job_started",
-        payload={"job_type": "team_analytics_refresh", "timestamp": timezone.now().isoformat()}
-    )
-    
-    try:
-        # Get all active games dynamically
-        from apps.games.models import Game
-        games = list(Game.objects.filter(is_active=True).values_list('slug', flat=True))
-        
-        teams_refreshed = 0
-        errors = 0
-        
-        # Refresh analytics for each game
-        for game_slug in games:
-            try:
-                # Get all teams with stats for this game
-                from apps.leaderboards.models import TeamStats
-                team_stats_queryset = TeamStats.objects.filter(game_slug=game_slug)
-                
-                logger.info(f"Refreshing team analytics for {team_stats_queryset.count()} teams in {game_slug}")
-                
-                # Batch process teams
-                for team_stats in team_stats_queryset:
-                    try:
-                        # Initialize analytics service
-                        from apps.tournament_ops.services.analytics_engine_service import AnalyticsEngineService
-                        from apps.tournament_ops.adapters import (
-                            AnalyticsAdapter,
-                            UserStatsAdapter,
-                            TeamStatsAdapter,
-                            TeamRankingAdapter,
-                            DjangoMatchHistoryAdapter,
-                        )
-                        
-                        analytics_service = AnalyticsEngineService(
-                            analytics_adapter=AnalyticsAdapter(),
-                            user_stats_adapter=UserStatsAdapter(),
-                            team_stats_adapter=TeamStatsAdapter(),
-                            team_ranking_adapter=TeamRankingAdapter(),
-                            match_history_adapter=DjangoMatchHistoryAdapter(),
-                        )
-                        
-                        # Compute and save analytics
-                        analytics_service.compute_team_analytics(team_stats.team_id, game_slug)
-                        teams_refreshed += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Error refreshing analytics for team {team_stats.team_id} in {game_slug}: {e}")
-                        errors += 1
-                        
-            except Exception as e:
-                logger.error(f"Error processing game {game_slug}: {e}")
-                errors += 1
-        
-        duration_ms = int((time.time() - start_time) * 1000)
-        
-        # Emit job completed event
-        event_bus.publish(
-            event_type="analytics.job_completed",
-            payload={
-                "job_type": "team_analytics_refresh",
-                "teams_refreshed": teams_refreshed,
-                "duration_ms": duration_ms,
-                "errors": errors,
-            }
-        )
-        
-        logger.info(f"Team analytics refresh completed: {teams_refreshed} teams, {errors} errors, {duration_ms}ms")
-        
-        return {
-            'teams_refreshed': teams_refreshed,
-            'duration_ms': duration_ms,
-            'errors': errors,
-        }
-        
-    except Exception as e:
-        duration_ms = int((time.time() - start_time) * 1000)
-        
-        # Emit job failed event
-        event_bus.publish(
-            event_type="analytics.job_failed",
-            payload={
-                "job_type": "team_analytics_refresh",
-                "error": str(e),
-                "duration_ms": duration_ms,
-            }
-        )
-        
-        logger.error(f"Team analytics refresh failed: {e}")
-        raise
+    return _run_analytics_batch("team", run_id)
 
 
 @shared_task
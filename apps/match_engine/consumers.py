@@ -6,6 +6,7 @@ Phase 9.3 rebuild goals:
 - Keep core event relay behavior stable.
 - Add explicit participant presence snapshots so the room waiting gate can be
   driven directly by socket state.
+- Negotiable ``dc.msgpack.v1`` compact frames (apps.tournaments.realtime.wire).
 
 Canonical location: apps.match_engine.consumers (Phase 6 extraction).
 """
@@ -24,6 +25,7 @@ from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.utils import timezone
 
+from apps.tournaments.realtime.wire import CompactFramesMixin
 from apps.tournaments.security import TournamentRole, get_user_tournament_role
 from apps.tournaments.services.match_lobby_service import (
     resolve_participant_lobby_access,
@@ -179,7 +181,7 @@ def get_live_presence_sync(match_id: int) -> dict:
     return sides
 
 
-class MatchConsumer(AsyncJsonWebsocketConsumer):
+class MatchConsumer(CompactFramesMixin, AsyncJsonWebsocketConsumer):
     """Realtime consumer for a single match room."""
 
     HEARTBEAT_INTERVAL = 30
@@ -6,3 +6,6 @@ class MobileApiConfig(AppConfig):
     name = "apps.mobile_api"
     label = "mobile_api"
     verbose_name = "Mobile API"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 from django.db import IntegrityError, transaction
-from django.db.models import Q
 from django.utils import timezone
 
 from apps.organizations.models import TeamMembership
 from apps.tournaments.models import Match, MatchResultSubmission
+from apps.tournaments.services import match_participant_index as participant_index
 
 from .serializers import participant_side, result_submission_summary
 
@@ -15,14 +15,7 @@ ALLOWED_RESULT_STATES = {Match.LIVE, Match.PENDING_RESULT}
 
 
 def matches_for_user(user):
-    team_ids = list(
-        TeamMembership.objects.filter(user=user, status=TeamMembership.Status.ACTIVE).values_list("team_id", flat=True)
-    )
-    participant_ids = [user.id, *team_ids]
-    return Match.objects.filter(
-        Q(participant1_id__in=participant_ids) | Q(participant2_id__in=participant_ids),
-        is_deleted=False,
-    )
+    return participant_index.matches_for_user(user)
 
 
 def check_in_match(match: Match, user) -> dict:
@@ -0,0 +1,38 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("mobile_api", "0002_rename_mobile_api_user_id_e17912_idx_mobile_api__user_id_74a009_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MobileSyncTombstone",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "entity",
+                    models.CharField(
+                        choices=[
+                            ("match", "Match"),
+                            ("notification", "Notification"),
+                            ("registration", "Registration"),
+                            ("membership", "Team membership"),
+                        ],
+                        max_length=24,
+                    ),
+                ),
+                ("object_id", models.BigIntegerField()),
+                ("scope_id", models.BigIntegerField()),
+                ("deleted_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["scope_id", "deleted_at"], name="mobile_sync_scope_del_idx"),
+                    models.Index(fields=["deleted_at"], name="mobile_sync_deleted_idx"),
+                ],
+            },
+        ),
+    ]
@@ -32,3 +32,33 @@ class MobileDeviceToken(models.Model):
 
     def __str__(self) -> str:
         return f"{self.user_id}:{self.platform}:{self.device_id or self.pk}"
+
+
+class MobileSyncTombstone(models.Model):
+    """Hard-delete marker consumed by the ``/sync/`` delta endpoint.
+
+    Soft-deleted rows are reported from their own ``deleted_at`` column; this
+    table only covers rows that physically disappear. ``scope_id`` is the
+    user or team id the row was visible to, so a client's delta can be
+    filtered with the same participant ids used for live rows.
+    """
+
+    class Entity(models.TextChoices):
+        MATCH = "match", "Match"
+        NOTIFICATION = "notification", "Notification"
+        REGISTRATION = "registration", "Registration"
+        MEMBERSHIP = "membership", "Team membership"
+
+    entity = models.CharField(max_length=24, choices=Entity.choices)
+    object_id = models.BigIntegerField()
+    scope_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["scope_id", "deleted_at"], name="mobile_sync_scope_del_idx"),
+            models.Index(fields=["deleted_at"], name="mobile_sync_deleted_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.entity}:{self.object_id}@{self.scope_id}"
@@ -0,0 +1,40 @@
+"""Signal receivers that record hard deletes for mobile delta sync."""
+from __future__ import annotations
+
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from apps.notifications.models import Notification
+from apps.organizations.models import TeamMembership
+from apps.tournaments.models import Match, Registration
+
+from .models import MobileSyncTombstone
+
+
+def _record(entity: str, object_id, scope_ids) -> None:
+    scope_ids = {scope_id for scope_id in scope_ids if scope_id}
+    if not object_id or not scope_ids:
+        return
+    MobileSyncTombstone.objects.bulk_create(
+        [MobileSyncTombstone(entity=entity, object_id=object_id, scope_id=scope_id) for scope_id in scope_ids]
+    )
+
+
+@receiver(post_delete, sender=Match, dispatch_uid="mobile_sync_match_deleted")
+def match_deleted(sender, instance, **kwargs):
+    _record(MobileSyncTombstone.Entity.MATCH, instance.pk, [instance.participant1_id, instance.participant2_id])
+
+
+@receiver(post_delete, sender=Notification, dispatch_uid="mobile_sync_notification_deleted")
+def notification_deleted(sender, instance, **kwargs):
+    _record(MobileSyncTombstone.Entity.NOTIFICATION, instance.pk, [instance.recipient_id])
+
+
+@receiver(post_delete, sender=Registration, dispatch_uid="mobile_sync_registration_deleted")
+def registration_deleted(sender, instance, **kwargs):
+    _record(MobileSyncTombstone.Entity.REGISTRATION, instance.pk, [instance.user_id, instance.team_id])
+
+
+@receiver(post_delete, sender=TeamMembership, dispatch_uid="mobile_sync_membership_deleted")
+def membership_deleted(sender, instance, **kwargs):
+    _record(MobileSyncTombstone.Entity.MEMBERSHIP, instance.pk, [instance.user_id])
@@ -0,0 +1 @@
+"""Mobile delta-sync endpoints."""
@@ -0,0 +1,280 @@
+"""Delta-sync helpers for the mobile API.
+
+A sync cursor is an opaque, server-issued token wrapping a UTC timestamp.
+Each entity is read through an ``updated_at``-style index with
+``> cursor`` filters; hard deletes come from ``MobileSyncTombstone`` and
+soft deletes from ``deleted_at``. Upserts are idempotent on the client, so
+a short overlap window is re-read to cover rows committed by transactions
+that started before the previous cursor was issued.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import Q
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from apps.notifications.models import Notification
+from apps.organizations.models import TeamMembership
+from apps.tournaments.models import Match, Registration
+
+from ..models import MobileSyncTombstone
+from ..notifications.serializers import serialize_notification
+
+
+CURSOR_VERSION = "v1"
+SYNC_CURSOR_OVERLAP = timedelta(seconds=2)
+SYNC_MAX_ITEMS = 500
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+class MobileSyncValidation(Exception):
+    def __init__(self, code: str, message: str, *, status_code: int = 400):
+        self.code = code
+        self.message = message
+        self.status_code = status_code
+        super().__init__(message)
+
+
+def encode_cursor(moment: datetime) -> str:
+    micros = int((moment - EPOCH).total_seconds() * 1_000_000)
+    raw = f"{CURSOR_VERSION}:{micros}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str | None) -> datetime | None:
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        version, micros = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii").split(":", 1)
+        if version != CURSOR_VERSION:
+            raise ValueError(version)
+        return EPOCH + timedelta(microseconds=int(micros))
+    except (ValueError, UnicodeError) as exc:
+        raise MobileSyncValidation("invalid_cursor", "The sync cursor is invalid or expired.") from exc
+
+
+def build_sync_payload(user, since: datetime | None, *, limit: int = SYNC_MAX_ITEMS) -> dict:
+    """Return everything visible to ``user`` that changed after ``since``.
+
+    ``since=None`` produces a bootstrap snapshot. When any entity hits
+    ``limit`` the response sets ``has_more`` and the cursor stops at the
+    oldest truncated timestamp so the client can keep paging. A cursor older
+    than the tombstone retention window could miss hard deletes, so it is
+    answered with a bootstrap snapshot as well.
+    """
+    issued_at = timezone.now()
+    if since is not None and since < issued_at - tombstone_retention():
+        since = None
+    floor = (since - SYNC_CURSOR_OVERLAP) if since else None
+
+    memberships = _membership_changes(user, floor, limit)
+    team_ids = set(
+        TeamMembership.objects.filter(user=user, status=TeamMembership.Status.ACTIVE).values_list("team_id", flat=True)
+    )
+    participant_ids = {user.id, *team_ids}
+    joined_team_ids = {row["team_id"] for row in memberships["upserted"]}
+    left_team_ids = {row["team_id"] for row in memberships["removed"] if row["team_id"]} - team_ids
+
+    matches = _match_changes(participant_ids, joined_team_ids, left_team_ids, floor, limit)
+    notifications = _notification_changes(user, floor, limit)
+    registrations = _registration_changes(user, team_ids, floor, limit)
+
+    sections = {
+        "matches": matches,
+        "notifications": notifications,
+        "registrations": registrations,
+        "teams": memberships,
+    }
+    truncated_at = [section.pop("_truncated_at") for section in sections.values()]
+    truncated_at = [moment for moment in truncated_at if moment is not None]
+    cursor_at = min(truncated_at) if truncated_at else issued_at
+
+    return {
+        "cursor": encode_cursor(cursor_at),
+        "has_more": bool(truncated_at),
+        "full": since is None,
+        **sections,
+    }
+
+
+def payload_etag(user, payload: dict) -> str:
+    """Weak ETag over the change set, ignoring the freshly issued cursor."""
+    body = {key: value for key, value in payload.items() if key != "cursor"}
+    digest = hashlib.sha1(
+        json.dumps([user.id, body], sort_keys=True, default=str, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+# ---------------------------------------------------------------------------
+# Per-entity readers
+# ---------------------------------------------------------------------------
+
+
+def _match_changes(participant_ids, joined_team_ids, left_team_ids, floor, limit) -> dict:
+    visible = Q(participant1_id__in=participant_ids) | Q(participant2_id__in=participant_ids)
+    queryset = Match.objects.filter(visible, is_deleted=False)
+    if floor is not None:
+        # Matches of a freshly joined team are new to this user even though
+        # the rows themselves did not change.
+        newly_visible = Q(participant1_id__in=joined_team_ids) | Q(participant2_id__in=joined_team_ids)
+        queryset = queryset.filter(Q(updated_at__gt=floor) | newly_visible)
+    rows = list(queryset.order_by("updated_at", "id")[: limit + 1])
+    truncated_at = rows[limit - 1].updated_at if len(rows) > limit else None
+    rows = rows[:limit]
+
+    deleted: list[int] = []
+    if floor is not None:
+        deleted.extend(
+            Match.objects.filter(visible, is_deleted=True, deleted_at__gt=floor).values_list("id", flat=True)
+        )
+        deleted.extend(_tombstones(MobileSyncTombstone.Entity.MATCH, participant_ids, floor))
+        if left_team_ids:
+            left = Q(participant1_id__in=left_team_ids) | Q(participant2_id__in=left_team_ids)
+            deleted.extend(Match.objects.filter(left).exclude(visible).values_list("id", flat=True))
+
+    return {
+        "upserted": [compact_match(match) for match in rows],
+        "deleted": sorted(set(deleted)),
+        "_truncated_at": truncated_at,
+    }
+
+
+def _notification_changes(user, floor, limit) -> dict:
+    # Filter, order and truncate on the same per-row timestamp; paging on
+    # created_at while matching read_at would re-serve the same page forever.
+    queryset = Notification.objects.filter(recipient=user).annotate(
+        changed_at=Greatest("created_at", Coalesce("read_at", "created_at"))
+    )
+    if floor is not None:
+        queryset = queryset.filter(changed_at__gt=floor)
+    rows = list(queryset.order_by("changed_at", "id")[: limit + 1])
+    truncated_at = rows[limit - 1].changed_at if len(rows) > limit else None
+    rows = rows[:limit]
+
+    deleted = _tombstones(MobileSyncTombstone.Entity.NOTIFICATION, [user.id], floor) if floor is not None else []
+    return {
+        "upserted": [serialize_notification(item) for item in rows],
+        "deleted": sorted(set(deleted)),
+        "_truncated_at": truncated_at,
+    }
+
+
+def _registration_changes(user, team_ids, floor, limit) -> dict:
+    visible = Q(user=user) | Q(team_id__in=team_ids)
+    queryset = Registration.objects.filter(visible, is_deleted=False)
+    if floor is not None:
+        queryset = queryset.filter(updated_at__gt=floor)
+    rows = list(queryset.order_by("updated_at", "id")[: limit + 1])
+    truncated_at = rows[limit - 1].updated_at if len(rows) > limit else None
+    rows = rows[:limit]
+
+    deleted: list[int] = []
+    if floor is not None:
+        deleted.extend(
+            Registration.objects.deleted_only().filter(visible, deleted_at__gt=floor).values_list("id", flat=True)
+        )
+        deleted.extend(_tombstones(MobileSyncTombstone.Entity.REGISTRATION, [user.id, *team_ids], floor))
+
+    return {
+        "upserted": [compact_registration(registration) for registration in rows],
+        "deleted": sorted(set(deleted)),
+        "_truncated_at": truncated_at,
+    }
+
+
+def _membership_changes(user, floor, limit) -> dict:
+    queryset = (
+        TeamMembership.objects.filter(user=user)
+        .select_related("team")
+        .annotate(changed_at=Greatest("joined_at", Coalesce("left_at", "joined_at")))
+    )
+    if floor is not None:
+        queryset = queryset.filter(changed_at__gt=floor)
+    rows = list(queryset.order_by("changed_at", "id")[: limit + 1])
+    truncated_at = rows[limit - 1].changed_at if len(rows) > limit else None
+    rows = rows[:limit]
+
+    upserted = [compact_membership(row) for row in rows if row.status == TeamMembership.Status.ACTIVE]
+    removed = [
+        {"id": row.id, "team_id": row.team_id}
+        for row in rows
+        if row.status != TeamMembership.Status.ACTIVE and floor is not None
+    ]
+    if floor is not None:
+        removed.extend(
+            {"id": object_id, "team_id": None}
+            for object_id in _tombstones(MobileSyncTombstone.Entity.MEMBERSHIP, [user.id], floor)
+        )
+    return {"upserted": upserted, "removed": removed, "_truncated_at": truncated_at}
+
+
+def _tombstones(entity: str, scope_ids, floor) -> list[int]:
+    return list(
+        MobileSyncTombstone.objects.filter(entity=entity, scope_id__in=list(scope_ids), deleted_at__gt=floor)
+        .values_list("object_id", flat=True)
+    )
+
+
+def tombstone_retention() -> timedelta:
+    return timedelta(days=getattr(settings, "MOBILE_SYNC_TOMBSTONE_RETENTION_DAYS", 30))
+
+
+def prune_tombstones(*, now: datetime | None = None) -> int:
+    """Delete tombstones older than the retention window; returns the count removed."""
+    cutoff = (now or timezone.now()) - tombstone_retention()
+    deleted, _ = MobileSyncTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
+
+
+# ---------------------------------------------------------------------------
+# Compact row encoders (no per-row queries)
+# ---------------------------------------------------------------------------
+
+
+def compact_match(match: Match) -> dict:
+    return {
+        "id": match.id,
+        "tournament_id": match.tournament_id,
+        "status": match.state,
+        "round": match.round_number,
+        "match_number": match.match_number,
+        "p1": [match.participant1_id, match.participant1_name],
+        "p2": [match.participant2_id, match.participant2_name],
+        "score": [match.participant1_score, match.participant2_score],
+        "winner_id": match.winner_id,
+        "checked_in": [match.participant1_checked_in, match.participant2_checked_in],
+        "scheduled_time": match.scheduled_time.isoformat() if match.scheduled_time else None,
+        "updated_at": match.updated_at.isoformat() if match.updated_at else None,
+    }
+
+
+def compact_registration(registration: Registration) -> dict:
+    return {
+        "id": registration.id,
+        "tournament_id": registration.tournament_id,
+        "team_id": registration.team_id,
+        "status": registration.status,
+        "checked_in": registration.checked_in,
+        "slot_number": registration.slot_number,
+        "updated_at": registration.updated_at.isoformat() if registration.updated_at else None,
+    }
+
+
+def compact_membership(membership: TeamMembership) -> dict:
+    team = membership.team
+    return {
+        "id": membership.id,
+        "team_id": membership.team_id,
+        "team": {"name": team.name, "slug": team.slug, "tag": team.tag} if team else None,
+        "role": membership.role,
+        "is_tournament_captain": membership.is_tournament_captain,
+        "joined_at": membership.joined_at.isoformat() if membership.joined_at else None,
+    }
@@ -0,0 +1,9 @@
+"""URL patterns for mobile delta-sync endpoints."""
+from django.urls import path
+
+from .views import MobileSyncView
+
+
+urlpatterns = [
+    path("sync/", MobileSyncView.as_view(), name="sync"),
+]
@@ -0,0 +1,41 @@
+"""Mobile delta-sync endpoint.
+
+``GET /sync/?since=<cursor>`` returns only matches, notifications,
+registrations and team memberships changed after the cursor. Clients echo
+the previous response's ``ETag`` in ``If-None-Match`` and receive a bare
+304 when nothing changed.
+"""
+from __future__ import annotations
+
+from rest_framework import status as http_status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from ..base import MobileApiView
+from ..responses import error_response, success_response
+from .services import MobileSyncValidation, build_sync_payload, decode_cursor, payload_etag
+
+
+class MobileSyncView(MobileApiView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        try:
+            since = decode_cursor(request.query_params.get("since"))
+        except MobileSyncValidation as exc:
+            return error_response(exc.code, exc.message, status=exc.status_code)
+
+        payload = build_sync_payload(request.user, since)
+        etag = payload_etag(request.user, payload)
+        if etag in _if_none_match(request):
+            response = Response(status=http_status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = success_response(payload)
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, no-cache"
+        return response
+
+
+def _if_none_match(request) -> set[str]:
+    header = request.headers.get("If-None-Match") or ""
+    return {value.strip() for value in header.split(",") if value.strip()}
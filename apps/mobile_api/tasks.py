@@ -0,0 +1,19 @@
+"""Periodic maintenance for the mobile API."""
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="mobile_api.prune_sync_tombstones")
+def prune_sync_tombstones() -> dict:
+    """Drop hard-delete tombstones that no valid sync cursor can still reach."""
+    from apps.mobile_api.sync.services import prune_tombstones
+
+    deleted = prune_tombstones()
+    if deleted:
+        logger.info("Pruned %s mobile sync tombstones", deleted)
+    return {"deleted": deleted}
@@ -0,0 +1,148 @@
+"""Tests for the mobile delta-sync endpoint."""
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.mobile_api.models import MobileSyncTombstone
+from apps.mobile_api.sync.services import build_sync_payload, decode_cursor, encode_cursor, prune_tombstones
+from apps.notifications.models import Notification
+from apps.tournaments.models import Match
+
+from .test_matches import create_game, create_match, create_tournament
+
+
+User = get_user_model()
+
+
+class MobileSyncEndpointTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user("syncuser", "syncuser@example.com", "testpass123!")
+        self.opponent = User.objects.create_user("syncopp", "syncopp@example.com", "testpass123!")
+        self.organizer = User.objects.create_user("syncorg", "syncorg@example.com", "testpass123!")
+        self.game = create_game()
+        self.tournament = create_tournament(self.organizer, self.game)
+        self.match = create_match(self.tournament, self.user, self.opponent)
+        self.client.force_authenticate(self.user)
+        self.url = reverse("mobile_api_v1:sync:sync")
+
+    def _sync(self, cursor=None, **headers):
+        params = {"since": cursor} if cursor else {}
+        return self.client.get(self.url, params, **headers)
+
+    def _age_everything(self):
+        past = timezone.now() - timedelta(minutes=10)
+        Match.objects.update(updated_at=past)
+        Notification.objects.update(created_at=past)
+
+    def test_sync_requires_auth(self):
+        response = APIClient().get(self.url)
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_cursor_round_trip(self):
+        moment = timezone.now().replace(microsecond=123456)
+
+        self.assertEqual(decode_cursor(encode_cursor(moment)), moment)
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self._sync("not-a-cursor")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"]["code"], "invalid_cursor")
+
+    def test_bootstrap_returns_full_snapshot(self):
+        response = self._sync()
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        self.assertTrue(data["full"])
+        self.assertEqual([item["id"] for item in data["matches"]["upserted"]], [self.match.id])
+        self.assertTrue(data["cursor"])
+        self.assertTrue(response["ETag"])
+
+    def test_since_cursor_returns_only_changed_rows(self):
+        self._age_everything()
+        cursor = encode_cursor(timezone.now() - timedelta(minutes=1))
+        other = create_match(self.tournament, self.user, self.opponent, match_number=2)
+        notification = Notification.objects.create(recipient=self.user, title="Match soon")
+
+        data = self._sync(cursor).json()["data"]
+
+        self.assertFalse(data["full"])
+        self.assertEqual([item["id"] for item in data["matches"]["upserted"]], [other.id])
+        self.assertEqual([item["id"] for item in data["notifications"]["upserted"]], [notification.id])
+
+    def test_unchanged_delta_returns_304_with_matching_etag(self):
+        self._age_everything()
+        cursor = encode_cursor(timezone.now() - timedelta(minutes=1))
+
+        first = self._sync(cursor)
+        second = self._sync(cursor, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_deletes_are_reported_as_tombstones(self):
+        self._age_everything()
+        cursor = encode_cursor(timezone.now() - timedelta(minutes=1))
+        match_id = self.match.id
+        Match.objects.filter(id=match_id).delete()
+
+        data = self._sync(cursor).json()["data"]
+
+        self.assertIn(match_id, data["matches"]["deleted"])
+        self.assertTrue(
+            MobileSyncTombstone.objects.filter(entity="match", object_id=match_id, scope_id=self.user.id).exists()
+        )
+
+    def test_soft_deleted_match_is_reported_as_deleted(self):
+        self._age_everything()
+        cursor = encode_cursor(timezone.now() - timedelta(minutes=1))
+        self.match.soft_delete()
+
+        data = self._sync(cursor).json()["data"]
+
+        self.assertEqual(data["matches"]["upserted"], [])
+        self.assertEqual(data["matches"]["deleted"], [self.match.id])
+
+    def test_paging_on_read_notifications_terminates(self):
+        self._age_everything()
+        cursor = encode_cursor(timezone.now() - timedelta(minutes=1))
+        old = timezone.now() - timedelta(days=2)
+        read_at = timezone.now() - timedelta(seconds=30)
+        for index in range(5):
+            notification = Notification.objects.create(recipient=self.user, title=f"Old {index}")
+            Notification.objects.filter(pk=notification.pk).update(
+                created_at=old, read_at=read_at + timedelta(seconds=5 * index)
+            )
+
+        seen, since = [], decode_cursor(cursor)
+        for _ in range(10):
+            payload = build_sync_payload(self.user, since, limit=2)
+            seen.extend(item["id"] for item in payload["notifications"]["upserted"])
+            if not payload["has_more"]:
+                break
+            since = decode_cursor(payload["cursor"])
+
+        self.assertFalse(payload["has_more"])
+        self.assertEqual(
+            set(seen), set(Notification.objects.filter(title__startswith="Old").values_list("id", flat=True))
+        )
+
+    def test_expired_tombstones_are_pruned_and_stale_cursors_get_a_snapshot(self):
+        MobileSyncTombstone.objects.create(entity="match", object_id=991, scope_id=self.user.id)
+        MobileSyncTombstone.objects.create(entity="match", object_id=992, scope_id=self.user.id)
+        MobileSyncTombstone.objects.filter(object_id=991).update(deleted_at=timezone.now() - timedelta(days=90))
+
+        self.assertEqual(prune_tombstones(), 1)
+        self.assertEqual(list(MobileSyncTombstone.objects.values_list("object_id", flat=True)), [992])
+
+        data = self._sync(encode_cursor(timezone.now() - timedelta(days=90))).json()["data"]
+        self.assertTrue(data["full"])
+        self.assertEqual([item["id"] for item in data["matches"]["upserted"]], [self.match.id])
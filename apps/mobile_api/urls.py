@@ -15,4 +15,5 @@ urlpatterns = [
     path("", include(("apps.mobile_api.teams.urls", "teams"), namespace="teams")),
     path("", include(("apps.mobile_api.matches.urls", "matches"), namespace="matches")),
     path("", include(("apps.mobile_api.notifications.urls", "notifications"), namespace="notifications")),
+    path("", include(("apps.mobile_api.sync.urls", "sync"), namespace="sync")),
 ]
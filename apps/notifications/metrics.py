@@ -129,3 +129,70 @@ def set_circuit_breaker_state(endpoint: str, state: str):
     }.get(state, 0)
     
     webhook_cb_state.labels(endpoint=endpoint).set(state_value)
+
+
+# ---------------------------------------------------------------------------
+# Mobile push delivery (PushDispatcher)
+# ---------------------------------------------------------------------------
+
+push_messages_total = Counter(
+    'push_messages_total',
+    'Total push deliveries by platform and outcome',
+    ['platform', 'outcome']
+)
+
+push_batch_latency_seconds = Histogram(
+    'push_batch_latency_seconds',
+    'Latency of a single provider push batch',
+    ['platform'],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
+push_dispatch_latency_seconds = Histogram(
+    'push_dispatch_latency_seconds',
+    'End-to-end latency of one PushDispatcher.dispatch() call',
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+
+push_coalesced_total = Counter(
+    'push_coalesced_total',
+    'Push messages collapsed or deferred by per-user coalescing'
+)
+
+push_tokens_pruned_total = Counter(
+    'push_tokens_pruned_total',
+    'Device tokens deactivated after provider rejection'
+)
+
+
+def record_push_batch(platform: str, sent: int, failed: int, latency_seconds: float):
+    """
+    Record one provider batch.
+    
+    Args:
+        platform: MobileDeviceToken platform ('android', 'ios')
+        sent: Deliveries accepted by the provider
+        failed: Deliveries that failed (excluding invalid tokens)
+        latency_seconds: Batch round-trip time
+    """
+    if sent:
+        push_messages_total.labels(platform=platform, outcome='sent').inc(sent)
+    if failed:
+        push_messages_total.labels(platform=platform, outcome='failed').inc(failed)
+    push_batch_latency_seconds.labels(platform=platform).observe(latency_seconds)
+
+
+def record_push_dispatch(coalesced: int, pruned: int, latency_seconds: float):
+    """
+    Record one dispatch run.
+    
+    Args:
+        coalesced: Messages collapsed or deferred
+        pruned: Tokens deactivated
+        latency_seconds: Total dispatch time
+    """
+    if coalesced:
+        push_coalesced_total.inc(coalesced)
+    if pruned:
+        push_tokens_pruned_total.inc(pruned)
+    push_dispatch_latency_seconds.observe(latency_seconds)
@@ -713,12 +713,15 @@ def notify(
     type_str = event_str if event_str in enum_values else "generic"
 
     created = skipped = sent = 0
+    push_enabled = getattr(settings, 'NOTIFICATIONS_PUSH_ENABLED', False)
+    push_user_ids = []
 
     # Detect presence of an optional fingerprint column on your Notification model
     has_fp = any(getattr(f, "name", None) == "fingerprint" for f in Notification._meta.get_fields())
 
     for target in recipients:
         user = _to_user_model(target)
+        created_before = created
 
         if user is not None:
             with transaction.atomic():
@@ -775,6 +778,12 @@ def notify(
                         )
                         created += 1
 
+        # Only push for a notification this call actually created; a dedupe
+        # skip means the user was already notified.
+        if push_enabled and user is not None and created > created_before:
+            if can_deliver_notification(user, 'push', category, bypass_user_prefs=bypass_user_prefs):
+                push_user_ids.append(user.id)
+
         # PHASE 5B: Optional email with enforcement checks
         if email_subject and email_template:
             user_model = _to_user_model(target)
@@ -791,6 +800,22 @@ def notify(
                 if _send_templated_email(_resolve_email(target), email_subject, email_template, email_ctx or {}):
                     sent += 1
     
+    # Mobile push: buffered per transaction, delivered in provider batches
+    if push_user_ids:
+        try:
+            from apps.notifications.services.push_service import queue_push
+
+            queue_push(
+                push_user_ids,
+                title or "",
+                body or "",
+                data={"event": event_str, "url": url or "", "tournament_id": tournament_id, "match_id": match_id},
+                collapse_key=f"{event_str}:{match_id or tournament_id or ''}" if (match_id or tournament_id) else "",
+            )
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).warning(f"Push queuing failed: {e}")
+
     # MILESTONE F: Optional webhook delivery
     webhook_sent = 0
     if getattr(settings, 'NOTIFICATIONS_WEBHOOK_ENABLED', False):
@@ -3,6 +3,7 @@ Notification services package.
 
 MILESTONE F: Services for notification delivery
 - webhook_service: HTTP webhook delivery with HMAC signing and retries
+- push_service: Batched mobile push delivery for MobileDeviceToken
 - Re-exports notify() and emit() from parent services.py for backward compatibility
 """
 
@@ -27,6 +28,11 @@ from .webhook_service import (
     get_webhook_service,
     deliver_webhook,
 )
+from .push_service import (
+    PushDispatcher,
+    PushMessage,
+    queue_push,
+)
 
 __all__ = [
     'notify',
@@ -37,4 +43,7 @@ __all__ = [
     'WebhookService',
     'get_webhook_service',
     'deliver_webhook',
+    'PushDispatcher',
+    'PushMessage',
+    'queue_push',
 ]
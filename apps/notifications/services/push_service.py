@@ -0,0 +1,340 @@
+"""
+PushDispatcher - Batched mobile push delivery for MobileDeviceToken.
+
+Outgoing pushes are buffered per transaction, released on commit to a
+Celery task, and delivered in provider-sized batches:
+
+- Messages for the same (user, collapse_key) are collapsed into one push
+  carrying a ``coalesced`` count (N score updates -> 1 push)
+- A per-user cache window defers repeats of a collapse key; the latest
+  deferred message is flushed once the window closes
+- Active tokens for every recipient are loaded in a single query and
+  grouped by platform
+- Tokens reported invalid by the provider are deactivated in bulk
+- Throughput / latency are exported via notifications.metrics
+
+The transport is pluggable (settings.NOTIFICATIONS_PUSH_TRANSPORT). The
+default LoggingPushTransport only logs batch sizes until a provider
+transport is configured; LocalPushTransport records deliveries in-process
+and is meant for tests.
+
+Configuration (settings.py):
+    NOTIFICATIONS_PUSH_ENABLED = False
+    NOTIFICATIONS_PUSH_TRANSPORT = 'apps.notifications.services.push_service.LoggingPushTransport'
+    NOTIFICATIONS_PUSH_BATCH_SIZES = {'android': 500, 'ios': 100}
+    NOTIFICATIONS_PUSH_COALESCE_SECONDS = 10
+"""
+
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from apps.common.commit_buffer import OnCommitBuffer
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRANSPORT = 'apps.notifications.services.push_service.LoggingPushTransport'
+DEFAULT_BATCH_SIZES = {'android': 500, 'ios': 100}
+DEFAULT_COALESCE_SECONDS = 10
+
+_WINDOW_KEY = 'push:window:{user_id}:{collapse_key}'
+_PENDING_KEY = 'push:pending:{user_id}:{collapse_key}'
+
+
+@dataclass
+class PushMessage:
+    """A single logical push for one user."""
+
+    user_id: int
+    title: str
+    body: str = ''
+    data: Dict[str, Any] = field(default_factory=dict)
+    collapse_key: str = ''
+    coalesced: int = 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> 'PushMessage':
+        return cls(**payload)
+
+
+@dataclass
+class PushDelivery:
+    """A message bound to one device token."""
+
+    token: str
+    message: PushMessage
+
+
+@dataclass
+class PushBatchResult:
+    sent: int = 0
+    failed: int = 0
+    invalid_tokens: List[str] = field(default_factory=list)
+
+
+class PushTransport:
+    """Provider transport interface. One call == one provider batch."""
+
+    def send_batch(self, platform: str, deliveries: List[PushDelivery]) -> PushBatchResult:
+        raise NotImplementedError
+
+
+class LoggingPushTransport(PushTransport):
+    """Default transport: logs each batch and keeps nothing in memory."""
+
+    def send_batch(self, platform: str, deliveries: List[PushDelivery]) -> PushBatchResult:
+        logger.info("Push batch (no provider configured): platform=%s size=%s", platform, len(deliveries))
+        return PushBatchResult(sent=len(deliveries))
+
+
+class LocalPushTransport(PushTransport):
+    """
+    In-process stand-in for FCM/APNs, for tests only.
+
+    Deliveries are appended to the class-level ``outbox``; any token in
+    ``invalid_tokens`` is reported back as unregistered.
+    """
+
+    outbox: List[tuple] = []
+    invalid_tokens: set = set()
+
+    def send_batch(self, platform: str, deliveries: List[PushDelivery]) -> PushBatchResult:
+        result = PushBatchResult()
+        for delivery in deliveries:
+            if delivery.token in self.invalid_tokens:
+                result.invalid_tokens.append(delivery.token)
+                continue
+            self.outbox.append((platform, delivery.token, delivery.message))
+            result.sent += 1
+        return result
+
+    @classmethod
+    def reset(cls):
+        cls.outbox = []
+        cls.invalid_tokens = set()
+
+
+def get_push_transport() -> PushTransport:
+    path = getattr(settings, 'NOTIFICATIONS_PUSH_TRANSPORT', DEFAULT_TRANSPORT)
+    return import_string(path)()
+
+
+def coalesce_messages(messages: Iterable[PushMessage]) -> List[PushMessage]:
+    """
+    Collapse messages sharing (user_id, collapse_key); the latest one wins.
+
+    Messages without a collapse key are never merged.
+    """
+    collapsed: 'OrderedDict[tuple, PushMessage]' = OrderedDict()
+    for index, message in enumerate(messages):
+        key = (message.user_id, message.collapse_key) if message.collapse_key else (message.user_id, None, index)
+        previous = collapsed.pop(key, None)
+        if previous is not None:
+            message.coalesced += previous.coalesced
+        collapsed[key] = message
+    return list(collapsed.values())
+
+
+class PushDispatcher:
+    """Deliver PushMessages in provider-sized batches."""
+
+    def __init__(
+        self,
+        transport: Optional[PushTransport] = None,
+        batch_sizes: Optional[Dict[str, int]] = None,
+        coalesce_seconds: Optional[int] = None,
+    ):
+        self.transport = transport or get_push_transport()
+        self.batch_sizes = batch_sizes or getattr(settings, 'NOTIFICATIONS_PUSH_BATCH_SIZES', DEFAULT_BATCH_SIZES)
+        self.coalesce_seconds = (
+            coalesce_seconds if coalesce_seconds is not None
+            else getattr(settings, 'NOTIFICATIONS_PUSH_COALESCE_SECONDS', DEFAULT_COALESCE_SECONDS)
+        )
+
+    def dispatch(self, messages: Iterable[PushMessage], *, respect_window: bool = True) -> Dict[str, int]:
+        """
+        Coalesce, admit and deliver ``messages``.
+
+        Returns:
+            dict with sent / failed / pruned / coalesced / deferred counts
+        """
+        from apps.notifications import metrics
+
+        started = time.monotonic()
+        messages = list(messages)
+        collapsed = coalesce_messages(messages)
+        stats = {
+            'sent': 0,
+            'failed': 0,
+            'pruned': 0,
+            'coalesced': len(messages) - len(collapsed),
+            'deferred': 0,
+        }
+
+        if respect_window and self.coalesce_seconds > 0:
+            admitted = [message for message in collapsed if self._admit(message)]
+            stats['deferred'] = len(collapsed) - len(admitted)
+        else:
+            admitted = collapsed
+
+        deliveries_by_platform = self._resolve_deliveries(admitted)
+        invalid_tokens: List[str] = []
+        for platform, deliveries in deliveries_by_platform.items():
+            size = max(1, int(self.batch_sizes.get(platform, 100)))
+            for offset in range(0, len(deliveries), size):
+                batch = deliveries[offset:offset + size]
+                batch_started = time.monotonic()
+                try:
+                    result = self.transport.send_batch(platform, batch)
+                except Exception as exc:
+                    logger.warning("Push batch to %s failed (%d deliveries): %s", platform, len(batch), exc)
+                    result = PushBatchResult(failed=len(batch))
+                metrics.record_push_batch(
+                    platform,
+                    sent=result.sent,
+                    failed=result.failed,
+                    latency_seconds=time.monotonic() - batch_started,
+                )
+                stats['sent'] += result.sent
+                stats['failed'] += result.failed
+                invalid_tokens.extend(result.invalid_tokens)
+
+        if invalid_tokens:
+            stats['pruned'] = self._prune(invalid_tokens)
+        metrics.record_push_dispatch(
+            coalesced=stats['coalesced'] + stats['deferred'],
+            pruned=stats['pruned'],
+            latency_seconds=time.monotonic() - started,
+        )
+        return stats
+
+    def _admit(self, message: PushMessage) -> bool:
+        """
+        Open a per-(user, collapse_key) window or defer into it.
+
+        The first message in a window is sent immediately. Later ones
+        overwrite a pending slot that is flushed when the window closes.
+        """
+        if not message.collapse_key:
+            return True
+        keys = {'user_id': message.user_id, 'collapse_key': message.collapse_key}
+        if cache.add(_WINDOW_KEY.format(**keys), 1, timeout=self.coalesce_seconds):
+            return True
+
+        pending_key = _PENDING_KEY.format(**keys)
+        pending = cache.get(pending_key)
+        if pending:
+            message.coalesced += pending.get('coalesced', 1)
+        first_deferral = pending is None
+        cache.set(pending_key, message.to_dict(), timeout=self.coalesce_seconds * 3)
+        if first_deferral:
+            _schedule_pending_flush(message.user_id, message.collapse_key, self.coalesce_seconds)
+        return False
+
+    def _resolve_deliveries(self, messages: List[PushMessage]) -> Dict[str, List[PushDelivery]]:
+        from apps.mobile_api.models import MobileDeviceToken
+
+        if not messages:
+            return {}
+        by_user: Dict[int, List[PushMessage]] = defaultdict(list)
+        for message in messages:
+            by_user[message.user_id].append(message)
+
+        deliveries: Dict[str, List[PushDelivery]] = defaultdict(list)
+        rows = MobileDeviceToken.objects.filter(
+            user_id__in=list(by_user.keys()), is_active=True,
+        ).values_list('user_id', 'token', 'platform')
+        for user_id, token, platform in rows:
+            for message in by_user[user_id]:
+                deliveries[platform].append(PushDelivery(token=token, message=message))
+        return deliveries
+
+    def _prune(self, tokens: List[str]) -> int:
+        from apps.mobile_api.models import MobileDeviceToken
+
+        return MobileDeviceToken.objects.filter(token__in=set(tokens), is_active=True).update(
+            is_active=False, updated_at=timezone.now(),
+        )
+
+
+def flush_pending_push(user_id: int, collapse_key: str) -> Dict[str, int]:
+    """Send the latest deferred message for a (user, collapse_key) window."""
+    pending_key = _PENDING_KEY.format(user_id=user_id, collapse_key=collapse_key)
+    payload = cache.get(pending_key)
+    if not payload:
+        return {'sent': 0, 'failed': 0, 'pruned': 0, 'coalesced': 0, 'deferred': 0}
+    cache.delete(pending_key)
+    return PushDispatcher().dispatch([PushMessage.from_dict(payload)], respect_window=False)
+
+
+def _schedule_pending_flush(user_id: int, collapse_key: str, countdown: int) -> None:
+    from apps.notifications.tasks import flush_pending_push_task
+
+    try:
+        flush_pending_push_task.apply_async(args=[user_id, collapse_key], countdown=countdown, retry=False)
+    except Exception:
+        logger.warning("Push flush queuing failed (broker down?) for user %s", user_id)
+
+
+# ---------------------------------------------------------------------------
+# Per-transaction buffer
+# ---------------------------------------------------------------------------
+
+
+def queue_push(
+    user_ids: Iterable[int],
+    title: str,
+    body: str = '',
+    *,
+    data: Optional[Dict[str, Any]] = None,
+    collapse_key: str = '',
+) -> int:
+    """
+    Buffer a push for ``user_ids`` and release it when the transaction commits.
+
+    All pushes queued inside one transaction go out as a single Celery task,
+    so a 500-team bracket reminder costs one broker round trip.
+    """
+    messages = [
+        PushMessage(
+            user_id=int(user_id),
+            title=title,
+            body=body,
+            data=dict(data or {}),
+            collapse_key=collapse_key,
+        )
+        for user_id in user_ids
+        if user_id is not None
+    ]
+    if not messages:
+        return 0
+    if not _buffer.extend(messages):
+        _release_buffer(messages)
+    return len(messages)
+
+
+def _release_buffer(messages: List[PushMessage]) -> None:
+    from apps.notifications.tasks import dispatch_push_notifications
+
+    if not messages:
+        return
+    payload = [message.to_dict() for message in messages]
+    try:
+        dispatch_push_notifications.apply_async(args=[payload], ignore_result=True, retry=False)
+    except Exception:
+        logger.warning("Push dispatch queuing failed (broker down?) — sending %d pushes inline", len(payload))
+        PushDispatcher().dispatch(messages)
+
+
+_buffer = OnCommitBuffer(_release_buffer)
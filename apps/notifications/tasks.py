@@ -343,3 +343,29 @@ def batch_send_notifications(self, user_ids, notification_type, title, body, url
     except Exception as exc:
         logger.error(f"Error sending batch notifications: {str(exc)}", exc_info=True)
         return {'status': 'error', 'message': str(exc)}
+
+
+@shared_task(bind=True, name='notifications.dispatch_push_notifications', ignore_result=True)
+def dispatch_push_notifications(self, messages):
+    """
+    Deliver a buffered batch of mobile pushes.
+    
+    Args:
+        messages: List of PushMessage dicts queued by push_service.queue_push()
+    """
+    from apps.notifications.services.push_service import PushDispatcher, PushMessage
+    
+    stats = PushDispatcher().dispatch(PushMessage.from_dict(payload) for payload in messages)
+    logger.info(
+        "Push dispatch: sent=%(sent)s failed=%(failed)s pruned=%(pruned)s "
+        "coalesced=%(coalesced)s deferred=%(deferred)s", stats,
+    )
+    return stats
+
+
+@shared_task(bind=True, name='notifications.flush_pending_push', ignore_result=True)
+def flush_pending_push_task(self, user_id, collapse_key):
+    """Send the latest push deferred inside a per-user coalescing window."""
+    from apps.notifications.services.push_service import flush_pending_push
+    
+    return flush_pending_push(user_id, collapse_key)
@@ -0,0 +1,116 @@
+"""
+Tests for the batched mobile push dispatcher.
+"""
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.mobile_api.models import MobileDeviceToken
+from apps.notifications.services import notify
+from apps.notifications.services.push_service import (
+    LocalPushTransport,
+    LoggingPushTransport,
+    PushDispatcher,
+    PushMessage,
+    coalesce_messages,
+    get_push_transport,
+)
+
+
+User = get_user_model()
+
+
+class PushDispatcherTestCase(TestCase):
+    """PushDispatcher batching, coalescing and token pruning"""
+    
+    def setUp(self):
+        cache.clear()
+        LocalPushTransport.reset()
+        self.users = [
+            User.objects.create_user(username=f'pushuser{i}', email=f'push{i}@example.com', password='testpass123')
+            for i in range(5)
+        ]
+        for index, user in enumerate(self.users):
+            MobileDeviceToken.objects.create(
+                user=user,
+                token=f'token-{index}',
+                platform='android' if index % 2 == 0 else 'ios',
+            )
+    
+    def test_coalesce_keeps_latest_message_per_collapse_key(self):
+        messages = [
+            PushMessage(user_id=1, title='1-0', collapse_key='score:9'),
+            PushMessage(user_id=1, title='2-0', collapse_key='score:9'),
+            PushMessage(user_id=1, title='Lobby open'),
+            PushMessage(user_id=1, title='Lobby open'),
+        ]
+        
+        collapsed = coalesce_messages(messages)
+        
+        self.assertEqual([m.title for m in collapsed], ['2-0', 'Lobby open', 'Lobby open'])
+        self.assertEqual(collapsed[0].coalesced, 2)
+    
+    def test_dispatch_sends_in_provider_sized_batches(self):
+        transport = LocalPushTransport()
+        dispatcher = PushDispatcher(transport=transport, batch_sizes={'android': 2, 'ios': 1}, coalesce_seconds=0)
+        messages = [PushMessage(user_id=user.id, title='Match starting') for user in self.users]
+        
+        with mock.patch.object(transport, 'send_batch', wraps=transport.send_batch) as send_batch:
+            stats = dispatcher.dispatch(messages)
+        
+        self.assertEqual(stats['sent'], 5)
+        batch_sizes = sorted(len(call.args[1]) for call in send_batch.call_args_list)
+        self.assertEqual(batch_sizes, [1, 1, 1, 2])
+    
+    def test_invalid_tokens_are_pruned(self):
+        LocalPushTransport.invalid_tokens = {'token-0'}
+        dispatcher = PushDispatcher(transport=LocalPushTransport(), coalesce_seconds=0)
+        
+        stats = dispatcher.dispatch([PushMessage(user_id=self.users[0].id, title='Hi')])
+        
+        self.assertEqual(stats['pruned'], 1)
+        self.assertFalse(MobileDeviceToken.objects.get(token='token-0').is_active)
+    
+    def test_repeat_collapse_key_inside_window_is_deferred(self):
+        dispatcher = PushDispatcher(transport=LocalPushTransport(), coalesce_seconds=30)
+        user_id = self.users[0].id
+        
+        with mock.patch('apps.notifications.services.push_service._schedule_pending_flush') as schedule:
+            first = dispatcher.dispatch([PushMessage(user_id=user_id, title='1-0', collapse_key='score:1')])
+            second = dispatcher.dispatch([PushMessage(user_id=user_id, title='2-0', collapse_key='score:1')])
+        
+        self.assertEqual(first['sent'], 1)
+        self.assertEqual(second['sent'], 0)
+        self.assertEqual(second['deferred'], 1)
+        schedule.assert_called_once()
+    
+    def test_single_query_for_all_recipient_tokens(self):
+        dispatcher = PushDispatcher(transport=LocalPushTransport(), coalesce_seconds=0)
+        messages = [PushMessage(user_id=user.id, title='Reminder') for user in self.users]
+        
+        with self.assertNumQueries(1):
+            dispatcher.dispatch(messages)
+
+    def test_default_transport_keeps_nothing_in_memory(self):
+        transport = get_push_transport()
+        dispatcher = PushDispatcher(transport=transport, coalesce_seconds=0)
+
+        stats = dispatcher.dispatch([PushMessage(user_id=self.users[0].id, title='Hi')])
+
+        self.assertIsInstance(transport, LoggingPushTransport)
+        self.assertEqual(stats['sent'], 1)
+        self.assertEqual(LocalPushTransport.outbox, [])
+
+    @override_settings(NOTIFICATIONS_PUSH_ENABLED=True)
+    def test_deduped_notification_is_not_pushed_again(self):
+        user = self.users[0]
+
+        with mock.patch('apps.notifications.services.push_service.queue_push') as queue_push:
+            first = notify([user], event='match_scheduled', title='Match soon', match_id=77, bypass_user_prefs=True)
+            second = notify([user], event='match_scheduled', title='Match soon', match_id=77, bypass_user_prefs=True)
+
+        self.assertEqual((first['created'], second['skipped']), (1, 1))
+        queue_push.assert_called_once()
+        self.assertEqual(list(queue_push.call_args.args[0]), [user.id])
@@ -28,6 +28,8 @@ from django.utils import timezone
 from django.db import models
 from datetime import timedelta
 
+from apps.common import cache_tags
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,7 +65,7 @@ def ticker_feed(request):
             }
         }
     """
-    cache_key = 'hub_ticker_feed'
+    cache_key = cache_tags.tagged_key('hub_ticker_feed', [cache_tags.HUB_TAG])
     cached_data = cache.get(cache_key)
     
     if cached_data is not None:
@@ -224,7 +226,7 @@ def scout_radar(request):
     game_filter = request.GET.get('game', None)
     limit = min(int(request.GET.get('limit', 20)), 50)  # Max 50
     
-    cache_key = f'scout_radar_{game_filter}_{limit}'
+    cache_key = cache_tags.tagged_key(f'scout_radar_{game_filter}_{limit}', [cache_tags.HUB_TAG])
     cached_data = cache.get(cache_key)
     
     if cached_data is not None:
@@ -320,7 +322,7 @@ def active_scrims(request):
     region_filter = request.GET.get('region', None)
     limit = min(int(request.GET.get('limit', 20)), 50)  # Max 50
     
-    cache_key = f'active_scrims_{game_filter}_{region_filter}_{limit}'
+    cache_key = cache_tags.tagged_key(f'active_scrims_{game_filter}_{region_filter}_{limit}', [cache_tags.HUB_TAG])
     cached_data = cache.get(cache_key)
     
     if cached_data is not None:
@@ -277,12 +277,8 @@ def competitive_settings(request, slug):
                 games = Game.objects.filter(pk__in=ids, is_active=True)
                 settings_obj.allowed_games.set(games)
             invalidate_hub_cache(game_id=team.game_id)
-            try:
-                from apps.organizations.services.cache_invalidation import safe_cache_delete_pattern
-                safe_cache_delete_pattern(f"team_detail:{team.slug}:*")
-                safe_cache_delete_pattern("active_scrims_*")
-            except Exception:
-                pass
+            from apps.organizations.services.cache_invalidation import invalidate_team_cache
+            invalidate_team_cache(team.slug, team_id=team.id)
         except (TypeError, ValueError, json.JSONDecodeError) as exc:
             return JsonResponse({"success": False, "error": str(exc)}, status=400)
 
@@ -0,0 +1,56 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0049_team_metadata'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerDiscoveryEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('user_id', models.BigIntegerField(unique=True)),
+                (
+                    'is_listed',
+                    models.BooleanField(
+                        default=True,
+                        help_text='Public LFT player; unlisted rows are kept so index readers see the removal',
+                    ),
+                ),
+                ('display_name', models.CharField(blank=True, default='', max_length=150)),
+                ('username', models.CharField(blank=True, default='', max_length=150)),
+                (
+                    'last_updated',
+                    models.DateTimeField(
+                        blank=True, help_text='CareerProfile.last_updated — sort key for "newest"', null=True,
+                    ),
+                ),
+                (
+                    'facets',
+                    models.JSONField(blank=True, default=dict, help_text='Normalized facet values: {facet: [value, ...]}'),
+                ),
+                (
+                    'labels',
+                    models.JSONField(
+                        blank=True, default=dict, help_text='Display label per normalized value: {facet: {value: label}}',
+                    ),
+                ),
+                ('search_text', models.TextField(blank=True, default='')),
+                (
+                    'summary',
+                    models.JSONField(
+                        blank=True, default=dict, help_text='Public-safe player card with ordered passport summaries',
+                    ),
+                ),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Player Discovery Entry',
+                'verbose_name_plural': 'Player Discovery Entries',
+                'db_table': 'organizations_player_discovery_entry',
+            },
+        ),
+    ]
@@ -42,6 +42,7 @@ if not _MINIMAL_TEST_APPS:
     from .discord_sync import DiscordChatMessage
     from .join_request import TeamJoinRequest
     from .recruitment import RecruitmentPosition, RecruitmentRequirement
+    from .player_discovery import PlayerDiscoveryEntry
     from .journey import TeamJourneyMilestone
     from .training import (
         PracticeSession,
@@ -70,6 +71,7 @@ if not _MINIMAL_TEST_APPS:
         'TeamJoinRequest',
         'RecruitmentPosition',
         'RecruitmentRequirement',
+        'PlayerDiscoveryEntry',
         'TeamJourneyMilestone',
         'TrainingVisibility',
         'ScrimRequest',
@@ -0,0 +1,56 @@
+"""
+PlayerDiscoveryEntry — denormalized Looking-For-Team listing per player.
+
+Scouting Grounds used to answer every filter combination with nested
+``icontains`` subqueries across CareerProfile, UserProfile and public
+game passports. This table holds one pre-joined row per player: the
+facet values they can be found by, a lowercased search blob and the
+public-safe card payload. apps.organizations.services.player_discovery
+keeps it current from passport / career profile saves and serves
+queries from in-memory posting lists built over it.
+"""
+
+from django.db import models
+
+
+class PlayerDiscoveryEntry(models.Model):
+    """Discovery document for one player (listed or formerly listed)."""
+
+    user_id = models.BigIntegerField(unique=True)
+    is_listed = models.BooleanField(
+        default=True,
+        help_text='Public LFT player; unlisted rows are kept so index readers see the removal',
+    )
+    display_name = models.CharField(max_length=150, blank=True, default='')
+    username = models.CharField(max_length=150, blank=True, default='')
+    last_updated = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='CareerProfile.last_updated — sort key for "newest"',
+    )
+    facets = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text='Normalized facet values: {facet: [value, ...]}',
+    )
+    labels = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text='Display label per normalized value: {facet: {value: label}}',
+    )
+    search_text = models.TextField(blank=True, default='')
+    summary = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text='Public-safe player card with ordered passport summaries',
+    )
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        db_table = 'organizations_player_discovery_entry'
+        verbose_name = 'Player Discovery Entry'
+        verbose_name_plural = 'Player Discovery Entries'
+
+    def __str__(self):
+        state = 'listed' if self.is_listed else 'unlisted'
+        return f'{self.username or self.user_id} ({state})'
@@ -2,12 +2,17 @@
 Cache invalidation helpers for vNext organizations and teams.
 
 Provides backend-agnostic cache invalidation that never crashes requests.
-Works with Redis (delete_pattern), LocMemCache (skip), or any other backend.
+Team, organization and hub caches are registered under tags
+(apps.common.cache_tags), so invalidation is an O(1) generation bump per
+tag instead of a Redis keyspace SCAN. ``safe_cache_delete_pattern`` is kept
+for callers whose keys are not tagged yet.
 """
 
 from django.core.cache import cache
 import logging
 
+from apps.common import cache_tags
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,14 +64,14 @@ def invalidate_vnext_hub_cache() -> None:
     - Team visibility/status changed
     - Featured team list should refresh
     
+    Bumps the ``hub`` tag, which covers featured teams, spotlight,
+    leaderboards, hub feeds and every user's hero carousel.
     This is a best-effort operation and never fails the request.
     """
-    safe_cache_delete_pattern('hub:featured_teams:*')
-    safe_cache_delete_pattern('hub:vnext:*')
-    safe_cache_delete_pattern('hero_carousel_*')
+    cache_tags.invalidate(cache_tags.HUB_TAG)
 
 
-def invalidate_team_cache(team_slug: str) -> None:
+def invalidate_team_cache(team_slug: str = None, *, team_id: int = None) -> None:
     """
     Invalidate cache entries for a specific team.
     
@@ -76,13 +81,21 @@ def invalidate_team_cache(team_slug: str) -> None:
     - Team roster changed
     
     Args:
-        team_slug: Team slug identifier
+        team_slug: Team slug identifier (resolved to an id when team_id is omitted)
+        team_id: Team primary key
     """
-    safe_cache_delete_pattern(f'team:{team_slug}:*')
-    safe_cache_delete_pattern(f'team_detail:{team_slug}')
+    if team_id is None and team_slug:
+        try:
+            from apps.organizations.models import Team
+            team_id = Team.objects.filter(slug=team_slug).values_list('id', flat=True).first()
+        except Exception:
+            logger.exception(f"Could not resolve team for cache invalidation: {team_slug}")
     
-    # Also invalidate hub cache if team visibility changed
-    invalidate_vnext_hub_cache()
+    if team_id is not None:
+        cache_tags.invalidate(cache_tags.team_tag(team_id), cache_tags.HUB_TAG)
+    else:
+        # Also invalidate hub cache if team visibility changed
+        invalidate_vnext_hub_cache()
 
 
 def invalidate_organization_cache(org_slug: str) -> None:
@@ -92,5 +105,4 @@ def invalidate_organization_cache(org_slug: str) -> None:
     Args:
         org_slug: Organization slug identifier
     """
-    safe_cache_delete_pattern(f'org:{org_slug}:*')
-    safe_cache_delete_pattern(f'org_detail:{org_slug}')
+    cache_tags.invalidate(cache_tags.org_tag(org_slug))
@@ -3,9 +3,10 @@ Hub cache invalidation helpers.
 
 Used to ensure hub displays fresh data after team/org changes.
 """
-from django.core.cache import cache
 import logging
 
+from apps.common import cache_tags
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,40 +20,17 @@ def invalidate_hub_cache(game_id=None):
     - Team deleted
     - Organization created/updated
     
+    Bumps the ``hub`` tag (featured teams, leaderboards, spotlight, feeds and
+    per-user hero carousels) plus the game tag when given. O(1) per tag —
+    no keyspace scan, and per-user keys are covered without enumerating them.
+    
     Args:
-        game_id: Optional game ID to invalidate specific game caches.
-                 If None, invalidates all game caches.
+        game_id: Optional game ID to also invalidate game-scoped caches.
     """
-    keys_to_delete = []
-    
-    # Featured teams caches
-    # ALWAYS invalidate "all games" cache since team affects global view
-    keys_to_delete.append(f'featured_teams_all_12')
-    
-    if game_id:
-        # Also invalidate game-specific cache
-        keys_to_delete.append(f'featured_teams_{game_id}_12')
-    
-    # Leaderboard caches
-    # ALWAYS invalidate "all games" cache
-    keys_to_delete.append(f'hub_leaderboard_all_50')
-    
+    tags = [cache_tags.HUB_TAG]
     if game_id:
-        # Also invalidate game-specific cache
-        keys_to_delete.append(f'hub_leaderboard_{game_id}_50')
-    
-    # Hero carousel cache (per-user, but invalidate pattern)
-    # Note: Hero carousel is user-specific, so we can't easily invalidate all users
-    # It will refresh after 2 minutes anyway
-    
-    # Delete all identified keys
-    for key in keys_to_delete:
-        try:
-            cache.delete(key)
-            logger.debug(f"Invalidated hub cache: {key}")
-        except Exception as e:
-            logger.warning(f"Failed to invalidate cache key {key}: {e}")
-    
+        tags.append(cache_tags.game_tag(game_id))
+    cache_tags.invalidate(*tags)
     logger.info(f"Hub cache invalidated for game_id={game_id or 'all'}")
 
 
@@ -62,7 +40,5 @@ def invalidate_all_hub_caches():
     
     Use sparingly - only for major data migrations or emergency fixes.
     """
-    # In a production system, you'd use cache.delete_pattern()
-    # For now, invalidate known keys
     invalidate_hub_cache(game_id=None)
     logger.info("All hub caches invalidated")
@@ -14,6 +14,8 @@ from django.contrib.auth.models import User
 from django.core.cache import cache
 from django.conf import settings
 
+from apps.common import cache_tags
+
 from apps.organizations.permissions import get_permission_context
 
 logger = logging.getLogger(__name__)
@@ -56,7 +58,7 @@ def get_org_hub_context(org_slug: str, user: Optional[User] = None) -> Dict[str,
     from apps.organizations.models import Organization, OrganizationMembership, Team
     
     # Build cache key (public data only, not permission-specific)
-    cache_key = f'org_hub_context:{org_slug}'
+    cache_key = cache_tags.tagged_key(f'org_hub_context:{org_slug}', [cache_tags.org_tag(org_slug)])
     
     # Try to get cached data
     cached_data = cache.get(cache_key)
@@ -0,0 +1,432 @@
+"""
+Faceted inverted index for Looking-For-Team player discovery.
+
+PlayerDiscoveryEntry holds one pre-joined row per player (see the model).
+``refresh_players`` re-derives rows from CareerProfile / UserProfile /
+public GameProfile data and is called from the save signals in
+apps.organizations.signals; ``rebuild_entries`` re-derives all of them.
+
+Each process keeps posting lists over the listed rows:
+
+- one set of user ids per (facet, value) for game, region, platform,
+  rank tier, role and LFT status;
+- one set per trigram of the lowercased name / IGN / rank search text.
+
+Queries intersect those sets in memory and never join. Before answering,
+the index applies rows changed since its last read with one indexed
+``updated_at`` query, and reloads in full when the shared generation key
+moves (``rebuild_entries``) or after PLAYER_DISCOVERY_RELOAD_SECONDS.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.organizations.services.recruitment_discovery import (
+    _lft_career_statuses,
+    _passport_summary,
+    _public_passport_queryset,
+    _safe_roles,
+)
+
+logger = logging.getLogger(__name__)
+
+FACETS = ('game', 'region', 'platform', 'rank_tier', 'role', 'lft_status')
+# Filters that matched with icontains before the index; a value selects
+# every posting list whose key contains it.
+SUBSTRING_FACETS = frozenset({'region', 'platform', 'role'})
+
+GENERATION_KEY = 'orgs:player_discovery:generation'
+SEED_LOCK_KEY = 'orgs:player_discovery:seeding'
+# Rows committed out of updated_at order are still picked up by the next delta.
+DELTA_OVERLAP = timedelta(seconds=5)
+ENTRY_BATCH_SIZE = 500
+
+ENTRY_FIELDS = [
+    'is_listed',
+    'display_name',
+    'username',
+    'last_updated',
+    'facets',
+    'labels',
+    'search_text',
+    'summary',
+    'updated_at',
+]
+PASSPORT_FIELDS = (
+    'id',
+    'user_id',
+    'game_id',
+    'game__name',
+    'game__display_name',
+    'game__slug',
+    'ign',
+    'in_game_name',
+    'rank_name',
+    'rank_tier',
+    'peak_rank',
+    'main_role',
+    'platform',
+    'region',
+    'is_lft',
+    'is_pinned',
+    'pinned_order',
+    'sort_order',
+    'status',
+    'visibility',
+)
+PASSPORT_ORDER = ('user_id', '-is_lft', '-is_pinned', 'pinned_order', 'sort_order', 'game__display_name')
+
+_OLDEST = datetime.min.replace(tzinfo=dt_timezone.utc)
+
+
+def _norm(value):
+    if value is None:
+        return ''
+    return str(value).strip().lower()
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+# ============================================================================
+# ENTRY MAINTENANCE
+# ============================================================================
+
+def _build_entry(career, passports):
+    from apps.organizations.models import PlayerDiscoveryEntry
+
+    profile = career.user_profile
+    user = profile.user
+    username = user.username
+    display_name = profile.display_name or user.get_full_name() or username
+
+    facets = {facet: {} for facet in FACETS}
+
+    def add(facet, value, label=None):
+        key = _norm(value)
+        if key:
+            facets[facet].setdefault(key, label or str(value).strip())
+
+    add('region', career.preferred_region)
+    add('lft_status', career.career_status, career.get_career_status_display())
+    for group in (career.primary_roles, career.secondary_roles):
+        for role in group if isinstance(group, list) else ():
+            add('role', role)
+
+    search_parts = [display_name, username, career.preferred_region]
+    cards = []
+    for passport in passports:
+        card = _passport_summary(passport)
+        cards.append(card)
+        add('game', card['game_slug'], card['game'])
+        add('region', passport.region)
+        add('platform', passport.platform)
+        add('role', passport.main_role)
+        if passport.rank_tier is not None:
+            add('rank_tier', passport.rank_tier, f'Tier {passport.rank_tier}')
+        search_parts += [
+            passport.ign,
+            passport.in_game_name,
+            passport.rank_name,
+            passport.main_role,
+            getattr(passport.game, 'display_name', ''),
+            getattr(passport.game, 'name', ''),
+        ]
+
+    return PlayerDiscoveryEntry(
+        user_id=user.id,
+        is_listed=True,
+        display_name=display_name[:150],
+        username=username,
+        last_updated=career.last_updated,
+        facets={facet: sorted(values) for facet, values in facets.items() if values},
+        labels={facet: values for facet, values in facets.items() if values},
+        search_text='\n'.join(_norm(part) for part in search_parts if part),
+        summary={
+            'display_name': display_name,
+            'username': username,
+            'roles': _safe_roles(career.primary_roles, career.secondary_roles),
+            'preferred_region': career.preferred_region,
+            'availability': career.get_availability_display() if career.availability else '',
+            'passports': cards,
+        },
+    )
+
+
+def refresh_players(user_ids):
+    """
+    Re-derive the discovery rows of ``user_ids``.
+
+    Public LFT players are upserted; players who stopped qualifying are
+    flagged unlisted (never deleted, so index readers pick up the removal).
+    Users that never had a row do not get one.
+
+    Returns:
+        Number of listed rows written.
+    """
+    from apps.organizations.models import PlayerDiscoveryEntry
+    from apps.user_profile.models import CareerProfile
+
+    user_ids = {int(user_id) for user_id in user_ids if user_id}
+    if not user_ids:
+        return 0
+
+    careers = {
+        career.user_profile.user_id: career
+        for career in CareerProfile.objects.filter(
+            user_profile__user_id__in=user_ids,
+            lft_enabled=True,
+            recruiter_visibility='PUBLIC',
+            career_status__in=_lft_career_statuses(),
+            user_profile__user__is_active=True,
+        ).select_related('user_profile', 'user_profile__user')
+    }
+    passports = defaultdict(list)
+    if careers:
+        for passport in (
+            _public_passport_queryset()
+            .filter(user_id__in=list(careers))
+            .select_related('game')
+            .only(*PASSPORT_FIELDS)
+            .order_by(*PASSPORT_ORDER)
+        ):
+            passports[passport.user_id].append(passport)
+
+    now = timezone.now()
+    rows = [_build_entry(career, passports[user_id]) for user_id, career in careers.items()]
+    if rows:
+        for row in rows:
+            row.updated_at = now
+        PlayerDiscoveryEntry.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['user_id'],
+            update_fields=ENTRY_FIELDS,
+        )
+    dropped = user_ids - careers.keys()
+    if dropped:
+        PlayerDiscoveryEntry.objects.filter(user_id__in=dropped, is_listed=True).update(
+            is_listed=False, updated_at=now,
+        )
+    return len(rows)
+
+
+def rebuild_entries(batch_size=ENTRY_BATCH_SIZE):
+    """
+    Re-derive every discovery row and make all processes reload.
+
+    Repair path for data written around the signals (bulk updates, game
+    renames, raw SQL). Returns the number of listed players.
+    """
+    from apps.organizations.models import PlayerDiscoveryEntry
+    from apps.user_profile.models import CareerProfile
+
+    user_ids = set(
+        CareerProfile.objects.filter(
+            lft_enabled=True,
+            recruiter_visibility='PUBLIC',
+            career_status__in=_lft_career_statuses(),
+            user_profile__user__is_active=True,
+        ).values_list('user_profile__user_id', flat=True)
+    )
+    user_ids |= set(PlayerDiscoveryEntry.objects.filter(is_listed=True).values_list('user_id', flat=True))
+
+    ordered = sorted(user_ids)
+    listed = 0
+    for start in range(0, len(ordered), batch_size):
+        listed += refresh_players(ordered[start:start + batch_size])
+
+    cache.set(GENERATION_KEY, uuid.uuid4().hex, None)
+    logger.info('Player discovery index rebuilt: %s listed players', listed)
+    return listed
+
+
+# ============================================================================
+# IN-MEMORY INDEX
+# ============================================================================
+
+class _DiscoveryIndex:
+    """Per-process posting lists over the listed PlayerDiscoveryEntry rows."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.generation = None
+        self.loaded_at = 0.0
+        self.synced_through = None
+        self._reset()
+
+    def _reset(self):
+        self.entries = {}
+        self.postings = {facet: defaultdict(set) for facet in FACETS}
+        self.labels = {facet: {} for facet in FACETS}
+        self.trigrams = defaultdict(set)
+        self._orders = {}
+
+    # -- maintenance ---------------------------------------------------------
+
+    def _remove(self, user_id):
+        entry = self.entries.pop(user_id, None)
+        if entry is None:
+            return
+        for facet, values in entry.facets.items():
+            postings = self.postings.get(facet, {})
+            for value in values:
+                users = postings.get(value)
+                if users is not None:
+                    users.discard(user_id)
+                    if not users:
+                        del postings[value]
+        for trigram in _trigrams(entry.search_text):
+            users = self.trigrams.get(trigram)
+            if users is not None:
+                users.discard(user_id)
+                if not users:
+                    del self.trigrams[trigram]
+        self._orders.clear()
+
+    def _add(self, entry):
+        self._remove(entry.user_id)
+        if not entry.is_listed:
+            return
+        self.entries[entry.user_id] = entry
+        for facet, values in entry.facets.items():
+            if facet not in self.postings:
+                continue
+            labels = entry.labels.get(facet, {})
+            for value in values:
+                self.postings[facet][value].add(entry.user_id)
+                self.labels[facet].setdefault(value, labels.get(value, value))
+        for trigram in _trigrams(entry.search_text):
+            self.trigrams[trigram].add(entry.user_id)
+        self._orders.clear()
+
+    def _current_generation(self):
+        generation = cache.get(GENERATION_KEY)
+        if generation is None:
+            generation = uuid.uuid4().hex
+            if not cache.add(GENERATION_KEY, generation, None):
+                generation = cache.get(GENERATION_KEY, generation)
+        return generation
+
+    def _sync(self):
+        from apps.organizations.models import PlayerDiscoveryEntry
+
+        generation = self._current_generation()
+        reload_after = getattr(settings, 'PLAYER_DISCOVERY_RELOAD_SECONDS', 900)
+        full = (
+            generation != self.generation
+            or self.synced_through is None
+            or time.monotonic() - self.loaded_at > reload_after
+        )
+        started = timezone.now()
+        if full:
+            if not PlayerDiscoveryEntry.objects.exists() and cache.add(SEED_LOCK_KEY, 1, 600):
+                # First read after deploy: seed the table from the profiles.
+                rebuild_entries()
+                generation = self._current_generation()
+            self._reset()
+            rows = PlayerDiscoveryEntry.objects.filter(is_listed=True)
+        else:
+            rows = PlayerDiscoveryEntry.objects.filter(updated_at__gte=self.synced_through - DELTA_OVERLAP)
+        for entry in rows.iterator(chunk_size=2000):
+            self._add(entry)
+        self.synced_through = started
+        if full:
+            self.generation = generation
+            self.loaded_at = time.monotonic()
+
+    # -- queries -------------------------------------------------------------
+
+    def _facet_users(self, facet, value):
+        key = _norm(value)
+        postings = self.postings[facet]
+        if facet in SUBSTRING_FACETS:
+            return set().union(*(users for candidate, users in postings.items() if key in candidate))
+        return set(postings.get(key, ()))
+
+    def _search_users(self, query):
+        query = _norm(query)
+        if len(query) < 3:
+            pool = self.entries.keys()
+        else:
+            buckets = [self.trigrams.get(trigram) for trigram in _trigrams(query)]
+            if not all(buckets):
+                return set()
+            buckets.sort(key=len)
+            pool = set(buckets[0]).intersection(*buckets[1:])
+        return {user_id for user_id in pool if query in self.entries[user_id].search_text}
+
+    def _candidates(self, filters, matched_search, skip=None):
+        """User ids passing every active filter except ``skip``; None means all."""
+        result = matched_search
+        for facet in FACETS:
+            value = filters.get(facet)
+            if facet == skip or value in (None, ''):
+                continue
+            users = self._facet_users(facet, value)
+            result = users if result is None else result & users
+            if not result:
+                return set()
+        return result
+
+    def _ordered(self, sort_by):
+        order = self._orders.get(sort_by)
+        if order is None:
+            entries = self.entries.values()
+            if sort_by == 'name':
+                ranked = sorted(entries, key=lambda e: (e.display_name.casefold(), e.username.casefold(), e.user_id))
+            else:
+                ranked = sorted(entries, key=lambda e: (e.last_updated or _OLDEST, e.user_id), reverse=True)
+            order = self._orders[sort_by] = [entry.user_id for entry in ranked]
+        return order
+
+    def search(self, filters, search_query, sort_by, limit):
+        with self._lock:
+            self._sync()
+            matched = self._search_users(search_query) if search_query else None
+            candidates = self._candidates(filters, matched)
+            results = []
+            for user_id in self._ordered(sort_by):
+                if len(results) >= limit:
+                    break
+                if candidates is None or user_id in candidates:
+                    results.append(self.entries[user_id])
+            return results
+
+    def facet_counts(self, filters, search_query):
+        with self._lock:
+            self._sync()
+            matched = self._search_users(search_query) if search_query else None
+            counts = {}
+            for facet in FACETS:
+                pool = self._candidates(filters, matched, skip=facet)
+                rows = []
+                for value, users in self.postings[facet].items():
+                    count = len(users) if pool is None else len(users & pool)
+                    if count:
+                        rows.append({'value': value, 'label': self.labels[facet].get(value, value), 'count': count})
+                rows.sort(key=lambda row: (-row['count'], row['label']))
+                counts[facet] = rows
+            return counts
+
+
+_index = _DiscoveryIndex()
+
+
+def search_players(filters, *, search_query='', sort_by='newest', limit=8):
+    """Return listed PlayerDiscoveryEntry rows matching ``filters`` ({facet: value})."""
+    return _index.search(filters, search_query, sort_by, limit)
+
+
+def facet_counts(filters, *, search_query=''):
+    """Return per-facet value counts, each facet ignoring its own filter."""
+    return _index.facet_counts(filters, search_query)
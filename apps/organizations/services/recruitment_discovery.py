@@ -1,8 +1,6 @@
 """Public-safe recruitment summaries for team discovery surfaces."""
 
-from collections import defaultdict
-
-from django.db.models import Prefetch, Q
+from django.db.models import Prefetch
 from django.urls import reverse
 
 from apps.organizations.models.recruitment import RecruitmentPosition
@@ -117,6 +115,57 @@ def _public_passport_queryset():
     )
 
 
+def _lft_career_statuses():
+    from apps.user_profile.models import CareerProfile
+
+    return tuple(
+        value
+        for value, _label in CareerProfile._meta.get_field("career_status").choices
+        if value in LFT_CAREER_STATUS_VALUES
+    )
+
+
+def _passport_matches(passport, *, game_slug="", region="", platform=""):
+    if game_slug and passport.get("game_slug") != game_slug:
+        return False
+    if platform and platform.lower() not in (passport.get("platform") or "").lower():
+        return False
+    if region and region.lower() not in (passport.get("region") or "").lower():
+        return False
+    return True
+
+
+def _player_card(summary, passports_per_player, *, game_slug="", region="", platform=""):
+    username = summary.get("username", "")
+    player_passports = [
+        passport
+        for passport in summary.get("passports", [])
+        if _passport_matches(passport, game_slug=game_slug, region=region, platform=platform)
+    ][:passports_per_player]
+    return {
+        "display_name": summary.get("display_name") or username,
+        "username": username,
+        "profile_url": _public_profile_url(username),
+        "roles": summary.get("roles", []),
+        "preferred_region": summary.get("preferred_region", ""),
+        "region": summary.get("preferred_region", ""),
+        "availability": summary.get("availability", ""),
+        "passports": player_passports,
+        "primary_passport": player_passports[0] if player_passports else None,
+    }
+
+
+def _discovery_filters(game_slug, region, platform, rank_tier, role, lft_status):
+    return {
+        "game": game_slug,
+        "region": region,
+        "platform": platform,
+        "rank_tier": rank_tier,
+        "role": role,
+        "lft_status": lft_status,
+    }
+
+
 def get_available_player_summaries(
     limit=8,
     passports_per_player=2,
@@ -124,126 +173,61 @@ def get_available_player_summaries(
     game_slug="",
     region="",
     platform="",
+    rank_tier=None,
+    role="",
+    lft_status="",
     search_query="",
     sort_by="newest",
 ):
-    """Return public-safe Looking For Team player summaries for discovery."""
-    from apps.user_profile.models import CareerProfile
-
-    career_statuses = tuple(
-        value
-        for value, _label in CareerProfile._meta.get_field("career_status").choices
-        if value in LFT_CAREER_STATUS_VALUES
+    """Return public-safe Looking For Team player summaries for discovery.
+
+    Served from the in-memory posting lists of
+    ``apps.organizations.services.player_discovery``; region, platform and
+    role match as case-insensitive substrings, game, rank tier and LFT
+    status exactly.
+    """
+    from apps.organizations.services import player_discovery
+
+    entries = player_discovery.search_players(
+        _discovery_filters(game_slug, region, platform, rank_tier, role, lft_status),
+        search_query=search_query,
+        sort_by=sort_by,
+        limit=limit,
     )
-    careers_qs = CareerProfile.objects.filter(
-        lft_enabled=True,
-        recruiter_visibility="PUBLIC",
-        career_status__in=career_statuses,
-        user_profile__user__is_active=True,
-    ).select_related("user_profile", "user_profile__user")
-
-    public_passports = _public_passport_queryset()
-
-    if game_slug:
-        game_user_ids = public_passports.filter(game__slug=game_slug).values("user_id")
-        careers_qs = careers_qs.filter(user_profile__user_id__in=game_user_ids)
+    return [
+        _player_card(
+            entry.summary,
+            passports_per_player,
+            game_slug=game_slug,
+            region=region,
+            platform=platform,
+        )
+        for entry in entries
+    ]
 
-    if platform:
-        platform_user_ids = public_passports.filter(platform__icontains=platform).values("user_id")
-        careers_qs = careers_qs.filter(user_profile__user_id__in=platform_user_ids)
 
-    if region:
-        region_user_ids = public_passports.filter(region__icontains=region).values("user_id")
-        careers_qs = careers_qs.filter(
-            Q(preferred_region__icontains=region) |
-            Q(user_profile__user_id__in=region_user_ids)
-        )
+def get_available_player_facets(
+    *,
+    game_slug="",
+    region="",
+    platform="",
+    rank_tier=None,
+    role="",
+    lft_status="",
+    search_query="",
+):
+    """Return ``{facet: [{"value", "label", "count"}, ...]}`` for the LFT filters.
 
-    if search_query:
-        matching_passport_user_ids = public_passports.filter(
-            Q(ign__icontains=search_query) |
-            Q(in_game_name__icontains=search_query) |
-            Q(rank_name__icontains=search_query) |
-            Q(main_role__icontains=search_query) |
-            Q(game__display_name__icontains=search_query) |
-            Q(game__name__icontains=search_query)
-        ).values("user_id")
-        careers_qs = careers_qs.filter(
-            Q(user_profile__display_name__icontains=search_query) |
-            Q(user_profile__user__username__icontains=search_query) |
-            Q(preferred_region__icontains=search_query) |
-            Q(user_profile__user_id__in=matching_passport_user_ids)
-        )
+    Each facet is counted with every other active filter applied but not
+    its own, so the UI can show how many players each alternative value
+    would return.
+    """
+    from apps.organizations.services import player_discovery
 
-    if sort_by == "name":
-        careers_qs = careers_qs.order_by("user_profile__display_name", "user_profile__user__username")
-    else:
-        careers_qs = careers_qs.order_by("-last_updated")
-
-    careers = list(careers_qs.distinct()[:limit])
-    if not careers:
-        return []
-
-    user_ids = [career.user_profile.user_id for career in careers]
-    passports_by_user = defaultdict(list)
-    passport_filters = Q(user_id__in=user_ids)
-    if game_slug:
-        passport_filters &= Q(game__slug=game_slug)
-    if platform:
-        passport_filters &= Q(platform__icontains=platform)
-    if region:
-        passport_filters &= Q(region__icontains=region)
-
-    passports = (
-        _public_passport_queryset()
-        .filter(passport_filters)
-        .select_related("game")
-        .only(
-            "id",
-            "user_id",
-            "game_id",
-            "game__name",
-            "game__display_name",
-            "game__slug",
-            "ign",
-            "in_game_name",
-            "rank_name",
-            "rank_tier",
-            "peak_rank",
-            "main_role",
-            "platform",
-            "region",
-            "is_lft",
-            "is_pinned",
-            "pinned_order",
-            "sort_order",
-            "status",
-            "visibility",
-        )
-        .order_by("user_id", "-is_lft", "-is_pinned", "pinned_order", "sort_order", "game__display_name")
+    return player_discovery.facet_counts(
+        _discovery_filters(game_slug, region, platform, rank_tier, role, lft_status),
+        search_query=search_query,
     )
-    for passport in passports:
-        if len(passports_by_user[passport.user_id]) < passports_per_player:
-            passports_by_user[passport.user_id].append(_passport_summary(passport))
-
-    players = []
-    for career in careers:
-        profile = career.user_profile
-        user = profile.user
-        username = user.username
-        player_passports = passports_by_user.get(user.id, [])
-        players.append({
-            "display_name": profile.display_name or user.get_full_name() or username,
-            "username": username,
-            "profile_url": _public_profile_url(username),
-            "roles": _safe_roles(career.primary_roles, career.secondary_roles),
-            "preferred_region": career.preferred_region,
-            "region": career.preferred_region,
-            "availability": career.get_availability_display() if career.availability else "",
-            "passports": player_passports,
-            "primary_passport": player_passports[0] if player_passports else None,
-        })
-    return players
 
 
 def is_public_available_player(user):
@@ -252,14 +236,9 @@ def is_public_available_player(user):
 
     if not user or not getattr(user, "is_active", False):
         return False
-    career_statuses = tuple(
-        value
-        for value, _label in CareerProfile._meta.get_field("career_status").choices
-        if value in LFT_CAREER_STATUS_VALUES
-    )
     return CareerProfile.objects.filter(
         user_profile__user=user,
         lft_enabled=True,
         recruiter_visibility="PUBLIC",
-        career_status__in=career_statuses,
+        career_status__in=_lft_career_statuses(),
     ).exists()
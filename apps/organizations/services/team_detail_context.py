@@ -14,6 +14,8 @@ from django.utils.html import escape
 from django.utils import timezone
 from django.core.cache import cache
 
+from apps.common import cache_tags
+
 from apps.organizations.models import Team  # vNext Team model (Phase 2B migration)
 from apps.games.services import GameService
 
@@ -182,7 +184,10 @@ def get_team_detail_context(
     cache_variant = 'restricted' if is_private_restricted else 'full'
     updated_at = getattr(team, 'updated_at', None)
     cache_version = int(updated_at.timestamp()) if updated_at else 'static'
-    cache_key = f'team_detail:{team.slug}:{cache_variant}:{cache_version}'
+    cache_key = cache_tags.tagged_key(
+        f'team_detail:{team.slug}:{cache_variant}:{cache_version}',
+        [cache_tags.team_tag(team.id)],
+    )
     public_ctx = cache.get(cache_key)
     if public_ctx is None:
         public_ctx = {
@@ -4,11 +4,14 @@ Django signals for the Organizations app.
 Handles:
   - Discord announcement sync on TeamAnnouncement creation
   - Discord role sync on TeamMembership role changes
+  - LFT discovery index refresh on passport / career profile changes
 """
 
 import logging
 
-from django.db.models.signals import post_save, pre_save
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 logger = logging.getLogger(__name__)
@@ -85,3 +88,51 @@ def sync_announcement_to_discord(sender, instance, created, **kwargs):
         )
     except Exception:
         logger.exception('Failed to dispatch Discord announcement task')
+
+
+# ── Passport / career profile change → LFT discovery index ───────
+
+_DISCOVERY_USER_FIELDS = frozenset({'is_active', 'username', 'first_name', 'last_name'})
+_DISCOVERY_PROFILE_FIELDS = frozenset({'display_name'})
+
+
+def _refresh_player_discovery(user_id):
+    if not user_id:
+        return
+    try:
+        from apps.organizations.services.player_discovery import refresh_players
+        with transaction.atomic():
+            refresh_players([user_id])
+    except Exception:
+        logger.exception('Failed to refresh player discovery entry for user=%s', user_id)
+
+
+@receiver(post_save, sender='user_profile.GameProfile', dispatch_uid='player_discovery:passport_save')
+@receiver(post_delete, sender='user_profile.GameProfile', dispatch_uid='player_discovery:passport_delete')
+def refresh_discovery_on_passport_change(sender, instance, **kwargs):
+    _refresh_player_discovery(instance.user_id)
+
+
+@receiver(post_save, sender='user_profile.CareerProfile', dispatch_uid='player_discovery:career_save')
+@receiver(post_delete, sender='user_profile.CareerProfile', dispatch_uid='player_discovery:career_delete')
+def refresh_discovery_on_career_change(sender, instance, **kwargs):
+    try:
+        user_id = instance.user_profile.user_id
+    except Exception:
+        # Cascade delete of the owning profile; the passport/user path covers it.
+        return
+    _refresh_player_discovery(user_id)
+
+
+@receiver(post_save, sender='user_profile.UserProfile', dispatch_uid='player_discovery:profile_save')
+def refresh_discovery_on_profile_change(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not _DISCOVERY_PROFILE_FIELDS.intersection(update_fields):
+        return
+    _refresh_player_discovery(instance.user_id)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid='player_discovery:user_save')
+def refresh_discovery_on_user_change(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields is not None and not _DISCOVERY_USER_FIELDS.intersection(update_fields)):
+        return
+    _refresh_player_discovery(instance.pk)
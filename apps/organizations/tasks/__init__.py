@@ -23,6 +23,9 @@ from .discord_sync import (
     sync_discord_role,
 )
 
+# LFT discovery index repair
+from .player_discovery import rebuild_player_discovery_index
+
 # Legacy task aliases — registered under the old apps.teams.tasks.* names
 # so Celery Beat schedules continue to work during migration.
 from .legacy_bridge import (
@@ -40,6 +43,7 @@ __all__ = [
     'send_discord_chat_message',
     'validate_discord_bot_presence',
     'sync_discord_role',
+    'rebuild_player_discovery_index',
     'recompute_team_rankings',
     'clean_expired_invites',
     'expire_sponsors_task',
@@ -0,0 +1,30 @@
+"""
+Celery task for the Looking-For-Team discovery index.
+
+Rows are kept current by save signals; this nightly rebuild repairs
+anything written around them (bulk updates, game renames) and makes
+every process reload its posting lists.
+"""
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    name='apps.organizations.tasks.rebuild_player_discovery_index',
+    max_retries=2,
+    default_retry_delay=300,
+)
+def rebuild_player_discovery_index(self):
+    """Re-derive every PlayerDiscoveryEntry from career profiles and passports."""
+    from apps.organizations.services.player_discovery import rebuild_entries
+
+    try:
+        listed = rebuild_entries()
+    except Exception as exc:
+        logger.exception('Player discovery index rebuild failed')
+        raise self.retry(exc=exc)
+    return {'listed': listed}
@@ -14,6 +14,7 @@ import pytest
 from django.test import Client
 from django.urls import reverse
 from django.core.cache import cache
+from apps.common import cache_tags
 from django.contrib.auth import get_user_model
 from apps.organizations.models import Team, TeamRanking, TeamMembership, Organization, OrganizationRanking
 from apps.games.models import Game
@@ -370,7 +371,7 @@ class TestCachingBehavior:
         assert response1.status_code == 200
         
         # Check cache was set
-        cache_key = f'hero_carousel_{user.id}'
+        cache_key = cache_tags.tagged_key(f'hero_carousel_{user.id}', [cache_tags.HUB_TAG])
         cached_data = cache.get(cache_key)
         assert cached_data is not None
     
@@ -386,7 +387,7 @@ class TestCachingBehavior:
         data1 = json.loads(response1.content)
         
         # Check cache was set
-        cache_key = 'hub_ticker_feed'
+        cache_key = cache_tags.tagged_key('hub_ticker_feed', [cache_tags.HUB_TAG])
         cached_data = cache.get(cache_key)
         assert cached_data is not None
     
@@ -403,8 +404,10 @@ class TestCachingBehavior:
         assert response1.status_code == 200
         
         # Check separate cache keys exist
-        cache_key_all = f'hub_leaderboard_None_50'
-        cache_key_game = f'hub_leaderboard_{game.id}_50'
+        cache_key_all = cache_tags.tagged_key('hub_leaderboard_all_50', [cache_tags.HUB_TAG])
+        cache_key_game = cache_tags.tagged_key(
+            f'hub_leaderboard_{game.id}_50', [cache_tags.HUB_TAG, cache_tags.game_tag(game.id)]
+        )
         
         # At least one should be set based on what we requested
         assert cache.get(cache_key_game) is not None or cache.get(cache_key_all) is not None
@@ -0,0 +1,126 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.games.models import Game
+from apps.organizations.models import PlayerDiscoveryEntry
+from apps.organizations.services import player_discovery
+from apps.organizations.services.recruitment_discovery import (
+    get_available_player_facets,
+    get_available_player_summaries,
+)
+from apps.user_profile.models import CareerProfile, GameProfile, UserProfile
+
+
+class PlayerDiscoveryIndexTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.valorant = Game.objects.create(
+            name="Index Valorant",
+            display_name="Index Valorant",
+            slug="index-valorant",
+            short_code="IVL",
+            category="FPS",
+            game_type="TEAM_VS_TEAM",
+            platforms=["PC"],
+            is_active=True,
+        )
+        self.efootball = Game.objects.create(
+            name="Index eFootball",
+            display_name="Index eFootball",
+            slug="index-efootball",
+            short_code="IEF",
+            category="SPORTS",
+            game_type="ONE_VS_ONE",
+            platforms=["Mobile"],
+            is_active=True,
+        )
+
+    def _player(self, username, *, game, platform="PC", region="BD", rank_tier=5, role="Duelist",
+                career_status="LOOKING"):
+        user = get_user_model().objects.create_user(
+            username=username, email=f"{username}@example.com", password="testpass123",
+        )
+        profile, _ = UserProfile.objects.get_or_create(user=user)
+        profile.display_name = username.replace("_", " ").title()
+        profile.save(update_fields=["display_name"])
+        CareerProfile.objects.update_or_create(
+            user_profile=profile,
+            defaults={
+                "career_status": career_status,
+                "lft_enabled": True,
+                "primary_roles": [role],
+                "preferred_region": region,
+                "availability": "WEEKENDS",
+                "recruiter_visibility": "PUBLIC",
+            },
+        )
+        GameProfile.objects.create(
+            user=user,
+            game=game,
+            ign=f"{username}Main",
+            in_game_name=f"{username}#123",
+            rank_name="Diamond 2",
+            rank_tier=rank_tier,
+            main_role=role,
+            platform=platform,
+            region=region,
+            visibility=GameProfile.VISIBILITY_PUBLIC,
+            status=GameProfile.STATUS_ACTIVE,
+            is_lft=True,
+        )
+        return user
+
+    def _usernames(self, **filters):
+        return sorted(player["username"] for player in get_available_player_summaries(limit=50, **filters))
+
+    def test_facet_filters_intersect_posting_lists(self):
+        self._player("pc_duelist", game=self.valorant, rank_tier=7)
+        self._player("pc_sentinel", game=self.valorant, role="Sentinel", rank_tier=5)
+        self._player("mobile_striker", game=self.efootball, platform="Mobile", region="NP", role="Striker")
+
+        self.assertEqual(self._usernames(game_slug="index-valorant"), ["pc_duelist", "pc_sentinel"])
+        self.assertEqual(self._usernames(platform="mob"), ["mobile_striker"])
+        self.assertEqual(self._usernames(game_slug="index-valorant", rank_tier=7), ["pc_duelist"])
+        self.assertEqual(self._usernames(role="sentinel", region="bd"), ["pc_sentinel"])
+        self.assertEqual(self._usernames(search_query="striker#1"), ["mobile_striker"])
+        self.assertEqual(self._usernames(search_query="zz"), [])
+
+    def test_profile_saves_update_index_without_reload(self):
+        user = self._player("soon_hidden", game=self.valorant)
+        self.assertEqual(self._usernames(), ["soon_hidden"])
+
+        career = CareerProfile.objects.get(user_profile__user=user)
+        career.lft_enabled = False
+        career.save()
+
+        self.assertEqual(self._usernames(), [])
+        self.assertFalse(PlayerDiscoveryEntry.objects.get(user_id=user.id).is_listed)
+
+    def test_warm_index_reads_with_single_delta_query(self):
+        self._player("warm_player", game=self.valorant)
+        get_available_player_summaries()
+
+        with self.assertNumQueries(1):
+            players = get_available_player_summaries(game_slug="index-valorant", platform="pc")
+
+        self.assertEqual(players[0]["primary_passport"]["in_game_name"], "warm_player#123")
+
+    def test_facet_counts_ignore_own_filter(self):
+        self._player("count_pc", game=self.valorant)
+        self._player("count_mobile", game=self.efootball, platform="Mobile")
+        self._player("count_free", game=self.valorant, career_status="FREE_AGENT")
+
+        facets = get_available_player_facets(game_slug="index-valorant")
+
+        games = {row["value"]: row["count"] for row in facets["game"]}
+        statuses = {row["value"]: row["count"] for row in facets["lft_status"]}
+        self.assertEqual(games, {"index-valorant": 2, "index-efootball": 1})
+        self.assertEqual(statuses, {"looking": 1, "free_agent": 1})
+
+    def test_rebuild_reseeds_entries(self):
+        self._player("rebuilt_player", game=self.valorant)
+        PlayerDiscoveryEntry.objects.all().delete()
+
+        self.assertEqual(player_discovery.rebuild_entries(), 1)
+        self.assertEqual(self._usernames(), ["rebuilt_player"])
@@ -17,6 +17,7 @@ import logging
 from django.shortcuts import render
 from django.conf import settings
 from django.core.cache import cache
+from apps.common import cache_tags
 from apps.common.seo import breadcrumb_schema, build_seo
 from django.db import ProgrammingError
 from django.http import JsonResponse
@@ -24,6 +25,14 @@ from django.http import JsonResponse
 logger = logging.getLogger(__name__)
 
 
+def _hub_tags(game_id=None):
+    """Hub caches depend on the hub tag, plus the game tag when filtered."""
+    tags = [cache_tags.HUB_TAG]
+    if game_id:
+        tags.append(cache_tags.game_tag(game_id))
+    return tags
+
+
 def _get_hero_carousel_context(request):
     """
     Get hero carousel data with robust fallbacks.
@@ -45,7 +54,7 @@ def _get_hero_carousel_context(request):
     from apps.organizations.models import Team  # vNext Team is canonical
     from apps.organizations.models import Organization
     
-    cache_key = f'hero_carousel_{request.user.id}'
+    cache_key = cache_tags.tagged_key(f'hero_carousel_{request.user.id}', [cache_tags.HUB_TAG])
     cached_data = cache.get(cache_key)
     
     if cached_data is not None:
@@ -152,7 +161,7 @@ def _get_spotlight_teams(limit=5):
     from apps.organizations.models import Team
     from apps.organizations.choices import TeamStatus
 
-    cache_key = f'spotlight_teams_{limit}'
+    cache_key = cache_tags.tagged_key(f'spotlight_teams_{limit}', [cache_tags.HUB_TAG])
     cached = cache.get(cache_key)
     if cached is not None:
         return cached
@@ -240,7 +249,7 @@ def _get_featured_teams(game_id=None, limit=12):
     from apps.organizations.models import Team  # vNext Team is canonical
     from apps.organizations.choices import TeamStatus
     
-    cache_key = f'featured_teams_{game_id or "all"}_{limit}'
+    cache_key = cache_tags.tagged_key(f'featured_teams_{game_id or "all"}_{limit}', _hub_tags(game_id))
     cached_teams = cache.get(cache_key)
     
     if cached_teams is not None:
@@ -317,7 +326,7 @@ def _get_leaderboard(game_id=None, limit=50):
     """
     from apps.organizations.models import TeamRanking
     
-    cache_key = f'hub_leaderboard_{game_id or "all"}_{limit}'
+    cache_key = cache_tags.tagged_key(f'hub_leaderboard_{game_id or "all"}_{limit}', _hub_tags(game_id))
     cached_leaderboard = cache.get(cache_key)
     
     if cached_leaderboard is not None:
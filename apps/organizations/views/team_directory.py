@@ -580,6 +580,7 @@ def team_directory(request, force_recruiting=False):
     - region: region string to filter
     - q: search query (team name or tag)
     - sort: 'newest' | 'name' | 'members' (default: 'newest')
+    - rank_tier / role / lft_status: LFT player filters (recruiting view only)
     """
     active_filter = 'recruiting' if force_recruiting else request.GET.get('filter', 'all')
     raw_game_filter = request.GET.get('game', '')
@@ -589,6 +590,9 @@ def team_directory(request, force_recruiting=False):
     platform_filter = request.GET.get('platform', '')
     search_query = request.GET.get('q', '')
     sort_by = request.GET.get('sort', 'newest')
+    rank_tier_filter = request.GET.get('rank_tier', '')
+    role_filter = request.GET.get('role', '')
+    lft_status_filter = request.GET.get('lft_status', '')
     is_recruiting_filter = active_filter == 'recruiting'
     selected_game = None
 
@@ -706,15 +710,17 @@ def team_directory(request, force_recruiting=False):
             'recruitment_summary': recruitment_summary,
         })
 
+    player_filters = {
+        'game_slug': "" if is_recruiting_filter else (selected_game.slug if selected_game else ""),
+        'region': region_filter,
+        'platform': platform_filter,
+        'rank_tier': rank_tier_filter,
+        'role': role_filter,
+        'lft_status': lft_status_filter,
+        'search_query': search_query,
+    }
     available_players = (
-        get_available_player_summaries(
-            limit=24,
-            game_slug="" if is_recruiting_filter else (selected_game.slug if selected_game else ""),
-            region=region_filter,
-            platform=platform_filter,
-            search_query=search_query,
-            sort_by=sort_by,
-        )
+        get_available_player_summaries(limit=24, sort_by=sort_by, **player_filters)
         if is_recruiting_filter
         else []
     )
@@ -772,6 +778,9 @@ def team_directory(request, force_recruiting=False):
         'regions': regions,
         'platforms': platforms,
         'available_players': available_players,
+        'rank_tier_filter': rank_tier_filter,
+        'role_filter': role_filter,
+        'lft_status_filter': lft_status_filter,
         'lft_teasers': available_players,
         'find_team_url': reverse('organizations:team_find'),
         'directory_recruiting_url': f"{reverse('organizations:team_directory')}?filter=recruiting",
@@ -7,7 +7,7 @@ Uses method-level ORM imports only to maintain architecture boundaries.
 Reference: Phase 8, Epic 8.5 - Advanced Analytics & Ranking Tiers
 """
 
-from typing import List, Optional, Protocol
+from typing import Dict, List, Optional, Protocol, Tuple
 from datetime import datetime
 from decimal import Decimal
 
@@ -17,6 +17,41 @@ from apps.tournament_ops.dtos import (
     LeaderboardEntryDTO,
     SeasonDTO,
     AnalyticsQueryDTO,
+    EloDistributionDTO,
+)
+
+
+# Distributions are rebuilt by the nightly refresh; keep them until the next one
+ELO_DISTRIBUTION_TTL = 26 * 3600
+
+# Snapshot columns written by the bulk upserts (besides owner, game, timestamps)
+USER_SNAPSHOT_FIELDS = (
+    "mmr_snapshot",
+    "elo_snapshot",
+    "win_rate",
+    "kda_ratio",
+    "matches_last_7d",
+    "matches_last_30d",
+    "win_rate_7d",
+    "win_rate_30d",
+    "current_streak",
+    "longest_win_streak",
+    "tier",
+    "percentile_rank",
+)
+TEAM_SNAPSHOT_FIELDS = (
+    "elo_snapshot",
+    "elo_volatility",
+    "avg_member_skill",
+    "win_rate",
+    "win_rate_7d",
+    "win_rate_30d",
+    "synergy_score",
+    "activity_score",
+    "matches_last_7d",
+    "matches_last_30d",
+    "tier",
+    "percentile_rank",
 )
 
 
@@ -549,3 +584,230 @@ class AnalyticsAdapter:
             queryset = queryset.filter(game_slug=game_slug)
         
         return queryset.count()
+    
+    # =========================================================================
+    # Batch refresh (nightly pipeline)
+    # =========================================================================
+    
+    def list_stats_game_slugs(self, subject: str) -> List[str]:
+        """
+        Distinct games that have UserStats ("user") or TeamStats ("team") rows.
+        """
+        model = self._stats_model(subject)
+        return list(
+            model.objects.order_by("game_slug")
+            .values_list("game_slug", flat=True)
+            .distinct()
+        )
+    
+    def get_stats_chunk_bounds(
+        self,
+        subject: str,
+        game_slug: str,
+        chunk_size: int,
+        after_id: int = 0,
+    ) -> List[Tuple[int, int]]:
+        """
+        Split a game's stats rows into id-ordered chunks.
+        
+        Each bound is ``(after_id, upto_id)`` covering ``after_id < id <= upto_id``
+        with at most ``chunk_size`` rows. Uses one index seek per chunk, so
+        ids are never loaded into memory wholesale.
+        """
+        from django.db.models import Max
+        
+        model = self._stats_model(subject)
+        queryset = model.objects.filter(game_slug=game_slug)
+        bounds = []
+        cursor = after_id
+        while True:
+            ids = queryset.filter(id__gt=cursor).order_by("id").values_list("id", flat=True)
+            boundary = list(ids[chunk_size - 1:chunk_size])
+            if boundary:
+                bounds.append((cursor, boundary[0]))
+                cursor = boundary[0]
+                continue
+            last_id = ids.aggregate(last_id=Max("id"))["last_id"]
+            if last_id is not None:
+                bounds.append((cursor, last_id))
+            return bounds
+    
+    def list_user_stats_chunk(
+        self,
+        game_slug: str,
+        after_id: int,
+        upto_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        UserStats rows with ``after_id < id <= upto_id`` in id order.
+        
+        Returns plain dicts (id, user_id, matches_played, win_rate, kd_ratio)
+        rather than DTOs — the batch pipeline touches every row once.
+        """
+        from apps.leaderboards.models import UserStats
+        
+        queryset = UserStats.objects.filter(game_slug=game_slug, id__gt=after_id)
+        if upto_id is not None:
+            queryset = queryset.filter(id__lte=upto_id)
+        queryset = queryset.order_by("id").values(
+            "id", "user_id", "matches_played", "win_rate", "kd_ratio",
+        )
+        if limit is not None:
+            queryset = queryset[:limit]
+        return list(queryset)
+    
+    def list_team_stats_chunk(
+        self,
+        game_slug: str,
+        after_id: int,
+        upto_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        TeamStats rows with ``after_id < id <= upto_id`` in id order, joined
+        with the team's ELO for the same game (``elo_rating`` is None when the
+        team has no TeamRanking yet).
+        """
+        from apps.leaderboards.models import TeamRanking, TeamStats
+        from django.db.models import OuterRef, Subquery
+        
+        elo = TeamRanking.objects.filter(
+            team_id=OuterRef("team_id"), game_slug=game_slug,
+        ).values("elo_rating")[:1]
+        queryset = TeamStats.objects.filter(game_slug=game_slug, id__gt=after_id)
+        if upto_id is not None:
+            queryset = queryset.filter(id__lte=upto_id)
+        queryset = (
+            queryset.annotate(elo_rating=Subquery(elo))
+            .order_by("id")
+            .values("id", "team_id", "matches_played", "win_rate", "elo_rating")
+        )
+        if limit is not None:
+            queryset = queryset[:limit]
+        return list(queryset)
+    
+    def get_elo_distribution(
+        self,
+        subject: str,
+        game_slug: str,
+        rebuild: bool = False,
+    ) -> EloDistributionDTO:
+        """
+        Per-game ELO distribution of user ("user") or team ("team") snapshots.
+        
+        Served from cache; built with one GROUP BY over the snapshot table on
+        a miss or when ``rebuild`` is set (once per nightly refresh).
+        """
+        from django.core.cache import cache
+        from django.db.models import Count
+        
+        cache_key = f"analytics:elo_dist:{subject}:{game_slug}"
+        if not rebuild:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return EloDistributionDTO(subject=subject, game_slug=game_slug, **cached)
+        
+        model = self._snapshot_model(subject)
+        histogram = (
+            model.objects.filter(game_slug=game_slug)
+            .order_by("elo_snapshot")
+            .values("elo_snapshot")
+            .annotate(count=Count("id"))
+            .values_list("elo_snapshot", "count")
+        )
+        distribution = EloDistributionDTO.from_histogram(subject, game_slug, histogram)
+        cache.set(
+            cache_key,
+            {"values": distribution.values, "below": distribution.below},
+            timeout=ELO_DISTRIBUTION_TTL,
+        )
+        return distribution
+    
+    def bulk_upsert_user_snapshots(self, game_slug: str, snapshots: Dict[int, dict]) -> int:
+        """
+        Insert or update many user snapshots in one statement.
+        
+        Args:
+            game_slug: Game identifier
+            snapshots: user_id -> snapshot_data (same keys as update_user_snapshot)
+        
+        Returns:
+            Number of rows written
+        """
+        from apps.leaderboards.models import UserAnalyticsSnapshot
+        from django.utils import timezone
+        
+        if not snapshots:
+            return 0
+        now = timezone.now()
+        rows = [
+            UserAnalyticsSnapshot(
+                user_id=user_id,
+                game_slug=game_slug,
+                recalculated_at=now,
+                **{field: data[field] for field in USER_SNAPSHOT_FIELDS},
+            )
+            for user_id, data in snapshots.items()
+        ]
+        UserAnalyticsSnapshot.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["user", "game_slug"],
+            update_fields=[*USER_SNAPSHOT_FIELDS, "recalculated_at"],
+        )
+        return len(rows)
+    
+    def bulk_upsert_team_snapshots(self, game_slug: str, snapshots: Dict[int, dict]) -> int:
+        """
+        Insert or update many team snapshots in one statement.
+        
+        Args:
+            game_slug: Game identifier
+            snapshots: team_id -> snapshot_data (same keys as update_team_snapshot)
+        
+        Returns:
+            Number of rows written
+        """
+        from apps.leaderboards.models import TeamAnalyticsSnapshot
+        from django.utils import timezone
+        
+        if not snapshots:
+            return 0
+        now = timezone.now()
+        rows = [
+            TeamAnalyticsSnapshot(
+                team_id=team_id,
+                game_slug=game_slug,
+                recalculated_at=now,
+                **{field: data[field] for field in TEAM_SNAPSHOT_FIELDS},
+            )
+            for team_id, data in snapshots.items()
+        ]
+        TeamAnalyticsSnapshot.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["team", "game_slug"],
+            update_fields=[*TEAM_SNAPSHOT_FIELDS, "recalculated_at"],
+        )
+        return len(rows)
+    
+    @staticmethod
+    def _snapshot_model(subject: str):
+        from apps.leaderboards.models import TeamAnalyticsSnapshot, UserAnalyticsSnapshot
+        
+        if subject == "user":
+            return UserAnalyticsSnapshot
+        if subject == "team":
+            return TeamAnalyticsSnapshot
+        raise ValueError(f"Unknown snapshot subject: {subject}")
+    
+    @staticmethod
+    def _stats_model(subject: str):
+        from apps.leaderboards.models import TeamStats, UserStats
+        
+        if subject == "user":
+            return UserStats
+        if subject == "team":
+            return TeamStats
+        raise ValueError(f"Unknown stats subject: {subject}")
@@ -8,7 +8,7 @@ Reference: ROADMAP_AND_EPICS_PART_4.md, Epic 8.4
 Architecture: Method-level ORM imports only
 """
 
-from typing import Protocol, List, Optional
+from typing import Protocol, List, Optional, Sequence, Tuple
 from datetime import datetime
 
 from apps.tournament_ops.dtos import (
@@ -179,6 +179,34 @@ class MatchHistoryAdapter(Protocol):
             Total count of matching entries
         """
         ...
+    
+    def list_recent_user_results(
+        self,
+        user_ids: Sequence[int],
+        game_slug: str,
+        since: datetime,
+    ) -> List[Tuple[int, bool, bool, datetime]]:
+        """
+        Results for many users since ``since`` in one query (batch analytics).
+        
+        Returns (user_id, is_winner, is_draw, completed_at) tuples ordered
+        by user_id, then completed_at ascending.
+        """
+        ...
+    
+    def list_recent_team_results(
+        self,
+        team_ids: Sequence[int],
+        game_slug: str,
+        since: datetime,
+    ) -> List[Tuple[int, bool, bool, Optional[int], datetime]]:
+        """
+        Results for many teams since ``since`` in one query (batch analytics).
+        
+        Returns (team_id, is_winner, is_draw, elo_change, completed_at) tuples
+        ordered by team_id, then completed_at ascending.
+        """
+        ...
 
 
 class DjangoMatchHistoryAdapter:
@@ -464,3 +492,45 @@ class DjangoMatchHistoryAdapter:
             queryset = queryset.filter(is_winner=False, is_draw=False)
         
         return queryset.count()
+    
+    def list_recent_user_results(
+        self,
+        user_ids: Sequence[int],
+        game_slug: str,
+        since: datetime,
+    ) -> List[Tuple[int, bool, bool, datetime]]:
+        """List (user_id, is_winner, is_draw, completed_at) for many users."""
+        from apps.leaderboards.models import UserMatchHistory
+        
+        if not user_ids:
+            return []
+        return list(
+            UserMatchHistory.objects.filter(
+                user_id__in=user_ids,
+                game_slug=game_slug,
+                completed_at__gte=since,
+            )
+            .order_by("user_id", "completed_at")
+            .values_list("user_id", "is_winner", "is_draw", "completed_at")
+        )
+    
+    def list_recent_team_results(
+        self,
+        team_ids: Sequence[int],
+        game_slug: str,
+        since: datetime,
+    ) -> List[Tuple[int, bool, bool, Optional[int], datetime]]:
+        """List (team_id, is_winner, is_draw, elo_change, completed_at) for many teams."""
+        from apps.leaderboards.models import TeamMatchHistory
+        
+        if not team_ids:
+            return []
+        return list(
+            TeamMatchHistory.objects.filter(
+                team_id__in=team_ids,
+                game_slug=game_slug,
+                completed_at__gte=since,
+            )
+            .order_by("team_id", "completed_at")
+            .values_list("team_id", "is_winner", "is_draw", "elo_change", "completed_at")
+        )
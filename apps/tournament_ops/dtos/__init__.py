@@ -89,6 +89,7 @@ from .analytics import (
     LeaderboardEntryDTO,
     SeasonDTO,
     AnalyticsQueryDTO,
+    EloDistributionDTO,
     TierBoundaries,
 )
 
@@ -152,5 +153,6 @@ __all__ = [
     "LeaderboardEntryDTO",
     "SeasonDTO",
     "AnalyticsQueryDTO",
+    "EloDistributionDTO",
     "TierBoundaries",
 ]
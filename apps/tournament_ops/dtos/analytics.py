@@ -7,10 +7,11 @@ All DTOs provide validation, serialization, and model mapping.
 Reference: Phase 8, Epic 8.5 - Advanced Analytics & Ranking Tiers
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .base import DTOBase
 
@@ -434,6 +435,73 @@ class AnalyticsQueryDTO(DTOBase):
         return {k: v for k, v in data.items() if v is not None}
 
 
+# =============================================================================
+# ELO Distribution DTO
+# =============================================================================
+
+@dataclass(frozen=True)
+class EloDistributionDTO(DTOBase):
+    """
+    Per-game ELO distribution of analytics snapshots.
+    
+    Stored as a compressed cumulative histogram: ``values`` holds the
+    distinct ELOs in ascending order and ``below[i]`` the number of
+    snapshots with ELO < ``values[i]`` (``below[-1]`` is the total). ELOs
+    are integers in a narrow range, so this is exact and stays a few
+    thousand entries regardless of player count. Lookups are a binary
+    search over ``values``.
+    """
+    
+    subject: str  # "user" or "team"
+    game_slug: str
+    values: Tuple[int, ...] = ()
+    below: Tuple[int, ...] = (0,)
+    
+    @classmethod
+    def from_histogram(
+        cls,
+        subject: str,
+        game_slug: str,
+        histogram: Iterable[Tuple[int, int]],
+    ) -> "EloDistributionDTO":
+        """
+        Build from (elo, count) pairs sorted by ELO ascending.
+        """
+        values: List[int] = []
+        below: List[int] = [0]
+        for elo, count in histogram:
+            values.append(elo)
+            below.append(below[-1] + count)
+        return cls(subject=subject, game_slug=game_slug, values=tuple(values), below=tuple(below))
+    
+    @property
+    def total(self) -> int:
+        return self.below[-1]
+    
+    def count_below(self, elo: int) -> int:
+        """Snapshots with ELO strictly below ``elo``."""
+        return self.below[bisect_left(self.values, elo)]
+    
+    def percentile(self, elo: int) -> Decimal:
+        """
+        Percentile = (snapshots with lower ELO / total snapshots) * 100.
+        
+        Returns 50.0 when the distribution is empty.
+        """
+        if not self.total:
+            return Decimal("50.0")
+        return Decimal(str(round(self.count_below(elo) / self.total * 100, 2)))
+    
+    def validate(self) -> None:
+        """Validate distribution shape."""
+        if self.subject not in ("user", "team"):
+            raise ValueError("subject must be 'user' or 'team'")
+        if len(self.below) != len(self.values) + 1:
+            raise ValueError("below must have one more entry than values")
+        if any(a >= b for a, b in zip(self.values, self.values[1:])):
+            raise ValueError("values must be strictly ascending")
+
+
 # =============================================================================
 # Tier Boundary Helpers
 # =============================================================================
@@ -17,11 +17,14 @@ NO ORM IMPORTS — Uses AnalyticsAdapter only.
 Reference: Phase 8, Epic 8.5 — Advanced Analytics & Ranking Tiers
 """
 
-from typing import List, Optional, Dict, Any, Tuple
-from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Tuple, Callable, Sequence
+from datetime import datetime, timedelta, timezone as dt_timezone
 from decimal import Decimal
 from collections import defaultdict
+from bisect import bisect_left
+import logging
 import statistics
+import time
 
 from apps.tournament_ops.dtos import (
     UserAnalyticsDTO,
@@ -29,6 +32,7 @@ from apps.tournament_ops.dtos import (
     LeaderboardEntryDTO,
     SeasonDTO,
     AnalyticsQueryDTO,
+    EloDistributionDTO,
     TierBoundaries,
     UserStatsDTO,
     TeamStatsDTO,
@@ -44,6 +48,12 @@ from apps.tournament_ops.adapters import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Stats rows per batch chunk (one history query + one bulk upsert each)
+DEFAULT_BATCH_CHUNK_SIZE = 500
+
+
 class AnalyticsEngineService:
     """
     Analytics engine for computing performance metrics, tier assignments, and leaderboards.
@@ -81,6 +91,7 @@ class AnalyticsEngineService:
         self.team_stats_adapter = team_stats_adapter
         self.team_ranking_adapter = team_ranking_adapter
         self.match_history_adapter = match_history_adapter
+        self._elo_distributions: Dict[Tuple[str, str], EloDistributionDTO] = {}
     
     # =============================================================================
     # User Analytics Computation
@@ -278,18 +289,23 @@ class AnalyticsEngineService:
         Uses win rate and match count to estimate competitive rating.
         Real implementation should use actual ELO if available.
         """
-        if user_stats.matches_played == 0:
+        return self._elo_from_win_rate(user_stats.win_rate, user_stats.matches_played)
+    
+    @staticmethod
+    def _elo_from_win_rate(win_rate: Decimal, matches_played: int) -> int:
+        """ELO estimate from a win rate (0-100) and match count."""
+        if matches_played == 0:
             return 1200  # Default starting ELO
         
         # Simple estimation: map win rate to ELO range
         # 0% win rate → 800 ELO
         # 50% win rate → 1200 ELO (default)
         # 100% win rate → 2800 ELO
-        win_rate_decimal = float(user_stats.win_rate) / 100
+        win_rate_decimal = float(win_rate) / 100
         base_elo = 800 + (win_rate_decimal * 2000)
         
         # Adjust for experience (more matches = more confident rating)
-        experience_factor = min(1.0, user_stats.matches_played / 50)
+        experience_factor = min(1.0, matches_played / 50)
         final_elo = int(base_elo * (0.8 + 0.2 * experience_factor))
         
         return max(800, min(2800, final_elo))
@@ -303,23 +319,30 @@ class AnalyticsEngineService:
         """
         Calculate percentile ranking for user.
         
-        Percentile = (users with lower ELO / total users) * 100
+        Percentile = (users with lower ELO / total users) * 100, looked up in
+        the game's cached ELO distribution (binary search).
         """
-        # Get all user snapshots for game
-        query = AnalyticsQueryDTO(
-            game_slug=game_slug,
-            limit=10000,  # Get all users for accurate percentile
-        )
-        all_snapshots = self.analytics_adapter.list_user_snapshots(query)
-        
-        if not all_snapshots:
-            return Decimal("50.0")  # Default if no data
-        
-        # Count users with lower ELO
-        lower_count = sum(1 for s in all_snapshots if s.elo_snapshot < user_elo)
-        percentile = (lower_count / len(all_snapshots)) * 100
+        return self.get_elo_distribution("user", game_slug).percentile(user_elo)
+    
+    def get_elo_distribution(
+        self,
+        subject: str,
+        game_slug: str,
+        rebuild: bool = False,
+    ) -> EloDistributionDTO:
+        """
+        ELO distribution for "user" or "team" snapshots of a game.
         
-        return Decimal(str(round(percentile, 2)))
+        Memoized for the lifetime of this service (one batch chunk or one
+        request); ``rebuild`` recomputes it from the snapshot table and
+        refreshes the shared cache.
+        """
+        key = (subject, game_slug)
+        if rebuild or key not in self._elo_distributions:
+            self._elo_distributions[key] = self.analytics_adapter.get_elo_distribution(
+                subject, game_slug, rebuild=rebuild
+            )
+        return self._elo_distributions[key]
     
     # =============================================================================
     # Team Analytics Computation
@@ -407,21 +430,7 @@ class AnalyticsEngineService:
     
     def _create_default_team_analytics(self, team_id: int, game_slug: str) -> TeamAnalyticsDTO:
         """Create default analytics for team with no match history."""
-        snapshot_data = {
-            "elo_snapshot": 1200,
-            "elo_volatility": Decimal("0.0"),
-            "avg_member_skill": Decimal("1200.0"),
-            "win_rate": Decimal("0.0"),
-            "win_rate_7d": Decimal("0.0"),
-            "win_rate_30d": Decimal("0.0"),
-            "synergy_score": Decimal("0.0"),
-            "activity_score": Decimal("0.0"),
-            "matches_last_7d": 0,
-            "matches_last_30d": 0,
-            "tier": "bronze",
-            "percentile_rank": Decimal("50.0"),
-        }
-        return self.analytics_adapter.update_team_snapshot(team_id, game_slug, snapshot_data)
+        return self.analytics_adapter.update_team_snapshot(team_id, game_slug, _default_team_snapshot())
     
     def _get_team_recent_matches(
         self,
@@ -462,7 +471,11 @@ class AnalyticsEngineService:
             return Decimal("0.0")
         
         elo_changes = [m["elo_change"] for m in matches if m["elo_change"] is not None]
-        
+        return self._volatility_from_changes(elo_changes)
+    
+    @staticmethod
+    def _volatility_from_changes(elo_changes: Sequence[int]) -> Decimal:
+        """Population standard deviation of ELO changes."""
         if not elo_changes:
             return Decimal("0.0")
         
@@ -482,7 +495,12 @@ class AnalyticsEngineService:
         
         Simplified: based on win rate consistency.
         """
-        if len(matches) < 5:
+        return self._synergy_from_results([m["is_winner"] for m in matches])
+    
+    @staticmethod
+    def _synergy_from_results(wins: Sequence[bool]) -> Decimal:
+        """Synergy score from a sequence of win flags (see _calculate_synergy_score)."""
+        if len(wins) < 5:
             return Decimal("0.0")  # Need minimum data
         
         # Calculate win rate variance across time windows
@@ -492,11 +510,8 @@ class AnalyticsEngineService:
         window_size = 5
         win_rates = []
         
-        for i in range(0, len(matches) - window_size + 1, window_size):
-            window = matches[i:i+window_size]
-            wins = sum(1 for m in window if m["is_winner"])
-            win_rate = wins / window_size
-            win_rates.append(win_rate)
+        for i in range(0, len(wins) - window_size + 1, window_size):
+            win_rates.append(sum(wins[i:i + window_size]) / window_size)
         
         if not win_rates:
             return Decimal("50.0")
@@ -538,20 +553,8 @@ class AnalyticsEngineService:
         game_slug: str,
         team_elo: int
     ) -> Decimal:
-        """Calculate percentile ranking for team."""
-        query = AnalyticsQueryDTO(
-            game_slug=game_slug,
-            limit=10000,
-        )
-        all_snapshots = self.analytics_adapter.list_team_snapshots(query)
-        
-        if not all_snapshots:
-            return Decimal("50.0")
-        
-        lower_count = sum(1 for s in all_snapshots if s.elo_snapshot < team_elo)
-        percentile = (lower_count / len(all_snapshots)) * 100
-        
-        return Decimal(str(round(percentile, 2)))
+        """Calculate percentile ranking for team (see _calculate_user_percentile)."""
+        return self.get_elo_distribution("team", game_slug).percentile(team_elo)
     
     # =============================================================================
     # Leaderboard Aggregation
@@ -764,14 +767,23 @@ class AnalyticsEngineService:
         Generate tier-based leaderboard (grouped by tier).
         
         Returns top players from each tier (Crown → Diamond → Gold → Silver → Bronze).
+        
+        Tiers below the ``limit`` cut-off are never queried, and each tier
+        query asks only for what is left of ``limit``.
         """
+        per_tier = 20  # Top 20 per tier
         all_entries = []
         
         for tier in ["crown", "diamond", "gold", "silver", "bronze"]:
+            # Tiers are processed in final sort order, so lower tiers can
+            # only fill what is left of ``limit``
+            remaining = limit - len(all_entries)
+            if remaining <= 0:
+                break
             query = AnalyticsQueryDTO(
                 game_slug=game_slug,
                 tier=tier,
-                limit=20,  # Top 20 per tier
+                limit=min(per_tier, remaining),
                 order_by="-elo_snapshot"
             )
             snapshots = self.analytics_adapter.list_user_snapshots(query)
@@ -837,40 +849,215 @@ class AnalyticsEngineService:
     # =============================================================================
     # Batch Operations
     # =============================================================================
+    # The nightly refresh walks every UserStats / TeamStats row of a game in
+    # id-ordered chunks. Per chunk it issues one query for the stats rows,
+    # one for 30 days of match results of every owner in the chunk and one
+    # bulk upsert — instead of ~4 queries per user. Percentiles come from the
+    # game's ELO distribution, rebuilt once when the refresh starts and read
+    # from cache by every chunk. Chunks are independent, so the Celery layer
+    # (apps.leaderboards.tasks) can fan them out and checkpoint each one.
     
-    def refresh_all_user_analytics(self, game_slug: Optional[str] = None) -> int:
+    def refresh_user_analytics_chunk(
+        self,
+        game_slug: str,
+        after_id: int = 0,
+        upto_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Recompute user snapshots for UserStats rows with
+        ``after_id < id <= upto_id`` (at most ``limit`` rows).
+        
+        Returns:
+            Dict with rows, last_id (cursor for the next chunk), duration_ms
+            and rows_per_second
         """
-        Refresh analytics for all users in a game (or all games).
+        started = time.perf_counter()
+        now = now or datetime.now(dt_timezone.utc)
+        stats_rows = self.analytics_adapter.list_user_stats_chunk(
+            game_slug, after_id, upto_id=upto_id, limit=limit
+        )
+        if not stats_rows:
+            return self._chunk_result(0, after_id, started)
         
-        Used by nightly Celery job.
+        results = self.match_history_adapter.list_recent_user_results(
+            [row["user_id"] for row in stats_rows], game_slug, now - timedelta(days=30)
+        )
+        summaries = _summarize_results(results, now - timedelta(days=7))
+        distribution = self.get_elo_distribution("user", game_slug)
+        
+        snapshots = {}
+        for row in stats_rows:
+            summary = summaries.get(row["user_id"]) or _empty_summary()
+            elo = self._elo_from_win_rate(row["win_rate"], row["matches_played"])
+            snapshots[row["user_id"]] = {
+                "mmr_snapshot": elo,
+                "elo_snapshot": elo,
+                "win_rate": row["win_rate"],
+                "kda_ratio": row["kd_ratio"],
+                "matches_last_7d": summary["matches_7d"],
+                "matches_last_30d": summary["matches_30d"],
+                "win_rate_7d": _rate(summary["wins_7d"], summary["matches_7d"]),
+                "win_rate_30d": _rate(summary["wins_30d"], summary["matches_30d"]),
+                "current_streak": summary["current_streak"],
+                "longest_win_streak": summary["longest_win_streak"],
+                "tier": TierBoundaries.calculate_tier(elo),
+                "percentile_rank": distribution.percentile(elo),
+            }
+        
+        written = self.analytics_adapter.bulk_upsert_user_snapshots(game_slug, snapshots)
+        return self._chunk_result(written, stats_rows[-1]["id"], started)
+    
+    def refresh_team_analytics_chunk(
+        self,
+        game_slug: str,
+        after_id: int = 0,
+        upto_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Recompute team snapshots for TeamStats rows with
+        ``after_id < id <= upto_id`` (at most ``limit`` rows).
+        
+        Teams without a TeamRanking get the default snapshot, as in
+        compute_team_analytics.
+        
+        Returns:
+            Dict with rows, last_id, duration_ms and rows_per_second
+        """
+        started = time.perf_counter()
+        now = now or datetime.now(dt_timezone.utc)
+        stats_rows = self.analytics_adapter.list_team_stats_chunk(
+            game_slug, after_id, upto_id=upto_id, limit=limit
+        )
+        if not stats_rows:
+            return self._chunk_result(0, after_id, started)
+        
+        results = self.match_history_adapter.list_recent_team_results(
+            [row["team_id"] for row in stats_rows], game_slug, now - timedelta(days=30)
+        )
+        summaries = _summarize_results(results, now - timedelta(days=7))
+        distribution = self.get_elo_distribution("team", game_slug)
+        
+        snapshots = {}
+        for row in stats_rows:
+            elo = row["elo_rating"]
+            if elo is None:
+                snapshots[row["team_id"]] = _default_team_snapshot()
+                continue
+            summary = summaries.get(row["team_id"]) or _empty_summary()
+            volatility = (
+                self._volatility_from_changes(summary["elo_changes"])
+                if summary["matches_30d"] >= 2 else Decimal("0.0")
+            )
+            snapshots[row["team_id"]] = {
+                "elo_snapshot": elo,
+                "elo_volatility": volatility,
+                "avg_member_skill": Decimal(str(elo)),
+                "win_rate": row["win_rate"],
+                "win_rate_7d": _rate(summary["wins_7d"], summary["matches_7d"]),
+                "win_rate_30d": _rate(summary["wins_30d"], summary["matches_30d"]),
+                "synergy_score": self._synergy_from_results(summary["wins"]),
+                "activity_score": self._calculate_activity_score(
+                    summary["matches_7d"], summary["matches_30d"]
+                ),
+                "matches_last_7d": summary["matches_7d"],
+                "matches_last_30d": summary["matches_30d"],
+                "tier": TierBoundaries.calculate_tier(elo),
+                "percentile_rank": distribution.percentile(elo),
+            }
+        
+        written = self.analytics_adapter.bulk_upsert_team_snapshots(game_slug, snapshots)
+        return self._chunk_result(written, stats_rows[-1]["id"], started)
+    
+    def refresh_all_user_analytics(
+        self,
+        game_slug: Optional[str] = None,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+        start_after_id: int = 0,
+        on_chunk: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> int:
+        """
+        Refresh analytics for all users in a game (or all games), in-process.
+        
+        Used by the nightly Celery job when chunks are not fanned out.
+        
+        Args:
+            game_slug: Restrict to one game (default: every game with stats)
+            chunk_size: Stats rows per chunk
+            start_after_id: Resume cursor (only with ``game_slug``)
+            on_chunk: Called with (game_slug, chunk result) after each chunk,
+                e.g. to persist ``last_id`` as a checkpoint
         
         Returns:
             Count of users refreshed
         """
-        # Get all user stats
-        if game_slug:
-            # Get users for specific game
-            # Would need adapter method to list all users with stats for game
-            # For now, simplified implementation
-            count = 0
-            # In real implementation: iterate all users with stats for game
-            return count
-        else:
-            # Get all users across all games
-            # Would batch process all users
-            return 0
+        return self._refresh_all("user", self.refresh_user_analytics_chunk,
+                                 game_slug, chunk_size, start_after_id, on_chunk)
     
-    def refresh_all_team_analytics(self, game_slug: Optional[str] = None) -> int:
+    def refresh_all_team_analytics(
+        self,
+        game_slug: Optional[str] = None,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+        start_after_id: int = 0,
+        on_chunk: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> int:
         """
-        Refresh analytics for all teams in a game (or all games).
+        Refresh analytics for all teams in a game (or all games), in-process.
         
-        Used by nightly Celery job.
+        Used by the nightly Celery job when chunks are not fanned out.
+        See refresh_all_user_analytics for the arguments.
         
         Returns:
             Count of teams refreshed
         """
-        # Similar to user refresh
-        return 0
+        return self._refresh_all("team", self.refresh_team_analytics_chunk,
+                                 game_slug, chunk_size, start_after_id, on_chunk)
+    
+    def _refresh_all(
+        self,
+        subject: str,
+        refresh_chunk: Callable[..., Dict[str, Any]],
+        game_slug: Optional[str],
+        chunk_size: int,
+        start_after_id: int,
+        on_chunk: Optional[Callable[[str, Dict[str, Any]], None]],
+    ) -> int:
+        started = time.perf_counter()
+        now = datetime.now(dt_timezone.utc)
+        games = [game_slug] if game_slug else self.analytics_adapter.list_stats_game_slugs(subject)
+        
+        total = 0
+        for game in games:
+            self.get_elo_distribution(subject, game, rebuild=True)
+            cursor = start_after_id if game_slug else 0
+            while True:
+                result = refresh_chunk(game, after_id=cursor, limit=chunk_size, now=now)
+                total += result["rows"]
+                cursor = result["last_id"]
+                if on_chunk is not None and result["rows"]:
+                    on_chunk(game, result)
+                if result["rows"] < chunk_size:
+                    break
+        
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"{subject.capitalize()} analytics refreshed: {total} rows in {elapsed:.1f}s "
+            f"({total / elapsed if elapsed else 0:.0f} rows/s)"
+        )
+        return total
+    
+    @staticmethod
+    def _chunk_result(rows: int, last_id: int, started: float) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - started
+        return {
+            "rows": rows,
+            "last_id": last_id,
+            "duration_ms": int(elapsed * 1000),
+            "rows_per_second": round(rows / elapsed, 1) if elapsed and rows else 0.0,
+        }
     
     def refresh_all_leaderboards(self) -> Dict[str, int]:
         """
@@ -905,3 +1092,97 @@ class AnalyticsEngineService:
         results["global_user"] = count
         
         return results
+
+
+# =============================================================================
+# Batch helpers (column-wise over one chunk of match results)
+# =============================================================================
+
+def _empty_summary() -> Dict[str, Any]:
+    return {
+        "matches_7d": 0,
+        "matches_30d": 0,
+        "wins_7d": 0,
+        "wins_30d": 0,
+        "current_streak": 0,
+        "longest_win_streak": 0,
+        "wins": [],
+        "elo_changes": [],
+    }
+
+
+def _summarize_results(rows: Sequence[tuple], week_start: datetime) -> Dict[int, Dict[str, Any]]:
+    """
+    Per-owner rolling metrics from one chunk of match results.
+    
+    ``rows`` are (owner_id, is_winner, is_draw[, elo_change], completed_at)
+    tuples ordered by owner, then completed_at ascending — as returned by
+    the match history adapter's ``list_recent_*_results``. Each owner's rows
+    are split into columns once and every metric is a pass over a column.
+    """
+    grouped: Dict[int, Tuple[list, list, list, list]] = {}
+    for row in rows:
+        columns = grouped.get(row[0])
+        if columns is None:
+            columns = grouped[row[0]] = ([], [], [], [])
+        wins, draws, changes, times = columns
+        wins.append(row[1])
+        draws.append(row[2])
+        if len(row) == 5 and row[3] is not None:
+            changes.append(row[3])
+        times.append(row[-1])
+    
+    summaries = {}
+    for owner_id, (wins, draws, changes, times) in grouped.items():
+        first_recent = bisect_left(times, week_start)
+        
+        current = 0
+        if not draws[-1]:
+            latest = wins[-1]
+            for is_winner, is_draw in zip(reversed(wins), reversed(draws)):
+                if is_draw or is_winner != latest:
+                    break
+                current += 1
+            if not latest:
+                current = -current
+        
+        longest = run = 0
+        for is_winner in wins:
+            run = run + 1 if is_winner else 0
+            if run > longest:
+                longest = run
+        
+        summaries[owner_id] = {
+            "matches_7d": len(wins) - first_recent,
+            "matches_30d": len(wins),
+            "wins_7d": sum(wins[first_recent:]),
+            "wins_30d": sum(wins),
+            "current_streak": current,
+            "longest_win_streak": longest,
+            "wins": wins,
+            "elo_changes": changes,
+        }
+    return summaries
+
+
+def _rate(wins: int, matches: int) -> Decimal:
+    if not matches:
+        return Decimal("0.0")
+    return Decimal(str((wins / matches) * 100))
+
+
+def _default_team_snapshot() -> Dict[str, Any]:
+    return {
+        "elo_snapshot": 1200,
+        "elo_volatility": Decimal("0.0"),
+        "avg_member_skill": Decimal("1200.0"),
+        "win_rate": Decimal("0.0"),
+        "win_rate_7d": Decimal("0.0"),
+        "win_rate_30d": Decimal("0.0"),
+        "synergy_score": Decimal("0.0"),
+        "activity_score": Decimal("0.0"),
+        "matches_last_7d": 0,
+        "matches_last_30d": 0,
+        "tier": "bronze",
+        "percentile_rank": Decimal("50.0"),
+    }
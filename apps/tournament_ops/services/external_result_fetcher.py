@@ -0,0 +1,342 @@
+"""
+Bulk External Match-Result Fetcher — Riot / Steam polling
+
+The pollers used to dispatch one Celery task per pending match under a fixed
+per-cycle cap, so a busy weekend left most of the provider quota unused while
+results sat pending. ``BulkResultFetcher`` fetches a whole poll cycle at once:
+
+- requests are grouped per routing key (Riot cluster; Steam has one) and
+  deduplicated by external match id, so a match mirrored across tournaments
+  costs one request;
+- every routing key has a ``TokenBucket`` sized to the provider quota and
+  shared by all requests of the batch; its state is kept in the cache between
+  cycles so back-to-back cycles cannot spend the same window twice;
+- requests run concurrently on one aiohttp session until the cycle deadline
+  or the bucket runs dry; a 429 pauses that routing key only;
+- payloads of finished matches never change and are cached, so re-polls and
+  retries spend no quota.
+
+Base URLs come from settings (``RIOT_MATCH_API_BASE_URL``,
+``STEAM_API_BASE_URL``) so tests can point the fetcher at a local fake
+provider server.
+
+Usage::
+
+    fetcher = BulkResultFetcher(RIOT_VALORANT)
+    outcomes = fetcher.fetch_many([("ap", "APAC1-1"), ("eu", "EU1-9")])
+    outcomes[("ap", "APAC1-1")].payload
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+_PAYLOAD_CACHE_PREFIX = "external_match:payload:"
+_BUCKET_CACHE_PREFIX = "external_match:bucket:"
+
+# Outcome errors
+DEFERRED = "deferred"          # no quota left before the cycle deadline
+RATE_LIMITED = "rate_limited"  # provider answered 429
+HTTP_ERROR = "http_error"      # 4xx / 5xx (404 = match not finished yet)
+NETWORK_ERROR = "network_error"
+NOT_FINAL = "not_final"        # 200 but payload is not a finished match
+
+
+def _is_dict(payload: Any) -> bool:
+    return isinstance(payload, dict)
+
+
+def _is_final_steam_payload(payload: Any) -> bool:
+    result = payload.get("result") if isinstance(payload, dict) else None
+    return isinstance(result, dict) and "error" not in result
+
+
+@dataclass(frozen=True)
+class ProviderSpec:
+    """Endpoint, credentials and quota of one external match-result API."""
+
+    name: str
+    base_url_setting: str
+    default_base_url: str         # may contain ``{route}``
+    path: str                     # may contain ``{match_id}``
+    quota_setting: str
+    default_quota: int            # requests per window per routing key
+    window_seconds: float
+    api_key_setting: str
+    api_key_header: str = ""      # send the key as this header ...
+    api_key_param: str = ""       # ... or as this query parameter
+    match_id_param: str = ""      # pass the match id as a query parameter
+    is_final: Callable[[Any], bool] = _is_dict
+
+    @property
+    def quota(self) -> int:
+        return int(getattr(settings, self.quota_setting, self.default_quota))
+
+    def url(self, route: str, match_id: str) -> str:
+        base = getattr(settings, self.base_url_setting, "") or self.default_base_url
+        return base.format(route=route).rstrip("/") + self.path.format(match_id=match_id)
+
+
+RIOT_VALORANT = ProviderSpec(
+    name="riot",
+    base_url_setting="RIOT_MATCH_API_BASE_URL",
+    default_base_url="https://{route}.api.riotgames.com",
+    path="/val/match/v1/matches/{match_id}",
+    quota_setting="RIOT_MATCH_QUOTA_PER_WINDOW",
+    default_quota=95,               # 5-request buffer below 100 req / 2 min
+    window_seconds=120,
+    api_key_setting="RIOT_API_KEY",
+    api_key_header="X-Riot-Token",
+)
+
+STEAM_DOTA2 = ProviderSpec(
+    name="steam",
+    base_url_setting="STEAM_API_BASE_URL",
+    default_base_url="https://api.steampowered.com",
+    path="/IDOTA2Match_570/GetMatchDetails/v1",
+    quota_setting="STEAM_MATCH_QUOTA_PER_WINDOW",
+    default_quota=3500,             # buffer below ~3600 req / hr
+    window_seconds=3600,
+    api_key_setting="STEAM_API_KEY",
+    api_key_param="key",
+    match_id_param="match_id",
+    is_final=_is_final_steam_payload,
+)
+
+
+@dataclass
+class FetchOutcome:
+    """Result of one deduplicated fetch."""
+
+    payload: dict[str, Any] | None = None
+    status_code: int | None = None
+    error: str = ""
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.payload is not None
+
+
+class TokenBucket:
+    """
+    Async token bucket: ``capacity`` tokens refilled at ``rate`` per second.
+
+    Uses wall-clock time so the state can be handed to the next poll cycle
+    (possibly another worker) through the cache.
+    """
+
+    def __init__(self, capacity: float, rate: float, tokens: float | None = None,
+                 updated: float | None = None, clock: Callable[[], float] = time.time) -> None:
+        self.capacity = capacity
+        self.rate = rate
+        self.clock = clock
+        self.tokens = capacity if tokens is None else tokens
+        self.updated = clock() if updated is None else updated
+        self.paused_until = 0.0
+        self._lock: asyncio.Lock | None = None
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def pause(self, seconds: float) -> None:
+        """Drain the bucket and hold it for ``seconds`` (provider said 429)."""
+        now = self.clock()
+        self._refill(now)
+        self.tokens = 0.0
+        self.paused_until = max(self.paused_until, now + seconds)
+
+    def paused(self) -> bool:
+        return self.clock() < self.paused_until
+
+    async def acquire(self, deadline: float) -> bool:
+        """Take one token, waiting for refill; False if none arrives before ``deadline``."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = self.clock()
+                self._refill(now)
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                else:
+                    wait = (1 - self.tokens) / self.rate
+                if now + wait > deadline:
+                    return False
+                await asyncio.sleep(wait)
+
+    def state(self) -> tuple[float, float]:
+        now = self.clock()
+        self._refill(now)
+        if now < self.paused_until:
+            # Carry the pause over: the next cycle starts from an empty bucket
+            # that only begins refilling once the pause has elapsed.
+            return 0.0, self.paused_until
+        return self.tokens, self.updated
+
+
+class BulkResultFetcher:
+    """Fetches many external match payloads under one shared, quota-sized limiter."""
+
+    DEFAULT_TIMEOUT: int = 10
+
+    def __init__(self, provider: ProviderSpec, *, concurrency: int | None = None,
+                 cache_seconds: int | None = None) -> None:
+        self.provider = provider
+        self.concurrency = concurrency or int(getattr(settings, "EXTERNAL_MATCH_FETCH_CONCURRENCY", 16))
+        self.cache_seconds = cache_seconds or int(
+            getattr(settings, "EXTERNAL_MATCH_PAYLOAD_CACHE_SECONDS", 7 * 24 * 3600)
+        )
+
+    # ------------------------------------------------------------------ #
+    #  Public interface                                                    #
+    # ------------------------------------------------------------------ #
+
+    def fetch_many(
+        self,
+        keys: Iterable[tuple[str, str]],
+        time_budget: float | None = None,
+    ) -> dict[tuple[str, str], FetchOutcome]:
+        """
+        Fetch ``(route, match_id)`` pairs, each at most once.
+
+        Args:
+            keys: Routing key / external match id pairs; duplicates collapse.
+            time_budget: Seconds the batch may run (default: one quota window).
+
+        Returns:
+            ``{(route, match_id): FetchOutcome}`` for every distinct key.
+        """
+        unique = list(dict.fromkeys((route, str(match_id)) for route, match_id in keys if match_id))
+        if not unique:
+            return {}
+
+        outcomes: dict[tuple[str, str], FetchOutcome] = {}
+        cache_keys = {self._payload_key(*key): key for key in unique}
+        for cache_key, payload in cache.get_many(list(cache_keys)).items():
+            outcomes[cache_keys[cache_key]] = FetchOutcome(payload=payload, status_code=200, cached=True)
+        pending = [key for key in unique if key not in outcomes]
+        if not pending:
+            return outcomes
+
+        budget = self.provider.window_seconds if time_budget is None else time_budget
+        buckets = {route: self._load_bucket(route) for route in {route for route, _ in pending}}
+        fetched = asyncio.run(self._fetch_all(pending, buckets, time.time() + budget))
+        outcomes.update(fetched)
+
+        self._save_buckets(buckets)
+        final = {
+            self._payload_key(*key): outcome.payload
+            for key, outcome in fetched.items()
+            if outcome.ok
+        }
+        if final:
+            cache.set_many(final, self.cache_seconds)
+
+        logger.info(
+            "[BulkFetch] provider=%s requested=%d cached=%d fetched=%d deferred=%d failed=%d",
+            self.provider.name,
+            len(unique),
+            len(unique) - len(pending),
+            len(final),
+            sum(1 for o in fetched.values() if o.error == DEFERRED),
+            sum(1 for o in fetched.values() if o.error and o.error != DEFERRED),
+        )
+        return outcomes
+
+    # ------------------------------------------------------------------ #
+    #  Internal helpers                                                   #
+    # ------------------------------------------------------------------ #
+
+    def _payload_key(self, route: str, match_id: str) -> str:
+        return f"{_PAYLOAD_CACHE_PREFIX}{self.provider.name}:{route}:{match_id}"
+
+    def _bucket_key(self, route: str) -> str:
+        return f"{_BUCKET_CACHE_PREFIX}{self.provider.name}:{route}"
+
+    def _load_bucket(self, route: str) -> TokenBucket:
+        quota = self.provider.quota
+        tokens, updated = cache.get(self._bucket_key(route)) or (None, None)
+        bucket = TokenBucket(quota, quota / self.provider.window_seconds, tokens=tokens, updated=updated)
+        if updated and updated > bucket.clock():
+            bucket.paused_until = updated  # a carried-over 429 pause
+        return bucket
+
+    def _save_buckets(self, buckets: dict[str, TokenBucket]) -> None:
+        cache.set_many(
+            {self._bucket_key(route): bucket.state() for route, bucket in buckets.items()},
+            int(self.provider.window_seconds * 2),
+        )
+
+    def _request_args(self, route: str, match_id: str) -> tuple[str, dict, dict]:
+        provider = self.provider
+        api_key = getattr(settings, provider.api_key_setting, "")
+        headers = {"Accept": "application/json"}
+        params = {}
+        if provider.api_key_header:
+            headers[provider.api_key_header] = api_key
+        if provider.api_key_param:
+            params[provider.api_key_param] = api_key
+        if provider.match_id_param:
+            params[provider.match_id_param] = match_id
+        return provider.url(route, match_id), headers, params
+
+    async def _fetch_all(self, pending, buckets, deadline):
+        import aiohttp
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.DEFAULT_TIMEOUT)
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            results = await asyncio.gather(*(
+                self._fetch_one(session, semaphore, buckets[route], route, match_id, deadline)
+                for route, match_id in pending
+            ))
+        return dict(zip(pending, results))
+
+    async def _fetch_one(self, session, semaphore, bucket, route, match_id, deadline) -> FetchOutcome:
+        import aiohttp
+
+        if not await bucket.acquire(deadline):
+            return FetchOutcome(error=DEFERRED)
+
+        url, headers, params = self._request_args(route, match_id)
+        async with semaphore:
+            if bucket.paused():
+                # The route answered 429 while this request was queued.
+                return FetchOutcome(error=DEFERRED)
+            try:
+                async with session.get(url, headers=headers, params=params) as response:
+                    if response.status == 429:
+                        retry_after = response.headers.get("Retry-After", "")
+                        bucket.pause(float(retry_after) if retry_after.isdigit() else self.provider.window_seconds)
+                        logger.warning(
+                            "[BulkFetch] %s rate limited on route '%s' — pausing.", self.provider.name, route,
+                        )
+                        return FetchOutcome(status_code=429, error=RATE_LIMITED)
+                    if response.status >= 400:
+                        return FetchOutcome(status_code=response.status, error=HTTP_ERROR)
+                    payload = await response.json(content_type=None)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as exc:
+                logger.warning(
+                    "[BulkFetch] %s request failed for %s/%s: %s", self.provider.name, route, match_id, exc,
+                )
+                return FetchOutcome(error=NETWORK_ERROR)
+
+        if not self.provider.is_final(payload):
+            return FetchOutcome(status_code=200, error=NOT_FINAL)
+        return FetchOutcome(payload=payload, status_code=200)
@@ -13,6 +13,7 @@ Reference: PHASE6_WORKPLAN_DRAFT.md - Epic 6.3 (Organizer Results Inbox) & Epic
 from typing import List, Optional, Dict, Any, TYPE_CHECKING
 
 from apps.common.events.event_bus import Event, get_event_bus
+from apps.common.events.outbox import batched_outbox
 from apps.tournament_ops.dtos import (
     OrganizerReviewItemDTO,
     MatchResultSubmissionDTO,
@@ -690,16 +691,20 @@ class ReviewInboxService:
             'items': [],
         }
         
-        for submission_id in submission_ids:
-            try:
-                finalized = self.finalize_submission(submission_id, resolved_by_user_id)
-                results['processed'] += 1
-                results['items'].append(finalized)
-            except Exception as e:
-                results['failed'].append({
-                    'submission_id': submission_id,
-                    'error': str(e),
-                })
+        # One outbox INSERT for the whole run; each submission is its own
+        # savepoint so a failure drops only that submission's rows and events.
+        with batched_outbox():
+            for submission_id in submission_ids:
+                try:
+                    with batched_outbox():
+                        finalized = self.finalize_submission(submission_id, resolved_by_user_id)
+                    results['processed'] += 1
+                    results['items'].append(finalized)
+                except Exception as e:
+                    results['failed'].append({
+                        'submission_id': submission_id,
+                        'error': str(e),
+                    })
         
         return results
     
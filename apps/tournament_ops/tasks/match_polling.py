@@ -2,13 +2,15 @@
 Match Polling Celery Tasks — Phase 1 (AUTOMATED_TOURNAMENTS_ROADMAP.md)
 
 Task map:
-  poll_pending_riot_matches    — Beat, every 2 min — finds Valorant matches needing fetch
+  poll_pending_riot_matches    — Beat, every 2 min — fetches & ingests pending Valorant
+                                 matches in one rate-aware batch (BulkResultFetcher)
   poll_pending_steam_matches   — Beat, every 5 min — finds CS2/Dota2 matches needing fetch
   fetch_riot_match_v5          — Per match — fetches & ingests one Riot match
   fetch_steam_match_result     — Per match — fetches & ingests one Steam match
   advance_bracket_after_match  — After ingest — triggers bracket progression
 
-Redis rate-limit guard:
+Redis rate-limit guard (per-match tasks; the batch poller uses the
+BulkResultFetcher token buckets instead):
   _check_riot_rate_limit(region) — enforces 100 req / 2 min per routing region
   _check_steam_rate_limit()      — enforces ~1 req/s (3600/hr) for Steam Web API
 
@@ -26,16 +28,29 @@ Add to CELERYBEAT_SCHEDULE in settings:
 from __future__ import annotations
 
 import logging
+import time
 
 from celery import shared_task
 from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Exists, OuterRef
 
 logger = logging.getLogger(__name__)
 
-# Maximum match fetches dispatched per poller cycle.
-RIOT_POLL_MAX = getattr(settings, "RIOT_MATCH_POLL_MAX_PER_CYCLE", 20)
+# Maximum pending matches read per poller cycle; how many are actually fetched
+# is bounded by the provider quota (see BulkResultFetcher).
+RIOT_POLL_MAX = getattr(settings, "RIOT_MATCH_POLL_MAX_PER_CYCLE", 500)
 STEAM_POLL_MAX = getattr(settings, "STEAM_MATCH_POLL_MAX_PER_CYCLE", 10)
+# Seconds a Riot poll cycle may spend fetching (beat runs it every 2 min).
+RIOT_POLL_CYCLE_SECONDS = getattr(settings, "RIOT_MATCH_POLL_CYCLE_SECONDS", 110)
+# Seconds a cycle may spend ingesting fetched payloads; the rest wait for the
+# next cycle.
+RIOT_POLL_INGEST_SECONDS = getattr(settings, "RIOT_MATCH_POLL_INGEST_SECONDS", 120)
+_RIOT_POLL_LOCK_KEY = "deltacrown:riot_poll:running"
+# The lock is held for the whole cycle (fetch + ingest). Expire it only well
+# past the worst case, so a crashed worker cannot wedge polling for long but
+# a slow cycle never overlaps the next one.
+_RIOT_POLL_LOCK_TIMEOUT = RIOT_POLL_CYCLE_SECONDS + RIOT_POLL_INGEST_SECONDS + 60
 
 # Redis key prefixes
 _RIOT_RL_PREFIX = "deltacrown:riot_ratelimit:"
@@ -109,49 +124,110 @@ def _check_steam_rate_limit() -> bool:
 def poll_pending_riot_matches(self):
     """
     Find all LIVE or PENDING_RESULT Valorant matches that have a riot_match_id
-    in lobby_info but no AUTO_CONFIRMED / FINALIZED submission yet, then dispatch
-    a fetch_riot_match_v5 task for each one.
+    in lobby_info but no AUTO_CONFIRMED / FINALIZED submission yet, fetch their
+    payloads in one batch and ingest every finished one.
+
+    The batch shares one token bucket per Riot cluster, so a cycle spends up
+    to the cluster quota instead of a fixed match count, and a Riot match id
+    referenced by several matches is fetched once. Matches whose payload is
+    not available yet (404), did not fit the quota or did not fit the ingest
+    time budget stay pending for the next cycle.
+
+    The cycle lock is held until ingestion finishes so two cycles never
+    ingest the same match concurrently.
     """
     from apps.tournaments.models.match import Match
     from apps.tournaments.models.result_submission import MatchResultSubmission
+    from apps.tournament_ops.services.external_result_fetcher import (
+        RIOT_VALORANT,
+        BulkResultFetcher,
+    )
+    from apps.tournament_ops.services.riot_result_fetcher import VALID_CLUSTERS
 
-    qs = (
-        Match.objects.filter(
-            state__in=[Match.LIVE, Match.PENDING_RESULT],
-            tournament__game__slug="valorant",
-        )
-        .exclude(lobby_info={})
-        .annotate(
-            has_auto_result=Exists(
-                MatchResultSubmission.objects.filter(
-                    match=OuterRef("pk"),
-                    source=MatchResultSubmission.SOURCE_RIOT_API,
-                    status__in=[
-                        MatchResultSubmission.STATUS_AUTO_CONFIRMED,
-                        MatchResultSubmission.STATUS_FINALIZED,
-                    ],
+    if not cache.add(_RIOT_POLL_LOCK_KEY, 1, _RIOT_POLL_LOCK_TIMEOUT):
+        logger.info("[Polling] poll_pending_riot_matches — previous cycle still running, skipping.")
+        return {"status": "skipped", "reason": "cycle_running"}
+
+    try:
+        qs = (
+            Match.objects.filter(
+                state__in=[Match.LIVE, Match.PENDING_RESULT],
+                tournament__game__slug="valorant",
+            )
+            .exclude(lobby_info={})
+            .annotate(
+                has_auto_result=Exists(
+                    MatchResultSubmission.objects.filter(
+                        match=OuterRef("pk"),
+                        source=MatchResultSubmission.SOURCE_RIOT_API,
+                        status__in=[
+                            MatchResultSubmission.STATUS_AUTO_CONFIRMED,
+                            MatchResultSubmission.STATUS_FINALIZED,
+                        ],
+                    )
                 )
             )
+            .filter(has_auto_result=False)
+            .select_related("tournament__game")
+            .order_by("pk")[:RIOT_POLL_MAX]
+        )
+
+        pending = []
+        skipped = 0
+        for match in qs:
+            lobby = match.lobby_info or {}
+            riot_match_id = lobby.get("riot_match_id", "")
+            region = (lobby.get("region") or "").lower().strip()
+            if not riot_match_id or region not in VALID_CLUSTERS:
+                skipped += 1
+                continue
+            pending.append((match, (region, str(riot_match_id))))
+
+        outcomes = BulkResultFetcher(RIOT_VALORANT).fetch_many(
+            [key for _, key in pending],
+            time_budget=RIOT_POLL_CYCLE_SECONDS,
         )
-        .filter(has_auto_result=False)[:RIOT_POLL_MAX]
-    )
 
-    dispatched = 0
-    skipped = 0
-    for match in qs:
-        riot_match_id = (match.lobby_info or {}).get("riot_match_id", "")
-        if not riot_match_id:
-            skipped += 1
-            continue
-        fetch_riot_match_v5.delay(match.pk, riot_match_id)
-        dispatched += 1
+        ingested = 0
+        waiting = 0
+        failed = 0
+        deadline = time.monotonic() + RIOT_POLL_INGEST_SECONDS
+        for match, (region, riot_match_id) in pending:
+            outcome = outcomes.get((region, riot_match_id))
+            if outcome is None or not outcome.ok or time.monotonic() >= deadline:
+                waiting += 1
+                continue
+            try:
+                result = _ingest_riot_payload(match, riot_match_id, region, outcome.payload)
+            except Exception:
+                logger.exception(
+                    "[Polling] Ingest failed for match_pk=%s riot_id=%s", match.pk, riot_match_id,
+                )
+                failed += 1
+                continue
+            if result["status"] == "ok":
+                ingested += 1
+            else:
+                failed += 1
+    finally:
+        cache.delete(_RIOT_POLL_LOCK_KEY)
 
     logger.info(
-        "[Polling] poll_pending_riot_matches — dispatched=%d skipped=%d",
-        dispatched,
+        "[Polling] poll_pending_riot_matches — matches=%d unique=%d ingested=%d waiting=%d failed=%d skipped=%d",
+        len(pending),
+        len(outcomes),
+        ingested,
+        waiting,
+        failed,
         skipped,
     )
-    return {"status": "ok", "dispatched": dispatched, "skipped": skipped}
+    return {
+        "status": "ok",
+        "ingested": ingested,
+        "waiting": waiting,
+        "failed": failed,
+        "skipped": skipped,
+    }
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=300)
@@ -180,20 +256,10 @@ def fetch_riot_match_v5(self, match_pk: int, riot_match_id: str):
     Fetch one Valorant match from the Riot Match-V5 API and ingest the result.
     """
     from apps.tournaments.models.match import Match
-    from apps.tournaments.models.result_submission import MatchResultSubmission
     from apps.tournament_ops.services.riot_result_fetcher import (
         RiotMatchFetchError,
-        RiotMatchParseError,
         RiotMatchV5Fetcher,
     )
-    from apps.tournament_ops.services.match_ingestion_service import (
-        MatchIngestionService,
-    )
-    from apps.tournament_ops.services.integrity_check import (
-        flag_integrity_failure,
-        validate_participant_puuids,
-    )
-    from apps.user_profile.models import ProviderAccount
 
     try:
         match = Match.objects.select_related("tournament__game").get(pk=match_pk)
@@ -240,6 +306,39 @@ def fetch_riot_match_v5(self, match_pk: int, riot_match_id: str):
         )
         raise self.retry(exc=exc)
 
+    return _ingest_riot_payload(match, riot_match_id, region, payload, fetcher=fetcher)
+
+
+# ---------------------------------------------------------------------------
+# Riot payload ingestion (shared by the batch poller and per-match task)
+# ---------------------------------------------------------------------------
+
+def _ingest_riot_payload(match, riot_match_id: str, region: str, payload: dict, fetcher=None) -> dict:
+    """
+    Parse a fetched Riot payload for ``match``, run the integrity check,
+    ingest the result and queue bracket advancement.
+
+    Shared by the per-match task and the batch poller. The fingerprint is
+    per match, so one Riot match mirrored across tournaments ingests into
+    each of them.
+    """
+    from apps.tournaments.models.result_submission import MatchResultSubmission
+    from apps.tournament_ops.services.riot_result_fetcher import (
+        RiotMatchParseError,
+        RiotMatchV5Fetcher,
+    )
+    from apps.tournament_ops.services.match_ingestion_service import (
+        MatchIngestionService,
+    )
+    from apps.tournament_ops.services.integrity_check import (
+        flag_integrity_failure,
+        validate_participant_puuids,
+    )
+    from apps.user_profile.models import ProviderAccount
+
+    match_pk = match.pk
+    fetcher = fetcher or RiotMatchV5Fetcher()
+
     # Resolve PUUIDs for each participant via ProviderAccount
     def _resolve_puuids(participant_id):
         if not participant_id:
@@ -299,7 +398,7 @@ def fetch_riot_match_v5(self, match_pk: int, riot_match_id: str):
         provider=ProviderAccount.Provider.RIOT,
     )
 
-    fingerprint = f"riot:{riot_match_id}"
+    fingerprint = f"riot:{region}:{riot_match_id}:{match_pk}"
     submission = MatchIngestionService().ingest(
         match=match,
         parsed_result=parsed,
@@ -0,0 +1,131 @@
+"""
+Tests for BulkResultFetcher against a local fake Riot server.
+
+The fake server runs on its own event loop in a background thread and
+records every request, so the tests can assert on deduplication, quota
+pacing and payload caching without touching the network.
+"""
+
+import asyncio
+import threading
+from collections import Counter
+
+import pytest
+from aiohttp import web
+from django.core.cache import cache
+
+from apps.tournament_ops.services.external_result_fetcher import (
+    DEFERRED,
+    HTTP_ERROR,
+    RATE_LIMITED,
+    RIOT_VALORANT,
+    BulkResultFetcher,
+)
+
+
+class FakeRiotServer:
+    def __init__(self):
+        self.hits = Counter()
+        self.keys = set()
+        self.unfinished = set()
+        self.throttled_routes = set()
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self.port = None
+
+    async def _match(self, request):
+        route, match_id = request.match_info["route"], request.match_info["match_id"]
+        self.hits[(route, match_id)] += 1
+        self.keys.add(request.headers.get("X-Riot-Token"))
+        if route in self.throttled_routes:
+            return web.json_response({}, status=429, headers={"Retry-After": "60"})
+        if match_id in self.unfinished:
+            return web.json_response({"status": {"status_code": 404}}, status=404)
+        return web.json_response({"matchInfo": {"matchId": match_id}, "players": [], "teams": []})
+
+    def _serve(self):
+        asyncio.set_event_loop(self._loop)
+        app = web.Application()
+        app.router.add_get("/{route}/val/match/v1/matches/{match_id}", self._match)
+        self._runner = web.AppRunner(app)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        self._loop.run_until_complete(site.start())
+        self.port = site._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        self._ready.wait(5)
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(5)
+
+
+@pytest.fixture
+def riot_server(settings):
+    cache.clear()
+    server = FakeRiotServer()
+    server.start()
+    settings.RIOT_API_KEY = "test-key"
+    settings.RIOT_MATCH_API_BASE_URL = f"http://127.0.0.1:{server.port}/{{route}}"
+    settings.RIOT_MATCH_QUOTA_PER_WINDOW = 10
+    yield server
+    server.stop()
+    cache.clear()
+
+
+def test_duplicate_match_ids_are_fetched_once(riot_server):
+    outcomes = BulkResultFetcher(RIOT_VALORANT).fetch_many(
+        [("ap", "APAC1-1"), ("ap", "APAC1-1"), ("eu", "EU1-7")], time_budget=1,
+    )
+
+    assert set(outcomes) == {("ap", "APAC1-1"), ("eu", "EU1-7")}
+    assert all(outcome.ok for outcome in outcomes.values())
+    assert riot_server.hits == Counter({("ap", "APAC1-1"): 1, ("eu", "EU1-7"): 1})
+    assert riot_server.keys == {"test-key"}
+
+
+def test_finished_payloads_are_cached_and_pending_ones_are_not(riot_server):
+    riot_server.unfinished.add("APAC1-2")
+    fetcher = BulkResultFetcher(RIOT_VALORANT)
+
+    first = fetcher.fetch_many([("ap", "APAC1-1"), ("ap", "APAC1-2")], time_budget=1)
+    second = fetcher.fetch_many([("ap", "APAC1-1"), ("ap", "APAC1-2")], time_budget=1)
+
+    assert first[("ap", "APAC1-2")].error == HTTP_ERROR
+    assert second[("ap", "APAC1-1")].cached
+    assert riot_server.hits == Counter({("ap", "APAC1-1"): 1, ("ap", "APAC1-2"): 2})
+
+
+def test_quota_is_shared_per_route_and_carried_across_cycles(riot_server):
+    fetcher = BulkResultFetcher(RIOT_VALORANT)
+    ap_ids = [("ap", f"APAC1-{n}") for n in range(14)]
+
+    outcomes = fetcher.fetch_many(ap_ids + [("eu", "EU1-1")], time_budget=0.5)
+
+    fetched = [key for key in ap_ids if outcomes[key].ok]
+    assert len(fetched) == 10
+    assert {outcomes[key].error for key in ap_ids if key not in fetched} == {DEFERRED}
+    assert outcomes[("eu", "EU1-1")].ok
+
+    # The next cycle starts from the drained bucket, not a fresh quota.
+    retry = fetcher.fetch_many([key for key in ap_ids if key not in fetched], time_budget=0.5)
+    assert not any(outcome.ok for outcome in retry.values())
+
+
+def test_rate_limited_route_pauses_without_blocking_others(riot_server):
+    riot_server.throttled_routes.add("na")
+
+    outcomes = BulkResultFetcher(RIOT_VALORANT, concurrency=1).fetch_many(
+        [("na", "NA1-1"), ("na", "NA1-2"), ("ap", "APAC1-1")], time_budget=1,
+    )
+
+    assert outcomes[("na", "NA1-1")].error == RATE_LIMITED
+    assert outcomes[("na", "NA1-2")].error == DEFERRED
+    assert outcomes[("ap", "APAC1-1")].ok
+    assert riot_server.hits[("na", "NA1-2")] == 0
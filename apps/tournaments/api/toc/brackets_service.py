@@ -9,7 +9,7 @@ import logging
 from typing import Any, Dict, List, Optional
 
 from django.core.exceptions import ValidationError
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.utils import timezone
 
 from apps.tournaments.models import (
@@ -196,11 +196,9 @@ class TOCBracketsService:
 
     @staticmethod
     def _group_stage_match_stats(tournament, group_ids: set[int]) -> Dict[int, Dict[str, int]]:
-        """Return per-group totals for bracket-less matches that are tagged with lobby_info.group_id.
+        """Return per-group totals for bracket-less matches of the given groups.
 
-        Uses a JSONB ``__group_id__in`` filter so PostgreSQL skips matches that
-        don't belong to any of the requested groups. This is significantly
-        faster than iterating every bracket-less match in Python.
+        Grouped COUNT over the indexed ``group`` FK.
         """
         stats = {
             gid: {"total": 0, "completed": 0}
@@ -209,51 +207,39 @@ class TOCBracketsService:
         if not group_ids:
             return stats
 
-        # DB-side filter for matches whose lobby_info.group_id ∈ group_ids
-        from django.db.models import Q
-        gid_list = list(group_ids)
-        matches = (
+        rows = (
             Match.objects.filter(
                 tournament=tournament,
+                group_id__in=list(group_ids),
                 bracket__isnull=True,
                 is_deleted=False,
             )
-            .filter(
-                Q(lobby_info__group_id__in=gid_list)
-                | Q(lobby_info__group_id__in=[str(g) for g in gid_list])
+            .order_by()
+            .values("group_id")
+            .annotate(
+                total=Count("id"),
+                completed=Count("id", filter=Q(state__in=[Match.COMPLETED, Match.FORFEIT])),
             )
-            .only("id", "state", "lobby_info")
         )
-
-        for match in matches.iterator():
-            group_id = TOCBracketsService._coerce_group_id((match.lobby_info or {}).get("group_id"))
-            if group_id not in stats:
-                continue
-            stats[group_id]["total"] += 1
-            if match.state in (Match.COMPLETED, Match.FORFEIT):
-                stats[group_id]["completed"] += 1
+        for row in rows:
+            stats[row["group_id"]] = {"total": row["total"], "completed": row["completed"]}
 
         return stats
 
     @staticmethod
     def _group_stage_match_ids(tournament, group_ids: set[int]) -> List[int]:
-        """Collect IDs of bracket-less matches that belong to the given groups via lobby_info.group_id."""
+        """Collect IDs of bracket-less matches that belong to the given groups."""
         if not group_ids:
             return []
 
-        ids: List[int] = []
-        matches = Match.objects.filter(
-            tournament=tournament,
-            bracket__isnull=True,
-            is_deleted=False,
-        ).only("id", "lobby_info")
-
-        for match in matches.iterator():
-            group_id = TOCBracketsService._coerce_group_id((match.lobby_info or {}).get("group_id"))
-            if group_id in group_ids:
-                ids.append(match.id)
-
-        return ids
+        return list(
+            Match.objects.filter(
+                tournament=tournament,
+                group_id__in=list(group_ids),
+                bracket__isnull=True,
+                is_deleted=False,
+            ).values_list("id", flat=True)
+        )
 
     @staticmethod
     def _group_generation_diagnostics(groups: List[Dict[str, Any]], rounds: int) -> Dict[str, Any]:
@@ -1758,6 +1744,15 @@ class TOCBracketsService:
             "message": f"Match #{match.match_number} (R{match.round_number}) scheduled.",
         }
 
+    @staticmethod
+    def _sync_rescheduled_matches(match_ids: List[int]) -> None:
+        """Bulk ``.update()`` skips post_save: refresh lifecycle deadlines and the participant index."""
+        from apps.tournaments.services import lifecycle_scheduler
+        from apps.tournaments.services.match_participant_index import sync_scheduled_times
+
+        lifecycle_scheduler.sync_matches(match_ids)
+        sync_scheduled_times(match_ids)
+
     @staticmethod
     def bulk_shift(tournament, data: Dict, user) -> Dict[str, Any]:
         """Bulk shift match times by a delta. Uses single SQL UPDATE."""
@@ -1778,7 +1773,9 @@ class TOCBracketsService:
             qs = qs.filter(round_number=round_number)
 
         delta = timedelta(minutes=shift_minutes)
-        count = qs.update(scheduled_time=F('scheduled_time') + delta)
+        match_ids = list(qs.values_list('id', flat=True))
+        count = Match.objects.filter(id__in=match_ids).update(scheduled_time=F('scheduled_time') + delta)
+        TOCBracketsService._sync_rescheduled_matches(match_ids)
 
         if count > 0:
             TOCBracketsService._fire_schedule_generated_event(
@@ -1802,11 +1799,15 @@ class TOCBracketsService:
         label = data.get("label", "Break")
 
         delta = timedelta(minutes=break_minutes)
-        count = Match.objects.filter(
-            tournament=tournament,
-            round_number__gt=after_round,
-            scheduled_time__isnull=False,
-        ).update(scheduled_time=F('scheduled_time') + delta)
+        match_ids = list(
+            Match.objects.filter(
+                tournament=tournament,
+                round_number__gt=after_round,
+                scheduled_time__isnull=False,
+            ).values_list('id', flat=True)
+        )
+        count = Match.objects.filter(id__in=match_ids).update(scheduled_time=F('scheduled_time') + delta)
+        TOCBracketsService._sync_rescheduled_matches(match_ids)
 
         if count > 0:
             TOCBracketsService._fire_schedule_generated_event(
@@ -367,8 +367,8 @@ class TOCLobbyService:
 
         # Invalidate any related caches so the FE sees fresh values on next refresh.
         try:
-            from django.core.cache import cache
-            cache.delete(f"toc:stamp:lobby:{tournament.id}")
+            from apps.tournaments.api.toc.cache_utils import bump_toc_scope
+            bump_toc_scope("lobby", tournament.id)
         except Exception:
             pass
 
@@ -6,7 +6,7 @@ S6-B2  POST matches/<id>/score/
 S6-B3  POST matches/<id>/mark-live/
 S6-B4  POST matches/<id>/pause/
 S6-B5  POST matches/<id>/resume/
-S6-B6  POST matches/<id>/force-complete/
+S6-B6  POST matches/<id>/force-complete/  + POST matches/bulk-force-complete/
 S6-B7  POST matches/<id>/reschedule/
 S6-B8  POST matches/<id>/forfeit/
 S6-B9  POST matches/<id>/add-note/
@@ -23,6 +23,7 @@ from rest_framework.response import Response
 from apps.tournaments.api.toc.base import TOCBaseView
 from apps.tournaments.api.toc.cache_utils import bump_toc_scopes, toc_cache_key
 from apps.tournaments.api.toc.matches_service import TOCMatchesService
+from apps.tournaments.api.toc.serializers import BulkMatchCompleteInputSerializer
 
 
 def _is_finalized_tournament(tournament) -> bool:
@@ -179,6 +180,20 @@ class MatchForceCompleteView(TOCBaseView):
         return Response(data)
 
 
+class MatchBulkForceCompleteView(TOCBaseView):
+    """POST /api/toc/<slug>/matches/bulk-force-complete/ — close out a set of matches."""
+
+    def post(self, request, slug):
+        ser = BulkMatchCompleteInputSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+
+        data = TOCMatchesService.bulk_force_complete(
+            ser.validated_data['ids'], self.tournament, user_id=request.user.id,
+        )
+        bump_toc_scopes(self.tournament.id, 'matches', 'brackets', 'overview', 'analytics')
+        return Response(data)
+
+
 class MatchResetView(TOCBaseView):
     """Reset scores and match verification artifacts — requires explicit confirmation.
 
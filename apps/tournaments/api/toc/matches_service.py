@@ -453,6 +453,11 @@ class TOCMatchesService:
     @classmethod
     def force_complete(cls, match_id: int, tournament: Tournament, *, user_id: int) -> Dict[str, Any]:
         match = Match.objects.get(pk=match_id, tournament=tournament)
+        cls._force_complete(match, user_id=user_id)
+        return cls._serialize_match(match)
+
+    @classmethod
+    def _force_complete(cls, match: Match, *, user_id: int) -> None:
         previous_state = match.state
         previous_winner_id = match.winner_id
         match.state = Match.COMPLETED
@@ -464,7 +469,38 @@ class TOCMatchesService:
             previous_state=previous_state,
             previous_winner_id=previous_winner_id,
         )
-        return cls._serialize_match(match)
+
+    @classmethod
+    @transaction.atomic
+    def bulk_force_complete(cls, match_ids: List[int], tournament: Tournament, *, user_id: int) -> Dict[str, Any]:
+        """
+        Force-complete several matches at once (closing out a round).
+
+        Bracket advancement for the whole set runs once through
+        BracketService.advance_matches() instead of once per match.
+        Matches that are already completed or have no winner are skipped.
+        """
+        from apps.tournaments.services.bracket_service import BracketService
+
+        matches = list(
+            Match.objects.filter(pk__in=match_ids, tournament=tournament)
+            .order_by('round_number', 'match_number')
+        )
+        completed, skipped = [], []
+        with BracketService.batched_advancement():
+            for match in matches:
+                if match.state in (Match.COMPLETED, Match.FORFEIT) or not match.winner_id:
+                    skipped.append(match.id)
+                    continue
+                cls._force_complete(match, user_id=user_id)
+                completed.append(match.id)
+
+        found = {match.id for match in matches}
+        return {
+            'completed': completed,
+            'skipped': skipped,
+            'not_found': [match_id for match_id in match_ids if match_id not in found],
+        }
 
     @classmethod
     @transaction.atomic
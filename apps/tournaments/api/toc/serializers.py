@@ -511,6 +511,11 @@ class ScheduleMatchSerializer(serializers.Serializer):
     stream_url = serializers.CharField(allow_blank=True)
 
 
+class BulkMatchCompleteInputSerializer(serializers.Serializer):
+    """Input for force-completing a set of matches (e.g. closing out a round)."""
+    ids = serializers.ListField(child=serializers.IntegerField(), min_length=1, max_length=256)
+
+
 class AutoScheduleInputSerializer(serializers.Serializer):
     """Input for auto-scheduling matches."""
     start_time = serializers.CharField(required=False, allow_blank=True)
@@ -155,6 +155,7 @@ urlpatterns = [
 
     # ── Matches (S6-B1 through S6-B10) ──
     path('<slug:slug>/matches/', matches.MatchListView.as_view(), name='matches'),
+    path('<slug:slug>/matches/bulk-force-complete/', matches.MatchBulkForceCompleteView.as_view(), name='matches-bulk-force-complete'),
     path('<slug:slug>/matches/<int:pk>/score/', matches.MatchScoreView.as_view(), name='match-score'),
     path('<slug:slug>/matches/<int:pk>/mark-live/', matches.MatchMarkLiveView.as_view(), name='match-mark-live'),
     path('<slug:slug>/matches/<int:pk>/pause/', matches.MatchPauseView.as_view(), name='match-pause'),
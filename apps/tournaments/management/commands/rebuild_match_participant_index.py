@@ -0,0 +1,60 @@
+"""
+Management Command: Rebuild / verify MatchParticipantIndex
+
+Usage:
+    # Full rebuild (chunked by match id)
+    python manage.py rebuild_match_participant_index
+
+    # Report drift without writing
+    python manage.py rebuild_match_participant_index --check
+
+    # Report drift and re-index only drifted matches
+    python manage.py rebuild_match_participant_index --check --repair
+"""
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.tournaments.services.match_participant_index import check_consistency, rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild or verify the per-user match participant index"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Compare stored rows with resolved rows instead of rebuilding',
+        )
+        parser.add_argument(
+            '--repair',
+            action='store_true',
+            help='With --check, re-index matches whose rows drifted',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Matches per chunk (default: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        start_time = timezone.now()
+
+        if options['check']:
+            report = check_consistency(batch_size=batch_size, repair=options['repair'])
+            duration = (timezone.now() - start_time).total_seconds()
+            summary = (
+                f"checked={report['matches_checked']} missing={report['missing']} "
+                f"extra={report['extra']} repaired={report['repaired_matches']} ({duration:.2f}s)"
+            )
+            if report['missing'] or report['extra']:
+                self.stdout.write(self.style.WARNING(f"Participant index drift: {summary}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"Participant index consistent: {summary}"))
+            return
+
+        written = rebuild_index(batch_size=batch_size)
+        duration = (timezone.now() - start_time).total_seconds()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt participant index: {written} rows in {duration:.2f}s"))
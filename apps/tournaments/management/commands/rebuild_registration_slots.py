@@ -0,0 +1,51 @@
+"""
+Management Command: Rebuild / verify RegistrationSlotCounter
+
+Usage:
+    # Reset every counter to the live active-registration count
+    python manage.py rebuild_registration_slots
+
+    # Report drift without writing
+    python manage.py rebuild_registration_slots --check
+
+    # Limit to specific tournaments
+    python manage.py rebuild_registration_slots --tournament 12 --tournament 15
+"""
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.tournaments.services.registration_slots import check_counters
+
+
+class Command(BaseCommand):
+    help = "Rebuild or verify per-tournament registration slot counters"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Report counters that differ from live counts instead of repairing them',
+        )
+        parser.add_argument(
+            '--tournament',
+            type=int,
+            action='append',
+            dest='tournament_ids',
+            help='Tournament id to check (repeatable; default: all)',
+        )
+
+    def handle(self, *args, **options):
+        start_time = timezone.now()
+        report = check_counters(
+            tournament_ids=options['tournament_ids'],
+            repair=not options['check'],
+        )
+        duration = (timezone.now() - start_time).total_seconds()
+        summary = (
+            f"checked={report['checked']} drifted={report['drifted']} "
+            f"missing={report['missing']} repaired={report['repaired']} ({duration:.2f}s)"
+        )
+        if (report['drifted'] or report['missing']) and not report['repaired']:
+            self.stdout.write(self.style.WARNING(f"Registration slot drift: {summary}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Registration slots consistent: {summary}"))
@@ -10,9 +10,12 @@ Usage:
     # Full refresh (all tournaments)
     python manage.py refresh_analytics
 
-    # Targeted refresh (single tournament)
+    # Targeted refresh (recompute one tournament's snapshot row)
     python manage.py refresh_analytics --tournament 123
 
+    # Recompute every snapshot row marked dirty since the last run
+    python manage.py refresh_analytics --dirty
+
     # Dry-run mode (show SQL without executing)
     python manage.py refresh_analytics --dry-run
 
@@ -24,6 +27,8 @@ Safety:
     - Requires unique index on tournament_id (created in migration 0009)
     - Failed refresh leaves prior materialized view intact
     - Logs duration and row counts for monitoring
+    - --tournament / --dirty touch TournamentAnalyticsSnapshot only; the
+      materialized view is left as is
 """
 from django.core.management.base import BaseCommand, CommandError
 from django.db import connection
@@ -40,7 +45,12 @@ class Command(BaseCommand):
         parser.add_argument(
             '--tournament',
             type=int,
-            help='Tournament ID for targeted refresh (default: refresh all)',
+            help='Recompute the analytics snapshot of one tournament (default: refresh the whole MV)',
+        )
+        parser.add_argument(
+            '--dirty',
+            action='store_true',
+            help='Recompute analytics snapshots of tournaments changed since the last run',
         )
         parser.add_argument(
             '--dry-run',
@@ -61,16 +71,13 @@ class Command(BaseCommand):
         
         start_time = timezone.now()
         
-        # Build SQL
-        # Note: PostgreSQL materialized views don't support row-level refresh
-        # For "targeted" refresh, we still REFRESH the entire MV but log it as targeted
-        if tournament_id:
-            operation = f"Targeted refresh for tournament {tournament_id} (full MV refresh)"
-            logger.info(f"Targeted refresh for tournament {tournament_id} (refreshing entire MV)")
-        else:
-            operation = f"Full refresh ({('concurrent' if concurrent else 'blocking')})"
+        if tournament_id or options.get('dirty'):
+            self._refresh_snapshots(tournament_id, dry_run, start_time)
+            return
+
+        operation = f"Full refresh ({('concurrent' if concurrent else 'blocking')})"
         
-        # Always use REFRESH MATERIALIZED VIEW (targeted refresh not supported)
+        # PostgreSQL materialized views only refresh as a whole
         concurrent_keyword = "CONCURRENTLY" if concurrent else ""
         sql = f"REFRESH MATERIALIZED VIEW {concurrent_keyword} tournament_analytics_summary;"
         
@@ -107,3 +114,31 @@ class Command(BaseCommand):
         except Exception as e:
             logger.error(f"Analytics MV refresh failed: {e}", exc_info=True)
             raise CommandError(f"Refresh failed: {e}")
+
+    def _refresh_snapshots(self, tournament_id, dry_run, start_time):
+        from apps.tournaments.services import analytics_rollup
+
+        if tournament_id:
+            operation = f"Snapshot refresh for tournament {tournament_id}"
+        else:
+            operation = "Snapshot refresh of dirty tournaments"
+        if dry_run:
+            self.stdout.write(self.style.WARNING(f"DRY-RUN MODE: {operation}"))
+            return
+
+        try:
+            if tournament_id:
+                if analytics_rollup.refresh(tournament_id) is None:
+                    raise CommandError(f"Tournament {tournament_id} not found")
+                summary = {'refreshed': 1}
+            else:
+                summary = analytics_rollup.refresh_dirty()
+        except CommandError:
+            raise
+        except Exception as e:
+            logger.error(f"Analytics snapshot refresh failed: {e}", exc_info=True)
+            raise CommandError(f"Refresh failed: {e}")
+
+        duration_ms = (timezone.now() - start_time).total_seconds() * 1000
+        logger.info(f"Analytics snapshots: {operation}, {summary}, {duration_ms:.2f}ms")
+        self.stdout.write(self.style.SUCCESS(f"✅ {operation} complete: {summary}, {duration_ms:.2f}ms"))
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tournaments", "0065_hosting_fee_payment"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="match",
+            index=models.Index(fields=["updated_at"], name="idx_match_updated"),
+        ),
+        migrations.AddIndex(
+            model_name="registration",
+            index=models.Index(fields=["user", "updated_at"], name="reg_user_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="registration",
+            index=models.Index(fields=["team_id", "updated_at"], name="reg_team_updated_idx"),
+        ),
+    ]
@@ -0,0 +1,125 @@
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_index(apps, schema_editor):
+    Match = apps.get_model("tournaments", "Match")
+    MatchParticipantIndex = apps.get_model("tournaments", "MatchParticipantIndex")
+    TeamMembership = apps.get_model("organizations", "TeamMembership")
+    Tournament = apps.get_model("tournaments", "Tournament")
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    solo_tournament_ids = set(Tournament.objects.filter(participation_type="solo").values_list("id", flat=True))
+
+    last_id = 0
+    while True:
+        chunk = list(
+            Match.objects.filter(id__gt=last_id, is_deleted=False)
+            .order_by("id")
+            .values("id", "tournament_id", "participant1_id", "participant2_id", "state", "scheduled_time")[:1000]
+        )
+        if not chunk:
+            break
+        last_id = chunk[-1]["id"]
+        player_ids, team_ids = set(), set()
+        for row in chunk:
+            slots = player_ids if row["tournament_id"] in solo_tournament_ids else team_ids
+            slots.update(pid for pid in (row["participant1_id"], row["participant2_id"]) if pid)
+        user_ids = set(User.objects.filter(id__in=player_ids).values_list("id", flat=True))
+        members = defaultdict(list)
+        for team_id, user_id in TeamMembership.objects.filter(
+            team_id__in=team_ids, status="ACTIVE"
+        ).values_list("team_id", "user_id"):
+            members[team_id].append(user_id)
+
+        rows = []
+        for row in chunk:
+            seen = set()
+            for side, pid in ((1, row["participant1_id"]), (2, row["participant2_id"])):
+                if not pid:
+                    continue
+                if row["tournament_id"] in solo_tournament_ids:
+                    candidates = [(pid, "player", None)] if pid in user_ids else []
+                else:
+                    candidates = [(uid, "team", pid) for uid in members.get(pid, ())]
+                for uid, via, team_id in candidates:
+                    if uid in seen:
+                        continue
+                    seen.add(uid)
+                    rows.append(
+                        MatchParticipantIndex(
+                            user_id=uid,
+                            match_id=row["id"],
+                            tournament_id=row["tournament_id"],
+                            side=side,
+                            via=via,
+                            team_id=team_id,
+                            state=row["state"],
+                            scheduled_time=row["scheduled_time"],
+                        )
+                    )
+        MatchParticipantIndex.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tournaments", "0066_sync_updated_at_indexes"),
+        ("organizations", "0049_team_metadata"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MatchParticipantIndex",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("tournament_id", models.BigIntegerField()),
+                (
+                    "side",
+                    models.PositiveSmallIntegerField(help_text="1 or 2 — which participant slot the user plays in"),
+                ),
+                (
+                    "via",
+                    models.CharField(
+                        choices=[("player", "Player"), ("team", "Team member")], default="player", max_length=8
+                    ),
+                ),
+                ("team_id", models.BigIntegerField(blank=True, null=True)),
+                ("state", models.CharField(max_length=20)),
+                ("scheduled_time", models.DateTimeField(blank=True, null=True)),
+                (
+                    "match",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="participant_index",
+                        to="tournaments.match",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="match_participant_index",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Match Participant Index",
+                "verbose_name_plural": "Match Participant Index",
+                "db_table": "tournament_engine_match_participant_index",
+                "indexes": [
+                    models.Index(fields=["user", "scheduled_time"], name="idx_match_pidx_user_sched"),
+                    models.Index(fields=["user", "state", "scheduled_time"], name="idx_match_pidx_user_state"),
+                    models.Index(fields=["team_id"], name="idx_match_pidx_team"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(fields=("user", "match"), name="uniq_match_pidx_user_match"),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,56 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+ACTIVE_STATUSES = ("pending", "payment_submitted", "confirmed")
+
+
+def backfill_counters(apps, schema_editor):
+    Registration = apps.get_model("tournaments", "Registration")
+    RegistrationSlotCounter = apps.get_model("tournaments", "RegistrationSlotCounter")
+
+    counts = (
+        Registration.objects.filter(status__in=ACTIVE_STATUSES, is_deleted=False)
+        .order_by()
+        .values("tournament_id")
+        .annotate(n=models.Count("id"))
+        .values_list("tournament_id", "n")
+    )
+    RegistrationSlotCounter.objects.bulk_create(
+        [RegistrationSlotCounter(tournament_id=tournament_id, reserved=n) for tournament_id, n in counts],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tournaments", "0067_match_participant_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RegistrationSlotCounter",
+            fields=[
+                (
+                    "tournament",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="slot_counter",
+                        serialize=False,
+                        to="tournaments.tournament",
+                    ),
+                ),
+                ("reserved", models.PositiveIntegerField(default=0, help_text="Active registrations holding a slot")),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Registration Slot Counter",
+                "verbose_name_plural": "Registration Slot Counters",
+                "db_table": "tournament_engine_registration_slot_counter",
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tournaments", "0068_registration_slot_counter"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LifecycleDeadline",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("tournament_advance", "Tournament status advance"),
+                            ("match_timeout", "Match no-show / lobby close"),
+                            ("payment_expiry", "Payment expiry"),
+                            ("submission_auto_confirm", "Result auto-confirm"),
+                            ("dispute_escalation", "Dispute escalation"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                ("object_id", models.BigIntegerField()),
+                (
+                    "tournament_id",
+                    models.BigIntegerField(
+                        blank=True,
+                        help_text="Owning tournament; entries of one tournament are dispatched serially",
+                        null=True,
+                    ),
+                ),
+                ("due_at", models.DateTimeField()),
+                (
+                    "claimed_until",
+                    models.DateTimeField(
+                        blank=True, help_text="Lease held by the worker dispatching this entry", null=True,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "Lifecycle Deadline",
+                "verbose_name_plural": "Lifecycle Deadlines",
+                "db_table": "tournament_engine_lifecycle_deadline",
+                "indexes": [models.Index(fields=["due_at"], name="idx_lifecycle_deadline_due")],
+                "constraints": [
+                    models.UniqueConstraint(fields=("kind", "object_id"), name="uniq_lifecycle_deadline_kind_obj"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,70 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_match_group(apps, schema_editor):
+    Match = apps.get_model("tournaments", "Match")
+    Group = apps.get_model("tournaments", "Group")
+
+    group_ids = set(Group.objects.values_list("id", flat=True))
+    pending = []
+    for match in (
+        Match.objects.filter(group__isnull=True, bracket__isnull=True)
+        .exclude(lobby_info={})
+        .only("id", "lobby_info")
+        .iterator(chunk_size=2000)
+    ):
+        raw = (match.lobby_info or {}).get("group_id") if isinstance(match.lobby_info, dict) else None
+        try:
+            group_id = int(raw)
+        except (TypeError, ValueError):
+            continue
+        if group_id in group_ids:
+            match.group_id = group_id
+            pending.append(match)
+        if len(pending) >= 1000:
+            Match.objects.bulk_update(pending, ["group"])
+            pending = []
+    if pending:
+        Match.objects.bulk_update(pending, ["group"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tournaments", "0069_lifecycle_deadline"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="match",
+            name="group",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Group-stage group this match belongs to (null for knockout)",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="matches",
+                to="tournaments.group",
+                verbose_name="Group",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="match",
+            index=models.Index(fields=["group", "state"], name="idx_match_group_state"),
+        ),
+        migrations.AddField(
+            model_name="group",
+            name="head_to_head",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text=(
+                    "Completed results counted in standings, keyed by match id: "
+                    "[p1_id, p2_id, p1_score, p2_score, winner_id, p1_points, p2_points]"
+                ),
+                verbose_name="Head-to-Head Results",
+            ),
+        ),
+        migrations.RunPython(backfill_match_group, migrations.RunPython.noop),
+    ]
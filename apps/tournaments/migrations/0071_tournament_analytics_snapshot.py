@@ -0,0 +1,97 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+
+CLOSED_STATUSES = ("cancelled", "archived")
+
+
+def seed_snapshots(apps, schema_editor):
+    """Mark every open tournament dirty; the beat task builds the rows in batches."""
+    Tournament = apps.get_model("tournaments", "Tournament")
+    TournamentAnalyticsSnapshot = apps.get_model("tournaments", "TournamentAnalyticsSnapshot")
+
+    now = timezone.now()
+    tournament_ids = Tournament.objects.exclude(status__in=CLOSED_STATUSES).values_list("id", flat=True)
+    TournamentAnalyticsSnapshot.objects.bulk_create(
+        [TournamentAnalyticsSnapshot(tournament_id=tournament_id, dirty_at=now, changed_at=now)
+         for tournament_id in tournament_ids],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tournaments", "0070_match_group"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TournamentAnalyticsSnapshot",
+            fields=[
+                (
+                    "tournament",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="analytics_snapshot",
+                        serialize=False,
+                        to="tournaments.tournament",
+                    ),
+                ),
+                ("tournament_status", models.CharField(blank=True, default="", max_length=32)),
+                ("total_participants", models.PositiveIntegerField(default=0)),
+                ("checked_in_count", models.PositiveIntegerField(default=0)),
+                ("check_in_rate", models.FloatField(default=0.0)),
+                ("total_matches", models.PositiveIntegerField(default=0)),
+                ("completed_matches", models.PositiveIntegerField(default=0)),
+                ("disputed_matches", models.PositiveIntegerField(default=0)),
+                ("dispute_rate", models.FloatField(default=0.0)),
+                ("avg_match_duration_minutes", models.FloatField(blank=True, null=True)),
+                ("prize_pool_total", models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ("prizes_distributed", models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ("payout_count", models.PositiveIntegerField(default=0)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("concluded_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "refreshed_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="When the metrics were last recomputed; null until the first refresh",
+                        null=True,
+                    ),
+                ),
+                (
+                    "dirty_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Earliest change not yet reflected in the metrics",
+                        null=True,
+                    ),
+                ),
+                (
+                    "changed_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Latest change marked for this tournament",
+                        null=True,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Tournament Analytics Snapshot",
+                "verbose_name_plural": "Tournament Analytics Snapshots",
+                "db_table": "tournament_engine_analytics_snapshot",
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(dirty_at__isnull=False),
+                        fields=["dirty_at"],
+                        name="idx_analytics_snapshot_dirty",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(seed_snapshots, migrations.RunPython.noop),
+    ]
@@ -186,6 +186,18 @@ from .hosting_config import (
     PromoType,                # Promotion type choices enum
 )
 from .hosting_fee_payment import TournamentHostingFeePayment
+from .match_participant_index import (
+    MatchParticipantIndex,  # Denormalized user → match lookup
+)
+from .registration_slots import (
+    RegistrationSlotCounter,  # Per-tournament reserved-slot counter
+)
+from .lifecycle_deadline import (
+    LifecycleDeadline,  # Due-time index of pending lifecycle actions
+)
+from .analytics_snapshot import (
+    TournamentAnalyticsSnapshot,  # Per-tournament organizer analytics row
+)
 
 __all__ = [
     'Game',
@@ -286,4 +298,12 @@ __all__ = [
     # Hosting & Pricing Configuration (admin-controlled)
     'TournamentHostingConfig',
     'TournamentHostingFeePayment',
+    # Per-user "my matches" index
+    'MatchParticipantIndex',
+    # Registration capacity counter
+    'RegistrationSlotCounter',
+    # Lifecycle due-time index
+    'LifecycleDeadline',
+    # Incrementally refreshed organizer analytics
+    'TournamentAnalyticsSnapshot',
 ]
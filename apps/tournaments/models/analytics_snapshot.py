@@ -0,0 +1,74 @@
+"""
+TournamentAnalyticsSnapshot — per-tournament organizer analytics row.
+
+``tournament_analytics_summary`` is a materialized view that can only be
+refreshed as a whole, so during a live event it was nearly always older
+than the freshness threshold and organizer dashboards fell back to the
+live aggregates. This table carries the same columns for one tournament
+per row and is recomputed a row at a time.
+
+Registration, payment, check-in, match, prize and tournament saves mark
+the row dirty (``dirty_at`` keeps the oldest pending change, ``changed_at``
+the latest); a beat task recomputes only dirty rows. The nightly
+reconciliation marks every open tournament dirty and refreshes the
+materialized view, repairing anything written around the signals.
+Maintained by apps.tournaments.services.analytics_rollup.
+"""
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class TournamentAnalyticsSnapshot(models.Model):
+    """Organizer analytics for one tournament, refreshed when it changes."""
+
+    tournament = models.OneToOneField(
+        'tournaments.Tournament',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='analytics_snapshot',
+    )
+    tournament_status = models.CharField(max_length=32, blank=True, default='')
+    total_participants = models.PositiveIntegerField(default=0)
+    checked_in_count = models.PositiveIntegerField(default=0)
+    check_in_rate = models.FloatField(default=0.0)
+    total_matches = models.PositiveIntegerField(default=0)
+    completed_matches = models.PositiveIntegerField(default=0)
+    disputed_matches = models.PositiveIntegerField(default=0)
+    dispute_rate = models.FloatField(default=0.0)
+    avg_match_duration_minutes = models.FloatField(null=True, blank=True)
+    prize_pool_total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    prizes_distributed = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    payout_count = models.PositiveIntegerField(default=0)
+    started_at = models.DateTimeField(null=True, blank=True)
+    concluded_at = models.DateTimeField(null=True, blank=True)
+    refreshed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=_('When the metrics were last recomputed; null until the first refresh'),
+    )
+    dirty_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=_('Earliest change not yet reflected in the metrics'),
+    )
+    changed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=_('Latest change marked for this tournament'),
+    )
+
+    class Meta:
+        db_table = 'tournament_engine_analytics_snapshot'
+        verbose_name = _('Tournament Analytics Snapshot')
+        verbose_name_plural = _('Tournament Analytics Snapshots')
+        indexes = [
+            models.Index(
+                fields=['dirty_at'],
+                name='idx_analytics_snapshot_dirty',
+                condition=models.Q(dirty_at__isnull=False),
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"tournament={self.tournament_id} refreshed={self.refreshed_at} dirty={self.dirty_at}"
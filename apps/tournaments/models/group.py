@@ -85,6 +85,16 @@ class Group(SoftDeleteModel, TimestampedModel):
     #     "matches_per_matchday": 2
     # }
     
+    head_to_head = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name=_('Head-to-Head Results'),
+        help_text=_(
+            'Completed results counted in standings, keyed by match id: '
+            '[p1_id, p2_id, p1_score, p2_score, winner_id, p1_points, p2_points]'
+        )
+    )
+
     is_finalized = models.BooleanField(
         default=False,
         verbose_name=_('Is Finalized'),
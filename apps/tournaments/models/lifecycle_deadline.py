@@ -0,0 +1,64 @@
+"""
+LifecycleDeadline — due-time index of pending lifecycle actions.
+
+The lifecycle cron used to rediscover work by scanning every live
+tournament, match, payment, submission and dispute on each run. This
+table holds one row per object with a pending time-based action
+(registration window, no-show / lobby deadline, payment deadline,
+result auto-confirm, dispute SLA) keyed by when it falls due, so a run
+reads only the rows with ``due_at <= now``.
+
+Maintained by apps.tournaments.services.lifecycle_scheduler on save of
+the owning objects; the hourly full sweep re-seeds it and remains the
+safety net for anything written around the signals.
+"""
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class LifecycleDeadline(models.Model):
+    """Next time-based action due for one object."""
+
+    TOURNAMENT_ADVANCE = 'tournament_advance'
+    MATCH_TIMEOUT = 'match_timeout'
+    PAYMENT_EXPIRY = 'payment_expiry'
+    SUBMISSION_AUTO_CONFIRM = 'submission_auto_confirm'
+    DISPUTE_ESCALATION = 'dispute_escalation'
+    KIND_CHOICES = [
+        (TOURNAMENT_ADVANCE, _('Tournament status advance')),
+        (MATCH_TIMEOUT, _('Match no-show / lobby close')),
+        (PAYMENT_EXPIRY, _('Payment expiry')),
+        (SUBMISSION_AUTO_CONFIRM, _('Result auto-confirm')),
+        (DISPUTE_ESCALATION, _('Dispute escalation')),
+    ]
+
+    kind = models.CharField(max_length=32, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField()
+    tournament_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        help_text=_('Owning tournament; entries of one tournament are dispatched serially'),
+    )
+    due_at = models.DateTimeField()
+    claimed_until = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=_('Lease held by the worker dispatching this entry'),
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'tournament_engine_lifecycle_deadline'
+        verbose_name = _('Lifecycle Deadline')
+        verbose_name_plural = _('Lifecycle Deadlines')
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='uniq_lifecycle_deadline_kind_obj'),
+        ]
+        indexes = [
+            models.Index(fields=['due_at'], name='idx_lifecycle_deadline_due'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{self.object_id} due={self.due_at.isoformat()}"
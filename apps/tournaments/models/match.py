@@ -104,6 +104,16 @@ class Match(SoftDeleteModel, TimestampedModel):
         blank=True,
         help_text=_('Bracket this match belongs to (null for group stage)')
     )
+
+    group = models.ForeignKey(
+        'tournaments.Group',
+        on_delete=models.SET_NULL,
+        related_name='matches',
+        verbose_name=_('Group'),
+        null=True,
+        blank=True,
+        help_text=_('Group-stage group this match belongs to (null for knockout)')
+    )
     
     # Match identification
     round_number = models.PositiveIntegerField(
@@ -283,6 +293,7 @@ class Match(SoftDeleteModel, TimestampedModel):
             models.Index(fields=['tournament'], name='idx_match_tournament'),
             models.Index(fields=['bracket'], name='idx_match_bracket'),
             models.Index(fields=['bracket', 'round_number'], name='idx_match_round'),
+            models.Index(fields=['group', 'state'], name='idx_match_group_state'),
             models.Index(fields=['state'], name='idx_match_state'),
             models.Index(fields=['scheduled_time'], name='idx_match_scheduled'),
             models.Index(fields=['participant1_id', 'participant2_id'], name='idx_match_participants'),
@@ -311,6 +322,8 @@ class Match(SoftDeleteModel, TimestampedModel):
             ),
             # GIN index for lobby_info JSONB
             models.Index(fields=['lobby_info'], name='idx_match_lobby_gin'),
+            # Mobile delta sync (updated_at > cursor)
+            models.Index(fields=['updated_at'], name='idx_match_updated'),
         ]
         constraints = [
             # State must be valid (enforced by choices)
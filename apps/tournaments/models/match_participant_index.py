@@ -0,0 +1,60 @@
+"""
+MatchParticipantIndex — denormalized user → match lookup.
+
+Match rows store participants as bare ids (user id for solo events, team id
+for team events), so "matches for user X" used to be an OR of two IN lists
+over the whole Match table. This table holds one row per (user, match)
+with the match's state and scheduled_time copied in, so the lookup is a
+single range scan on ``(user, scheduled_time)``.
+
+Maintained by apps.tournaments.services.match_participant_index on match
+save and roster changes; ``rebuild_match_participant_index`` repairs drift.
+"""
+
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class MatchParticipantIndex(models.Model):
+    """One row per user who can see a match as a participant."""
+
+    VIA_PLAYER = 'player'
+    VIA_TEAM = 'team'
+    VIA_CHOICES = [
+        (VIA_PLAYER, _('Player')),
+        (VIA_TEAM, _('Team member')),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='match_participant_index',
+    )
+    match = models.ForeignKey(
+        'tournaments.Match',
+        on_delete=models.CASCADE,
+        related_name='participant_index',
+    )
+    tournament_id = models.BigIntegerField()
+    side = models.PositiveSmallIntegerField(help_text=_('1 or 2 — which participant slot the user plays in'))
+    via = models.CharField(max_length=8, choices=VIA_CHOICES, default=VIA_PLAYER)
+    team_id = models.BigIntegerField(null=True, blank=True)
+    state = models.CharField(max_length=20)
+    scheduled_time = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'tournament_engine_match_participant_index'
+        verbose_name = _('Match Participant Index')
+        verbose_name_plural = _('Match Participant Index')
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'match'], name='uniq_match_pidx_user_match'),
+        ]
+        indexes = [
+            models.Index(fields=['user', 'scheduled_time'], name='idx_match_pidx_user_sched'),
+            models.Index(fields=['user', 'state', 'scheduled_time'], name='idx_match_pidx_user_state'),
+            models.Index(fields=['team_id'], name='idx_match_pidx_team'),
+        ]
+
+    def __str__(self) -> str:
+        return f"user={self.user_id} match={self.match_id} side={self.side}"
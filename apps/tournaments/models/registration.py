@@ -237,6 +237,8 @@ class Registration(SoftDeleteModel, TimestampedModel):
             models.Index(fields=['tournament', 'is_deleted', '-registered_at'], name='reg_tour_del_regd_idx'),
             models.Index(fields=['tournament', 'is_deleted', 'status'], name='reg_tour_del_stat_idx'),
             models.Index(fields=['tournament', 'is_deleted', 'checked_in'], name='reg_tour_del_check_idx'),
+            models.Index(fields=['user', 'updated_at'], name='reg_user_updated_idx'),
+            models.Index(fields=['team_id', 'updated_at'], name='reg_team_updated_idx'),
         ]
         unique_together = [
             ('tournament', 'user'),  # One registration per user per tournament
@@ -0,0 +1,42 @@
+"""
+RegistrationSlotCounter — per-tournament count of reserved registration slots.
+
+``register_participant`` used to hold ``SELECT ... FOR UPDATE`` on the
+Tournament row for the whole registration (eligibility, profile auto-fill,
+duplicate game-ID checks, a capacity COUNT), serializing every registrant
+of a popular tournament behind the slowest one. Capacity is now claimed
+with one conditional UPDATE on this row right before the Registration
+INSERT, so the lock is held only for the tail of the transaction.
+
+``reserved`` mirrors the number of active registrations (PENDING,
+PAYMENT_SUBMITTED, CONFIRMED, not deleted). Maintained by
+apps.tournaments.services.registration_slots; a failed claim recounts
+before giving up, and ``rebuild_registration_slots`` repairs drift.
+"""
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class RegistrationSlotCounter(models.Model):
+    """Reserved-slot counter for one tournament."""
+
+    tournament = models.OneToOneField(
+        'tournaments.Tournament',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='slot_counter',
+    )
+    reserved = models.PositiveIntegerField(
+        default=0,
+        help_text=_('Active registrations holding a slot'),
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'tournament_engine_registration_slot_counter'
+        verbose_name = _('Registration Slot Counter')
+        verbose_name_plural = _('Registration Slot Counters')
+
+    def __str__(self) -> str:
+        return f"tournament={self.tournament_id} reserved={self.reserved}"
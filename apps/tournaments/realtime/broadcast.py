@@ -30,6 +30,7 @@ from asgiref.sync import async_to_sync
 
 from . import metrics
 from . import logging as ws_logging
+from . import room_stream
 
 logger = logging.getLogger(__name__)
 
@@ -102,7 +103,7 @@ def broadcast_match_started(
         payload["team2_id"] = team2_id
     
     try:
-        async_to_sync(channel_layer.group_send)(room_group, payload)
+        async_to_sync(channel_layer.group_send)(room_group, room_stream.stamp(tournament_id, payload))
         logger.info(f"Broadcast match_started (tournament={tournament_id}, match={match_id})")
         return True
     except Exception as e:
@@ -171,7 +172,7 @@ def broadcast_score_updated(
         payload["score2"] = score2
     
     try:
-        async_to_sync(channel_layer.group_send)(room_group, payload)
+        async_to_sync(channel_layer.group_send)(room_group, room_stream.stamp(tournament_id, payload))
         logger.info(f"Broadcast score_updated (tournament={tournament_id}, match={match_id})")
         return True
     except Exception as e:
@@ -229,7 +230,7 @@ def broadcast_match_completed(
         payload["winner_team_id"] = winner_team_id
     
     try:
-        async_to_sync(channel_layer.group_send)(room_group, payload)
+        async_to_sync(channel_layer.group_send)(room_group, room_stream.stamp(tournament_id, payload))
         logger.info(f"Broadcast match_completed (tournament={tournament_id}, match={match_id}, winner={winner_participant_id or winner_team_id})")
         return True
     except Exception as e:
@@ -263,7 +264,7 @@ def broadcast_bracket_updated(tournament_id: int) -> bool:
     }
     
     try:
-        async_to_sync(channel_layer.group_send)(room_group, payload)
+        async_to_sync(channel_layer.group_send)(room_group, room_stream.stamp(tournament_id, payload))
         logger.info(f"Broadcast bracket_updated (tournament={tournament_id})")
         return True
     except Exception as e:
@@ -317,7 +318,7 @@ def broadcast_dispute_created(
         payload["filed_by_team_id"] = filed_by_team_id
     
     try:
-        async_to_sync(channel_layer.group_send)(room_group, payload)
+        async_to_sync(channel_layer.group_send)(room_group, room_stream.stamp(tournament_id, payload))
         logger.info(f"Broadcast dispute_created (tournament={tournament_id}, match={match_id}, dispute={dispute_id})")
         return True
     except Exception as e:
@@ -354,7 +355,7 @@ def broadcast_bracket_state(tournament_id: int) -> bool:
     }
 
     try:
-        async_to_sync(channel_layer.group_send)(room_group, payload)
+        async_to_sync(channel_layer.group_send)(room_group, room_stream.stamp(tournament_id, payload))
         logger.info(f"Broadcast bracket_state refresh (tournament={tournament_id})")
         return True
     except Exception as e:
@@ -449,7 +450,7 @@ def broadcast_rank_update(
     }
     
     try:
-        async_to_sync(channel_layer.group_send)(room_group, payload)
+        async_to_sync(channel_layer.group_send)(room_group, room_stream.stamp(tournament_id, payload))
         
         # Module 2.6 observability: Record message metric
         metrics.record_message(
@@ -500,7 +501,7 @@ def broadcast_event(
     }
     
     try:
-        async_to_sync(channel_layer.group_send)(room_group, payload)
+        async_to_sync(channel_layer.group_send)(room_group, room_stream.stamp(tournament_id, payload))
         logger.info(f"Broadcast {event_type} (tournament={tournament_id})")
         return True
     except Exception as e:
@@ -0,0 +1,324 @@
+"""
+Post-commit, coalescing broadcast queue for tournament realtime events.
+
+The service layer used to call ``async_to_sync(broadcast_...)`` inline, so a
+result confirmation blocked on one channel-layer round trip per event and
+could push state that the surrounding transaction later rolled back. The
+helpers here have the same signatures as their ``realtime.utils`` /
+``realtime.broadcast`` namesakes but are plain sync functions that only
+queue the message:
+
+1. Inside ``transaction.atomic()`` messages are buffered per transaction
+   (apps.common.commit_buffer) and released from ``on_commit``.
+   A rollback discards them together with the hook.
+2. Released messages go to a per-process background sender that waits
+   ``REALTIME_BROADCAST_COALESCE_MS`` for more, coalesces the batch and
+   sends it from its own event loop. With ``REALTIME_BROADCAST_BACKGROUND``
+   off (in-memory channel layer, tests) the batch is coalesced and sent
+   inline at commit instead.
+
+Coalescing (see ``coalesce``) generalizes the score micro-batching in
+``realtime.utils`` to every event type that supersedes itself:
+
+- ``score_updated`` — latest wins per match
+- ``bracket_updated`` (both the ``tournament_event`` and the bracket-state
+  shapes) — one message per room, updated nodes / next matches unioned
+- ``rank_update`` — one message per room, latest change per participant
+
+Everything else is sent as-is. Per room, messages keep publish order; a
+merged message takes the position of its last contributor. Tournament-room
+messages are stamped with the room sequence (``room_stream``) after
+coalescing, so replay carries exactly what was delivered live.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from apps.common.commit_buffer import OnCommitBuffer
+
+from . import room_stream
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COALESCE_MS = 100
+
+Message = Tuple[str, Dict[str, Any]]  # (group, channel-layer message)
+
+
+def _room(tournament_id: int) -> str:
+    return f"tournament_{tournament_id}"
+
+
+def _room_tournament_id(group: str) -> Optional[int]:
+    prefix, _, suffix = group.partition("_")
+    return int(suffix) if prefix == "tournament" and suffix.isdigit() else None
+
+
+# ---------------------------------------------------------------------------
+# Coalescing
+# ---------------------------------------------------------------------------
+
+
+def _event_name(message: Dict[str, Any]) -> str:
+    if message.get("type") == "tournament_event":
+        return message.get("event_type", "")
+    return message.get("type", "")
+
+
+def _body(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Event fields regardless of shape ({type, data} or flat tournament_event)."""
+    if isinstance(message.get("data"), dict):
+        return message["data"]
+    return {k: v for k, v in message.items() if k not in ("type", "event_type")}
+
+
+def coalesce_key(group: str, message: Dict[str, Any]) -> Optional[tuple]:
+    name = _event_name(message)
+    if name == "score_updated":
+        match_id = _body(message).get("match_id")
+        return (group, "score", match_id) if match_id is not None else None
+    if name == "bracket_updated":
+        return (group, "bracket")
+    if name == "rank_update":
+        return (group, "rank")
+    return None
+
+
+def _merge_latest(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return messages[-1]
+
+
+def _merge_bracket(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    merged: Dict[str, Any] = {}
+    nodes: List[int] = []
+    next_matches: Dict[Any, Dict[str, Any]] = {}
+    for message in messages:
+        body = _body(message)
+        for node_id in body.get("updated_nodes") or ():
+            if node_id not in nodes:
+                nodes.append(node_id)
+        for match in body.get("next_matches") or ():
+            next_matches[match.get("match_id", id(match))] = match
+        merged.update({k: v for k, v in body.items() if k not in ("updated_nodes", "next_matches")})
+    if nodes:
+        merged["updated_nodes"] = nodes
+    if next_matches:
+        merged["next_matches"] = list(next_matches.values())
+    merged["coalesced"] = len(messages)
+    return {"type": "bracket_updated", "data": merged}
+
+
+def _merge_rank(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    changes: Dict[tuple, Dict[str, Any]] = {}
+    for message in messages:
+        for change in _body(message).get("changes") or ():
+            changes[(change.get("participant_id"), change.get("team_id"))] = change
+    latest = dict(messages[-1])
+    if isinstance(latest.get("data"), dict):
+        latest["data"] = {**latest["data"], "changes": list(changes.values())}
+    else:
+        latest["changes"] = list(changes.values())
+    return latest
+
+
+_MERGERS: Dict[str, Callable[[List[Dict[str, Any]]], Dict[str, Any]]] = {
+    "score": _merge_latest,
+    "bracket": _merge_bracket,
+    "rank": _merge_rank,
+}
+
+
+def coalesce(messages: List[Message]) -> List[Message]:
+    """Collapse superseded messages (see module docstring)."""
+    positions: Dict[tuple, List[int]] = {}
+    for index, (group, message) in enumerate(messages):
+        key = coalesce_key(group, message)
+        if key is not None:
+            positions.setdefault(key, []).append(index)
+
+    dropped = set()
+    replaced: Dict[int, Dict[str, Any]] = {}
+    for key, indexes in positions.items():
+        if len(indexes) < 2:
+            continue
+        replaced[indexes[-1]] = _MERGERS[key[1]]([messages[i][1] for i in indexes])
+        dropped.update(indexes[:-1])
+
+    return [
+        (group, replaced.get(index, message))
+        for index, (group, message) in enumerate(messages)
+        if index not in dropped
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Sending
+# ---------------------------------------------------------------------------
+
+
+async def send_messages(messages: List[Message]) -> int:
+    """group_send each message; rooms in parallel, publish order within a room."""
+    from channels.layers import get_channel_layer
+
+    channel_layer = get_channel_layer()
+    if not channel_layer:
+        logger.error("Channel layer not configured - dropping %d broadcasts", len(messages))
+        return 0
+
+    by_group: Dict[str, List[Dict[str, Any]]] = {}
+    for group, message in messages:
+        tournament_id = _room_tournament_id(group)
+        if tournament_id is not None:
+            message = room_stream.stamp(tournament_id, message)
+        by_group.setdefault(group, []).append(message)
+
+    async def _send_group(group: str, group_messages: List[Dict[str, Any]]) -> int:
+        sent = 0
+        for message in group_messages:
+            try:
+                await channel_layer.group_send(group, message)
+                sent += 1
+            except Exception as e:
+                logger.error(f"Failed to broadcast {_event_name(message)} to {group}: {e}")
+        return sent
+
+    results = await asyncio.gather(*(_send_group(g, m) for g, m in by_group.items()))
+    return sum(results)
+
+
+def _coalesce_window() -> float:
+    return getattr(settings, "REALTIME_BROADCAST_COALESCE_MS", DEFAULT_COALESCE_MS) / 1000.0
+
+
+class BackgroundSender:
+    """Daemon thread with its own event loop that drains released batches."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._queue: "queue.Queue[List[Message]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, messages: List[Message]) -> None:
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked worker: the parent's thread did not survive the fork
+                self._reset()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="realtime-broadcast-sender", daemon=True)
+                self._thread.start()
+        self._queue.put(messages)
+
+    def _collect(self) -> List[Message]:
+        batch = list(self._queue.get())
+        deadline = time.monotonic() + _coalesce_window()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return batch
+            try:
+                batch.extend(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                return batch
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        while True:
+            batch = self._collect()
+            messages = coalesce(batch)
+            try:
+                started = time.perf_counter()
+                sent = loop.run_until_complete(send_messages(messages))
+                logger.debug(
+                    f"Broadcast {sent}/{len(messages)} messages ({len(batch)} queued) "
+                    f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+                )
+            except Exception:
+                logger.exception("Background broadcast batch failed")
+
+
+_sender = BackgroundSender()
+
+
+def release(messages: List[Message]) -> None:
+    """Hand committed messages to the sender (or send them inline)."""
+    if not messages:
+        return
+    if getattr(settings, "REALTIME_BROADCAST_BACKGROUND", False):
+        _sender.submit(messages)
+        return
+    from asgiref.sync import async_to_sync
+
+    try:
+        async_to_sync(send_messages)(coalesce(messages))
+    except Exception as e:
+        logger.error(f"Inline broadcast of {len(messages)} messages failed: {e}")
+
+
+# ---------------------------------------------------------------------------
+# Per-transaction buffer
+# ---------------------------------------------------------------------------
+
+
+_buffer = OnCommitBuffer(release)
+
+
+def queue_group_send(group: str, message: Dict[str, Any]) -> None:
+    """Queue one channel-layer message; released after the current transaction commits."""
+    if not _buffer.add((group, message)):
+        release([(group, message)])
+
+
+def pending_count() -> int:
+    """Messages buffered in the current transaction."""
+    return len(_buffer)
+
+
+# ---------------------------------------------------------------------------
+# Queued counterparts of realtime.utils / realtime.broadcast helpers
+# ---------------------------------------------------------------------------
+
+
+def broadcast_tournament_event(tournament_id: int, event_type: str, data: Dict[str, Any]) -> None:
+    """Queued ``realtime.utils.broadcast_tournament_event`` ({type, data} shape)."""
+    queue_group_send(_room(tournament_id), {"type": event_type, "data": data})
+
+
+def broadcast_match_started(tournament_id: int, match_data: Dict[str, Any]) -> None:
+    broadcast_tournament_event(tournament_id, "match_started", match_data)
+
+
+def broadcast_score_updated(tournament_id: int, score_data: Dict[str, Any]) -> None:
+    broadcast_tournament_event(tournament_id, "score_updated", score_data)
+
+
+def broadcast_match_completed(tournament_id: int, result_data: Dict[str, Any]) -> None:
+    broadcast_tournament_event(tournament_id, "match_completed", result_data)
+
+
+def broadcast_bracket_updated(tournament_id: int, bracket_data: Dict[str, Any]) -> None:
+    broadcast_tournament_event(tournament_id, "bracket_updated", bracket_data)
+
+
+def broadcast_event(tournament_id: int, event_type: str, data: Dict[str, Any]) -> bool:
+    """Queued ``realtime.broadcast.broadcast_event`` (flat tournament_event shape)."""
+    queue_group_send(_room(tournament_id), {
+        "type": "tournament_event",
+        "event_type": event_type,
+        "tournament_id": tournament_id,
+        **data,
+    })
+    return True
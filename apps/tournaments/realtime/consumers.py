@@ -36,12 +36,29 @@ Security Features (Module 2.5):
 Module 4.5 Enhancements:
     - Server-initiated heartbeat (25s ping, 50s timeout)
     - dispute_created event handler
+
+Resumable stream:
+    Room events carry a ``seq`` (see realtime.room_stream). A client that
+    reconnects with ``?last_seq=<n>`` gets the missed events replayed before
+    live ones, or ``{type: 'resync'}`` when they are no longer buffered.
+
+Spectator fan-out:
+    With WS_SPECTATOR_FANOUT, spectator sockets share one room subscription
+    per process (see realtime.spectator_fanout) instead of joining the group.
+
+Compact frames:
+    Clients offering the ``dc.msgpack.v1`` subprotocol get msgpack frames
+    with short field codes and patch diffs for state frames (realtime.wire).
 """
 
 import logging
 import json
 import asyncio
+from contextvars import ContextVar
 from typing import Dict, Any, List, Optional
+from urllib.parse import parse_qs
+from asgiref.sync import sync_to_async
+from channels.consumer import get_handler_name
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from django.contrib.auth.models import AnonymousUser
 from django.conf import settings
@@ -55,11 +72,18 @@ from apps.tournaments.security import (
 # Module 2.6: Realtime Monitoring & Logging Enhancement
 from . import metrics
 from . import logging as ws_logging
+from . import room_stream
+from . import spectator_fanout
+from .wire import CompactFramesMixin
 
 logger = logging.getLogger(__name__)
 
+# Room sequence of the channel-layer event being handled; send_json adds it
+# to the outgoing frame. Task-local, so heartbeat pings are never stamped.
+_outgoing_seq: ContextVar[Optional[int]] = ContextVar('ws_outgoing_seq', default=None)
+
 
-class TournamentConsumer(AsyncJsonWebsocketConsumer):
+class TournamentConsumer(CompactFramesMixin, AsyncJsonWebsocketConsumer):
     """
     WebSocket consumer for real-time tournament updates.
     
@@ -209,11 +233,19 @@ class TournamentConsumer(AsyncJsonWebsocketConsumer):
         # Generate room group name
         self.room_group_name = f'tournament_{self.tournament_id}'
         
-        # Join tournament room group
-        await self.channel_layer.group_add(
-            self.room_group_name,
-            self.channel_name
-        )
+        # Join tournament room group; read-only spectators share the
+        # process-wide subscription instead (spectator_fanout)
+        self.spectator_socket = None
+        if self.user_role == TournamentRole.SPECTATOR and spectator_fanout.fanout_enabled():
+            self.spectator_socket = spectator_fanout.SpectatorSocket(
+                self.tournament_id, self._deliver_fanout
+            )
+            await spectator_fanout.get_hub().join(self.tournament_id, self.spectator_socket)
+        else:
+            await self.channel_layer.group_add(
+                self.room_group_name,
+                self.channel_name
+            )
         
         # Accept WebSocket connection
         await self.accept()
@@ -262,6 +294,12 @@ class TournamentConsumer(AsyncJsonWebsocketConsumer):
         self.last_pong_time = asyncio.get_event_loop().time()
         self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
         
+        # Resumable stream: read the room position only after joining the
+        # group, so nothing published in between can be missed
+        resume_from = self._get_resume_seq()
+        self.last_seq = await sync_to_async(room_stream.latest_seq)(self.tournament_id)
+        self._replayed_seqs = set()
+        
         # Send welcome message to client
         await self.send_json({
             'type': 'connection_established',
@@ -272,8 +310,15 @@ class TournamentConsumer(AsyncJsonWebsocketConsumer):
                 'role': self.user_role.value,  # Inform client of their role
                 'message': f'Connected to tournament {self.tournament_id} updates',
                 'heartbeat_interval': self.HEARTBEAT_INTERVAL,  # Module 4.5
+                'seq': self.last_seq,
             }
         })
+        
+        if resume_from is not None:
+            await self._replay_since(resume_from)
+        
+        if self.spectator_socket is not None:
+            self.spectator_socket.start()
     
     async def disconnect(self, close_code):
         """
@@ -303,11 +348,14 @@ class TournamentConsumer(AsyncJsonWebsocketConsumer):
                 pass
         
         if hasattr(self, 'room_group_name'):
-            # Leave tournament room group
-            await self.channel_layer.group_discard(
-                self.room_group_name,
-                self.channel_name
-            )
+            # Leave tournament room group (or the shared spectator subscription)
+            if getattr(self, 'spectator_socket', None) is not None:
+                await spectator_fanout.get_hub().leave(self.tournament_id, self.spectator_socket)
+            else:
+                await self.channel_layer.group_discard(
+                    self.room_group_name,
+                    self.channel_name
+                )
             
             logger.info(
                 f"WebSocket disconnected: user={getattr(self, 'user', 'unknown')}, "
@@ -350,6 +398,107 @@ class TournamentConsumer(AsyncJsonWebsocketConsumer):
                 duration_ms=duration_ms
             )
     
+    # -------------------------------------------------------------------------
+    # Resumable stream (room_stream)
+    # -------------------------------------------------------------------------
+    
+    def _get_resume_seq(self) -> Optional[int]:
+        """``last_seq`` query parameter of a reconnecting client, if valid."""
+        query = parse_qs(self.scope.get('query_string', b'').decode('latin-1'))
+        values = query.get('last_seq')
+        if not values:
+            return None
+        try:
+            last_seq = int(values[0])
+        except ValueError:
+            return None
+        return last_seq if last_seq >= 0 else None
+    
+    async def _replay_since(self, last_seq: int):
+        """
+        Send the room events a reconnecting client missed after ``last_seq``.
+        
+        Replayed events go through the normal handlers, so frames are
+        identical to live ones. When the gap is no longer buffered the client
+        gets ``resync`` and must refetch state over HTTP.
+        """
+        events = await sync_to_async(room_stream.since)(self.tournament_id, last_seq)
+        if events is None:
+            await self._send_resync(last_seq, reason='gap_not_buffered')
+            return
+        
+        for event in events:
+            await self.dispatch(event)
+            # The same event may still be queued live on this channel
+            self._replayed_seqs.add(event['seq'])
+        
+        logger.debug(
+            f"Replayed {len(events)} events to user {self.user.username}: "
+            f"tournament={self.tournament_id}, from_seq={last_seq}"
+        )
+    
+    async def _send_resync(self, last_seq: int, reason: str):
+        """Tell the client to refetch state (or resume from ``last_seq``)."""
+        await self.send_json({
+            'type': 'resync',
+            'data': {
+                'tournament_id': self.tournament_id,
+                'last_seq': last_seq,
+                'latest_seq': self.last_seq,
+                'reason': reason,
+            },
+        })
+        logger.info(
+            f"WebSocket resync required: user={self.user.username}, "
+            f"tournament={self.tournament_id}, last_seq={last_seq}, "
+            f"latest={self.last_seq}, reason={reason}"
+        )
+    
+    async def dispatch(self, message):
+        """Drop live duplicates of replayed events and stamp frames with ``seq``."""
+        if message.get('seq') is None:
+            return await super().dispatch(message)
+        return await self._dispatch_sequenced(message, super().dispatch)
+    
+    async def _dispatch_sequenced(self, message, handle):
+        seq = message['seq']
+        replayed = getattr(self, '_replayed_seqs', None)
+        if replayed and seq in replayed:
+            replayed.discard(seq)
+            return
+        
+        self.last_seq = max(getattr(self, 'last_seq', 0), seq)
+        token = _outgoing_seq.set(seq)
+        try:
+            return await handle(message)
+        finally:
+            _outgoing_seq.reset(token)
+    
+    async def _deliver_fanout(self, message):
+        """
+        Write one frame from the spectator send queue.
+        
+        Calls the handler directly: ``dispatch`` also closes stale DB
+        connections through a thread hop, too costly per frame per socket.
+        """
+        handler = getattr(self, get_handler_name(message), None)
+        if handler is None:
+            logger.debug(f"No handler for fan-out message type {message.get('type')}")
+            return
+        if message.get('seq') is None:
+            return await handler(message)
+        return await self._dispatch_sequenced(message, handler)
+    
+    async def spectator_resync(self, event: Dict[str, Any]):
+        """Spectator send queue overflowed; frames were discarded."""
+        await self._send_resync(self.last_seq, reason=event.get('reason', 'slow_consumer'))
+    
+    async def send_json(self, content, close=False):
+        seq = _outgoing_seq.get()
+        if seq is not None and 'seq' not in content:
+            content = {**content, 'seq': seq}
+        await super().send_json(content, close=close)
+    
     # -------------------------------------------------------------------------
     # Event Handlers (called by channel layer group_send)
     # -------------------------------------------------------------------------
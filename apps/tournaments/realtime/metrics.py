@@ -14,6 +14,8 @@ Metrics Tracked:
 - ws_auth_failures_total: Authentication failures (counter)
 - ws_message_latency_seconds: Message processing latency (histogram)
 - ws_active_connections_gauge: Current active connections (gauge)
+- ws_fanout_latency_seconds: Spectator fan-out latency by stage (histogram)
+- ws_fanout_events_total: Spectator queue conflations / drops / resyncs (counter)
 
 Label Structure:
 - role: WebSocket role (SPECTATOR, PLAYER, ORGANIZER, ADMIN)
@@ -81,6 +83,15 @@ _message_latency_histogram = defaultdict(list)
 # Active connections gauge: {(role, scope_type): count}
 _active_connections_gauge = defaultdict(int)
 
+# Spectator fan-out latency histogram: {(stage,): [duration_ms, ...]}
+_fanout_latency_histogram = defaultdict(list)
+
+# Spectator fan-out queue events: {(event,): count}
+_fanout_counters = defaultdict(int)
+
+# Samples kept per histogram key (fan-out records one sample per frame)
+_FANOUT_SAMPLES_MAX = 10000
+
 
 # =============================================================================
 # Constants: Reason Codes (Avoid Stringly-Typed)
@@ -119,6 +130,21 @@ class MessageType:
     UNKNOWN = 'unknown'
 
 
+class FanoutStage:
+    """Spectator fan-out latency stages."""
+    
+    DISPATCH = 'dispatch'  # channel-layer receive -> queued on every local socket
+    DELIVERY = 'delivery'  # queued -> written to the socket
+
+
+class FanoutEvent:
+    """Spectator send-queue events."""
+    
+    CONFLATED = 'conflated'  # superseded frame replaced in a queue
+    DROPPED = 'dropped'      # queue overflow, frames discarded
+    RESYNC = 'resync'        # overflow without a droppable frame, client told to resync
+
+
 class ConnectionStatus:
     """Connection lifecycle statuses."""
     
@@ -344,6 +370,39 @@ def record_message_latency(
     return _timer()
 
 
+def record_fanout_latency(stage: str, duration_seconds: float, count: int = 1) -> None:
+    """
+    Record spectator fan-out latency (histogram).
+    
+    Args:
+        stage: FanoutStage value
+        duration_seconds: Measured latency
+        count: Sockets the sample covers (logged only)
+    """
+    duration_ms = max(0.0, float(duration_seconds) * 1000.0)
+    with _metrics_lock:
+        samples = _fanout_latency_histogram[(stage,)]
+        samples.append(duration_ms)
+        if len(samples) > _FANOUT_SAMPLES_MAX:
+            del samples[:len(samples) - _FANOUT_SAMPLES_MAX]
+    
+    logger.debug(
+        "WebSocket fan-out latency",
+        extra={
+            'stage': stage,
+            'duration_ms': duration_ms,
+            'sockets': count,
+            'metric': 'ws_fanout_latency_seconds',
+        }
+    )
+
+
+def record_fanout_event(event: str, count: int = 1) -> None:
+    """Record spectator send-queue conflation / drop / resync (counter)."""
+    with _metrics_lock:
+        _fanout_counters[(event,)] += count
+
+
 # =============================================================================
 # Metrics Snapshot API
 # =============================================================================
@@ -363,6 +422,10 @@ def get_metrics_snapshot() -> dict:
             'message_latency_p95': {(type,): ms},
             'message_latency_p99': {(type,): ms},
             'active_connections': {(role, scope_type): count},
+            'fanout_events_total': {(event,): count},
+            'fanout_latency_p50': {(stage,): ms},
+            'fanout_latency_p95': {(stage,): ms},
+            'fanout_latency_p99': {(stage,): ms},
         }
         
     PII Discipline: No user-specific data, only aggregated counts/percentiles
@@ -374,6 +437,7 @@ def get_metrics_snapshot() -> dict:
             'ratelimit_events_total': dict(_ratelimit_counters),
             'auth_failures_total': dict(_auth_failure_counters),
             'active_connections': dict(_active_connections_gauge),
+            'fanout_events_total': dict(_fanout_counters),
         }
         
         # Compute latency percentiles
@@ -392,6 +456,13 @@ def get_metrics_snapshot() -> dict:
         snapshot['message_latency_p50'] = latency_p50
         snapshot['message_latency_p95'] = latency_p95
         snapshot['message_latency_p99'] = latency_p99
+        
+        for quantile in (50, 95, 99):
+            snapshot[f'fanout_latency_p{quantile}'] = {
+                key: sorted(durations)[int(len(durations) * quantile / 100)]
+                for key, durations in _fanout_latency_histogram.items()
+                if durations
+            }
     
     return snapshot
 
@@ -409,6 +480,8 @@ def reset_metrics() -> None:
         _auth_failure_counters.clear()
         _message_latency_histogram.clear()
         _active_connections_gauge.clear()
+        _fanout_latency_histogram.clear()
+        _fanout_counters.clear()
     
     logger.warning("WebSocket metrics reset (testing only)")
 
@@ -0,0 +1,106 @@
+"""
+Resumable, sequenced event stream for tournament WebSocket rooms.
+
+Every event the broadcast helpers send to ``tournament_{id}`` is stamped
+with a room-level ``seq`` (monotonic per tournament, shared by all
+processes through the cache) and kept in a bounded ring buffer of the last
+``WS_ROOM_REPLAY_BUFFER`` events. A client that reconnects with
+``?last_seq=N`` receives only the events after N, or a ``resync`` frame
+when they have already been overwritten — instead of refetching bracket,
+standings and hub state over HTTP.
+
+Storage (default cache, Redis in production):
+- ``ws:room:{id}:seq`` — last assigned sequence (``cache.incr``)
+- ``ws:room:{id}:evt:{seq % size}`` — stamped message; a slot is only
+  trusted when its stored ``seq`` matches the one being replayed
+
+Sequenced senders: realtime.broadcast, realtime.utils.broadcast_tournament_event
+and realtime.broadcast_queue. Direct ``group_send`` callers elsewhere are
+delivered live but are not replayable.
+
+A stamped event is written to the ring before it is sent, so a client
+that joins the group first and then reads the ring cannot miss it; the
+replay stops at the first slot not yet written (that event is still in
+flight and will arrive live).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUFFER_SIZE = 256
+EVENT_TTL = 6 * 3600
+
+
+def buffer_size() -> int:
+    return max(1, getattr(settings, "WS_ROOM_REPLAY_BUFFER", DEFAULT_BUFFER_SIZE))
+
+
+def _seq_key(tournament_id: int) -> str:
+    return f"ws:room:{tournament_id}:seq"
+
+
+def _slot_key(tournament_id: int, seq: int) -> str:
+    return f"ws:room:{tournament_id}:evt:{seq % buffer_size()}"
+
+
+def latest_seq(tournament_id: int) -> int:
+    return int(cache.get(_seq_key(tournament_id)) or 0)
+
+
+def stamp(tournament_id: int, message: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Assign the next room sequence to ``message`` and record it for replay.
+
+    Returns a copy carrying ``seq``; on cache failure the message is
+    returned unstamped (live delivery still works).
+    """
+    try:
+        key = _seq_key(tournament_id)
+        cache.add(key, 0, timeout=None)
+        seq = cache.incr(key)
+        stamped = {**message, "seq": seq}
+        cache.set(_slot_key(tournament_id, seq), stamped, timeout=EVENT_TTL)
+        return stamped
+    except Exception as e:
+        logger.warning(f"Failed to sequence event for tournament {tournament_id}: {e}")
+        return message
+
+
+def since(tournament_id: int, last_seq: int) -> Optional[List[Dict[str, Any]]]:
+    """
+    Stamped events after ``last_seq`` in order.
+
+    Returns None when the client must resync: the gap is larger than the
+    buffer, a slot was overwritten/expired, or the room sequence restarted
+    (``last_seq`` ahead of the current one).
+    """
+    current = latest_seq(tournament_id)
+    if last_seq > current:
+        return None
+    if last_seq == current:
+        return []
+    if current - last_seq > buffer_size():
+        return None
+
+    seqs = range(last_seq + 1, current + 1)
+    keys = [_slot_key(tournament_id, seq) for seq in seqs]
+    stored = cache.get_many(keys)
+
+    events: List[Dict[str, Any]] = []
+    for seq, key in zip(seqs, keys):
+        event = stored.get(key)
+        if event is None:
+            if any(k in stored for k in keys[len(events) + 1:]):
+                return None  # a hole with later events: evicted, not in flight
+            break  # still being written; arrives live
+        if event.get("seq") != seq:
+            return None  # overwritten by a newer lap of the ring
+        events.append(event)
+    return events
@@ -0,0 +1,242 @@
+"""
+Process-local fan-out for read-only spectator connections.
+
+With plain channel-layer groups every socket in ``tournament_{id}`` has its
+own channel, so one score_updated to a final with 20k viewers is 20k Redis
+channel writes (and 20k entries against the per-channel ``capacity``).
+With ``WS_SPECTATOR_FANOUT`` on, spectator sockets instead register with the
+process's ``SpectatorHub``:
+
+- one channel per tournament per ASGI process joins the room group, and a
+  single reader task per room receives each event once
+- the reader copies the event into every local socket's ``SendQueue`` in
+  memory; a writer task per socket drains it at the socket's own pace
+- queues are bounded (``WS_SPECTATOR_QUEUE_SIZE``): superseded score /
+  bracket / rank frames are conflated in place (same rules as
+  ``broadcast_queue.coalesce``); on overflow the oldest pending
+  score_updated is dropped, and when nothing is droppable the queue is
+  cleared and the client is told to resync (it can resume with ``last_seq``)
+
+Players, organizers and admins keep their own group membership: they send
+actions and must not have frames conflated away.
+
+Metrics: ``FanoutStage.DISPATCH`` (receive -> queued on every local socket)
+and ``FanoutStage.DELIVERY`` (receive -> written to the socket) latencies,
+plus conflated / dropped / resync counters (see realtime.metrics).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from django.conf import settings
+
+from . import metrics
+from .broadcast_queue import coalesce, coalesce_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 64
+
+RESYNC_MESSAGE = {'type': 'spectator_resync', 'reason': 'slow_consumer'}
+
+Deliver = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+def fanout_enabled() -> bool:
+    return getattr(settings, 'WS_SPECTATOR_FANOUT', False)
+
+
+def queue_size() -> int:
+    return max(1, getattr(settings, 'WS_SPECTATOR_QUEUE_SIZE', DEFAULT_QUEUE_SIZE))
+
+
+class SendQueue:
+    """
+    Bounded, conflating per-socket queue.
+
+    Entries are ``(message, received_at)``; ``received_at`` is when the room
+    reader got the event, for delivery latency.
+    """
+
+    def __init__(self, group: str, maxsize: int):
+        self.group = group
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Any, tuple]' = OrderedDict()
+        self._unique = count()
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, message: Dict[str, Any], received_at: float) -> None:
+        key = coalesce_key(self.group, message)
+        if key is not None and key in self._entries:
+            previous, _ = self._entries.pop(key)
+            merged = coalesce([(self.group, previous), (self.group, message)])[-1][1]
+            if 'seq' in message:
+                merged = {**merged, 'seq': message['seq']}
+            # Re-append so frames stay in seq order
+            self._entries[key] = (merged, received_at)
+            metrics.record_fanout_event(metrics.FanoutEvent.CONFLATED)
+            self._ready.set()
+            return
+
+        if len(self._entries) >= self.maxsize:
+            self._make_room()
+        self._entries[key if key is not None else ('unique', next(self._unique))] = (message, received_at)
+        self._ready.set()
+
+    def _make_room(self) -> None:
+        for key in self._entries:
+            if key[0] == self.group and key[1] == 'score':
+                del self._entries[key]
+                metrics.record_fanout_event(metrics.FanoutEvent.DROPPED)
+                return
+        metrics.record_fanout_event(metrics.FanoutEvent.DROPPED, len(self._entries))
+        metrics.record_fanout_event(metrics.FanoutEvent.RESYNC)
+        self._entries.clear()
+        self._entries[('resync', next(self._unique))] = (RESYNC_MESSAGE, time.monotonic())
+
+    async def get(self) -> tuple:
+        while not self._entries:
+            self._ready.clear()
+            await self._ready.wait()
+        _, entry = self._entries.popitem(last=False)
+        return entry
+
+
+class SpectatorSocket:
+    """One spectator connection: its send queue and writer task."""
+
+    def __init__(self, tournament_id: int, deliver: Deliver, maxsize: Optional[int] = None):
+        self.tournament_id = tournament_id
+        self.queue = SendQueue(f'tournament_{tournament_id}', maxsize or queue_size())
+        self._deliver = deliver
+        self._writer: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start writing queued frames (after any resume replay was sent)."""
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write())
+
+    async def stop(self) -> None:
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+            self._writer = None
+
+    async def _write(self) -> None:
+        while True:
+            message, received_at = await self.queue.get()
+            try:
+                await self._deliver(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Spectator frame delivery failed (tournament={self.tournament_id}): {e}")
+                continue
+            metrics.record_fanout_latency(metrics.FanoutStage.DELIVERY, time.monotonic() - received_at)
+
+
+class _Room:
+    def __init__(self, channel: str):
+        self.channel = channel
+        self.sockets: Set[SpectatorSocket] = set()
+        self.reader: Optional[asyncio.Task] = None
+
+
+class SpectatorHub:
+    """Per-process (per event loop) registry of spectator sockets by tournament."""
+
+    def __init__(self, channel_layer=None):
+        self._channel_layer = channel_layer
+        self._rooms: Dict[int, _Room] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def channel_layer(self):
+        if self._channel_layer is None:
+            from channels.layers import get_channel_layer
+
+            self._channel_layer = get_channel_layer()
+        return self._channel_layer
+
+    def socket_count(self, tournament_id: int) -> int:
+        room = self._rooms.get(tournament_id)
+        return len(room.sockets) if room else 0
+
+    async def join(self, tournament_id: int, socket: SpectatorSocket) -> None:
+        """Register a socket; the first one subscribes this process to the room."""
+        async with self._lock:
+            room = self._rooms.get(tournament_id)
+            if room is None:
+                channel = await self.channel_layer.new_channel()
+                await self.channel_layer.group_add(f'tournament_{tournament_id}', channel)
+                room = _Room(channel)
+                room.reader = asyncio.create_task(self._read(tournament_id, room))
+                self._rooms[tournament_id] = room
+                logger.info(f"Spectator fan-out subscribed: tournament={tournament_id}")
+            room.sockets.add(socket)
+
+    async def leave(self, tournament_id: int, socket: SpectatorSocket) -> None:
+        """Unregister a socket; the last one unsubscribes the process."""
+        await socket.stop()
+        async with self._lock:
+            room = self._rooms.get(tournament_id)
+            if room is None:
+                return
+            room.sockets.discard(socket)
+            if room.sockets:
+                return
+            del self._rooms[tournament_id]
+            room.reader.cancel()
+            try:
+                await room.reader
+            except asyncio.CancelledError:
+                pass
+            await self.channel_layer.group_discard(f'tournament_{tournament_id}', room.channel)
+            logger.info(f"Spectator fan-out unsubscribed: tournament={tournament_id}")
+
+    async def _read(self, tournament_id: int, room: _Room) -> None:
+        while True:
+            try:
+                message = await self.channel_layer.receive(room.channel)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Spectator fan-out receive failed (tournament={tournament_id}): {e}")
+                await asyncio.sleep(1)
+                continue
+            self.publish(room, message)
+
+    @staticmethod
+    def publish(room: _Room, message: Dict[str, Any]) -> None:
+        received_at = time.monotonic()
+        sockets = list(room.sockets)
+        for socket in sockets:
+            socket.queue.put(message, received_at)
+        metrics.record_fanout_latency(
+            metrics.FanoutStage.DISPATCH, time.monotonic() - received_at, count=len(sockets)
+        )
+
+
+_hubs: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SpectatorHub]' = weakref.WeakKeyDictionary()
+
+
+def get_hub() -> SpectatorHub:
+    """Hub for the running event loop (one per ASGI process in production)."""
+    loop = asyncio.get_running_loop()
+    hub = _hubs.get(loop)
+    if hub is None:
+        hub = _hubs[loop] = SpectatorHub()
+    return hub
@@ -20,6 +20,11 @@ Module 6.1: Async-Native WebSocket Helpers
     - Django ORM queries wrapped with sync_to_async
     - Unblocks 4 skipped tests from Module 4.5
 
+Sync service code (MatchService, BracketService) uses the queued
+counterparts in realtime.broadcast_queue instead: released on commit,
+coalesced per room (score, bracket and rank events) and sent from a
+background sender.
+
 Event Types:
     - match_started: New match begins
     - score_updated: Match score changes (micro-batched)
@@ -36,6 +41,8 @@ from typing import Dict, Any, Literal, Optional
 from channels.layers import get_channel_layer
 from asgiref.sync import sync_to_async
 
+from . import room_stream
+
 logger = logging.getLogger(__name__)
 
 # Type hints for event types (Module 4.5: added dispute_created, Module 5.1: added tournament_completed)
@@ -124,13 +131,13 @@ async def broadcast_tournament_event(
         
         # Send to all clients in tournament room
         # The 'type' field maps to consumer method name (e.g., match_started)
-        await channel_layer.group_send(
-            room_group_name,
-            {
-                'type': event_type,  # Maps to consumer method
-                'data': data,
-            }
-        )
+        message = {
+            'type': event_type,  # Maps to consumer method
+            'data': data,
+        }
+        # Sequence + ring buffer so reconnecting clients can resume (room_stream)
+        message = await sync_to_async(room_stream.stamp)(tournament_id, message)
+        await channel_layer.group_send(room_group_name, message)
         
         logger.debug(f"Successfully broadcast {event_type} to {room_group_name}")
         
@@ -0,0 +1,284 @@
+"""
+Compact binary WebSocket frames for realtime clients.
+
+Clients that offer the ``dc.msgpack.v1`` subprotocol (``new WebSocket(url,
+['dc.msgpack.v1'])``) get every frame as a binary msgpack message instead of
+JSON text:
+
+- dict keys listed in ``FIELDS`` are replaced by their integer index, and
+  the ``type`` / ``event_type`` values listed in ``TYPES`` by theirs
+  (integer keys never collide with payload keys, which are always strings).
+  Both tables are append-only; a change that reorders them needs a new
+  subprotocol name.
+- state-like frames (``DIFF_TYPES``) carry a per-stream version ``v``. Once
+  the client acknowledges a version with ``{type: 'ack', stream: <type>,
+  v: <n>}``, later frames of that stream are sent as a JSON-patch
+  (RFC 6902 ops) against the acknowledged body — ``{type, base, v, patch}``
+  — whenever the patch is smaller than the full body.
+
+Clients may send JSON text or msgpack (same codes) frames. Connections that
+do not negotiate the subprotocol are unchanged.
+
+The codebook for client decoders is ``codebook()``.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack ships with channels_redis
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+MSGPACK_SUBPROTOCOL = 'dc.msgpack.v1'
+
+# Append-only: the index is the wire code
+FIELDS = (
+    'type', 'data', 'seq', 'v', 'base', 'patch', 'op', 'path', 'value', 'stream',
+    'tournament_id', 'match_id', 'event_type', 'participant_id', 'team_id',
+    'participant1_id', 'participant2_id', 'team1_id', 'team2_id',
+    'participant1_score', 'participant2_score', 'winner_id', 'loser_id',
+    'round', 'round_number', 'match_number', 'state', 'status', 'changes',
+    'previous_rank', 'current_rank', 'rank_change', 'points', 'updated_nodes',
+    'next_matches', 'action', 'timestamp', 'sequence', 'user_id', 'username',
+    'role', 'message', 'heartbeat_interval', 'latest_seq', 'last_seq', 'reason',
+    'coalesced', 'score', 'participants', 'online', 'is_participant',
+)
+
+TYPES = (
+    'connection_established', 'ping', 'pong', 'ack', 'error', 'resync',
+    'tournament_event', 'match_started', 'score_updated', 'match_completed',
+    'bracket_updated', 'bracket_generated', 'rank_update', 'dispute_created',
+    'tournament_completed', 'registration_created', 'registration_cancelled',
+    'registration_checked_in', 'registration_checkin_reverted',
+    'payment_proof_submitted', 'payment_verified', 'payment_rejected',
+    'payment_refunded', 'match_state_changed', 'match_room_event', 'match_chat',
+    'typing_indicator', 'match_presence', 'voice_widget_update', 'chat_history',
+    'presence_synced', 'standings_updated',
+)
+
+# Frames whose body is a state snapshot worth diffing
+DIFF_TYPES = frozenset({
+    'bracket_updated', 'bracket_generated', 'rank_update', 'standings_updated',
+    'match_presence', 'match_state_changed',
+})
+
+# Unacknowledged versions kept per stream (older acks fall back to full frames)
+MAX_PENDING_VERSIONS = 8
+
+_ENVELOPE = ('type', 'seq', 'v', 'base', 'patch')
+
+_FIELD_CODES = {name: code for code, name in enumerate(FIELDS)}
+_TYPE_CODES = {name: code for code, name in enumerate(TYPES)}
+_TYPE_VALUED = ('type', 'event_type')
+
+
+def available() -> bool:
+    return msgpack is not None
+
+
+def codebook() -> Dict[str, Any]:
+    return {'subprotocol': MSGPACK_SUBPROTOCOL, 'fields': list(FIELDS), 'types': list(TYPES)}
+
+
+# ---------------------------------------------------------------------------
+# Field codes
+# ---------------------------------------------------------------------------
+
+
+def compact(value: Any) -> Any:
+    """Replace known keys / type names with their codes (recursively)."""
+    if isinstance(value, dict):
+        out = {}
+        for key, item in value.items():
+            if key in _TYPE_VALUED and isinstance(item, str):
+                item = _TYPE_CODES.get(item, item)
+            else:
+                item = compact(item)
+            out[_FIELD_CODES.get(key, key)] = item
+        return out
+    if isinstance(value, (list, tuple)):
+        return [compact(item) for item in value]
+    return value
+
+
+def expand(value: Any) -> Any:
+    """Inverse of ``compact``."""
+    if isinstance(value, dict):
+        out = {}
+        for key, item in value.items():
+            name = FIELDS[key] if isinstance(key, int) and 0 <= key < len(FIELDS) else key
+            if name in _TYPE_VALUED and isinstance(item, int) and 0 <= item < len(TYPES):
+                item = TYPES[item]
+            else:
+                item = expand(item)
+            out[name] = item
+        return out
+    if isinstance(value, list):
+        return [expand(item) for item in value]
+    return value
+
+
+def pack(content: Dict[str, Any]) -> bytes:
+    return msgpack.packb(compact(content), use_bin_type=True, default=str)
+
+
+def unpack(data: bytes) -> Dict[str, Any]:
+    return expand(msgpack.unpackb(data, raw=False, strict_map_key=False))
+
+
+# ---------------------------------------------------------------------------
+# JSON-patch (RFC 6902 subset: add / remove / replace)
+# ---------------------------------------------------------------------------
+
+
+def _pointer(path: str, key: Any) -> str:
+    return f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+
+
+def diff(old: Any, new: Any, path: str = '') -> List[Dict[str, Any]]:
+    """Patch ops turning ``old`` into ``new``; lists of different length are replaced."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[Dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'remove', 'path': _pointer(path, key)})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({'op': 'add', 'path': _pointer(path, key), 'value': value})
+            else:
+                ops.extend(diff(old[key], value, _pointer(path, key)))
+        return ops
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        ops = []
+        for index, (before, after) in enumerate(zip(old, new)):
+            ops.extend(diff(before, after, _pointer(path, index)))
+        return ops
+    if old == new and type(old) is type(new):
+        return []
+    return [{'op': 'replace', 'path': path, 'value': new}]
+
+
+def apply_patch(document: Any, ops: List[Dict[str, Any]]) -> Any:
+    """Apply ``diff`` output (reference implementation for clients and tests)."""
+    document = copy.deepcopy(document)
+    for op in ops:
+        if op['path'] == '':
+            document = copy.deepcopy(op['value'])
+            continue
+        *parents, last = [
+            part.replace('~1', '/').replace('~0', '~') for part in op['path'].split('/')[1:]
+        ]
+        target = document
+        for part in parents:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        if isinstance(target, list):
+            last = int(last)
+        if op['op'] == 'remove':
+            del target[last]
+        else:
+            target[last] = copy.deepcopy(op['value'])
+    return document
+
+
+# ---------------------------------------------------------------------------
+# Per-connection encoder
+# ---------------------------------------------------------------------------
+
+
+class FrameEncoder:
+    """Encodes one connection's outgoing frames; tracks acknowledged state per stream."""
+
+    def __init__(self):
+        self._versions: Dict[str, int] = {}
+        self._sent: Dict[str, 'OrderedDict[int, Dict[str, Any]]'] = {}
+        self._acked: Dict[str, tuple] = {}  # stream -> (version, body)
+
+    def version(self, stream: str) -> int:
+        """Last version sent on ``stream`` (0 if none)."""
+        return self._versions.get(stream, 0)
+
+    def ack(self, stream: str, version: int) -> bool:
+        """Record a client acknowledgement; False if that version is no longer held."""
+        sent = self._sent.get(stream)
+        if not sent or version not in sent:
+            return False
+        body = sent[version]
+        for held in list(sent):
+            if held <= version:
+                del sent[held]
+        self._acked[stream] = (version, body)
+        return True
+
+    def encode(self, content: Dict[str, Any]) -> bytes:
+        stream = content.get('type')
+        if stream not in DIFF_TYPES:
+            return pack(content)
+
+        body = {k: v for k, v in content.items() if k not in _ENVELOPE}
+        version = self._versions.get(stream, 0) + 1
+        self._versions[stream] = version
+        sent = self._sent.setdefault(stream, OrderedDict())
+        sent[version] = body
+        while len(sent) > MAX_PENDING_VERSIONS:
+            sent.popitem(last=False)
+
+        full = pack({**content, 'v': version})
+        acked = self._acked.get(stream)
+        if acked is None:
+            return full
+        base, base_body = acked
+        envelope = {k: content[k] for k in ('type', 'seq') if k in content}
+        patched = pack({**envelope, 'base': base, 'v': version, 'patch': diff(base_body, body)})
+        return patched if len(patched) < len(full) else full
+
+
+class CompactFramesMixin:
+    """
+    Consumer mixin: negotiates ``dc.msgpack.v1`` on accept and encodes
+    ``send_json`` frames with a per-connection ``FrameEncoder``.
+
+    Place before ``AsyncJsonWebsocketConsumer`` in the bases.
+    """
+
+    frame_encoder: Optional[FrameEncoder] = None
+
+    async def accept(self, subprotocol=None, headers=None):
+        if (
+            subprotocol is None
+            and available()
+            and MSGPACK_SUBPROTOCOL in (self.scope.get('subprotocols') or ())
+        ):
+            subprotocol = MSGPACK_SUBPROTOCOL
+        if subprotocol == MSGPACK_SUBPROTOCOL:
+            self.frame_encoder = FrameEncoder()
+        await super().accept(subprotocol=subprotocol, headers=headers)
+
+    async def send_json(self, content, close=False):
+        if self.frame_encoder is None:
+            return await super().send_json(content, close=close)
+        await self.send(bytes_data=self.frame_encoder.encode(content), close=close)
+
+    async def receive(self, text_data=None, bytes_data=None, **kwargs):
+        if self.frame_encoder is None:
+            return await super().receive(text_data=text_data, bytes_data=bytes_data, **kwargs)
+        try:
+            content = unpack(bytes_data) if bytes_data is not None else json.loads(text_data)
+        except Exception as e:
+            logger.warning(f"Undecodable compact frame: {e}")
+            await self.send_json({'type': 'error', 'code': 'invalid_frame', 'message': 'Undecodable frame'})
+            return
+        if isinstance(content, dict) and content.get('type') == 'ack':
+            try:
+                self.frame_encoder.ack(str(content.get('stream')), int(content.get('v')))
+            except (TypeError, ValueError):
+                pass
+            return
+        await self.receive_json(content, **kwargs)
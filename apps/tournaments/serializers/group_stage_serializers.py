@@ -112,8 +112,7 @@ class GroupSerializer:
         if include_matches:
             # Get upcoming matches for this group
             upcoming_matches = Match.objects.filter(
-                tournament=group.tournament,
-                lobby_info__group_id=group.id,
+                group=group,
                 state__in=[Match.SCHEDULED, Match.CHECK_IN, Match.READY, Match.LIVE]
             ).order_by('round_number', 'match_number')[:5]
             
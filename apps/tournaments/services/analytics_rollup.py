@@ -0,0 +1,198 @@
+"""Incremental organizer analytics via ``TournamentAnalyticsSnapshot``.
+
+The materialized view ``tournament_analytics_summary`` can only be
+refreshed for every tournament at once. Here each tournament has its own
+row, and only rows whose tournament changed since the last run are
+recomputed:
+
+- ``mark_dirty`` / ``mark_dirty_on_commit`` — called from the save signals
+  of Registration (status, check-in), Payment, Match, PrizeTransaction and
+  Tournament. Marking is one primary-key UPDATE: ``changed_at`` records
+  the latest change and ``dirty_at`` keeps the oldest one not yet applied.
+- ``refresh_dirty`` — beat task body; recomputes the oldest dirty rows.
+- ``refresh`` — recompute one tournament now (targeted refresh).
+- ``mark_all_dirty`` — nightly reconciliation for changes written around
+  the signals (``QuerySet.update()``, raw SQL, fixtures).
+
+Marks are written after the caller's transaction commits, so a request
+that reports a match never waits on the snapshot row and a rolled-back
+change marks nothing. Tournament ids marked inside one transaction are
+buffered and written together, one UPDATE per commit however many rows
+the transaction saved. A refresh clears ``dirty_at`` only if no change was
+marked while it was computing.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.common.commit_buffer import OnCommitBuffer
+from apps.tournaments.models import Tournament, TournamentAnalyticsSnapshot
+
+logger = logging.getLogger(__name__)
+
+METRIC_FIELDS = (
+    'tournament_status',
+    'total_participants',
+    'checked_in_count',
+    'check_in_rate',
+    'total_matches',
+    'completed_matches',
+    'disputed_matches',
+    'dispute_rate',
+    'avg_match_duration_minutes',
+    'prize_pool_total',
+    'prizes_distributed',
+    'payout_count',
+    'started_at',
+    'concluded_at',
+)
+
+# Saves that can move a metric. ``update_fields=None`` always counts.
+REGISTRATION_FIELDS = frozenset({'status', 'checked_in', 'is_deleted'})
+MATCH_FIELDS = frozenset({'state'})
+TOURNAMENT_FIELDS = frozenset({'status', 'prize_pool', 'tournament_start'})
+
+CLOSED_STATUSES = (Tournament.CANCELLED, Tournament.ARCHIVED)
+
+REFRESH_LOCK_KEY = 'tournament_analytics:refresh_lock'
+REFRESH_LOCK_SECONDS = 300
+
+
+def _enabled() -> bool:
+    return bool(getattr(settings, 'ANALYTICS_SNAPSHOTS_ENABLED', True))
+
+
+def touches(update_fields, tracked: frozenset) -> bool:
+    return update_fields is None or bool(set(update_fields) & tracked)
+
+
+def mark_dirty(tournament_id: Optional[int]) -> None:
+    """Flag a tournament's analytics for the next refresh."""
+    mark_many_dirty([tournament_id])
+
+
+def mark_many_dirty(tournament_ids: Iterable[Optional[int]]) -> None:
+    """Flag several tournaments with one UPDATE; rows that do not exist yet are inserted."""
+    ids = {tournament_id for tournament_id in tournament_ids if tournament_id}
+    if not ids or not _enabled():
+        return
+    now = timezone.now()
+    rows = TournamentAnalyticsSnapshot.objects.filter(tournament_id__in=ids)
+    if rows.update(changed_at=now, dirty_at=Coalesce(F('dirty_at'), Value(now))) == len(ids):
+        return
+    missing = ids.difference(rows.values_list('tournament_id', flat=True))
+    try:
+        with transaction.atomic():
+            TournamentAnalyticsSnapshot.objects.bulk_create(
+                [TournamentAnalyticsSnapshot(tournament_id=tid, dirty_at=now, changed_at=now) for tid in missing],
+                ignore_conflicts=True,
+            )
+    except IntegrityError:
+        # A tournament was deleted before the mark landed; keep the others.
+        if len(missing) > 1:
+            for tournament_id in missing:
+                mark_many_dirty([tournament_id])
+        else:
+            logger.debug("Skipped analytics mark for missing tournament %s", *missing)
+
+
+def _mark_buffered(tournament_ids: List[int]) -> None:
+    try:
+        mark_many_dirty(tournament_ids)
+    except Exception:
+        logger.exception("Failed to mark analytics dirty for tournaments %s", sorted(set(tournament_ids)))
+
+
+_buffer = OnCommitBuffer(_mark_buffered)
+
+
+def mark_dirty_on_commit(tournament_id: Optional[int]) -> None:
+    if not tournament_id or not _enabled():
+        return
+    if not _buffer.add(tournament_id):
+        _mark_buffered([tournament_id])
+
+
+def refresh(tournament_id: int) -> Optional[Dict[str, object]]:
+    """Recompute one tournament's row and return its metrics (None if the tournament is gone)."""
+    from apps.tournaments.services.analytics_service import AnalyticsService
+
+    started = timezone.now()
+    try:
+        tournament = Tournament.objects.get(pk=tournament_id)
+    except Tournament.DoesNotExist:
+        TournamentAnalyticsSnapshot.objects.filter(tournament_id=tournament_id).delete()
+        return None
+
+    metrics = AnalyticsService.compute_tournament_metrics(tournament)
+    # A change marked while we computed may be missing from the metrics:
+    # leave the row dirty from ``started`` so the next run picks it up.
+    updated = TournamentAnalyticsSnapshot.objects.filter(tournament_id=tournament_id).update(
+        refreshed_at=started,
+        dirty_at=Case(When(changed_at__gt=started, then=Value(started)), default=None),
+        **metrics,
+    )
+    if not updated:
+        TournamentAnalyticsSnapshot.objects.bulk_create(
+            [TournamentAnalyticsSnapshot(tournament_id=tournament_id, refreshed_at=started, **metrics)],
+            ignore_conflicts=True,
+        )
+    return metrics
+
+
+def refresh_dirty(limit: Optional[int] = None) -> Dict[str, int]:
+    """Recompute the oldest dirty rows (at most ``limit``)."""
+    summary = {'refreshed': 0, 'failed': 0, 'remaining': 0}
+    if not _enabled():
+        summary['skipped'] = 'disabled'
+        return summary
+    if not cache.add(REFRESH_LOCK_KEY, 1, timeout=REFRESH_LOCK_SECONDS):
+        summary['skipped'] = 'locked'
+        return summary
+
+    limit = limit or int(getattr(settings, 'ANALYTICS_SNAPSHOT_BATCH_SIZE', 200))
+    try:
+        dirty_ids = list(
+            TournamentAnalyticsSnapshot.objects.filter(dirty_at__isnull=False)
+            .order_by('dirty_at')
+            .values_list('tournament_id', flat=True)[:limit]
+        )
+        for tournament_id in dirty_ids:
+            try:
+                refresh(tournament_id)
+                summary['refreshed'] += 1
+            except Exception:
+                summary['failed'] += 1
+                logger.exception("Analytics snapshot refresh failed for tournament %s", tournament_id)
+        summary['remaining'] = TournamentAnalyticsSnapshot.objects.filter(dirty_at__isnull=False).count()
+    finally:
+        cache.delete(REFRESH_LOCK_KEY)
+    return summary
+
+
+def mark_all_dirty() -> int:
+    """Queue every open tournament for recomputation; returns the resulting queue depth."""
+    now = timezone.now()
+    open_tournaments = Tournament.objects.exclude(status__in=CLOSED_STATUSES).values_list('id', flat=True)
+    TournamentAnalyticsSnapshot.objects.filter(tournament_id__in=open_tournaments).update(
+        changed_at=now,
+        dirty_at=Coalesce(F('dirty_at'), Value(now)),
+    )
+    TournamentAnalyticsSnapshot.objects.bulk_create(
+        [
+            TournamentAnalyticsSnapshot(tournament_id=tournament_id, dirty_at=now, changed_at=now)
+            for tournament_id in open_tournaments
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+    return TournamentAnalyticsSnapshot.objects.filter(dirty_at__isnull=False).count()
@@ -10,6 +10,12 @@ Module 6.2 Enhancement:
 - Freshness threshold: 15 minutes (configurable)
 - Cache metadata in API responses
 
+Incremental snapshots:
+- Read TournamentAnalyticsSnapshot before the materialized view; rows are
+  recomputed per tournament shortly after each change (analytics_rollup)
+- A clean row is current whatever its age; a dirty row is served while its
+  oldest pending change is within the freshness threshold
+
 Implements:
 - Documents/ExecutionPlan/PHASE_5_IMPLEMENTATION_PLAN.md#module-54-analytics--reports
 - Documents/ExecutionPlan/PHASE_6_IMPLEMENTATION_PLAN.md#module-62-materialized-views-for-analytics
@@ -49,6 +55,7 @@ from apps.tournaments.models import (
     Match,
     TournamentResult,
     PrizeTransaction,
+    TournamentAnalyticsSnapshot,
 )
 
 logger = logging.getLogger(__name__)
@@ -177,6 +184,46 @@ class AnalyticsService:
         age = timezone.now() - last_refresh_at
         return age < timedelta(minutes=threshold_minutes)
     
+    # ========================================================================
+    # INCREMENTAL SNAPSHOT HELPERS
+    # ========================================================================
+    
+    @staticmethod
+    def _query_analytics_snapshot(tournament_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Read the incrementally maintained analytics row for a tournament.
+        
+        Returns formatted metrics with cache metadata, or None when the row
+        has not been built yet or has had a change pending for longer than
+        the freshness threshold (the refresh task is behind).
+        """
+        from apps.tournaments.services.analytics_rollup import METRIC_FIELDS
+        
+        snapshot = TournamentAnalyticsSnapshot.objects.filter(tournament_id=tournament_id).first()
+        if snapshot is None or snapshot.refreshed_at is None:
+            return None
+        
+        now = timezone.now()
+        pending_minutes = 0.0
+        if snapshot.dirty_at is not None:
+            pending_minutes = round((now - snapshot.dirty_at).total_seconds() / 60, 2)
+            if pending_minutes >= ANALYTICS_FRESHNESS_MINUTES:
+                logger.info(
+                    f"Analytics snapshot for tournament {tournament_id} has changes pending for "
+                    f"{pending_minutes:.1f}min (> {ANALYTICS_FRESHNESS_MINUTES}min threshold)"
+                )
+                return None
+        
+        data = AnalyticsService._format_metrics({
+            field: getattr(snapshot, field) for field in METRIC_FIELDS
+        })
+        data['cache'] = {
+            'source': 'incremental',
+            'as_of': snapshot.refreshed_at.isoformat(),
+            'age_minutes': pending_minutes,
+        }
+        return data
+    
     # ========================================================================
     # PUBLIC API
     # ========================================================================
@@ -186,8 +233,9 @@ class AnalyticsService:
         """
         Calculate tournament-level analytics for organizers.
         
-        Module 6.2: Optimized with materialized view (MV-first routing).
-        - Queries MV if fresh (<15 min) and not force_refresh
+        Routing (unless force_refresh):
+        - Incremental snapshot row if built and not behind
+        - Module 6.2 materialized view if fresh (<15 min)
         - Falls back to live aggregates if stale/missing
         - Returns cache metadata in response
         
@@ -212,21 +260,33 @@ class AnalyticsService:
                 - started_at (str|None): Tournament start time (UTC ISO-8601)
                 - concluded_at (str|None): Tournament conclusion time (UTC ISO-8601)
                 - cache (dict): Cache metadata
-                    - source (str): "materialized" or "live"
+                    - source (str): "incremental", "materialized" or "live"
                     - as_of (str): UTC ISO-8601 timestamp of data snapshot
-                    - age_minutes (float): Age of data in minutes (0 if live)
+                    - age_minutes (float): Age of data in minutes (0 if live;
+                      for "incremental", how long the oldest unapplied change
+                      has been pending)
         
         Raises:
             Tournament.DoesNotExist: If tournament not found
         
         Performance:
+            - Snapshot path: one primary-key lookup
             - MV path: <100ms target (cached aggregates)
             - Live path: 400-600ms (annotated aggregates with 5 table joins)
             - Logs warning if execution > 500ms
         """
         start_time = timezone.now()
         
-        # Module 6.2: Try materialized view first (if not force_refresh)
+        if not force_refresh:
+            snapshot_data = AnalyticsService._query_analytics_snapshot(tournament_id)
+            if snapshot_data:
+                duration_ms = (timezone.now() - start_time).total_seconds() * 1000
+                logger.info(
+                    f"Analytics for tournament {tournament_id} served from snapshot ({duration_ms:.2f}ms)"
+                )
+                return snapshot_data
+        
+        # Module 6.2: Try materialized view next (if not force_refresh)
         if not force_refresh:
             mv_data = AnalyticsService._query_analytics_mv(tournament_id)
             if mv_data:
@@ -262,74 +322,7 @@ class AnalyticsService:
         
         try:
             tournament = Tournament.objects.get(id=tournament_id)
-            
-            # Participant metrics
-            registrations = Registration.objects.filter(
-                tournament_id=tournament_id,
-                status=Registration.CONFIRMED
-            )
-            total_participants = registrations.count()
-            checked_in_count = registrations.filter(checked_in=True).count()
-            check_in_rate = AnalyticsService._calculate_check_in_rate(
-                checked_in_count, 
-                total_participants
-            )
-            
-            # Match metrics
-            matches = Match.objects.filter(tournament_id=tournament_id)
-            match_stats = matches.aggregate(
-                total=Count('id'),
-                completed=Count('id', filter=Q(state=Match.COMPLETED)),
-                disputed=Count('id', filter=Q(state=Match.DISPUTED)),
-                avg_duration=Avg(
-                    ExpressionWrapper(
-                        F('updated_at') - F('created_at'),
-                        output_field=DurationField()
-                    ),
-                    filter=Q(state=Match.COMPLETED)
-                )
-            )
-            
-            total_matches = match_stats['total'] or 0
-            completed_matches = match_stats['completed'] or 0
-            disputed_matches = match_stats['disputed'] or 0
-            dispute_rate = AnalyticsService._calculate_dispute_rate(
-                disputed_matches,
-                total_matches
-            )
-            
-            # Convert avg_duration timedelta to minutes
-            avg_match_duration_minutes = None
-            if match_stats['avg_duration']:
-                avg_match_duration_minutes = round(
-                    match_stats['avg_duration'].total_seconds() / 60,
-                    4  # 4 decimals for consistency
-                )
-            
-            # Prize metrics
-            prize_pool_total = AnalyticsService._format_decimal(
-                tournament.prize_pool or Decimal('0.00')
-            )
-            
-            prize_stats = PrizeTransaction.objects.filter(
-                tournament_id=tournament_id,
-                status=PrizeTransaction.Status.COMPLETED
-            ).aggregate(
-                total=Coalesce(Sum('amount'), Value(Decimal('0.00'))),
-                count=Count('id')
-            )
-            
-            prizes_distributed = AnalyticsService._format_decimal(
-                prize_stats['total']
-            )
-            payout_count = prize_stats['count'] or 0
-            
-            # Tournament metadata
-            tournament_status = tournament.status
-            started_at = AnalyticsService._format_datetime(tournament.tournament_start)
-            concluded_at = AnalyticsService._format_datetime(
-                tournament.updated_at if tournament.status == Tournament.COMPLETED else None
-            )
+            metrics = AnalyticsService.compute_tournament_metrics(tournament)
             
             # Performance monitoring
             duration_ms = (timezone.now() - start_time).total_seconds() * 1000
@@ -349,28 +342,104 @@ class AnalyticsService:
                 'age_minutes': 0.0
             }
             
-            return {
-                'total_participants': total_participants,
-                'checked_in_count': checked_in_count,
-                'check_in_rate': check_in_rate,
-                'total_matches': total_matches,
-                'completed_matches': completed_matches,
-                'disputed_matches': disputed_matches,
-                'dispute_rate': dispute_rate,
-                'avg_match_duration_minutes': avg_match_duration_minutes,
-                'prize_pool_total': prize_pool_total,
-                'prizes_distributed': prizes_distributed,
-                'payout_count': payout_count,
-                'tournament_status': tournament_status,
-                'started_at': started_at,
-                'concluded_at': concluded_at,
-                'cache': cache_metadata,
-            }
+            result = AnalyticsService._format_metrics(metrics)
+            result['cache'] = cache_metadata
+            return result
         
         except Tournament.DoesNotExist:
             logger.error(f"Tournament {tournament_id} not found for analytics")
             raise
     
+    @staticmethod
+    def compute_tournament_metrics(tournament: Tournament) -> Dict[str, Any]:
+        """
+        Aggregate organizer metrics for one tournament from the live tables.
+        
+        Shared by the live path and by analytics_rollup, which stores the
+        result in TournamentAnalyticsSnapshot. Values are unformatted
+        (Decimal amounts, datetime timestamps); see ``_format_metrics``.
+        """
+        tournament_id = tournament.id
+        
+        # Participant metrics
+        registrations = Registration.objects.filter(
+            tournament_id=tournament_id,
+            status=Registration.CONFIRMED
+        )
+        total_participants = registrations.count()
+        checked_in_count = registrations.filter(checked_in=True).count()
+        check_in_rate = AnalyticsService._calculate_check_in_rate(
+            checked_in_count, 
+            total_participants
+        )
+        
+        # Match metrics
+        matches = Match.objects.filter(tournament_id=tournament_id)
+        match_stats = matches.aggregate(
+            total=Count('id'),
+            completed=Count('id', filter=Q(state=Match.COMPLETED)),
+            disputed=Count('id', filter=Q(state=Match.DISPUTED)),
+            avg_duration=Avg(
+                ExpressionWrapper(
+                    F('updated_at') - F('created_at'),
+                    output_field=DurationField()
+                ),
+                filter=Q(state=Match.COMPLETED)
+            )
+        )
+        
+        total_matches = match_stats['total'] or 0
+        completed_matches = match_stats['completed'] or 0
+        disputed_matches = match_stats['disputed'] or 0
+        dispute_rate = AnalyticsService._calculate_dispute_rate(
+            disputed_matches,
+            total_matches
+        )
+        
+        # Convert avg_duration timedelta to minutes
+        avg_match_duration_minutes = None
+        if match_stats['avg_duration']:
+            avg_match_duration_minutes = round(
+                match_stats['avg_duration'].total_seconds() / 60,
+                4  # 4 decimals for consistency
+            )
+        
+        # Prize metrics
+        prize_stats = PrizeTransaction.objects.filter(
+            tournament_id=tournament_id,
+            status=PrizeTransaction.Status.COMPLETED
+        ).aggregate(
+            total=Coalesce(Sum('amount'), Value(Decimal('0.00'))),
+            count=Count('id')
+        )
+        
+        return {
+            'total_participants': total_participants,
+            'checked_in_count': checked_in_count,
+            'check_in_rate': check_in_rate,
+            'total_matches': total_matches,
+            'completed_matches': completed_matches,
+            'disputed_matches': disputed_matches,
+            'dispute_rate': dispute_rate,
+            'avg_match_duration_minutes': avg_match_duration_minutes,
+            'prize_pool_total': tournament.prize_pool or Decimal('0.00'),
+            'prizes_distributed': prize_stats['total'],
+            'payout_count': prize_stats['count'] or 0,
+            'tournament_status': tournament.status,
+            'started_at': tournament.tournament_start,
+            'concluded_at': tournament.updated_at if tournament.status == Tournament.COMPLETED else None,
+        }
+    
+    @staticmethod
+    def _format_metrics(metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """Render amounts and timestamps the way the API returns them."""
+        formatted = dict(metrics)
+        formatted['prize_pool_total'] = AnalyticsService._format_decimal(metrics['prize_pool_total'])
+        formatted['prizes_distributed'] = AnalyticsService._format_decimal(metrics['prizes_distributed'])
+        formatted['started_at'] = AnalyticsService._format_datetime(metrics['started_at'])
+        formatted['concluded_at'] = AnalyticsService._format_datetime(metrics['concluded_at'])
+        return formatted
+    
     @staticmethod
     def calculate_participant_analytics(user_id: int) -> Dict[str, Any]:
         """
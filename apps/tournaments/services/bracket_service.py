@@ -33,13 +33,17 @@ Assumptions:
 import logging
 import math
 import random
-from typing import List, Dict, Optional, Tuple
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterable, List, Dict, Optional, Tuple
 from decimal import Decimal
 from django.db import transaction
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.db.models import Max, Q
 
+from apps.common.events.outbox import batched_outbox
 from apps.tournaments.models import (
     Tournament,
     Bracket,
@@ -48,9 +52,8 @@ from apps.tournaments.models import (
     Registration
 )
 
-# Module 2.3: Real-time WebSocket broadcasting
-from apps.tournaments.realtime.utils import broadcast_bracket_updated
-from asgiref.sync import async_to_sync  # Module 6.1: Wrap async broadcast helpers
+# Module 2.3: Real-time WebSocket broadcasting (queued, released on commit)
+from apps.tournaments.realtime.broadcast_queue import broadcast_bracket_updated
 
 try:
     # Module-scope import keeps backward-compatible patch targets for tests.
@@ -60,6 +63,9 @@ except Exception:  # pragma: no cover - fail-soft for partial app bootstraps
 
 logger = logging.getLogger(__name__)
 
+# Matches collected by BracketService.batched_advancement() (per thread)
+_advancement_batch = threading.local()
+
 
 def _publish_bracket_event(event_name: str, **kwargs):
     """Publish bracket lifecycle events via the core EventBus (fire-and-forget)."""
@@ -338,7 +344,7 @@ class BracketService:
             return None
 
     @staticmethod
-    @transaction.atomic
+    @batched_outbox()
     def generate_bracket_universal_safe(
         tournament_id: int,
         bracket_format: Optional[str] = None,
@@ -628,7 +634,7 @@ class BracketService:
         return bracket
     
     @staticmethod
-    @transaction.atomic
+    @batched_outbox()
     def generate_bracket(
         tournament_id: int,
         bracket_format: Optional[str] = None,
@@ -1790,6 +1796,12 @@ class BracketService:
             raise ValidationError(
                 f"Cannot update bracket for match {match.id}: No winner determined"
             )
+
+        # Inside batched_advancement(): advance together with the rest of the batch
+        batch = getattr(_advancement_batch, 'matches', None)
+        if batch is not None:
+            batch[match.id] = match
+            return None
         
         # Get bracket node for this match
         try:
@@ -1813,7 +1825,7 @@ class BracketService:
         if node.bracket_type == BracketNode.THIRD_PLACE:
             logger.info(f"Match {match.id} completed Third Place Match - no bracket advancement")
             try:
-                async_to_sync(broadcast_bracket_updated)(
+                broadcast_bracket_updated(
                     tournament_id=match.tournament_id,
                     bracket_data={
                         'bracket_id': node.bracket.id,
@@ -1841,9 +1853,8 @@ class BracketService:
             BracketService._ensure_bronze_match_if_enabled(node.bracket)
             
             # Broadcast bracket_updated (tournament complete)
-            # Module 6.1: Wrap async broadcast with async_to_sync
             try:
-                async_to_sync(broadcast_bracket_updated)(
+                broadcast_bracket_updated(
                     tournament_id=match.tournament_id,
                     bracket_data={
                         'bracket_id': node.bracket.id,
@@ -2075,9 +2086,8 @@ class BracketService:
             })
         
         # Module 2.3: Broadcast bracket_updated event to WebSocket clients
-        # Module 6.1: Wrap async broadcast with async_to_sync
         try:
-            async_to_sync(broadcast_bracket_updated)(
+            broadcast_bracket_updated(
                 tournament_id=match.tournament_id,
                 bracket_data={
                     'bracket_id': node.bracket.id,
@@ -2102,6 +2112,325 @@ class BracketService:
         BracketService._maybe_finalize_tournament(match.tournament_id)
         return parent_node
     
+    @staticmethod
+    @contextmanager
+    def batched_advancement():
+        """
+        Collect update_bracket_after_match() calls and advance them in bulk.
+
+        Inside the block, completed matches passed to update_bracket_after_match()
+        (directly or via the Match post_save progression signal) are validated
+        and recorded instead of advanced. When the block exits without an
+        exception they are handed to advance_matches() in one go. Nested blocks
+        join the outermost batch.
+
+        Example:
+            >>> with transaction.atomic(), BracketService.batched_advancement():
+            ...     for match in round_matches:
+            ...         match.state = Match.COMPLETED
+            ...         match.save()
+        """
+        if getattr(_advancement_batch, 'matches', None) is not None:
+            yield
+            return
+        _advancement_batch.matches = OrderedDict()
+        try:
+            yield
+            pending = list(_advancement_batch.matches.values())
+        finally:
+            _advancement_batch.matches = None
+        if pending:
+            BracketService.advance_matches(pending)
+
+    @staticmethod
+    def _bracket_depths(nodes: Dict[int, BracketNode]) -> Dict[int, int]:
+        """Distance of every node from its bracket's root (children are always deeper)."""
+        depths: Dict[int, int] = {}
+        for node_id in nodes:
+            chain = []
+            current = node_id
+            while current is not None and current not in depths and current not in chain:
+                chain.append(current)
+                parent = nodes.get(current)
+                current = parent.parent_node_id if parent else None
+            base = depths.get(current, -1) if current is not None else -1
+            for offset, chained_id in enumerate(reversed(chain), start=1):
+                depths[chained_id] = base + offset
+        return depths
+
+    @staticmethod
+    @transaction.atomic
+    def advance_matches(matches: Iterable[Match]) -> Dict[int, Dict]:
+        """
+        Advance many completed matches through their brackets at once.
+
+        Bulk counterpart of update_bracket_after_match() with the same
+        placement rules (parent slot advancement, DE Grand Final reset
+        activation, DE loser drops, parent match sync and next-match creation),
+        but each affected bracket is loaded with one query, placements are
+        computed in memory children-first, and nodes / matches are written with
+        bulk_update / bulk_create. Each bracket gets one consolidated
+        bracket_updated broadcast, and each tournament one finalize check.
+
+        Args:
+            matches: Completed Match instances with a winner determined
+
+        Returns:
+            Dict of bracket_id -> the bracket_updated payload broadcast for it
+
+        Raises:
+            ValidationError: If any match is not completed or has no winner
+        """
+        by_id: Dict[int, Match] = OrderedDict()
+        for match in matches:
+            if match.state not in (Match.COMPLETED, Match.FORFEIT):
+                raise ValidationError(
+                    f"Cannot update bracket for match {match.id}: "
+                    f"Match state is '{match.state}', expected one of: completed, forfeit"
+                )
+            if not match.winner_id:
+                raise ValidationError(
+                    f"Cannot update bracket for match {match.id}: No winner determined"
+                )
+            by_id[match.id] = match
+        if not by_id:
+            return {}
+
+        tournament_ids = {match.tournament_id for match in by_id.values()}
+        linked = list(
+            BracketNode.objects.select_related('bracket__tournament')
+            .filter(match_id__in=list(by_id))
+        )
+        brackets = {node.bracket_id: node.bracket for node in linked}
+        nodes: Dict[int, BracketNode] = {
+            node.id: node for node in BracketNode.objects.filter(bracket_id__in=list(brackets))
+        }
+        for node in nodes.values():
+            node.bracket = brackets[node.bracket_id]
+        losers_index = {
+            (node.bracket_id, node.round_number, node.match_number_in_round): node
+            for node in nodes.values()
+            if node.bracket_type == BracketNode.LOSERS
+        }
+        depths = BracketService._bracket_depths(nodes)
+
+        dirty: Dict[int, set] = {}
+        advanced_parents: Dict[int, BracketNode] = OrderedDict()
+        reached: Dict[int, BracketNode] = OrderedDict()
+        summaries: Dict[int, Dict] = {
+            bracket_id: {'updated_nodes': OrderedDict(), 'advanced_matches': []}
+            for bracket_id in brackets
+        }
+
+        def touch(node: BracketNode, fields) -> None:
+            dirty.setdefault(node.id, set()).update(fields)
+            summaries[node.bracket_id]['updated_nodes'][node.id] = None
+
+        ordered = sorted(
+            (nodes[node.id] for node in linked),
+            key=lambda n: (-depths.get(n.id, 0), n.bracket_id, n.position),
+        )
+        for node in ordered:
+            match = by_id[node.match_id]
+            summary = summaries[node.bracket_id]
+            summary['advanced_matches'].append(match.id)
+            node.winner_id = match.winner_id
+            touch(node, ['winner_id'])
+
+            if node.bracket_type == BracketNode.THIRD_PLACE:
+                summary['bronze_winner_id'] = match.winner_id
+                continue
+
+            parent_node = nodes.get(node.parent_node_id)
+            if parent_node is None:
+                summary['finals_winner_id'] = match.winner_id
+                continue
+
+            winner_name = node.get_winner_name() or ""
+            if node.parent_slot == 1:
+                parent_node.participant1_id = match.winner_id
+                parent_node.participant1_name = winner_name
+            elif node.parent_slot == 2:
+                parent_node.participant2_id = match.winner_id
+                parent_node.participant2_name = winner_name
+            else:
+                raise ValidationError(
+                    f"Invalid parent_slot {node.parent_slot} for node {node.id}. "
+                    "Must be 1 or 2."
+                )
+
+            # GF reset activation — same rules as update_bracket_after_match()
+            gfr_activated = False
+            if parent_node.is_bye:
+                child1 = nodes.get(node.child1_node_id)
+                child2 = nodes.get(node.child2_node_id)
+                wb_side_id = (child1.winner_id if child1 and child1.winner_id else node.participant1_id)
+                lb_side_id = (child2.winner_id if child2 and child2.winner_id else node.participant2_id)
+                if lb_side_id and match.winner_id == lb_side_id:
+                    wb_name = (
+                        node.participant1_name
+                        if node.participant1_id == wb_side_id
+                        else node.participant2_name
+                    ) or ""
+                    if node.parent_slot == 1:
+                        parent_node.participant2_id = wb_side_id
+                        parent_node.participant2_name = wb_name
+                    else:
+                        parent_node.participant1_id = wb_side_id
+                        parent_node.participant1_name = wb_name
+                    parent_node.is_bye = False
+                    gfr_activated = True
+                elif node.parent_slot == 1:
+                    parent_node.participant1_id = None
+                    parent_node.participant1_name = ""
+                else:
+                    parent_node.participant2_id = None
+                    parent_node.participant2_name = ""
+
+            touch(parent_node, ['participant1_id', 'participant1_name',
+                                'participant2_id', 'participant2_name']
+                  + (['is_bye'] if gfr_activated else []))
+            advanced_parents[parent_node.id] = parent_node
+            reached[parent_node.id] = parent_node
+
+            # DE loser drop into the losers bracket
+            if (
+                not gfr_activated
+                and node.bracket_type == BracketNode.MAIN
+                and node.bracket.format == Bracket.DOUBLE_ELIMINATION
+                and not node.is_bye
+            ):
+                loser_drops = (node.bracket.bracket_structure or {}).get("loser_drops", {})
+                drop_key = f"main_R{node.round_number}_M{node.match_number_in_round}"
+                drop_info = loser_drops.get(drop_key)
+                if drop_info:
+                    lb_node = losers_index.get(
+                        (node.bracket_id, drop_info["lb_round"], drop_info["lb_match"])
+                    )
+                    if lb_node is None:
+                        logger.warning(
+                            "DE loser drop: LB node not found for drop_key=%s (bracket %s)",
+                            drop_key, node.bracket_id,
+                        )
+                    else:
+                        winner_was_p1 = match.winner_id == node.participant1_id
+                        loser_id = node.participant2_id if winner_was_p1 else node.participant1_id
+                        loser_name = (node.participant2_name if winner_was_p1 else node.participant1_name) or ""
+                        if drop_info["lb_slot"] == 1:
+                            lb_node.participant1_id = loser_id
+                            lb_node.participant1_name = loser_name
+                            touch(lb_node, ['participant1_id', 'participant1_name'])
+                        else:
+                            lb_node.participant2_id = loser_id
+                            lb_node.participant2_name = loser_name
+                            touch(lb_node, ['participant2_id', 'participant2_name'])
+                        reached[lb_node.id] = lb_node
+
+        # Keep pre-created parent matches in step with their nodes
+        parent_matches = Match.objects.in_bulk(
+            [node.match_id for node in advanced_parents.values() if node.match_id]
+        )
+        synced_matches = []
+        for node in advanced_parents.values():
+            parent_match = parent_matches.get(node.match_id)
+            if parent_match is None:
+                continue
+            before = (parent_match.participant1_id, parent_match.participant1_name or "",
+                      parent_match.participant2_id, parent_match.participant2_name or "")
+            after = (node.participant1_id, node.participant1_name or "",
+                     node.participant2_id, node.participant2_name or "")
+            if before != after:
+                (parent_match.participant1_id, parent_match.participant1_name,
+                 parent_match.participant2_id, parent_match.participant2_name) = after
+                parent_match.updated_at = timezone.now()
+                synced_matches.append(parent_match)
+        if synced_matches:
+            Match.objects.bulk_update(
+                synced_matches,
+                ['participant1_id', 'participant1_name', 'participant2_id', 'participant2_name', 'updated_at'],
+            )
+
+        # Create the next matches for nodes that now have both participants
+        ready = [node for node in reached.values() if node.has_both_participants and not node.match_id]
+        created = Match.objects.bulk_create([
+            Match(
+                tournament_id=node.bracket.tournament_id,
+                round_number=node.round_number,
+                match_number=node.match_number_in_round,
+                participant1_id=node.participant1_id,
+                participant2_id=node.participant2_id,
+                state=Match.SCHEDULED,
+            )
+            for node in ready
+        ])
+        for node, new_match in zip(ready, created):
+            node.match = new_match
+            touch(node, ['match'])
+            summaries[node.bracket_id].setdefault('next_matches', []).append({
+                'match_id': new_match.id,
+                'round': new_match.round_number,
+                'match_number': new_match.match_number,
+                'participant1_id': new_match.participant1_id,
+                'participant2_id': new_match.participant2_id,
+            })
+
+        dirty_nodes = [nodes[node_id] for node_id in dirty]
+        if dirty_nodes:
+            BracketNode.objects.bulk_update(
+                dirty_nodes, sorted(set().union(*dirty.values())), batch_size=500,
+            )
+
+        # bulk_create / bulk_update skip post_save, so maintain the participant index here
+        if created or synced_matches:
+            from apps.tournaments.services.match_participant_index import reindex_matches
+
+            reindex_matches([m.id for m in created] + [m.id for m in synced_matches])
+
+        payloads: Dict[int, Dict] = {}
+        for bracket_id, bracket in brackets.items():
+            summary = summaries[bracket_id]
+            next_matches = summary.get('next_matches', [])
+            bronze_match = BracketService._ensure_bronze_match_if_enabled(bracket)
+            if bronze_match:
+                next_matches.append({
+                    'match_id': bronze_match.id,
+                    'round': bronze_match.round_number,
+                    'match_number': bronze_match.match_number,
+                    'participant1_id': bronze_match.participant1_id,
+                    'participant2_id': bronze_match.participant2_id,
+                })
+            bracket_data = {
+                'bracket_id': bracket_id,
+                'tournament_id': bracket.tournament_id,
+                'updated_nodes': list(summary['updated_nodes']),
+                'next_matches': next_matches,
+                'advanced_matches': summary['advanced_matches'],
+                'bracket_status': 'completed' if 'finals_winner_id' in summary else bracket.status,
+                'updated_at': timezone.now().isoformat(),
+            }
+            for key in ('finals_winner_id', 'bronze_winner_id'):
+                if key in summary:
+                    bracket_data[key] = summary[key]
+            payloads[bracket_id] = bracket_data
+            try:
+                broadcast_bracket_updated(tournament_id=bracket.tournament_id, bracket_data=bracket_data)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to broadcast bracket_updated for bracket {bracket_id}: {e}",
+                    exc_info=True,
+                )
+
+        unlinked = set(by_id) - {node.match_id for node in linked}
+        if unlinked:
+            logger.info(f"{len(unlinked)} matches not linked to a bracket - skipping bracket update")
+        logger.info(
+            f"Advanced {len(linked)} matches across {len(brackets)} brackets "
+            f"({len(created)} next matches created)"
+        )
+        for tournament_id in sorted(tournament_ids):
+            BracketService._maybe_finalize_tournament(tournament_id)
+        return payloads
+
     @staticmethod
     @transaction.atomic
     def recalculate_bracket(tournament_id: int, force: bool = False) -> Bracket:
@@ -376,12 +376,21 @@ class RoundRobinStrategy(FormatStrategy):
             getattr(tournament, "tournament_start", None)
             or timezone.now()
         )
-        _Match.objects.filter(
-            tournament=tournament,
-            bracket__isnull=True,
-            scheduled_time__isnull=True,
-            is_deleted=False,
-        ).update(scheduled_time=default_time)
+        stamped_ids = list(
+            _Match.objects.filter(
+                tournament=tournament,
+                bracket__isnull=True,
+                scheduled_time__isnull=True,
+                is_deleted=False,
+            ).values_list("id", flat=True)
+        )
+        _Match.objects.filter(id__in=stamped_ids).update(scheduled_time=default_time)
+        # .update() skips post_save: refresh deadlines and the participant index
+        from apps.tournaments.services import lifecycle_scheduler
+        from apps.tournaments.services.match_participant_index import sync_scheduled_times
+
+        lifecycle_scheduler.sync_matches(stamped_ids)
+        sync_scheduled_times(stamped_ids)
 
         # ── Bust standings cache so the tab is live immediately ───────────────
         try:
@@ -29,6 +29,7 @@ from typing import List, Dict, Optional, Tuple
 from decimal import Decimal
 import functools
 import logging
+from django.core.cache import cache
 from django.db import transaction
 from django.core.exceptions import ValidationError
 from django.utils import timezone
@@ -47,6 +48,172 @@ from apps.tournaments.models import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_POINTS_SYSTEM = {'win': 3, 'draw': 1, 'loss': 0}
+DEFAULT_TIEBREAKER_RULES = ['points', 'wins', 'goal_difference', 'goals_for']
+STANDINGS_CONFIG_TTL = 300  # seconds
+
+STANDING_FIELDS = [
+    'rank',
+    'is_advancing',
+    'is_eliminated',
+    'matches_played',
+    'points',
+    'matches_won',
+    'matches_drawn',
+    'matches_lost',
+    'goals_for',
+    'goals_against',
+    'goal_difference',
+]
+
+
+# ---------------------------------------------------------------------------
+# Group standings helpers (shared by the rebuild and incremental paths)
+# ---------------------------------------------------------------------------
+
+
+def _participant_id(standing: GroupStanding) -> Optional[int]:
+    return standing.team_id if standing.team_id else standing.user_id
+
+
+def _reset_standing(standing: GroupStanding) -> None:
+    standing.matches_played = 0
+    standing.matches_won = 0
+    standing.matches_drawn = 0
+    standing.matches_lost = 0
+    standing.points = Decimal('0')
+    standing.goals_for = 0
+    standing.goals_against = 0
+    standing.goal_difference = 0
+
+
+def _ledger_entry(match: Match, points_system: Dict) -> List:
+    """What one completed match contributes: [p1, p2, s1, s2, winner, p1_points, p2_points]."""
+    p1_id, p2_id, winner_id = match.participant1_id, match.participant2_id, match.winner_id
+    if winner_id == p1_id:
+        awarded = (points_system['win'], points_system['loss'])
+    elif winner_id == p2_id:
+        awarded = (points_system['loss'], points_system['win'])
+    elif winner_id is None:
+        awarded = (points_system['draw'], points_system['draw'])
+    else:
+        awarded = (0, 0)
+    return [
+        p1_id,
+        p2_id,
+        match.participant1_score or 0,
+        match.participant2_score or 0,
+        winner_id,
+        str(awarded[0]),
+        str(awarded[1]),
+    ]
+
+
+def _fold_entry(standings: Dict[int, GroupStanding], entry: List, sign: int) -> None:
+    """Add (sign=1) or remove (sign=-1) one ledger entry from the standings."""
+    p1_id, p2_id, p1_score, p2_score, winner_id, p1_points, p2_points = entry
+    for own, opp, scored, conceded, points in (
+        (p1_id, p2_id, p1_score, p2_score, p1_points),
+        (p2_id, p1_id, p2_score, p1_score, p2_points),
+    ):
+        standing = standings.get(own)
+        if standing is None:
+            continue
+        if winner_id == own:
+            standing.matches_won += sign
+        elif winner_id == opp:
+            standing.matches_lost += sign
+        elif winner_id is None:
+            standing.matches_drawn += sign
+        standing.points = (standing.points or Decimal('0')) + sign * Decimal(str(points))
+        standing.goals_for += sign * scored
+        standing.goals_against += sign * conceded
+        standing.goal_difference = standing.goals_for - standing.goals_against
+        standing.matches_played = standing.matches_won + standing.matches_drawn + standing.matches_lost
+
+
+def _head_to_head_matrix(ledger: Dict[str, List]) -> Dict[Tuple[int, int], int]:
+    """h2h[(a, b)] = 1 if a beat b, -1 if b beat a, 0 if drawn (latest meeting wins)."""
+    h2h: Dict[Tuple[int, int], int] = {}
+    for key in sorted(ledger, key=int):
+        p1_id, p2_id, _, _, winner_id = ledger[key][:5]
+        if winner_id == p1_id:
+            h2h[(p1_id, p2_id)] = 1
+            h2h[(p2_id, p1_id)] = -1
+        elif winner_id == p2_id:
+            h2h[(p1_id, p2_id)] = -1
+            h2h[(p2_id, p1_id)] = 1
+        else:
+            h2h.setdefault((p1_id, p2_id), 0)
+            h2h.setdefault((p2_id, p1_id), 0)
+    return h2h
+
+
+def _standing_row(standing: GroupStanding, rank: int) -> Dict:
+    return {
+        "participant_id": _participant_id(standing),
+        "rank": rank,
+        "matches_played": standing.matches_played,
+        "points": standing.points,
+        "wins": standing.matches_won,
+        "draws": standing.matches_drawn,
+        "losses": standing.matches_lost,
+        "goals_for": standing.goals_for,
+        "goals_against": standing.goals_against,
+        "goal_diff": standing.goal_difference,
+        "scored_data": {},
+    }
+
+
+def _tiebreaker_val(data: Dict, rule: str):
+    """Return numeric value for a tiebreaker rule (higher = better)."""
+    if rule == 'points':
+        return data["points"]
+    if rule == 'wins':
+        return data["wins"]
+    if rule in ('goal_difference', 'score_difference'):
+        return data["goal_diff"]
+    if rule in ('goals_for', 'score_for'):
+        return data["goals_for"]
+    return 0
+
+
+def _rank_group(
+    group: Group,
+    standings: Dict[int, GroupStanding],
+    tiebreaker_rules: List[str],
+    h2h_results: Dict[Tuple[int, int], int],
+) -> List[Dict]:
+    """Sort by tiebreakers (comparator supports head-to-head) and stamp rank / advancement."""
+    def _cmp_standings(a, b):
+        for rule in tiebreaker_rules:
+            if rule in ('head_to_head', 'h2h'):
+                # Positive = a is ranked higher (better)
+                h2h = h2h_results.get((a["participant_id"], b["participant_id"]))
+                if h2h is not None and h2h != 0:
+                    return -h2h  # -1 means a beat b → a ranks first
+            else:
+                a_val = _tiebreaker_val(a, rule)
+                b_val = _tiebreaker_val(b, rule)
+                if a_val > b_val:
+                    return -1  # a ranks higher
+                if a_val < b_val:
+                    return 1   # b ranks higher
+        return 0
+
+    rows = sorted(
+        (_standing_row(standing, 0) for standing in standings.values()),
+        key=functools.cmp_to_key(_cmp_standings),
+    )
+    for rank, data in enumerate(rows, start=1):
+        data["rank"] = rank
+        standing = standings[data["participant_id"]]
+        standing.rank = rank
+        standing.is_advancing = rank <= group.advancement_count
+        standing.is_eliminated = rank > group.advancement_count
+    return rows
+
+
 
 class GroupStageService:
     """Service for group stage tournament logic."""
@@ -369,7 +536,7 @@ class GroupStageService:
 
         .. deprecated::
             Prefer ``calculate_group_standings(stage_id)`` (Epic 3.2) which uses
-            the correct ``state`` field, filters matches by ``lobby_info__group_id``,
+            the correct ``state`` field, filters matches by the ``group`` FK,
             and is driven by GameRulesEngine.  This method is retained for
             backwards-compat with any callers that predate Epic 3.2.
 
@@ -925,6 +1092,7 @@ class GroupStageService:
 
                     Match.objects.create(
                         tournament=stage.tournament,
+                        group=group,
                         participant1_id=home_id,
                         participant1_name=home_name,
                         participant2_id=away_id,
@@ -943,6 +1111,67 @@ class GroupStageService:
 
         return total_matches
     
+    @staticmethod
+    def _standings_config(stage=None, tournament_id: Optional[int] = None, refresh: bool = False) -> Tuple[Dict, List[str]]:
+        """
+        Resolve ``(points_system, tiebreaker_rules)`` for a group stage.
+
+        Priority: tournament config → game scoring rule → stage config → 3/1/0.
+        Resolved once per STANDINGS_CONFIG_TTL per tournament; ``refresh``
+        forces a fresh lookup (rebuild path).
+        """
+        from apps.tournaments.models import GroupStage
+        from apps.games.services.game_service import GameService
+
+        if tournament_id is None:
+            tournament_id = stage.tournament_id
+        cache_key = f'group_stage:standings_config:{tournament_id}'
+        if not refresh:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+        if stage is None:
+            stage = (
+                GroupStage.objects.select_related('tournament', 'tournament__game')
+                .filter(tournament_id=tournament_id)
+                .order_by('-created_at')
+                .first()
+            )
+            if stage is None:
+                return dict(DEFAULT_POINTS_SYSTEM), list(DEFAULT_TIEBREAKER_RULES)
+
+        game_slug = stage.tournament.game.slug
+        points_system = (stage.tournament.config or {}).get('points_system')
+
+        if not points_system:
+            try:
+                scoring_rules = GameService.get_scoring_rules(game_slug)
+                if scoring_rules:
+                    scoring_rule = scoring_rules[0]  # Highest priority
+                    points_system = scoring_rule.config.get('points_system')
+            except ValueError:
+                pass
+
+        if not points_system:
+            points_system = stage.config.get('points_system', DEFAULT_POINTS_SYSTEM)
+
+        points_system = {**DEFAULT_POINTS_SYSTEM, **(points_system or {})}
+
+        # Get tiebreaker rules from tournament config if available
+        try:
+            tournament_config = GameService.get_tournament_config_by_slug(game_slug)
+            if tournament_config and getattr(tournament_config, 'default_tiebreakers', None):
+                tiebreaker_rules = tournament_config.default_tiebreakers
+            else:
+                tiebreaker_rules = stage.config.get('tiebreaker_rules', DEFAULT_TIEBREAKER_RULES)
+        except (ValueError, AttributeError):
+            # Game or config not found, use defaults
+            tiebreaker_rules = stage.config.get('tiebreaker_rules', DEFAULT_TIEBREAKER_RULES)
+
+        resolved = (points_system, list(tiebreaker_rules))
+        cache.set(cache_key, resolved, STANDINGS_CONFIG_TTL)
+        return resolved
+
     @staticmethod
     def calculate_group_standings(
         stage_id: int,
@@ -952,6 +1181,11 @@ class GroupStageService:
         """
         Calculate standings for all groups in a stage (Epic 3.2).
         
+        Full rebuild from the groups' completed matches; also re-seeds each
+        group's ``head_to_head`` ledger. Single results are folded in by
+        ``apply_match_result``; use this path for repairs and stage-wide
+        recalculation.
+
         Integrates with GameRulesEngine for game-specific scoring logic.
         Uses GameService to retrieve scoring configuration for the tournament's game.
         
@@ -970,38 +1204,10 @@ class GroupStageService:
         """
         from apps.tournaments.models import GroupStage
         from apps.games.services.rules_engine import GameRulesEngine
-        from apps.games.services.game_service import GameService
         
         stage = GroupStage.objects.select_related('tournament', 'tournament__game').get(id=stage_id)
         game_slug = stage.tournament.game.slug
-        
-        default_points_system = {'win': 3, 'draw': 1, 'loss': 0}
-        points_system = (stage.tournament.config or {}).get('points_system')
-
-        if not points_system:
-            try:
-                scoring_rules = GameService.get_scoring_rules(game_slug)
-                if scoring_rules:
-                    scoring_rule = scoring_rules[0]  # Highest priority
-                    points_system = scoring_rule.config.get('points_system')
-            except ValueError:
-                pass
-
-        if not points_system:
-            points_system = stage.config.get('points_system', default_points_system)
-
-        points_system = {**default_points_system, **(points_system or {})}
-        
-        # Get tiebreaker rules from tournament config if available
-        try:
-            tournament_config = GameService.get_tournament_config_by_slug(game_slug)
-            if tournament_config and getattr(tournament_config, 'default_tiebreakers', None):
-                tiebreaker_rules = tournament_config.default_tiebreakers
-            else:
-                tiebreaker_rules = stage.config.get('tiebreaker_rules', ['points', 'wins', 'goal_difference', 'goals_for'])
-        except (ValueError, AttributeError):
-            # Game or config not found, use defaults
-            tiebreaker_rules = stage.config.get('tiebreaker_rules', ['points', 'wins', 'goal_difference', 'goals_for'])
+        points_system, tiebreaker_rules = GroupStageService._standings_config(stage, refresh=True)
         
         rules_engine = GameRulesEngine()
         groups_qs = Group.objects.filter(tournament=stage.tournament, is_deleted=False)
@@ -1022,35 +1228,28 @@ class GroupStageService:
         group_matches: Dict[int, List[Match]] = {group_id: [] for group_id in selected_group_ids}
         if selected_group_ids:
             matches_qs = Match.objects.filter(
-                tournament=stage.tournament,
-                lobby_info__group_id__in=selected_group_ids,
+                group_id__in=selected_group_ids,
                 state=Match.COMPLETED,
                 is_deleted=False,
             ).only(
                 'id',
-                'lobby_info',
+                'group_id',
                 'participant1_id',
                 'participant2_id',
                 'participant1_score',
                 'participant2_score',
                 'winner_id',
                 'state',
-            )
+            ).order_by('id')
             for match in matches_qs:
-                lobby = match.lobby_info or {}
-                raw_group_id = lobby.get('group_id')
-                try:
-                    match_group_id = int(raw_group_id)
-                except (TypeError, ValueError):
-                    continue
-                if match_group_id in group_matches:
-                    group_matches[match_group_id].append(match)
+                group_matches[match.group_id].append(match)
         
         result = {}
         
         for group in groups:
             matches = group_matches.get(group.id, [])
             standings_for_group = list(getattr(group, '_active_standings', []))
+            group.head_to_head = {}
             
             # If no completed matches exist, rank from pre-populated standings data
             # (manual entry, imports, or cancelled-match scenarios).
@@ -1074,19 +1273,7 @@ class GroupStageService:
                     standing.is_eliminated = rank > group.advancement_count
                     if needs_update:
                         standings_to_fix.append(standing)
-                    participant_id = standing.team_id if standing.team_id else standing.user_id
-                    existing_standings.append({
-                        "participant_id": participant_id,
-                        "rank": rank,
-                        "points": standing.points,
-                        "wins": standing.matches_won,
-                        "draws": standing.matches_drawn,
-                        "losses": standing.matches_lost,
-                        "goals_for": standing.goals_for,
-                        "goals_against": standing.goals_against,
-                        "goal_diff": standing.goal_difference,
-                        "scored_data": {},
-                    })
+                    existing_standings.append(_standing_row(standing, rank))
                 if standings_to_fix:
                     GroupStanding.objects.bulk_update(
                         standings_to_fix,
@@ -1095,177 +1282,67 @@ class GroupStageService:
                 result[group.id] = existing_standings
                 continue
             
-            # Initialize standings data
-            standings_data = {}
+            # Reset to zero and fold every completed match in, as apply_match_result
+            # does one match at a time
             standing_objects_by_participant: Dict[int, GroupStanding] = {}
             for standing in standings_for_group:
-                participant_id = standing.team_id if standing.team_id else standing.user_id
+                participant_id = _participant_id(standing)
                 if not participant_id:
                     continue
                 standing_objects_by_participant[participant_id] = standing
-                standings_data[participant_id] = {
-                    "participant_id": participant_id,
-                    "rank": 0,
-                    "matches_played": 0,
-                    "points": Decimal('0'),
-                    "wins": 0,
-                    "draws": 0,
-                    "losses": 0,
-                    "goals_for": 0,
-                    "goals_against": 0,
-                    "goal_diff": 0,
-                    "scored_data": {},  # Game-specific scoring data
-                }
+                _reset_standing(standing)
+            scored_data: Dict[int, Dict] = {pid: {} for pid in standing_objects_by_participant}
             
             # Process match results using GameRulesEngine
             for match in matches:
                 p1_id = match.participant1_id
                 p2_id = match.participant2_id
                 
-                if p1_id not in standings_data or p2_id not in standings_data:
+                if p1_id not in standing_objects_by_participant or p2_id not in standing_objects_by_participant:
                     continue
                 
-                # Score match using GameRulesEngine
-                # Build result_data from Match score fields
-                result_data = {
-                    "participant1_score": match.participant1_score,
-                    "participant2_score": match.participant2_score,
-                }
-                match_payload = {
-                    "participant1_id": p1_id,
-                    "participant2_id": p2_id,
-                    "result_data": result_data,
-                    "winner_id": match.winner_id,
-                }
-                
                 if include_scored_data:
+                    # Score match using GameRulesEngine
+                    # Build result_data from Match score fields
+                    match_payload = {
+                        "participant1_id": p1_id,
+                        "participant2_id": p2_id,
+                        "result_data": {
+                            "participant1_score": match.participant1_score,
+                            "participant2_score": match.participant2_score,
+                        },
+                        "winner_id": match.winner_id,
+                    }
                     try:
                         scoring_result = rules_engine.score_match(game_slug, match_payload)
                         # Store game-specific scoring breakdown
-                        standings_data[p1_id]["scored_data"][match.id] = scoring_result.get('participant1', {})
-                        standings_data[p2_id]["scored_data"][match.id] = scoring_result.get('participant2', {})
+                        scored_data[p1_id][match.id] = scoring_result.get('participant1', {})
+                        scored_data[p2_id][match.id] = scoring_result.get('participant2', {})
                     except Exception as e:
                         logger.warning(f"GameRulesEngine scoring failed for match {match.id}: {e}, using fallback")
                 
-                # Determine outcome
-                if match.winner_id == p1_id:
-                    standings_data[p1_id]["wins"] += 1
-                    standings_data[p1_id]["points"] += Decimal(str(points_system['win']))
-                    standings_data[p2_id]["losses"] += 1
-                    standings_data[p2_id]["points"] += Decimal(str(points_system['loss']))
-                elif match.winner_id == p2_id:
-                    standings_data[p2_id]["wins"] += 1
-                    standings_data[p2_id]["points"] += Decimal(str(points_system['win']))
-                    standings_data[p1_id]["losses"] += 1
-                    standings_data[p1_id]["points"] += Decimal(str(points_system['loss']))
-                elif match.winner_id is None and match.state == Match.COMPLETED:
-                    standings_data[p1_id]["draws"] += 1
-                    standings_data[p1_id]["points"] += Decimal(str(points_system['draw']))
-                    standings_data[p2_id]["draws"] += 1
-                    standings_data[p2_id]["points"] += Decimal(str(points_system['draw']))
-                
-                # Goal/score tracking from Match fields
-                p1_score = match.participant1_score or 0
-                p2_score = match.participant2_score or 0
-                standings_data[p1_id]["goals_for"] += p1_score
-                standings_data[p1_id]["goals_against"] += p2_score
-                standings_data[p2_id]["goals_for"] += p2_score
-                standings_data[p2_id]["goals_against"] += p1_score
-            
-            # Calculate goal difference
-            for data in standings_data.values():
-                data["goal_diff"] = data["goals_for"] - data["goals_against"]
-            
-            # Build head-to-head results map (Epic 3.5)
-            # h2h_results[(p1_id, p2_id)] = 1 if p1 won, -1 if p2 won, 0 if draw / no result
-            h2h_results: Dict = {}
-            for match in matches:
-                p1_id = match.participant1_id
-                p2_id = match.participant2_id
-                if match.winner_id == p1_id:
-                    h2h_results[(p1_id, p2_id)] = 1
-                    h2h_results[(p2_id, p1_id)] = -1
-                elif match.winner_id == p2_id:
-                    h2h_results[(p1_id, p2_id)] = -1
-                    h2h_results[(p2_id, p1_id)] = 1
-                else:
-                    h2h_results.setdefault((p1_id, p2_id), 0)
-                    h2h_results.setdefault((p2_id, p1_id), 0)
+                entry = _ledger_entry(match, points_system)
+                _fold_entry(standing_objects_by_participant, entry, 1)
+                group.head_to_head[str(match.id)] = entry
             
-            # Sort by tiebreakers using comparator (supports head-to-head, from config)
-            def _cmp_standings(a, b):
-                for rule in tiebreaker_rules:
-                    if rule in ('head_to_head', 'h2h'):
-                        # Positive = a is ranked higher (better)
-                        h2h = h2h_results.get((a["participant_id"], b["participant_id"]))
-                        if h2h is not None and h2h != 0:
-                            return -h2h  # -1 means a beat b → a ranks first
-                    else:
-                        a_val = _tiebreaker_val(a, rule)
-                        b_val = _tiebreaker_val(b, rule)
-                        if a_val > b_val:
-                            return -1  # a ranks higher
-                        if a_val < b_val:
-                            return 1   # b ranks higher
-                return 0
-            
-            def _tiebreaker_val(data, rule):
-                """Return numeric value for a tiebreaker rule (higher = better)."""
-                if rule == 'points':
-                    return data["points"]
-                if rule == 'wins':
-                    return data["wins"]
-                if rule in ('goal_difference', 'score_difference'):
-                    return data["goal_diff"]
-                if rule in ('goals_for', 'score_for'):
-                    return data["goals_for"]
-                return 0
-            
-            sorted_standings = sorted(
-                standings_data.values(),
-                key=functools.cmp_to_key(_cmp_standings),
+            sorted_standings = _rank_group(
+                group,
+                standing_objects_by_participant,
+                tiebreaker_rules,
+                _head_to_head_matrix(group.head_to_head),
             )
-            
-            # Assign ranks and update database
-            standings_to_update: List[GroupStanding] = []
-            for rank, data in enumerate(sorted_standings, start=1):
-                data["rank"] = rank
-                data["matches_played"] = data["wins"] + data["draws"] + data["losses"]
-                standing_obj = standing_objects_by_participant.get(data["participant_id"])
-                if not standing_obj:
-                    continue
-                standing_obj.rank = rank
-                standing_obj.is_advancing = rank <= group.advancement_count
-                standing_obj.is_eliminated = rank > group.advancement_count
-                standing_obj.matches_played = data["matches_played"]
-                standing_obj.points = data["points"]
-                standing_obj.matches_won = data["wins"]
-                standing_obj.matches_drawn = data["draws"]
-                standing_obj.matches_lost = data["losses"]
-                standing_obj.goals_for = data["goals_for"]
-                standing_obj.goals_against = data["goals_against"]
-                standing_obj.goal_difference = data["goal_diff"]
-                standings_to_update.append(standing_obj)
-
-            if standings_to_update:
+            for data in sorted_standings:
+                data["scored_data"] = scored_data.get(data["participant_id"], {})
+            if standing_objects_by_participant:
                 GroupStanding.objects.bulk_update(
-                    standings_to_update,
-                    fields=[
-                        'rank',
-                        'is_advancing',
-                        'is_eliminated',
-                        'matches_played',
-                        'points',
-                        'matches_won',
-                        'matches_drawn',
-                        'matches_lost',
-                        'goals_for',
-                        'goals_against',
-                        'goal_difference',
-                    ],
+                    list(standing_objects_by_participant.values()),
+                    fields=STANDING_FIELDS,
                 )
             
             result[group.id] = sorted_standings
+
+        if groups:
+            Group.objects.bulk_update(groups, fields=['head_to_head'])
         
         logger.info(
             "Calculated standings for %s groups in stage %s using GameRulesEngine%s",
@@ -1274,6 +1351,77 @@ class GroupStageService:
             "" if include_scored_data else " (scored_data skipped)",
         )
         return result
+
+    @staticmethod
+    def apply_match_result(match: Match) -> Optional[List[Dict]]:
+        """
+        Fold one match into its group's standings without rescanning the group.
+
+        Called when a group match completes, or leaves COMPLETED (reset). The
+        group's ``head_to_head`` ledger records what each match contributed,
+        so re-applying is a no-op and a changed or reverted result subtracts
+        the old contribution first. Head-to-head tiebreakers read the ledger
+        instead of the matches. A group without a ledger yet is rebuilt once
+        via ``calculate_group_standings``.
+
+        Returns:
+            The group's ranked standing dicts, or None if nothing changed.
+        """
+        if not match.group_id:
+            return None
+
+        with transaction.atomic():
+            group = Group.objects.select_for_update().filter(pk=match.group_id, is_deleted=False).first()
+            if group is None:
+                return None
+            ledger = dict(group.head_to_head or {})
+            if not ledger:
+                from apps.tournaments.models import GroupStage
+
+                stage_id = (
+                    GroupStage.objects.filter(tournament_id=group.tournament_id)
+                    .order_by('-created_at')
+                    .values_list('id', flat=True)
+                    .first()
+                )
+                if stage_id is None:
+                    return None
+                return GroupStageService.calculate_group_standings(
+                    stage_id, group_ids=[group.id], include_scored_data=False,
+                ).get(group.id)
+
+            points_system, tiebreaker_rules = GroupStageService._standings_config(tournament_id=group.tournament_id)
+            standings = {
+                _participant_id(standing): standing
+                for standing in GroupStanding.objects.filter(group=group, is_deleted=False)
+                if _participant_id(standing)
+            }
+
+            key = str(match.id)
+            old = ledger.get(key)
+            new = None
+            if (
+                match.state == Match.COMPLETED
+                and not match.is_deleted
+                and match.participant1_id in standings
+                and match.participant2_id in standings
+            ):
+                new = _ledger_entry(match, points_system)
+            if old == new:
+                return None
+
+            if old:
+                _fold_entry(standings, old, -1)
+                del ledger[key]
+            if new:
+                _fold_entry(standings, new, 1)
+                ledger[key] = new
+
+            ranked = _rank_group(group, standings, tiebreaker_rules, _head_to_head_matrix(ledger))
+            GroupStanding.objects.bulk_update(list(standings.values()), fields=STANDING_FIELDS)
+            group.head_to_head = ledger
+            group.save(update_fields=['head_to_head', 'updated_at'])
+        return ranked
     
     @staticmethod
     def export_standings(stage_id: int) -> dict:
@@ -0,0 +1,444 @@
+"""Due-time scheduling for time-based lifecycle actions.
+
+Each object with a pending deadline has one ``LifecycleDeadline`` row
+keyed by ``(kind, object_id)``:
+
+- ``tournament_advance`` — next registration / start / end threshold
+- ``match_timeout``      — no-show forfeit (READY/LIVE) or lobby close
+  (SCHEDULED/CHECK_IN)
+- ``payment_expiry``     — submitted payment past the payment deadline
+- ``submission_auto_confirm`` — result submission past its confirm deadline
+- ``dispute_escalation`` — open dispute past the escalation SLA
+
+Write paths:
+- ``sync`` — from post_save of the owning object (see signals.py); computes
+  the next due time from the saved state, or drops the row
+- ``sync_matches`` — after a bulk ``Match`` ``.update()`` (no signals)
+- ``resync_all`` — re-seeds every pending row (hourly full sweep)
+
+``run_due`` claims due rows with a lease (``SKIP LOCKED``), dispatches them
+on a bounded thread pool — rows of one tournament run serially in one lane —
+and recomputes each row from the object's new state afterwards: a resolved
+object drops its row, one that is still overdue (cooldown, failure) is
+retried with exponential backoff. Handlers re-check their condition against
+the database, so a stale or duplicate row is a no-op.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.tournaments.models import (
+    DisputeRecord,
+    LifecycleDeadline,
+    Match,
+    MatchResultSubmission,
+    Payment,
+    Tournament,
+)
+from apps.tournaments.services.match_lobby_service import LOBBY_CLOSES_AFTER_MINUTES
+
+logger = logging.getLogger(__name__)
+
+# Tournament statuses whose matches are subject to no-show / lobby timeouts
+# (same set the scanning tasks in tasks/no_show_timer.py use)
+MATCH_TIMEOUT_TOURNAMENT_STATUSES = ('registration_open', 'registration_closed', 'check_in', 'live')
+# SCHEDULED/CHECK_IN close with the lobby, READY/LIVE on the no-show timer
+MATCH_TIMEOUT_STATES = (Match.SCHEDULED, Match.CHECK_IN, Match.READY, Match.LIVE)
+SUBMISSION_PENDING_STATUSES = (MatchResultSubmission.STATUS_PENDING, 'pending_opponent')
+DISPUTE_PENDING_STATUSES = (DisputeRecord.OPEN, DisputeRecord.UNDER_REVIEW)
+
+MATCH_FIELDS = frozenset({'state', 'scheduled_time', 'is_deleted', 'tournament', 'tournament_id'})
+TOURNAMENT_FIELDS = frozenset({
+    'status', 'registration_start', 'registration_end', 'tournament_start', 'tournament_end', 'is_deleted',
+})
+TOURNAMENT_MATCH_FIELDS = frozenset({'status', 'enable_no_show_timer', 'no_show_timeout_minutes'})
+
+MAX_RETRY_SECONDS = 3600
+
+Due = Tuple[Optional[datetime], Optional[int]]  # (due_at, tournament_id)
+
+
+def enabled() -> bool:
+    return getattr(settings, 'LIFECYCLE_DEADLINE_INDEX_ENABLED', True)
+
+
+def _dispute_escalation_hours() -> int:
+    # Same source as tournament_ops.dispute_escalation_task
+    return int(os.getenv('DISPUTE_AUTO_ESCALATION_HOURS', '48'))
+
+
+# ---------------------------------------------------------------------------
+# Due-time rules
+# ---------------------------------------------------------------------------
+
+
+def tournament_due(tournament: Tournament, now: datetime) -> Due:
+    """Next threshold ``TournamentLifecycleService.auto_advance`` acts on."""
+    if tournament.is_deleted:
+        return None, tournament.id
+    status = tournament.status
+    due = None
+    if status == Tournament.PUBLISHED:
+        due = tournament.registration_start
+    elif status == Tournament.REGISTRATION_OPEN:
+        due = tournament.registration_end
+    elif status == Tournament.REGISTRATION_CLOSED:
+        reg_end, start = tournament.registration_end, tournament.tournament_start
+        if reg_end and now < reg_end and (not start or now < start):
+            due = now  # deadline extended: re-open
+        else:
+            due = start
+    elif status == Tournament.LIVE:
+        due = tournament.tournament_end
+    return due, tournament.id
+
+
+def match_due(match: Match, now: datetime) -> Due:
+    if match.is_deleted or not match.scheduled_time or match.state not in MATCH_TIMEOUT_STATES:
+        return None, match.tournament_id
+    tournament = match.tournament
+    if tournament.status not in MATCH_TIMEOUT_TOURNAMENT_STATUSES:
+        return None, match.tournament_id
+    if match.state in (Match.READY, Match.LIVE):
+        if not tournament.enable_no_show_timer:
+            return None, match.tournament_id
+        minutes = tournament.no_show_timeout_minutes or 5
+    else:
+        minutes = LOBBY_CLOSES_AFTER_MINUTES
+    return match.scheduled_time + timedelta(minutes=minutes), match.tournament_id
+
+
+def payment_due(payment: Payment, now: datetime) -> Due:
+    if payment.status != Payment.SUBMITTED or payment.is_deleted or not payment.submitted_at:
+        return None, None
+    tournament = payment.registration.tournament
+    if not tournament.has_entry_fee or not tournament.payment_deadline_hours:
+        return None, tournament.id
+    return payment.submitted_at + timedelta(hours=tournament.payment_deadline_hours), tournament.id
+
+
+def submission_due(submission: MatchResultSubmission, now: datetime) -> Due:
+    if submission.status not in SUBMISSION_PENDING_STATUSES or not submission.auto_confirm_deadline:
+        return None, None
+    return submission.auto_confirm_deadline, submission.match.tournament_id
+
+
+def dispute_due(dispute: DisputeRecord, now: datetime) -> Due:
+    if dispute.status not in DISPUTE_PENDING_STATUSES or dispute.is_deleted or not dispute.opened_at:
+        return None, None
+    due = dispute.opened_at + timedelta(hours=_dispute_escalation_hours())
+    return due, dispute.submission.match.tournament_id
+
+
+# ---------------------------------------------------------------------------
+# Handlers — re-check against the database and act; return an outcome label
+# ---------------------------------------------------------------------------
+
+
+def _advance_tournament(tournament: Tournament, now: datetime) -> str:
+    from apps.tournaments.services.lifecycle_service import TournamentLifecycleService
+
+    return TournamentLifecycleService.auto_advance(tournament) or 'noop'
+
+
+def _time_out_match(match: Match, now: datetime) -> str:
+    from apps.tournaments.tasks.no_show_timer import _auto_close_lobby, _auto_forfeit_match
+
+    with transaction.atomic():
+        match = Match.objects.select_for_update(of=('self',)).select_related('tournament').get(pk=match.pk)
+        due, _ = match_due(match, now)
+        if due is None or due > now:
+            return 'noop'
+        if match.state in (Match.READY, Match.LIVE):
+            _auto_forfeit_match(match, now)
+        else:
+            _auto_close_lobby(match, now)
+    return 'timed_out'
+
+
+def _expire_payment(payment: Payment, now: datetime) -> str:
+    from apps.tournaments.tasks.payment_expiry import _expire_payment as expire
+
+    with transaction.atomic():
+        payment = Payment.objects.select_for_update(of=('self',)).select_related(
+            'registration', 'registration__tournament',
+        ).get(pk=payment.pk)
+        due, _ = payment_due(payment, now)
+        if due is None or due > now:
+            return 'noop'
+        promoted = expire(payment, payment.registration.tournament.payment_deadline_hours, now)
+    return 'expired_promoted' if promoted else 'expired'
+
+
+def _auto_confirm_submission(submission: MatchResultSubmission, now: datetime) -> str:
+    from apps.tournament_ops.tasks_result_submission import auto_confirm_submission_task
+
+    result = auto_confirm_submission_task.apply(args=[submission.id]).result
+    return result.get('status', 'done') if isinstance(result, dict) else 'done'
+
+
+def _escalate_dispute(dispute: DisputeRecord, now: datetime) -> str:
+    from apps.tournament_ops.adapters import DisputeAdapter, ResultSubmissionAdapter
+    from apps.tournament_ops.services import DisputeService
+
+    DisputeService(
+        dispute_adapter=DisputeAdapter(),
+        result_submission_adapter=ResultSubmissionAdapter(),
+    ).escalate_dispute(dispute_id=dispute.id, escalated_by_user_id=None)
+    return 'escalated'
+
+
+def _load_match(object_id):
+    return Match.objects.select_related('tournament').filter(pk=object_id).first()
+
+
+def _load_payment(object_id):
+    return Payment.objects.select_related('registration__tournament').filter(pk=object_id).first()
+
+
+def _load_submission(object_id):
+    return MatchResultSubmission.objects.select_related('match').filter(pk=object_id).first()
+
+
+def _load_dispute(object_id):
+    return DisputeRecord.objects.select_related('submission__match').filter(pk=object_id).first()
+
+
+# kind -> (loader, due rule, handler)
+KINDS: Dict[str, Tuple[Callable[[int], Any], Callable[[Any, datetime], Due], Callable[[Any, datetime], str]]] = {
+    LifecycleDeadline.TOURNAMENT_ADVANCE: (
+        lambda object_id: Tournament.objects.filter(pk=object_id).first(), tournament_due, _advance_tournament,
+    ),
+    LifecycleDeadline.MATCH_TIMEOUT: (_load_match, match_due, _time_out_match),
+    LifecycleDeadline.PAYMENT_EXPIRY: (_load_payment, payment_due, _expire_payment),
+    LifecycleDeadline.SUBMISSION_AUTO_CONFIRM: (_load_submission, submission_due, _auto_confirm_submission),
+    LifecycleDeadline.DISPUTE_ESCALATION: (_load_dispute, dispute_due, _escalate_dispute),
+}
+
+
+# ---------------------------------------------------------------------------
+# Index maintenance
+# ---------------------------------------------------------------------------
+
+
+def _upsert(rows: List[LifecycleDeadline], release: bool = False) -> None:
+    fields = ['due_at', 'tournament_id', 'attempts']
+    if release:
+        fields.append('claimed_until')
+    LifecycleDeadline.objects.bulk_create(
+        rows,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=['kind', 'object_id'],
+        update_fields=fields,
+    )
+
+
+def schedule(kind: str, object_id: int, due_at: Optional[datetime], tournament_id: Optional[int] = None) -> None:
+    """Set the due time of ``(kind, object_id)``; ``None`` drops the row."""
+    if due_at is None:
+        LifecycleDeadline.objects.filter(kind=kind, object_id=object_id).delete()
+        return
+    _upsert([LifecycleDeadline(kind=kind, object_id=object_id, due_at=due_at, tournament_id=tournament_id)])
+
+
+def sync(kind: str, instance) -> None:
+    """Recompute the row for a saved object."""
+    if not enabled():
+        return
+    due_at, tournament_id = KINDS[kind][1](instance, timezone.now())
+    schedule(kind, instance.pk, due_at, tournament_id)
+
+
+def _sync_match_rows(matches: Iterable[Match], now: datetime) -> int:
+    rows, dropped = [], []
+    for match in matches:
+        due_at, tournament_id = match_due(match, now)
+        if due_at is None:
+            dropped.append(match.id)
+        else:
+            rows.append(LifecycleDeadline(
+                kind=LifecycleDeadline.MATCH_TIMEOUT, object_id=match.id, due_at=due_at, tournament_id=tournament_id,
+            ))
+    if dropped:
+        LifecycleDeadline.objects.filter(kind=LifecycleDeadline.MATCH_TIMEOUT, object_id__in=dropped).delete()
+    if rows:
+        _upsert(rows)
+    return len(rows)
+
+
+def sync_tournament_matches(tournament: Tournament) -> int:
+    """Recompute the match rows of one tournament (timeout settings or status changed)."""
+    if not enabled():
+        return 0
+    matches = list(
+        Match.objects.filter(
+            tournament_id=tournament.id,
+            state__in=MATCH_TIMEOUT_STATES,
+        ).only('id', 'tournament_id', 'state', 'scheduled_time', 'is_deleted')
+    )
+    for match in matches:
+        match.tournament = tournament
+    return _sync_match_rows(matches, timezone.now())
+
+
+def sync_matches(match_ids: Iterable[int]) -> int:
+    """Recompute the rows of ``match_ids`` after a bulk ``.update()`` bypassed post_save."""
+    match_ids = list(match_ids)
+    if not enabled() or not match_ids:
+        return 0
+    matches = Match.objects.filter(id__in=match_ids).select_related('tournament')
+    return _sync_match_rows(matches, timezone.now())
+
+
+def _pending_querysets() -> Iterable[Tuple[str, Any]]:
+    yield LifecycleDeadline.TOURNAMENT_ADVANCE, Tournament.objects.filter(
+        status__in=[Tournament.PUBLISHED, Tournament.REGISTRATION_OPEN, Tournament.REGISTRATION_CLOSED, Tournament.LIVE],
+        is_deleted=False,
+    )
+    yield LifecycleDeadline.MATCH_TIMEOUT, Match.objects.filter(
+        tournament__status__in=MATCH_TIMEOUT_TOURNAMENT_STATUSES,
+        state__in=MATCH_TIMEOUT_STATES,
+        scheduled_time__isnull=False,
+    ).select_related('tournament')
+    yield LifecycleDeadline.PAYMENT_EXPIRY, Payment.objects.filter(
+        status=Payment.SUBMITTED,
+        registration__tournament__has_entry_fee=True,
+        registration__tournament__payment_deadline_hours__gt=0,
+    ).select_related('registration__tournament')
+    yield LifecycleDeadline.SUBMISSION_AUTO_CONFIRM, MatchResultSubmission.objects.filter(
+        status__in=SUBMISSION_PENDING_STATUSES,
+    ).select_related('match')
+    yield LifecycleDeadline.DISPUTE_ESCALATION, DisputeRecord.objects.filter(
+        status__in=DISPUTE_PENDING_STATUSES,
+    ).select_related('submission__match')
+
+
+def resync_all() -> Dict[str, int]:
+    """Re-seed rows for every object with a pending deadline (hourly sweep)."""
+    now = timezone.now()
+    counts: Dict[str, int] = {}
+    for kind, queryset in _pending_querysets():
+        rule = KINDS[kind][1]
+        rows: List[LifecycleDeadline] = []
+        for obj in queryset.iterator(chunk_size=500):
+            due_at, tournament_id = rule(obj, now)
+            if due_at is not None:
+                rows.append(LifecycleDeadline(kind=kind, object_id=obj.pk, due_at=due_at, tournament_id=tournament_id))
+        if rows:
+            _upsert(rows)
+        counts[kind] = len(rows)
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Dispatch
+# ---------------------------------------------------------------------------
+
+
+def claim_due(limit: int, lease_seconds: int = 300) -> List[LifecycleDeadline]:
+    """Lease up to ``limit`` due rows; concurrent workers skip each other's rows."""
+    now = timezone.now()
+    with transaction.atomic():
+        rows = list(
+            LifecycleDeadline.objects.select_for_update(skip_locked=True)
+            .filter(due_at__lte=now)
+            .filter(Q(claimed_until__isnull=True) | Q(claimed_until__lt=now))
+            .order_by('due_at')[:limit]
+        )
+        if rows:
+            LifecycleDeadline.objects.filter(pk__in=[row.pk for row in rows]).update(
+                claimed_until=now + timedelta(seconds=lease_seconds),
+            )
+    return rows
+
+
+def _backoff(attempts: int) -> timedelta:
+    return timedelta(seconds=min(60 * 2 ** attempts, MAX_RETRY_SECONDS))
+
+
+def _settle(entry: LifecycleDeadline, obj, failed: bool) -> None:
+    """Recompute ``entry`` from its object's current state and release the lease."""
+    now = timezone.now()
+    due_at, tournament_id = (None, entry.tournament_id) if obj is None else KINDS[entry.kind][1](obj, now)
+    if due_at is None:
+        LifecycleDeadline.objects.filter(pk=entry.pk).delete()
+        return
+    attempts = 0
+    if failed or due_at <= now:
+        # Still overdue after dispatch (cooldown, blocked transition, error)
+        attempts = entry.attempts + 1
+        due_at = now + _backoff(entry.attempts)
+    _upsert(
+        [LifecycleDeadline(
+            kind=entry.kind, object_id=entry.object_id, due_at=due_at,
+            tournament_id=tournament_id, attempts=attempts, claimed_until=None,
+        )],
+        release=True,
+    )
+
+
+def dispatch(entry: LifecycleDeadline) -> str:
+    loader, rule, handler = KINDS[entry.kind]
+    obj = loader(entry.object_id)
+    if obj is None:
+        _settle(entry, None, failed=False)
+        return 'missing'
+    failed = False
+    try:
+        outcome = handler(obj, timezone.now())
+    except Exception:
+        logger.exception("[lifecycle_scheduler] %s:%s failed", entry.kind, entry.object_id)
+        outcome, failed = 'error', True
+    _settle(entry, loader(entry.object_id), failed)
+    return outcome
+
+
+def _run_lane(entries: List[LifecycleDeadline], threaded: bool) -> List[str]:
+    try:
+        return [dispatch(entry) for entry in entries]
+    finally:
+        if threaded:
+            connections.close_all()
+
+
+def run_due(limit: Optional[int] = None, concurrency: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Dispatch every due row (up to ``limit``).
+
+    Rows are grouped into lanes by tournament; lanes run on up to
+    ``concurrency`` threads, each with its own database connection.
+    """
+    limit = limit or getattr(settings, 'LIFECYCLE_DEADLINE_BATCH_SIZE', 200)
+    concurrency = concurrency or getattr(settings, 'LIFECYCLE_DEADLINE_CONCURRENCY', 4)
+    entries = claim_due(limit)
+    if not entries:
+        return {'claimed': 0, 'outcomes': {}}
+
+    lanes: Dict[Any, List[LifecycleDeadline]] = defaultdict(list)
+    for entry in entries:
+        lanes[entry.tournament_id or (entry.kind, entry.object_id)].append(entry)
+
+    workers = min(concurrency, len(lanes))
+    if workers <= 1:
+        results = [_run_lane(lane, threaded=False) for lane in lanes.values()]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='lifecycle') as pool:
+            results = list(pool.map(lambda lane: _run_lane(lane, threaded=True), lanes.values()))
+
+    outcomes: Dict[str, int] = defaultdict(int)
+    for lane in results:
+        for outcome in lane:
+            outcomes[outcome] += 1
+    return {'claimed': len(entries), 'lanes': len(lanes), 'outcomes': dict(outcomes)}
@@ -0,0 +1,289 @@
+"""Maintenance and reads for ``MatchParticipantIndex``.
+
+A user sees a match as a participant when a participant slot holds their
+user id (solo events) or the id of a team they are an ACTIVE member of.
+The tournament's ``participation_type`` says which of the two a slot holds;
+user and team ids share a numeric range, so the id alone cannot.
+That rule used to be evaluated per request as
+``Q(participant1_id__in=ids) | Q(participant2_id__in=ids)``; here it is
+evaluated once on write and stored per (user, match).
+
+Write paths:
+- ``reindex_matches`` — match created or re-slotted
+- ``sync_match_fields`` — state / scheduled_time changed only
+- ``reindex_team`` — roster changed
+- ``sync_scheduled_times`` — after a bulk ``scheduled_time`` ``.update()``
+
+``snapshot_match`` (pre_save) records the stored slot / state columns so a
+full ``Match.save()`` that touches neither costs nothing here.
+
+Bulk writes (``bulk_create``/``bulk_update``) bypass signals; run
+``manage.py rebuild_match_participant_index --check`` to detect drift.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import OuterRef, Q, Subquery
+
+from apps.organizations.models import TeamMembership
+from apps.tournaments.models import Match, MatchParticipantIndex, Tournament
+
+
+PARTICIPANT_FIELDS = frozenset({'participant1_id', 'participant2_id', 'participant1', 'participant2'})
+INDEXED_FIELDS = frozenset({'state', 'scheduled_time', 'is_deleted', 'tournament', 'tournament_id'})
+
+_SNAPSHOT_ATTR = '_participant_index_snapshot'
+_SLOT_COLUMNS = ('tournament_id', 'participant1_id', 'participant2_id', 'is_deleted')
+_SYNCED_COLUMNS = ('state', 'scheduled_time')
+
+_MATCH_COLUMNS = ('id', 'tournament_id', 'participant1_id', 'participant2_id', 'state', 'scheduled_time', 'is_deleted')
+
+
+def build_index_rows(matches: Iterable[Match]) -> List[MatchParticipantIndex]:
+    """Resolve participant slots to users with at most three queries for the whole batch."""
+    matches = [match for match in matches if not match.is_deleted]
+    if not matches:
+        return []
+    solo_tournament_ids = set(
+        Tournament.objects.filter(
+            id__in={match.tournament_id for match in matches},
+            participation_type=Tournament.SOLO,
+        ).values_list('id', flat=True)
+    )
+
+    player_ids: Set[int] = set()
+    team_ids: Set[int] = set()
+    for match in matches:
+        slots = player_ids if match.tournament_id in solo_tournament_ids else team_ids
+        slots.update(pid for pid in (match.participant1_id, match.participant2_id) if pid)
+
+    user_ids: Set[int] = set()
+    if player_ids:
+        user_ids = set(get_user_model().objects.filter(id__in=player_ids).values_list('id', flat=True))
+    members_by_team: Dict[int, List[int]] = defaultdict(list)
+    if team_ids:
+        for team_id, user_id in TeamMembership.objects.filter(
+            team_id__in=team_ids, status=TeamMembership.Status.ACTIVE,
+        ).values_list('team_id', 'user_id'):
+            members_by_team[team_id].append(user_id)
+
+    rows: List[MatchParticipantIndex] = []
+    for match in matches:
+        seen: Set[int] = set()
+        for side, participant_id in ((1, match.participant1_id), (2, match.participant2_id)):
+            if not participant_id:
+                continue
+            if match.tournament_id in solo_tournament_ids:
+                candidates = (
+                    [(participant_id, MatchParticipantIndex.VIA_PLAYER, None)]
+                    if participant_id in user_ids else []
+                )
+            else:
+                candidates = [
+                    (member_id, MatchParticipantIndex.VIA_TEAM, participant_id)
+                    for member_id in members_by_team.get(participant_id, ())
+                ]
+            for user_id, via, team_id in candidates:
+                if user_id in seen:
+                    continue
+                seen.add(user_id)
+                rows.append(MatchParticipantIndex(
+                    user_id=user_id,
+                    match_id=match.id,
+                    tournament_id=match.tournament_id,
+                    side=side,
+                    via=via,
+                    team_id=team_id,
+                    state=match.state,
+                    scheduled_time=match.scheduled_time,
+                ))
+    return rows
+
+
+def reindex_matches(match_ids: Iterable[int]) -> int:
+    """Replace the index rows of ``match_ids``. Returns rows written."""
+    match_ids = [match_id for match_id in set(match_ids) if match_id]
+    if not match_ids:
+        return 0
+    matches = Match.objects.filter(id__in=match_ids).only(*_MATCH_COLUMNS)
+    rows = build_index_rows(matches)
+    with transaction.atomic():
+        MatchParticipantIndex.objects.filter(match_id__in=match_ids).delete()
+        MatchParticipantIndex.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def sync_match_fields(match: Match) -> int:
+    """Copy state / scheduled_time onto existing rows (participants unchanged)."""
+    if match.is_deleted:
+        return MatchParticipantIndex.objects.filter(match_id=match.id).delete()[0]
+    return MatchParticipantIndex.objects.filter(match_id=match.id).update(
+        state=match.state,
+        scheduled_time=match.scheduled_time,
+    )
+
+
+def sync_scheduled_times(match_ids: Iterable[int]) -> int:
+    """Copy scheduled_time from the match rows in one UPDATE (bulk reschedules skip post_save)."""
+    match_ids = list(match_ids)
+    if not match_ids:
+        return 0
+    return MatchParticipantIndex.objects.filter(match_id__in=match_ids).update(
+        scheduled_time=Subquery(Match.objects.filter(id=OuterRef('match_id')).values('scheduled_time')[:1]),
+    )
+
+
+def reindex_team(team_id: int) -> int:
+    """Re-resolve every match a team played or is scheduled to play."""
+    if not team_id:
+        return 0
+    match_ids = set(
+        Match.objects.filter(Q(participant1_id=team_id) | Q(participant2_id=team_id)).values_list('id', flat=True)
+    )
+    match_ids.update(
+        MatchParticipantIndex.objects.filter(team_id=team_id).values_list('match_id', flat=True)
+    )
+    return reindex_matches(match_ids)
+
+
+def snapshot_match(match: Match, update_fields: Optional[Iterable[str]] = None) -> None:
+    """pre_save entry point: remember the stored slot and synced columns."""
+    if not match.pk or update_fields is not None:
+        match.__dict__.pop(_SNAPSHOT_ATTR, None)
+        return
+    stored = (
+        Match._base_manager.filter(pk=match.pk)
+        .values_list(*_SLOT_COLUMNS, *_SYNCED_COLUMNS)
+        .first()
+    )
+    if stored is None:
+        match.__dict__.pop(_SNAPSHOT_ATTR, None)
+    else:
+        match.__dict__[_SNAPSHOT_ATTR] = stored
+
+
+def handle_match_saved(match: Match, *, created: bool, update_fields: Optional[Iterable[str]] = None) -> None:
+    """post_save entry point: pick the cheapest maintenance path."""
+    snapshot = match.__dict__.pop(_SNAPSHOT_ATTR, None)
+    if not created and update_fields is not None:
+        update_fields = set(update_fields)
+        if not update_fields & (PARTICIPANT_FIELDS | INDEXED_FIELDS):
+            return
+        if not update_fields & PARTICIPANT_FIELDS and not update_fields & {'is_deleted', 'tournament', 'tournament_id'}:
+            sync_match_fields(match)
+            return
+    elif not created and snapshot is not None:
+        slots = tuple(getattr(match, column) for column in _SLOT_COLUMNS)
+        synced = tuple(getattr(match, column) for column in _SYNCED_COLUMNS)
+        if slots == snapshot[:len(_SLOT_COLUMNS)]:
+            if synced != snapshot[len(_SLOT_COLUMNS):]:
+                sync_match_fields(match)
+            return
+    reindex_matches([match.id])
+
+
+# ---------------------------------------------------------------------------
+# Reads
+# ---------------------------------------------------------------------------
+
+
+def match_ids_for_user(user, *, states: Optional[Iterable[str]] = None, tournament_id: Optional[int] = None):
+    """Index-backed subquery of the match ids visible to ``user``."""
+    rows = MatchParticipantIndex.objects.filter(user=user)
+    if states is not None:
+        rows = rows.filter(state__in=list(states))
+    if tournament_id is not None:
+        rows = rows.filter(tournament_id=tournament_id)
+    return rows.values('match_id')
+
+
+def matches_for_user(user, *, states: Optional[Iterable[str]] = None):
+    """Matches visible to ``user`` as a participant (soft-deleted excluded)."""
+    return Match.objects.filter(id__in=match_ids_for_user(user, states=states), is_deleted=False)
+
+
+def upcoming_matches_for_user(user, *, states: Iterable[str], limit: int = 20) -> List[Match]:
+    """Upcoming-first match list via one range scan on (user, state, scheduled_time)."""
+    ids = list(
+        MatchParticipantIndex.objects.filter(user=user, state__in=list(states))
+        .order_by('scheduled_time', 'match_id')
+        .values_list('match_id', flat=True)[:limit]
+    )
+    by_id = Match.objects.select_related('tournament').in_bulk(ids)
+    return [by_id[match_id] for match_id in ids if match_id in by_id and not by_id[match_id].is_deleted]
+
+
+# ---------------------------------------------------------------------------
+# Rebuild / consistency
+# ---------------------------------------------------------------------------
+
+
+def _row_key(row) -> tuple:
+    return (row.user_id, row.match_id, row.side, row.via, row.team_id, row.state, row.scheduled_time)
+
+
+def check_consistency(*, batch_size: int = 1000, repair: bool = False) -> Dict[str, int]:
+    """
+    Compare stored rows with freshly resolved rows, chunked by match id.
+
+    Returns counts of checked matches, missing rows, stale/extra rows and
+    matches repaired (when ``repair=True``).
+    """
+    report = {'matches_checked': 0, 'missing': 0, 'extra': 0, 'repaired_matches': 0}
+    last_id = 0
+    while True:
+        chunk = list(
+            Match.objects.filter(id__gt=last_id).only(*_MATCH_COLUMNS).order_by('id')[:batch_size]
+        )
+        if not chunk:
+            break
+        last_id = chunk[-1].id
+        chunk_ids = [match.id for match in chunk]
+
+        expected: Dict[int, Set[tuple]] = defaultdict(set)
+        for row in build_index_rows(chunk):
+            expected[row.match_id].add(_row_key(row))
+        actual: Dict[int, Set[tuple]] = defaultdict(set)
+        for row in MatchParticipantIndex.objects.filter(match_id__in=chunk_ids):
+            actual[row.match_id].add(_row_key(row))
+
+        drifted = []
+        for match_id in chunk_ids:
+            missing = expected[match_id] - actual[match_id]
+            extra = actual[match_id] - expected[match_id]
+            report['missing'] += len(missing)
+            report['extra'] += len(extra)
+            if missing or extra:
+                drifted.append(match_id)
+        report['matches_checked'] += len(chunk)
+        if repair and drifted:
+            reindex_matches(drifted)
+            report['repaired_matches'] += len(drifted)
+
+    # Rows whose match row is gone entirely (hard delete cascades, but be safe)
+    orphaned = MatchParticipantIndex.objects.exclude(match_id__in=Match.objects.values('id'))
+    orphan_count = orphaned.count()
+    report['extra'] += orphan_count
+    if repair and orphan_count:
+        orphaned.delete()
+    return report
+
+
+def rebuild_index(*, batch_size: int = 1000) -> int:
+    """Rebuild the whole index in match-id chunks. Returns rows written."""
+    written = 0
+    last_id = 0
+    while True:
+        ids = list(
+            Match.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        last_id = ids[-1]
+        written += reindex_matches(ids)
+    return written
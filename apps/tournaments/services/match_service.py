@@ -55,13 +55,13 @@ from apps.user_profile.integrations.tournaments import (
     on_dispute_resolved,
 )
 
-# Module 2.3: Real-time WebSocket broadcasting
-from apps.tournaments.realtime.utils import (
+# Module 2.3: Real-time WebSocket broadcasting (queued, released on commit)
+from apps.tournaments.realtime.broadcast_queue import (
     broadcast_match_started,
     broadcast_score_updated,
     broadcast_match_completed,
 )
-from asgiref.sync import async_to_sync  # Module 6.1: Wrap async broadcast helpers
+from asgiref.sync import async_to_sync  # noqa: F401 — legacy tests patch this name
 
 # Module 2.x: In-app notification dispatch
 from apps.notifications.services import notify as _notify_users
@@ -308,7 +308,7 @@ class MatchService:
         
         # Broadcast check-in update to tournament room (ADR-007)
         try:
-            from apps.tournaments.realtime.broadcast import broadcast_event
+            from apps.tournaments.realtime.broadcast_queue import broadcast_event
             broadcast_event(
                 tournament_id=match.tournament_id,
                 event_type='checkin_updated',
@@ -359,9 +359,9 @@ class MatchService:
         match.save()
         
         # Module 2.3: Broadcast match_started event to WebSocket clients
-        # Module 6.1: Wrap async broadcast with async_to_sync
+        # Queued: sent after commit by the broadcast queue
         try:
-            async_to_sync(broadcast_match_started)(
+            broadcast_match_started(
                 tournament_id=match.tournament_id,
                 match_data={
                     'match_id': match.id,
@@ -492,9 +492,9 @@ class MatchService:
         transaction.on_commit(_notify_profile)
         
         # Module 2.3: Broadcast score_updated event to WebSocket clients
-        # Module 6.1: Wrap async broadcast with async_to_sync
+        # Queued: sent after commit, coalesced per match
         try:
-            async_to_sync(broadcast_score_updated)(
+            broadcast_score_updated(
                 tournament_id=match.tournament_id,
                 score_data={
                     'match_id': match.id,
@@ -582,9 +582,9 @@ class MatchService:
         match.save()
         
         # Module 2.3: Broadcast match_completed event to WebSocket clients
-        # Module 6.1: Wrap async broadcast with async_to_sync
+        # Queued: sent after commit by the broadcast queue
         try:
-            async_to_sync(broadcast_match_completed)(
+            broadcast_match_completed(
                 tournament_id=match.tournament_id,
                 result_data={
                     'match_id': match.id,
@@ -734,8 +734,8 @@ class MatchService:
                 pass  # Non-blocking
         transaction.on_commit(_notify_profile)
 
-        # WebSocket broadcast - dispute_created event
-        from apps.tournaments.realtime.utils import broadcast_tournament_event
+        # WebSocket broadcast - dispute_created event (tournament + match rooms, after commit)
+        from apps.tournaments.realtime.broadcast_queue import broadcast_tournament_event, queue_group_send
 
         dispute_data = {
             'match_id': match.id,
@@ -752,19 +752,7 @@ class MatchService:
             event_type='dispute_created',
             data=dispute_data,
         )
-
-        from channels.layers import get_channel_layer
-        from asgiref.sync import async_to_sync
-
-        channel_layer = get_channel_layer()
-        if channel_layer:
-            try:
-                async_to_sync(channel_layer.group_send)(
-                    f'match_{match.id}',
-                    {'type': 'dispute_created', 'data': dispute_data},
-                )
-            except Exception as e:
-                logger.error(f"Failed to broadcast dispute_created to match room: {e}")
+        queue_group_send(f'match_{match.id}', {'type': 'dispute_created', 'data': dispute_data})
 
         # Notify tournament organizer
         try:
@@ -951,7 +939,7 @@ class MatchService:
 
         # Broadcast dispute_resolved event
         try:
-            from apps.tournaments.realtime.broadcast import broadcast_event
+            from apps.tournaments.realtime.broadcast_queue import broadcast_event
             broadcast_event(
                 tournament_id=match.tournament_id,
                 event_type='dispute_resolved',
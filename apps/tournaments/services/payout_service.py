@@ -9,20 +9,28 @@ Key Features:
 - Process refunds for cancelled tournaments
 - Verify payout reconciliation
 
+Payouts and refunds are planned in memory and written in bulk: one ordered
+lock over every recipient wallet, then bulk inserts for ledger and prize
+rows. Each run returns a PayoutDigest summarising what it wrote, so callers
+need not re-read the tournament's prize rows to confirm the totals.
+
 Source: PHASE_5_IMPLEMENTATION_PLAN.md Module 5.2
 ADR-001: Economy app decoupling (IntegerField references)
 """
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass, field
 from decimal import Decimal, ROUND_DOWN
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError, transaction
+from django.db import transaction
+from django.utils import timezone
 
 from apps.economy.models import DeltaCrownTransaction, DeltaCrownWallet
+from apps.economy.services import ledger
 from apps.tournaments.models import Tournament, Registration, TournamentResult, PrizeTransaction, Payment
 
 User = get_user_model()
@@ -30,8 +38,78 @@ logger = logging.getLogger(__name__)
 
 __all__ = [
     'PayoutService',
+    'PayoutDigest',
 ]
 
+# Rows per INSERT/UPDATE statement in the bulk writers
+BULK_BATCH_SIZE = 500
+
+
+@dataclass
+class PayoutLine:
+    """One planned credit: who is paid, how much, and under which key."""
+    registration: Registration
+    placement: str
+    amount: Decimal
+    reason: str
+    note: str
+    idempotency_key: str
+    prize_status: str
+    success_note: str
+    failure: Optional[str] = None
+    coin_tx: Optional[DeltaCrownTransaction] = None
+    coin_transaction_id: Optional[int] = None
+
+    @property
+    def amount_int(self) -> int:
+        # Delta Coins are stored as integers in economy
+        return int(self.amount)
+
+
+@dataclass
+class PayoutDigest:
+    """
+    Reconciliation summary built while a payout/refund batch is written.
+
+    ``ledger_total`` (sum of new ledger lines), ``balance_delta`` (sum of
+    wallet balance changes) and ``prize_total`` (prize amounts behind those
+    ledger lines) must agree for the batch to be reconciled. A fractional
+    prize amount, truncated to whole DC on the ledger, shows up here.
+    """
+    tournament_id: int
+    mode: str
+    transaction_ids: List[int] = field(default_factory=list)
+    ledger_lines: int = 0
+    already_recorded: int = 0
+    wallet_count: int = 0
+    ledger_total: int = 0
+    balance_delta: int = 0
+    prize_total: Decimal = Decimal('0.00')
+    failed: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def is_reconciled(self) -> bool:
+        return (
+            not self.failed
+            and self.ledger_total == self.balance_delta
+            and Decimal(self.ledger_total) == self.prize_total
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'tournament_id': self.tournament_id,
+            'mode': self.mode,
+            'transaction_ids': self.transaction_ids,
+            'ledger_lines': self.ledger_lines,
+            'already_recorded': self.already_recorded,
+            'wallet_count': self.wallet_count,
+            'ledger_total': self.ledger_total,
+            'balance_delta': self.balance_delta,
+            'prize_total': str(self.prize_total),
+            'failed': self.failed,
+            'is_reconciled': self.is_reconciled,
+        }
+
 
 class PayoutService:
     """
@@ -48,47 +126,6 @@ class PayoutService:
         'participation': PrizeTransaction.Placement.PARTICIPATION,
     }
 
-    @staticmethod
-    def _locked_wallet_for_profile(profile):
-        wallet, _ = DeltaCrownWallet.objects.get_or_create(profile=profile)
-        return DeltaCrownWallet.objects.select_for_update().get(pk=wallet.pk)
-
-    @classmethod
-    def _create_wallet_transaction(
-        cls,
-        *,
-        profile,
-        amount: int,
-        reason: str,
-        tournament_id: int,
-        registration_id: int,
-        note: str,
-        created_by: Optional[User],
-        idempotency_key: str,
-    ) -> Tuple[DeltaCrownTransaction, bool]:
-        wallet = cls._locked_wallet_for_profile(profile)
-        balance_after = int(wallet.cached_balance) + int(amount)
-
-        try:
-            coin_tx = DeltaCrownTransaction.objects.create(
-                wallet=wallet,
-                amount=int(amount),
-                reason=reason,
-                tournament_id=tournament_id,
-                registration_id=registration_id,
-                note=note,
-                created_by=created_by,
-                idempotency_key=idempotency_key,
-                cached_balance_after=balance_after,
-            )
-        except IntegrityError:
-            existing_tx = DeltaCrownTransaction.objects.get(idempotency_key=idempotency_key)
-            return existing_tx, False
-
-        wallet.cached_balance = balance_after
-        wallet.save(update_fields=['cached_balance', 'updated_at'])
-        return coin_tx, True
-    
     @classmethod
     def calculate_prize_distribution(
         cls,
@@ -193,40 +230,218 @@ class PayoutService:
             f"Got: {distribution_config}"
         )
     
+    # ------------------------------------------------------------------
+    # Bulk distribution engine
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _placement_reason(placement_key: str) -> str:
+        if placement_key == '1st':
+            return DeltaCrownTransaction.Reason.WINNER
+        if placement_key == '2nd':
+            return DeltaCrownTransaction.Reason.RUNNER_UP
+        return DeltaCrownTransaction.Reason.TOP4
+
+    @classmethod
+    def _write_plan(
+        cls,
+        tournament: Tournament,
+        lines: List[PayoutLine],
+        *,
+        mode: str,
+        processed_by: Optional[User],
+    ) -> PayoutDigest:
+        """
+        Write a distribution plan in one pass. Must run inside a transaction.
+
+        1. Lines whose (participant, placement) already has a PrizeTransaction
+           are skipped; completed ones contribute their ledger id.
+        2. Recipient wallets are created if missing, then locked with a
+           single SELECT ... FOR UPDATE ordered by pk (same deadlock-safe
+           order as transfer_dc).
+        3. Ledger lines, wallet balances, running ledger totals and
+           PrizeTransaction rows are written with bulk statements.
+        4. The digest is built from what was written, not re-read.
+
+        bulk_create fires no post_save, so the work those receivers would
+        do is queued for commit instead: analytics rollup, wallet -> profile
+        sync and the COINS_EARNED activity events.
+
+        A line that cannot be paid (no user, no profile, sub-1 DC amount) is
+        recorded as a FAILED PrizeTransaction. A database error aborts the
+        whole batch instead, so a retry starts from a clean slate.
+        """
+        digest = PayoutDigest(tournament_id=tournament.id, mode=mode)
+
+        # 1. Idempotency against earlier runs
+        existing = {
+            (prize.participant_id, prize.placement): prize
+            for prize in PrizeTransaction.objects.filter(
+                tournament=tournament,
+                participant_id__in={line.registration.id for line in lines},
+                placement__in={line.placement for line in lines},
+            )
+        }
+        pending: List[PayoutLine] = []
+        for line in lines:
+            prior = existing.get((line.registration.id, line.placement))
+            if prior is None:
+                pending.append(line)
+                continue
+            logger.info(
+                f"Tournament {tournament.id}: {mode} already recorded for Registration "
+                f"{line.registration.id} ({line.placement}), status={prior.status}"
+            )
+            if prior.coin_transaction_id and prior.status == line.prize_status:
+                line.coin_transaction_id = prior.coin_transaction_id
+                digest.already_recorded += 1
+
+        # 2. Recipients and their wallets
+        from apps.user_profile.models import UserProfile
+
+        profile_ids = dict(
+            UserProfile.objects.filter(
+                user_id__in={line.registration.user_id for line in pending if line.registration.user_id}
+            ).values_list('user_id', 'id')
+        )
+        for line in pending:
+            if not line.registration.user_id:
+                line.failure = f"Registration {line.registration.id} has no user"
+            elif line.registration.user_id not in profile_ids:
+                line.failure = f"User {line.registration.user_id} has no profile"
+            elif line.amount_int <= 0:
+                line.failure = f"Amount {line.amount} is less than 1 DC"
+        payable = [line for line in pending if not line.failure]
+
+        recipient_profiles = {profile_ids[line.registration.user_id] for line in payable}
+        DeltaCrownWallet.objects.bulk_create(
+            [DeltaCrownWallet(profile_id=profile_id) for profile_id in recipient_profiles],
+            ignore_conflicts=True,
+        )
+        wallets = {
+            wallet.profile_id: wallet
+            for wallet in DeltaCrownWallet.objects.select_for_update()
+            .filter(profile_id__in=recipient_profiles)
+            .order_by('pk')
+        }
+        opening = {wallet.pk: int(wallet.cached_balance) for wallet in wallets.values()}
+
+        # 3. Ledger lines (reusing any written under the same key earlier)
+        prior_ledger = {
+            tx.idempotency_key: tx
+            for tx in DeltaCrownTransaction.objects.filter(
+                idempotency_key__in=[line.idempotency_key for line in payable]
+            )
+        }
+        new_ledger: List[DeltaCrownTransaction] = []
+        for line in payable:
+            coin_tx = prior_ledger.get(line.idempotency_key)
+            if coin_tx is None:
+                wallet = wallets[profile_ids[line.registration.user_id]]
+                wallet.cached_balance = int(wallet.cached_balance) + line.amount_int
+                coin_tx = DeltaCrownTransaction(
+                    wallet=wallet,
+                    amount=line.amount_int,
+                    reason=line.reason,
+                    tournament_id=tournament.id,
+                    registration_id=line.registration.id,
+                    note=line.note,
+                    created_by=processed_by,
+                    idempotency_key=line.idempotency_key,
+                    cached_balance_after=wallet.cached_balance,
+                )
+                new_ledger.append(coin_tx)
+            line.coin_tx = coin_tx
+
+        ledger.apply_lines((coin_tx.wallet_id, coin_tx.amount) for coin_tx in new_ledger)
+        DeltaCrownTransaction.objects.bulk_create(new_ledger, batch_size=BULK_BATCH_SIZE)
+        for line in payable:
+            line.coin_transaction_id = line.coin_tx.id
+
+        touched = {coin_tx.wallet_id: coin_tx.wallet for coin_tx in new_ledger}
+        now = timezone.now()
+        for wallet in touched.values():
+            wallet.updated_at = now
+        DeltaCrownWallet.objects.bulk_update(
+            list(touched.values()), ['cached_balance', 'updated_at'], batch_size=BULK_BATCH_SIZE,
+        )
+
+        # 4. Prize audit rows
+        prize_rows = [
+            PrizeTransaction(
+                tournament=tournament,
+                participant=line.registration,
+                placement=line.placement,
+                amount=line.amount,
+                coin_transaction_id=line.coin_transaction_id,
+                status=line.prize_status,
+                processed_by=processed_by,
+                notes=f"{line.success_note}. Economy TX ID: {line.coin_transaction_id}",
+            )
+            for line in payable
+        ]
+        for line in pending:
+            if line.failure:
+                logger.error(
+                    f"Tournament {tournament.id}: {mode} failed for Registration "
+                    f"{line.registration.id} ({line.placement}): {line.failure}"
+                )
+                prize_rows.append(PrizeTransaction(
+                    tournament=tournament,
+                    participant=line.registration,
+                    placement=line.placement,
+                    amount=line.amount,
+                    coin_transaction_id=None,
+                    status=PrizeTransaction.Status.FAILED,
+                    processed_by=processed_by,
+                    notes=f"{mode.title()} failed: {line.failure}",
+                ))
+                digest.failed.append({
+                    'registration_id': line.registration.id,
+                    'placement': line.placement,
+                    'amount': str(line.amount),
+                    'reason': line.failure,
+                })
+        PrizeTransaction.objects.bulk_create(prize_rows, batch_size=BULK_BATCH_SIZE)
+
+        # bulk_create skips the post_save receivers these rows would fire
+        if prize_rows:
+            from apps.tournaments.services import analytics_rollup
+
+            analytics_rollup.mark_dirty_on_commit(tournament.id)
+        if touched:
+            from apps.user_profile.services.activity_service import UserActivityService
+            from apps.user_profile.services.economy_sync import sync_wallets_to_profiles
+
+            wallet_ids = list(touched)
+            ledger_ids = [coin_tx.id for coin_tx in new_ledger]
+            transaction.on_commit(lambda: sync_wallets_to_profiles(wallet_ids))
+            transaction.on_commit(lambda: UserActivityService.record_economy_transactions(ledger_ids))
+
+        # Digest, from what was just written
+        digest.transaction_ids = [line.coin_transaction_id for line in lines if line.coin_transaction_id]
+        digest.ledger_lines = len(new_ledger)
+        digest.ledger_total = sum(coin_tx.amount for coin_tx in new_ledger)
+        written = {id(coin_tx) for coin_tx in new_ledger}
+        digest.prize_total = sum(
+            (line.amount for line in payable if id(line.coin_tx) in written), Decimal('0.00')
+        )
+        digest.wallet_count = len(touched)
+        digest.balance_delta = sum(int(wallet.cached_balance) - opening[pk] for pk, wallet in touched.items())
+        logger.info(f"Tournament {tournament.id}: {mode} digest {digest.as_dict()}")
+        return digest
+
     @classmethod
     @transaction.atomic
-    def process_payouts(
+    def distribute_prizes(
         cls,
         tournament_id: int,
         processed_by: Optional[User] = None
-    ) -> List[int]:
+    ) -> PayoutDigest:
         """
-        Process prize payouts for a completed tournament.
-        
-        Preconditions:
-        - Tournament status must be COMPLETED
-        - TournamentResult must exist (from Module 5.1)
-        
-        For each placement (1st/2nd/3rd):
-        - Creates DeltaCrownTransaction via economy service (idempotent)
-        - Creates PrizeTransaction audit record
-        - Sets status='completed' on success, 'failed' on error (with notes)
-        
-        Args:
-            tournament_id: Tournament ID
-            processed_by: User who triggered the payout (optional)
-        
-        Returns:
-            List of DeltaCrownTransaction IDs created
-        
-        Raises:
-            ValidationError: If preconditions not met or distribution invalid
-        
-        Notes:
-            - Idempotency key pattern: prize_payout_t{t_id}_r{reg_id}_p{placement}
-            - If placement winner missing, skips that placement (logs warning)
-            - Economy call failures: sets status='failed' + notes, continues with others
-            - Method returns partial success list on failures
+        Pay out prizes for a completed tournament and return the write-time digest.
+
+        See process_payouts() for preconditions and idempotency rules.
         """
         # Validate preconditions
         try:
@@ -259,15 +474,17 @@ class PayoutService:
         except ValidationError as e:
             raise ValidationError(f"Invalid prize distribution: {e}")
         
-        created_transaction_ids: List[int] = []
-        
         # Map TournamentResult fields to placement keys
         placement_winners = {
             '1st': result.winner_id,
             '2nd': result.runner_up_id,
             '3rd': result.third_place_id,
         }
+        registrations = Registration.objects.in_bulk(
+            [registration_id for registration_id in placement_winners.values() if registration_id]
+        )
         
+        lines: List[PayoutLine] = []
         for placement_key, registration_id in placement_winners.items():
             if not registration_id:
                 logger.warning(
@@ -288,125 +505,74 @@ class PayoutService:
                 )
                 continue
             
-            # Get registration
-            try:
-                registration = Registration.objects.select_related('user').get(id=registration_id)
-            except Registration.DoesNotExist:
+            registration = registrations.get(registration_id)
+            if registration is None:
                 logger.error(
                     f"Tournament {tournament_id}: Registration {registration_id} not found for {placement_key}"
                 )
                 continue
             
-            # Idempotency: Check if PrizeTransaction already exists
-            placement_enum = cls.PLACEMENT_MAP[placement_key]
-            existing = PrizeTransaction.objects.filter(
-                tournament=tournament,
-                participant=registration,
-                placement=placement_enum
-            ).first()
-            
-            if existing:
-                logger.info(
-                    f"Tournament {tournament_id}: PrizeTransaction already exists for {placement_key} "
-                    f"(Registration {registration_id}), status={existing.status}"
-                )
-                if existing.coin_transaction_id and existing.status == PrizeTransaction.Status.COMPLETED:
-                    created_transaction_ids.append(existing.coin_transaction_id)
-                continue
-            
-            # Award via economy service
-            try:
-                if not registration.user_id:
-                    raise ValueError(f"Registration {registration_id} has no user")
-                profile = registration.user.profile
-                
-                # Idempotency key for economy service
-                idempotency_key = f"prize_payout_t{tournament_id}_r{registration_id}_p{placement_key}"
-                
-                # Convert Decimal to int (Delta Coins are stored as integers in economy)
-                amount_int = int(amount)
-                
-                # Atomic: both economy credit and prize audit record succeed or fail together
-                with transaction.atomic():
-                    coin_tx, _created = cls._create_wallet_transaction(
-                        profile=profile,
-                        amount=amount_int,
-                        reason=DeltaCrownTransaction.Reason.WINNER if placement_key == '1st' else (
-                            DeltaCrownTransaction.Reason.RUNNER_UP if placement_key == '2nd' else 
-                            DeltaCrownTransaction.Reason.TOP4
-                        ),
-                        tournament_id=tournament.id,
-                        registration_id=registration.id,
-                        note=f"Prize payout - {placement_key} place",
-                        created_by=processed_by,
-                        idempotency_key=idempotency_key,
-                    )
-                    
-                    # Create PrizeTransaction audit record
-                    prize_tx = PrizeTransaction.objects.create(
-                        tournament=tournament,
-                        participant=registration,
-                        placement=placement_enum,
-                        amount=amount,
-                        coin_transaction_id=coin_tx.id,  # IntegerField reference to economy
-                        status=PrizeTransaction.Status.COMPLETED,
-                        processed_by=processed_by,
-                        notes=f"Prize payout processed successfully. Economy TX ID: {coin_tx.id}"
-                    )
-                
-                created_transaction_ids.append(coin_tx.id)
-                logger.info(
-                    f"Tournament {tournament_id}: Created payout for {placement_key} place "
-                    f"(Registration {registration_id}, Amount: {amount}, Economy TX: {coin_tx.id})"
-                )
-            
-            except Exception as e:
-                # Economy call failed - create failed PrizeTransaction
-                logger.error(
-                    f"Tournament {tournament_id}: Payout failed for {placement_key} place "
-                    f"(Registration {registration_id}): {e}"
-                )
-                
-                PrizeTransaction.objects.create(
-                    tournament=tournament,
-                    participant=registration,
-                    placement=placement_enum,
-                    amount=amount,
-                    coin_transaction_id=None,
-                    status=PrizeTransaction.Status.FAILED,
-                    processed_by=processed_by,
-                    notes=f"Payout failed: {str(e)}"
-                )
-        
-        return created_transaction_ids
-    
+            lines.append(PayoutLine(
+                registration=registration,
+                placement=cls.PLACEMENT_MAP[placement_key],
+                amount=amount,
+                reason=cls._placement_reason(placement_key),
+                note=f"Prize payout - {placement_key} place",
+                idempotency_key=f"prize_payout_t{tournament_id}_r{registration_id}_p{placement_key}",
+                prize_status=PrizeTransaction.Status.COMPLETED,
+                success_note="Prize payout processed successfully",
+            ))
+        
+        return cls._write_plan(tournament, lines, mode='payout', processed_by=processed_by)
+
     @classmethod
-    @transaction.atomic
-    def process_refunds(
+    def process_payouts(
         cls,
         tournament_id: int,
         processed_by: Optional[User] = None
     ) -> List[int]:
         """
-        Process refunds for a cancelled tournament.
+        Process prize payouts for a completed tournament.
         
-        Refunds verified DeltaCoin payments only, using the original debit
-        transaction amount.
+        Preconditions:
+        - Tournament status must be COMPLETED
+        - TournamentResult must exist (from Module 5.1)
+        
+        For each placement (1st/2nd/3rd), in one bulk write (see _write_plan):
+        - Creates a DeltaCrownTransaction credit (idempotent)
+        - Creates a PrizeTransaction audit record
+        - Sets status='completed' on success, 'failed' (with notes) when the
+          recipient cannot be paid
         
         Args:
             tournament_id: Tournament ID
-            processed_by: User who triggered refunds (optional)
+            processed_by: User who triggered the payout (optional)
         
         Returns:
             List of DeltaCrownTransaction IDs created
         
         Raises:
-            ValidationError: If tournament not found or not cancelled
+            ValidationError: If preconditions not met or distribution invalid
         
         Notes:
-            - Idempotency key pattern: prize_refund_t{t_id}_r{reg_id}
-            - Creates PrizeTransaction with status='refunded' and placement='participation'
-            - Only processes confirmed registrations that paid with DeltaCoin
+            - Idempotency key pattern: prize_payout_t{t_id}_r{reg_id}_p{placement}
+            - If placement winner missing, skips that placement (logs warning)
+            - Use distribute_prizes() for the reconciliation digest
+        """
+        return cls.distribute_prizes(tournament_id, processed_by).transaction_ids
+
+    @classmethod
+    @transaction.atomic
+    def distribute_refunds(
+        cls,
+        tournament_id: int,
+        processed_by: Optional[User] = None
+    ) -> PayoutDigest:
+        """
+        Refund DeltaCoin entry fees for a cancelled tournament and return the
+        write-time digest.
+
+        See process_refunds() for preconditions and idempotency rules.
         """
         try:
             tournament = Tournament.objects.get(id=tournament_id)
@@ -419,29 +585,37 @@ class PayoutService:
                 f"Current status: {tournament.status}"
             )
         
-        payments = Payment.objects.filter(
+        payments = list(Payment.objects.filter(
             registration__tournament=tournament,
             registration__status=Registration.CONFIRMED,
             payment_method=Payment.DELTACOIN,
             status=Payment.VERIFIED,
-        ).select_related('registration__user')
+        ).select_related('registration'))
 
-        if not payments.exists():
+        if not payments:
             logger.info(
                 f"Tournament {tournament_id}: No verified DeltaCoin payments, no refunds to process"
             )
-            return []
+            return PayoutDigest(tournament_id=tournament_id, mode='refund')
         
-        created_transaction_ids: List[int] = []
+        # Original entry-fee debits, one query for the whole field
+        entry_keys = {
+            payment.registration_id: f"tournament_entry_{tournament_id}_reg_{payment.registration_id}"
+            for payment in payments
+        }
+        original_debits = {
+            tx.idempotency_key: tx
+            for tx in DeltaCrownTransaction.objects.filter(
+                idempotency_key__in=entry_keys.values(),
+                amount__lt=0,
+                reason=DeltaCrownTransaction.Reason.ENTRY_FEE_DEBIT,
+            )
+        }
         
+        lines: List[PayoutLine] = []
         for payment in payments:
             registration = payment.registration
-            original_idempotency_key = f"tournament_entry_{tournament_id}_reg_{registration.id}"
-            original_tx = DeltaCrownTransaction.objects.filter(
-                idempotency_key=original_idempotency_key,
-                amount__lt=0,
-                reason=DeltaCrownTransaction.Reason.ENTRY_FEE_DEBIT,
-            ).first()
+            original_tx = original_debits.get(entry_keys[registration.id])
             if original_tx is None:
                 logger.warning(
                     f"Tournament {tournament_id}: Missing original DeltaCoin debit for "
@@ -450,80 +624,49 @@ class PayoutService:
                 continue
 
             amount_int = abs(int(original_tx.amount))
-            refund_amount = Decimal(str(amount_int))
+            lines.append(PayoutLine(
+                registration=registration,
+                placement=PrizeTransaction.Placement.PARTICIPATION,  # Refunds use 'participation'
+                amount=Decimal(str(amount_int)),
+                reason=DeltaCrownTransaction.Reason.REFUND,
+                note="Entry fee refund - tournament cancelled",
+                idempotency_key=f"prize_refund_t{tournament_id}_r{registration.id}",
+                prize_status=PrizeTransaction.Status.REFUNDED,
+                success_note="Entry fee refund processed",
+            ))
+        
+        return cls._write_plan(tournament, lines, mode='refund', processed_by=processed_by)
 
-            # Idempotency: Check if refund PrizeTransaction already exists
-            existing = PrizeTransaction.objects.filter(
-                tournament=tournament,
-                participant=registration,
-                placement=PrizeTransaction.Placement.PARTICIPATION,
-                status=PrizeTransaction.Status.REFUNDED
-            ).first()
-            
-            if existing:
-                logger.info(
-                    f"Tournament {tournament_id}: Refund already processed for Registration {registration.id}"
-                )
-                if existing.coin_transaction_id:
-                    created_transaction_ids.append(existing.coin_transaction_id)
-                continue
-            
-            # Award via economy service (positive amount = credit)
-            try:
-                if not registration.user_id:
-                    raise ValueError(f"Registration {registration.id} has no user")
-                profile = registration.user.profile
-                
-                # Idempotency key for economy service
-                idempotency_key = f"prize_refund_t{tournament_id}_r{registration.id}"
-                
-                coin_tx, _created = cls._create_wallet_transaction(
-                    profile=profile,
-                    amount=amount_int,
-                    reason=DeltaCrownTransaction.Reason.REFUND,
-                    tournament_id=tournament.id,
-                    registration_id=registration.id,
-                    note=f"Entry fee refund - tournament cancelled",
-                    created_by=processed_by,
-                    idempotency_key=idempotency_key,
-                )
-                
-                # Create PrizeTransaction audit record
-                prize_tx = PrizeTransaction.objects.create(
-                    tournament=tournament,
-                    participant=registration,
-                    placement=PrizeTransaction.Placement.PARTICIPATION,  # Refunds use 'participation'
-                    amount=refund_amount,
-                    coin_transaction_id=coin_tx.id,
-                    status=PrizeTransaction.Status.REFUNDED,
-                    processed_by=processed_by,
-                    notes=f"Entry fee refund processed. Economy TX ID: {coin_tx.id}"
-                )
-                
-                created_transaction_ids.append(coin_tx.id)
-                logger.info(
-                    f"Tournament {tournament_id}: Refund processed for Registration {registration.id} "
-                    f"(Amount: {refund_amount}, Economy TX: {coin_tx.id})"
-                )
-            
-            except Exception as e:
-                # Economy call failed - create failed refund record
-                logger.error(
-                    f"Tournament {tournament_id}: Refund failed for Registration {registration.id}: {e}"
-                )
-                
-                PrizeTransaction.objects.create(
-                    tournament=tournament,
-                    participant=registration,
-                    placement=PrizeTransaction.Placement.PARTICIPATION,
-                    amount=refund_amount,
-                    coin_transaction_id=None,
-                    status=PrizeTransaction.Status.FAILED,
-                    processed_by=processed_by,
-                    notes=f"Refund failed: {str(e)}"
-                )
+    @classmethod
+    def process_refunds(
+        cls,
+        tournament_id: int,
+        processed_by: Optional[User] = None
+    ) -> List[int]:
+        """
+        Process refunds for a cancelled tournament.
+        
+        Refunds verified DeltaCoin payments only, using the original debit
+        transaction amount. All refunds are written in one bulk pass (see
+        _write_plan).
+        
+        Args:
+            tournament_id: Tournament ID
+            processed_by: User who triggered refunds (optional)
         
-        return created_transaction_ids
+        Returns:
+            List of DeltaCrownTransaction IDs created
+        
+        Raises:
+            ValidationError: If tournament not found or not cancelled
+        
+        Notes:
+            - Idempotency key pattern: prize_refund_t{t_id}_r{reg_id}
+            - Creates PrizeTransaction with status='refunded' and placement='participation'
+            - Only processes confirmed registrations that paid with DeltaCoin
+            - Use distribute_refunds() for the reconciliation digest
+        """
+        return cls.distribute_refunds(tournament_id, processed_by).transaction_ids
     
     @classmethod
     def verify_payout_reconciliation(cls, tournament_id: int) -> Tuple[bool, Dict[str, any]]:
@@ -599,27 +742,27 @@ class PayoutService:
             report['error'] = f'Invalid distribution: {e}'
             return False, report
         
-        # Get all PrizeTransactions for this tournament
-        prize_txs = PrizeTransaction.objects.filter(tournament=tournament).select_related('participant')
+        # Get all PrizeTransactions for this tournament (one query; checked in memory)
+        prize_txs = list(PrizeTransaction.objects.filter(tournament=tournament))
         
         # Check for completed payouts
         for placement_key in report['expected_placements']:
             placement_enum = cls.PLACEMENT_MAP[placement_key]
             
             # Find completed transactions for this placement
-            completed = prize_txs.filter(
-                placement=placement_enum,
-                status=PrizeTransaction.Status.COMPLETED
-            )
+            completed = [
+                tx for tx in prize_txs
+                if tx.placement == placement_enum and tx.status == PrizeTransaction.Status.COMPLETED
+            ]
             
-            if completed.count() == 0:
+            if not completed:
                 report['missing_payouts'].append(placement_key)
-            elif completed.count() > 1:
+            elif len(completed) > 1:
                 # Duplicate check
-                report['duplicate_checks'][placement_key] = completed.count()
+                report['duplicate_checks'][placement_key] = len(completed)
             else:
                 # Check amount match
-                tx = completed.first()
+                tx = completed[0]
                 expected_amount = expected_distribution.get(placement_key, Decimal('0.00'))
                 if tx.amount != expected_amount:
                     report['amount_mismatches'].append({
@@ -632,8 +775,9 @@ class PayoutService:
                     report['completed_payouts'][placement_key] = tx.amount
         
         # Check for failed transactions
-        failed = prize_txs.filter(status=PrizeTransaction.Status.FAILED)
-        for tx in failed:
+        for tx in prize_txs:
+            if tx.status != PrizeTransaction.Status.FAILED:
+                continue
             report['failed_transactions'].append({
                 'id': tx.id,
                 'placement': tx.placement,
@@ -64,6 +64,11 @@ from django.db import transaction, models, IntegrityError
 from django.utils import timezone
 from django.db.models import Count, Q
 from apps.tournaments.models import Registration, Payment, Tournament
+from apps.tournaments.services.registration_slots import (
+    mark_reserved,
+    next_waitlist_position,
+    reserve_slot,
+)
 from apps.user_profile.integrations.tournaments import (
     on_registration_status_change,
     on_payment_status_change,
@@ -151,10 +156,14 @@ class RegistrationService:
             ...         'notes': 'Looking forward to competing!'
             ...     }
             ... )
+        
+        Capacity is claimed through ``RegistrationSlotCounter`` as the last
+        step before the INSERT (see services.registration_slots); eligibility,
+        auto-fill and duplicate checks run without holding any lock.
         """
-        # Get tournament with lock for capacity checks
+        # No row lock here: capacity is claimed on the slot counter below
         try:
-            tournament = Tournament.objects.select_related('game').select_for_update().get(id=tournament_id)
+            tournament = Tournament.objects.select_related('game').get(id=tournament_id)
         except Tournament.DoesNotExist:
             raise ValidationError(f"Tournament with ID {tournament_id} not found")
         
@@ -198,22 +207,6 @@ class RegistrationService:
                 exclude_user=user,
             )
         
-        # Determine registration status based on capacity
-        current_registrations = Registration.objects.filter(
-            tournament=tournament,
-            status__in=[Registration.PENDING, Registration.PAYMENT_SUBMITTED, Registration.CONFIRMED],
-            is_deleted=False,
-        ).count()
-        
-        at_capacity = current_registrations >= tournament.max_participants
-        
-        if is_guest_team:
-            initial_status = Registration.PENDING  # Guest teams always start as PENDING for review
-        elif at_capacity:
-            initial_status = Registration.WAITLISTED
-        else:
-            initial_status = Registration.PENDING
-
         reusable_registration = RegistrationService._find_reusable_registration(
             tournament=tournament,
             user=user,
@@ -228,7 +221,7 @@ class RegistrationService:
             registration.user = user if (is_guest_team or not team_id) else None
             registration.team_id = team_id if not is_guest_team else None
             registration.registration_data = merged_data
-            registration.status = initial_status
+            registration.status = Registration.PENDING
             registration.is_guest_team = is_guest_team
             registration.checked_in = False
             registration.checked_in_at = None
@@ -298,21 +291,25 @@ class RegistrationService:
                 user=user if (is_guest_team or not team_id) else None,
                 team_id=team_id if not is_guest_team else None,
                 registration_data=merged_data,
-                status=initial_status,
+                status=Registration.PENDING,
                 is_guest_team=is_guest_team,
             )
         
-        # Assign waitlist position if waitlisted
-        if initial_status == Registration.WAITLISTED:
-            last_position = Registration.objects.filter(
-                tournament=tournament,
-                status=Registration.WAITLISTED,
-                is_deleted=False,
-            ).aggregate(max_pos=models.Max('waitlist_position'))['max_pos'] or 0
-            registration.waitlist_position = last_position + 1
-        
-        # Validate
+        # Validate before claiming so the counter lock covers only the INSERT
         registration.full_clean()
+        
+        # Critical section: claim a slot or join the waitlist. The counter row
+        # stays locked until commit; a failed claim also serializes waitlist
+        # positions for this tournament.
+        if is_guest_team:
+            initial_status = Registration.PENDING  # Guest teams always start as PENDING for review
+        elif reserve_slot(tournament.id, tournament.max_participants):
+            initial_status = Registration.PENDING
+            mark_reserved(registration)
+        else:
+            initial_status = Registration.WAITLISTED
+            registration.waitlist_position = next_waitlist_position(tournament.id)
+        registration.status = initial_status
         registration.save()
         
         # Publish registration.created event + UserProfile activity tracking
@@ -874,20 +871,7 @@ class RegistrationService:
         Raises:
             ValidationError: If registration cannot be promoted
         """
-        tournament = Tournament.objects.select_for_update().get(id=tournament_id)
-        
-        # Check if there's room
-        active_count = Registration.objects.filter(
-            tournament=tournament,
-            status__in=[Registration.PENDING, Registration.PAYMENT_SUBMITTED, Registration.CONFIRMED],
-            is_deleted=False,
-        ).count()
-        
-        if active_count >= tournament.max_participants:
-            raise ValidationError(
-                "Cannot promote from waitlist: tournament is still at capacity. "
-                "Free one slot first (cancel/reject/disqualify an active registration), then promote again."
-            )
+        tournament = Tournament.objects.get(id=tournament_id)
         
         if registration_id:
             reg = Registration.objects.select_for_update().get(
@@ -907,10 +891,18 @@ class RegistrationService:
         if not reg:
             return None
         
+        # Claim the freed slot (the counter lock also covers the reorder below)
+        if not reserve_slot(tournament.id, tournament.max_participants):
+            raise ValidationError(
+                "Cannot promote from waitlist: tournament is still at capacity. "
+                "Free one slot first (cancel/reject/disqualify an active registration), then promote again."
+            )
+        
         # Promote
         old_position = reg.waitlist_position
         reg.status = Registration.PENDING
         reg.waitlist_position = None
+        mark_reserved(reg)
         reg.save(update_fields=['status', 'waitlist_position'])
         
         # Reorder remaining waitlist positions
@@ -2511,36 +2503,29 @@ class RegistrationService:
     @staticmethod
     def _promote_from_waitlist(tournament: Tournament):
         """Promote next waitlisted registration if space available"""
-        # Count active registrations
-        active_count = Registration.objects.filter(
+        # Get next waitlisted registration
+        next_waitlist = Registration.objects.select_for_update().filter(
             tournament=tournament,
-            status__in=[Registration.PENDING, Registration.PAYMENT_SUBMITTED, Registration.CONFIRMED],
+            status=Registration.WAITLISTED,
             is_deleted=False
-        ).count()
-        
-        # Check if space available
-        if active_count < tournament.max_participants:
-            # Get next waitlisted registration
-            next_waitlist = Registration.objects.filter(
-                tournament=tournament,
-                status=Registration.WAITLISTED,
-                is_deleted=False
-            ).order_by('registered_at').first()
-            
-            if next_waitlist:
-                next_waitlist.status = Registration.PENDING
-                if not hasattr(next_waitlist, 'promoted_from_waitlist_at'):
-                    next_waitlist.registration_data['promoted_from_waitlist_at'] = timezone.now().isoformat()
-                next_waitlist.save()
+        ).order_by('registered_at').first()
+        
+        # Check if space available (claims the slot on success)
+        if next_waitlist and reserve_slot(tournament.id, tournament.max_participants):
+            next_waitlist.status = Registration.PENDING
+            mark_reserved(next_waitlist)
+            if not hasattr(next_waitlist, 'promoted_from_waitlist_at'):
+                next_waitlist.registration_data['promoted_from_waitlist_at'] = timezone.now().isoformat()
+            next_waitlist.save()
 
-                # Notify participant about promotion
-                try:
-                    from apps.tournaments.services.notification_service import TournamentNotificationService
-                    deadline_hours = tournament.payment_deadline_hours or 48
-                    payment_deadline = timezone.now() + timezone.timedelta(hours=deadline_hours)
-                    TournamentNotificationService.notify_waitlist_promotion(next_waitlist, payment_deadline)
-                except Exception as _e:
-                    logger.warning("Failed to send waitlist promotion notification: %s", _e)
+            # Notify participant about promotion
+            try:
+                from apps.tournaments.services.notification_service import TournamentNotificationService
+                deadline_hours = tournament.payment_deadline_hours or 48
+                payment_deadline = timezone.now() + timezone.timedelta(hours=deadline_hours)
+                TournamentNotificationService.notify_waitlist_promotion(next_waitlist, payment_deadline)
+            except Exception as _e:
+                logger.warning("Failed to send waitlist promotion notification: %s", _e)
     
     @staticmethod
     @transaction.atomic
@@ -0,0 +1,210 @@
+"""Registration capacity via ``RegistrationSlotCounter``.
+
+Claiming a slot is one conditional UPDATE::
+
+    UPDATE ... SET reserved = reserved + 1
+    WHERE tournament_id = %s AND reserved < capacity
+
+The row lock it takes is held until the caller's transaction commits, so
+callers claim as the last step before writing the Registration — all
+validation and profile auto-fill happen before it. Concurrent claimants
+queue on this one row instead of the Tournament row, and PostgreSQL
+re-checks ``reserved < capacity`` after the wait, so the counter can never
+pass capacity.
+
+When the UPDATE matches nothing (tournament full, or no counter row yet)
+the claimant locks the counter and recounts active registrations before
+deciding. Every in-flight claim holds that lock until commit, so the
+recount is exact; it both self-heals a counter that drifted high and
+serializes the waitlist path (callers that fail a claim may assign
+``waitlist_position`` without further locking).
+
+Write paths:
+- ``reserve_slot`` — register / promote; mark the instance with
+  ``mark_reserved`` so the save signal does not count it twice
+- ``handle_registration_saved`` / ``handle_registration_deleted`` — any
+  other transition into or out of an active status (cancel, reject,
+  withdraw, disqualify, admin edits)
+
+``QuerySet.update()`` bypasses signals; run
+``manage.py rebuild_registration_slots --check`` to detect drift.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional
+
+from django.db import transaction
+from django.db.models import Count, F, Max, Value
+from django.db.models.functions import Greatest
+
+from apps.tournaments.models import Registration, RegistrationSlotCounter
+
+
+ACTIVE_STATUSES = frozenset({
+    Registration.PENDING,
+    Registration.PAYMENT_SUBMITTED,
+    Registration.CONFIRMED,
+})
+SLOT_FIELDS = frozenset({'status', 'is_deleted'})
+
+_RESERVED_ATTR = '_slot_reserved'
+_WAS_ACTIVE_ATTR = '_slot_was_active'
+
+
+def is_active(registration: Registration) -> bool:
+    return registration.status in ACTIVE_STATUSES and not registration.is_deleted
+
+
+def count_active(tournament_id: int) -> int:
+    return Registration.objects.filter(
+        tournament_id=tournament_id,
+        status__in=ACTIVE_STATUSES,
+        is_deleted=False,
+    ).count()
+
+
+def _locked_counter(tournament_id: int) -> RegistrationSlotCounter:
+    RegistrationSlotCounter.objects.get_or_create(tournament_id=tournament_id)
+    return RegistrationSlotCounter.objects.select_for_update().get(tournament_id=tournament_id)
+
+
+def reserve_slot(tournament_id: int, capacity: int) -> bool:
+    """
+    Claim one slot if fewer than ``capacity`` are reserved.
+
+    Must run inside ``transaction.atomic()``; a rollback returns the slot.
+    Returns False when the tournament is full — the counter row stays
+    locked until commit.
+    """
+    claimed = RegistrationSlotCounter.objects.filter(
+        tournament_id=tournament_id,
+        reserved__lt=capacity,
+    ).update(reserved=F('reserved') + 1)
+    if claimed:
+        return True
+
+    counter = _locked_counter(tournament_id)
+    actual = count_active(tournament_id)
+    has_room = actual < capacity
+    reserved = actual + 1 if has_room else actual
+    if counter.reserved != reserved:
+        counter.reserved = reserved
+        counter.save(update_fields=['reserved', 'updated_at'])
+    return has_room
+
+
+def release_slot(tournament_id: int, count: int = 1) -> None:
+    """Return ``count`` slots (never below zero)."""
+    RegistrationSlotCounter.objects.filter(tournament_id=tournament_id).update(
+        reserved=Greatest(F('reserved') - count, Value(0)),
+    )
+
+
+def _occupy_slot(tournament_id: int) -> None:
+    """Count a registration that became active without claiming (may exceed capacity)."""
+    if RegistrationSlotCounter.objects.filter(tournament_id=tournament_id).update(
+        reserved=F('reserved') + 1,
+    ):
+        return
+    # No counter yet: the recount already includes the saved registration
+    counter = _locked_counter(tournament_id)
+    counter.reserved = count_active(tournament_id)
+    counter.save(update_fields=['reserved', 'updated_at'])
+
+
+def mark_reserved(registration: Registration) -> None:
+    """Flag ``registration`` as already counted by ``reserve_slot``."""
+    setattr(registration, _RESERVED_ATTR, True)
+
+
+def next_waitlist_position(tournament_id: int) -> int:
+    """Next FIFO position; call after a failed ``reserve_slot`` in the same transaction."""
+    last_position = Registration.objects.filter(
+        tournament_id=tournament_id,
+        status=Registration.WAITLISTED,
+        is_deleted=False,
+    ).aggregate(max_pos=Max('waitlist_position'))['max_pos'] or 0
+    return last_position + 1
+
+
+# ---------------------------------------------------------------------------
+# Signal handlers
+# ---------------------------------------------------------------------------
+
+
+def snapshot_registration(registration: Registration, update_fields: Optional[Iterable[str]] = None) -> None:
+    """Pre-save: remember whether the stored row held a slot."""
+    if update_fields is not None and not SLOT_FIELDS.intersection(update_fields):
+        setattr(registration, _WAS_ACTIVE_ATTR, None)
+        return
+    was_active = False
+    if registration.pk:
+        stored = Registration._base_manager.filter(pk=registration.pk).values_list('status', 'is_deleted').first()
+        was_active = bool(stored) and stored[0] in ACTIVE_STATUSES and not stored[1]
+    setattr(registration, _WAS_ACTIVE_ATTR, was_active)
+
+
+def handle_registration_saved(registration: Registration) -> None:
+    """Post-save: apply the slot delta of a status / soft-delete transition."""
+    was_active = registration.__dict__.pop(_WAS_ACTIVE_ATTR, None)
+    reserved = registration.__dict__.pop(_RESERVED_ATTR, False)
+    if was_active is None:
+        return
+    now_active = is_active(registration)
+    if now_active and not was_active:
+        if not reserved:
+            _occupy_slot(registration.tournament_id)
+    elif was_active and not now_active:
+        release_slot(registration.tournament_id)
+    elif reserved and not now_active:
+        # Claimed but saved inactive: hand the slot back
+        release_slot(registration.tournament_id)
+
+
+def handle_registration_deleted(registration: Registration) -> None:
+    """Post-delete: a hard-deleted active registration frees its slot."""
+    if is_active(registration):
+        release_slot(registration.tournament_id)
+
+
+# ---------------------------------------------------------------------------
+# Repair
+# ---------------------------------------------------------------------------
+
+
+def check_counters(tournament_ids: Optional[Iterable[int]] = None, repair: bool = False) -> Dict[str, int]:
+    """
+    Compare stored counters with live active counts.
+
+    Returns:
+        dict with checked / drifted / missing / repaired counts
+    """
+    actual_qs = Registration.objects.filter(status__in=ACTIVE_STATUSES, is_deleted=False)
+    counter_qs = RegistrationSlotCounter.objects.all()
+    if tournament_ids is not None:
+        tournament_ids = list(tournament_ids)
+        actual_qs = actual_qs.filter(tournament_id__in=tournament_ids)
+        counter_qs = counter_qs.filter(tournament_id__in=tournament_ids)
+
+    actual = dict(
+        actual_qs.order_by().values('tournament_id').annotate(n=Count('id')).values_list('tournament_id', 'n')
+    )
+    stored = dict(counter_qs.values_list('tournament_id', 'reserved'))
+
+    report = {'checked': len(set(actual) | set(stored)), 'drifted': 0, 'missing': 0, 'repaired': 0}
+    for tournament_id in set(actual) | set(stored):
+        expected = actual.get(tournament_id, 0)
+        if tournament_id not in stored:
+            report['missing'] += 1
+        elif stored[tournament_id] != expected:
+            report['drifted'] += 1
+        else:
+            continue
+        if repair:
+            with transaction.atomic():
+                counter = _locked_counter(tournament_id)
+                counter.reserved = count_active(tournament_id)
+                counter.save(update_fields=['reserved', 'updated_at'])
+            report['repaired'] += 1
+    return report
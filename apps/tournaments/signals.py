@@ -28,12 +28,24 @@ Planning Documents:
 
 import logging
 from django.db import transaction
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.conf import settings
 
 from apps.common.signals import make_status_tracker
-from apps.tournaments.models import PaymentVerification, Match, Tournament, FormResponse
+from apps.organizations.models import TeamMembership
+from apps.tournaments.models import (
+    DisputeRecord,
+    FormResponse,
+    LifecycleDeadline,
+    Match,
+    MatchResultSubmission,
+    Payment,
+    PaymentVerification,
+    PrizeTransaction,
+    Registration,
+    Tournament,
+)
 from apps.notifications.services import notify
 
 logger = logging.getLogger(__name__)
@@ -307,6 +319,44 @@ def handle_match_state_change(sender, instance, created, **kwargs):
                 logger.error(f"Failed to queue Discord match result: {e}")
 
 
+def _apply_group_result(match):
+    try:
+        from apps.tournaments.services.group_stage_service import GroupStageService
+
+        GroupStageService.apply_match_result(match)
+    except Exception as exc:
+        logger.warning(
+            "Group standings update failed (non-critical). match_id=%s err=%s",
+            match.id,
+            exc,
+        )
+
+
+def _recalculate_legacy_group(match, match_group_id):
+    """Matches tagged only via lobby_info (group row missing): recompute that group."""
+    try:
+        from apps.tournaments.models.group import GroupStage
+        from apps.tournaments.services.group_stage_service import GroupStageService
+
+        tournament = match.tournament
+        stage = GroupStage.objects.filter(tournament=tournament).order_by('-created_at').first()
+        if stage:
+            GroupStageService.calculate_group_standings(
+                stage.id,
+                group_ids=[match_group_id],
+                include_scored_data=False,
+            )
+        else:
+            game_slug = getattr(getattr(tournament, 'game', None), 'slug', '') or ''
+            GroupStageService.calculate_standings(group_id=match_group_id, game_slug=game_slug)
+    except Exception as exc:
+        logger.warning(
+            "Group standings recalculation failed (non-critical). match_id=%s err=%s",
+            match.id,
+            exc,
+        )
+
+
 @receiver(post_save, sender=Match)
 def sync_match_completion_progression(sender, instance, created, **kwargs):
     """
@@ -325,9 +375,16 @@ def sync_match_completion_progression(sender, instance, created, **kwargs):
     old_state = instance._original_state
     new_state = instance.state
     if old_state == new_state:
+        if new_state == Match.COMPLETED and instance.group_id:
+            # Score or winner corrected after completion — swap the old
+            # ledger contribution for the new one (no-op when unchanged)
+            _apply_group_result(instance)
         return
 
     if new_state not in (Match.COMPLETED, Match.FORFEIT):
+        if old_state == Match.COMPLETED and instance.group_id:
+            # Result reset — take it back out of the group standings
+            _apply_group_result(instance)
         return
 
     lobby_info = instance.lobby_info or {}
@@ -351,39 +408,19 @@ def sync_match_completion_progression(sender, instance, created, **kwargs):
                 exc,
             )
 
-    # 2) Recalculate group standings (non-critical — warn only on failure).
-    try:
-        from apps.tournaments.models.group import Group, GroupStage
-        from apps.tournaments.services.group_stage_service import GroupStageService
+    # 2) Update group standings (non-critical — warn only on failure).
+    if instance.group_id:
+        # Incremental: folds just this result into the group's standings
+        _apply_group_result(instance)
+    else:
+        from apps.tournaments.models.group import Group
 
-        tournament = instance.tournament
-        groups = Group.objects.filter(
-            tournament=tournament,
-            is_deleted=False,
-        )
-        if not groups.exists():
+        if not Group.objects.filter(tournament_id=instance.tournament_id, is_deleted=False).exists():
             return
-
-        stage = GroupStage.objects.filter(tournament=tournament).order_by('-created_at').first()
         if match_group_id is not None:
-            # Only recompute the specific group containing this match.
-            if stage:
-                GroupStageService.calculate_group_standings(
-                    stage.id,
-                    group_ids=[match_group_id],
-                    include_scored_data=False,
-                )
-            else:
-                game_slug = getattr(getattr(tournament, 'game', None), 'slug', '') or ''
-                GroupStageService.calculate_standings(group_id=match_group_id, game_slug=game_slug)
+            _recalculate_legacy_group(instance, match_group_id)
         # When match_group_id is None the match is not part of the group
         # stage (e.g. knockout round); skip the expensive full-stage recalc.
-    except Exception as exc:
-        logger.warning(
-            "Group standings recalculation failed (non-critical). match_id=%s err=%s",
-            instance.id,
-            exc,
-        )
 
     # 3) Auto-transition to knockout when all group matches are complete (CRITICAL).
     try:
@@ -454,6 +491,26 @@ track_match_state_change = make_status_tracker('state', '_original_state')
 pre_save.connect(track_match_state_change, sender=Match)
 
 
+@receiver(pre_save, sender=Match, dispatch_uid='match_group_from_lobby_info')
+def attach_match_group(sender, instance, **kwargs):
+    """Mirror ``lobby_info['group_id']`` onto the indexed ``group`` FK.
+
+    Group fixtures are tagged in lobby_info by older writers; standings and
+    TOC counts read the FK.
+    """
+    if instance.group_id is not None or instance.bracket_id is not None:
+        return
+    lobby_info = instance.lobby_info if isinstance(instance.lobby_info, dict) else {}
+    try:
+        group_id = int(lobby_info['group_id'])
+    except (KeyError, TypeError, ValueError):
+        return
+    from apps.tournaments.models.group import Group
+
+    if Group.all_objects.filter(pk=group_id, tournament_id=instance.tournament_id).exists():
+        instance.group_id = group_id
+
+
 # ===========================
 # Tournament Notification Signals
 # ===========================
@@ -753,3 +810,202 @@ def convert_form_response_to_registration(sender, instance, created, **kwargs):
             f"Failed to convert FormResponse to Registration: form_response_id={instance.id}, "
             f"error='{str(e)}'"
         )
+
+
+# ===========================
+# Match Participant Index Maintenance
+# ===========================
+
+@receiver(pre_save, sender=Match, dispatch_uid='match_participant_index_match_snapshot')
+def snapshot_match_participants(sender, instance, update_fields=None, **kwargs):
+    from apps.tournaments.services.match_participant_index import snapshot_match
+
+    snapshot_match(instance, update_fields=update_fields)
+
+
+@receiver(post_save, sender=Match, dispatch_uid='match_participant_index_match_saved')
+def maintain_match_participant_index(sender, instance, created, update_fields=None, **kwargs):
+    """Keep MatchParticipantIndex in step with match slots, state and schedule."""
+    from apps.tournaments.services.match_participant_index import handle_match_saved
+
+    try:
+        handle_match_saved(instance, created=created, update_fields=update_fields)
+    except Exception:
+        logger.exception("Failed to maintain participant index for match %s", instance.pk)
+
+
+def _reindex_team_on_commit(team_id):
+    from apps.tournaments.services.match_participant_index import reindex_team
+
+    def _run():
+        try:
+            reindex_team(team_id)
+        except Exception:
+            logger.exception("Failed to reindex matches for team %s", team_id)
+
+    transaction.on_commit(_run)
+
+
+@receiver(post_save, sender=TeamMembership, dispatch_uid='match_participant_index_roster_saved')
+def reindex_matches_on_roster_save(sender, instance, created, update_fields=None, **kwargs):
+    """Roster joins / leaves change who sees a team's matches."""
+    if update_fields is not None and 'status' not in update_fields and not created:
+        return
+    _reindex_team_on_commit(instance.team_id)
+
+
+@receiver(post_delete, sender=TeamMembership, dispatch_uid='match_participant_index_roster_deleted')
+def reindex_matches_on_roster_delete(sender, instance, **kwargs):
+    _reindex_team_on_commit(instance.team_id)
+
+
+# ===========================
+# Registration Slot Counter Maintenance
+# ===========================
+
+@receiver(pre_save, sender=Registration, dispatch_uid='registration_slots_snapshot')
+def snapshot_registration_slot(sender, instance, update_fields=None, **kwargs):
+    from apps.tournaments.services.registration_slots import snapshot_registration
+
+    snapshot_registration(instance, update_fields=update_fields)
+
+
+@receiver(post_save, sender=Registration, dispatch_uid='registration_slots_saved')
+def maintain_registration_slots(sender, instance, **kwargs):
+    """Keep RegistrationSlotCounter in step with transitions into / out of active statuses.
+
+    Runs inside the caller's transaction so the counter commits or rolls back
+    with the registration; errors propagate rather than leave it skewed.
+    """
+    from apps.tournaments.services.registration_slots import handle_registration_saved
+
+    handle_registration_saved(instance)
+
+
+@receiver(post_delete, sender=Registration, dispatch_uid='registration_slots_deleted')
+def release_registration_slot(sender, instance, **kwargs):
+    from apps.tournaments.services.registration_slots import handle_registration_deleted
+
+    handle_registration_deleted(instance)
+
+
+# ===========================
+# Lifecycle Deadline Index
+# ===========================
+
+def _sync_lifecycle_deadline(kind, instance):
+    """Recompute one due-time row; a failure must not abort the caller's save.
+
+    The hourly full sweep re-seeds anything missed here.
+    """
+    from apps.tournaments.services import lifecycle_scheduler
+
+    try:
+        with transaction.atomic():
+            lifecycle_scheduler.sync(kind, instance)
+    except Exception:
+        logger.exception("Failed to schedule %s deadline for %s", kind, instance.pk)
+
+
+@receiver(post_save, sender=Tournament, dispatch_uid='lifecycle_deadline_tournament_saved')
+def schedule_tournament_deadlines(sender, instance, created, update_fields=None, **kwargs):
+    from apps.tournaments.services import lifecycle_scheduler
+
+    changed = None if update_fields is None else set(update_fields)
+    if changed is None or changed & lifecycle_scheduler.TOURNAMENT_FIELDS:
+        _sync_lifecycle_deadline(LifecycleDeadline.TOURNAMENT_ADVANCE, instance)
+    if not created and (changed is None or changed & lifecycle_scheduler.TOURNAMENT_MATCH_FIELDS):
+        try:
+            with transaction.atomic():
+                lifecycle_scheduler.sync_tournament_matches(instance)
+        except Exception:
+            logger.exception("Failed to schedule match deadlines for tournament %s", instance.pk)
+
+
+@receiver(post_save, sender=Match, dispatch_uid='lifecycle_deadline_match_saved')
+def schedule_match_deadline(sender, instance, created, update_fields=None, **kwargs):
+    from apps.tournaments.services.lifecycle_scheduler import MATCH_FIELDS
+
+    if created or update_fields is None or set(update_fields) & MATCH_FIELDS:
+        _sync_lifecycle_deadline(LifecycleDeadline.MATCH_TIMEOUT, instance)
+
+
+@receiver(post_save, sender=Payment, dispatch_uid='lifecycle_deadline_payment_saved')
+def schedule_payment_deadline(sender, instance, **kwargs):
+    _sync_lifecycle_deadline(LifecycleDeadline.PAYMENT_EXPIRY, instance)
+
+
+@receiver(post_save, sender=MatchResultSubmission, dispatch_uid='lifecycle_deadline_submission_saved')
+def schedule_submission_deadline(sender, instance, **kwargs):
+    _sync_lifecycle_deadline(LifecycleDeadline.SUBMISSION_AUTO_CONFIRM, instance)
+
+
+@receiver(post_save, sender=DisputeRecord, dispatch_uid='lifecycle_deadline_dispute_saved')
+def schedule_dispute_deadline(sender, instance, **kwargs):
+    _sync_lifecycle_deadline(LifecycleDeadline.DISPUTE_ESCALATION, instance)
+
+
+# ===========================
+# Incremental Analytics Snapshots
+# ===========================
+
+@receiver(post_save, sender=Registration, dispatch_uid='analytics_snapshot_registration_saved')
+def mark_analytics_on_registration(sender, instance, created, update_fields=None, **kwargs):
+    """Registration, confirmation and check-in move participant counts."""
+    from apps.tournaments.services import analytics_rollup
+
+    if created or analytics_rollup.touches(update_fields, analytics_rollup.REGISTRATION_FIELDS):
+        analytics_rollup.mark_dirty_on_commit(instance.tournament_id)
+
+
+@receiver(post_delete, sender=Registration, dispatch_uid='analytics_snapshot_registration_deleted')
+def mark_analytics_on_registration_delete(sender, instance, **kwargs):
+    from apps.tournaments.services import analytics_rollup
+
+    analytics_rollup.mark_dirty_on_commit(instance.tournament_id)
+
+
+@receiver(post_save, sender=Payment, dispatch_uid='analytics_snapshot_payment_saved')
+def mark_analytics_on_payment(sender, instance, **kwargs):
+    from apps.tournaments.services import analytics_rollup
+
+    try:
+        tournament_id = instance.registration.tournament_id
+    except Registration.DoesNotExist:
+        return
+    analytics_rollup.mark_dirty_on_commit(tournament_id)
+
+
+@receiver(post_save, sender=Match, dispatch_uid='analytics_snapshot_match_saved')
+def mark_analytics_on_match(sender, instance, created, update_fields=None, **kwargs):
+    """State changes move match counts; any save of a completed match moves its duration."""
+    from apps.tournaments.services import analytics_rollup
+
+    if (
+        created
+        or instance.state == Match.COMPLETED
+        or analytics_rollup.touches(update_fields, analytics_rollup.MATCH_FIELDS)
+    ):
+        analytics_rollup.mark_dirty_on_commit(instance.tournament_id)
+
+
+@receiver(post_delete, sender=Match, dispatch_uid='analytics_snapshot_match_deleted')
+def mark_analytics_on_match_delete(sender, instance, **kwargs):
+    from apps.tournaments.services import analytics_rollup
+
+    analytics_rollup.mark_dirty_on_commit(instance.tournament_id)
+
+
+@receiver(post_save, sender=PrizeTransaction, dispatch_uid='analytics_snapshot_prize_saved')
+def mark_analytics_on_prize(sender, instance, **kwargs):
+    from apps.tournaments.services import analytics_rollup
+
+    analytics_rollup.mark_dirty_on_commit(instance.tournament_id)
+
+
+@receiver(post_save, sender=Tournament, dispatch_uid='analytics_snapshot_tournament_saved')
+def mark_analytics_on_tournament(sender, instance, created, update_fields=None, **kwargs):
+    from apps.tournaments.services import analytics_rollup
+
+    if created or analytics_rollup.touches(update_fields, analytics_rollup.TOURNAMENT_FIELDS):
+        analytics_rollup.mark_dirty_on_commit(instance.pk)
@@ -7,9 +7,15 @@ from .lifecycle import (
     auto_advance_tournaments,
     check_tournament_wrapup,
     auto_archive_tournaments,
+    process_lifecycle_deadlines,
+    resync_lifecycle_deadlines,
 )
 from .payment_expiry import expire_overdue_payments
 from .match_ready import notify_match_ready
 from .discord_tasks import dispatch_discord_webhook
 from .no_show_timer import check_no_show_matches
-from .evidence_cleanup import purge_tournament_result_evidence_files_task
\ No newline at end of file
+from .evidence_cleanup import purge_tournament_result_evidence_files_task
+from .analytics_refresh import (
+    refresh_dirty_tournament_analytics,
+    reconcile_tournament_analytics,
+)
@@ -6,17 +6,16 @@ Phase 6 Sprint 1
 
 Implements: PHASE_6_IMPLEMENTATION_PLAN.md#module-62-materialized-views-for-analytics
 
-Scheduled Tasks:
-    - refresh_analytics_hourly: Runs every hour (jittered) via Celery beat
-    - refresh_tournament_analytics: On-demand refresh for single tournament
-
-Configuration (deltacrown/settings.py):
-    CELERY_BEAT_SCHEDULE = {
-        'refresh-analytics-hourly': {
-            'task': 'apps.tournaments.tasks.analytics_refresh.refresh_analytics_hourly',
-            'schedule': crontab(minute='*/60'),  # Every hour
-        },
-    }
+Scheduled Tasks (deltacrown/celery.py):
+    - refresh_dirty_tournament_analytics: Every minute; recomputes the
+      TournamentAnalyticsSnapshot rows of tournaments changed since the
+      last run (see services/analytics_rollup.py)
+    - reconcile_tournament_analytics: Nightly; re-marks every open
+      tournament and refreshes the full materialized view
+
+On-demand Tasks:
+    - refresh_analytics_hourly: Full MV refresh (jittered)
+    - refresh_tournament_analytics: Snapshot refresh for single tournament
 
 Performance:
     - Uses REFRESH MATERIALIZED VIEW CONCURRENTLY (non-blocking)
@@ -29,6 +28,8 @@ from django.utils import timezone
 import logging
 import random
 
+from apps.tournaments.services import analytics_rollup
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,11 +100,10 @@ def refresh_tournament_analytics(self, tournament_id: int):
     
     Use Cases:
         - Organizer views tournament dashboard (force fresh data)
-        - Match/result/prize update (invalidate cache)
         - Admin export request (ensure latest data)
     
     Implements:
-        - Targeted DELETE + INSERT (faster than full refresh)
+        - Recomputes the tournament's TournamentAnalyticsSnapshot row only
         - Retry logic (2 attempts)
         - Performance logging
     
@@ -113,8 +113,7 @@ def refresh_tournament_analytics(self, tournament_id: int):
     try:
         start_time = timezone.now()
         
-        # Execute targeted refresh via management command
-        call_command('refresh_analytics', tournament=tournament_id, verbosity=0)
+        analytics_rollup.refresh(tournament_id)
         
         duration_ms = (timezone.now() - start_time).total_seconds() * 1000
         
@@ -137,3 +136,43 @@ def refresh_tournament_analytics(self, tournament_id: int):
         
         # Retry once with 30s delay
         raise self.retry(exc=exc, countdown=30)
+
+
+@shared_task
+def refresh_dirty_tournament_analytics():
+    """
+    Recompute analytics snapshots of tournaments changed since the last run.
+    
+    Schedule: Every minute. A run that finds another in progress exits
+    immediately; rows beyond ANALYTICS_SNAPSHOT_BATCH_SIZE wait for the
+    next run, oldest change first.
+    """
+    summary = analytics_rollup.refresh_dirty()
+    if summary.get('refreshed') or summary.get('failed'):
+        logger.info(f"Analytics snapshot refresh: {summary}")
+    return summary
+
+
+@shared_task(bind=True, max_retries=3)
+def reconcile_tournament_analytics(self):
+    """
+    Nightly reconciliation of incremental analytics.
+    
+    Re-marks every open tournament so the per-minute task recomputes its
+    snapshot (repairing changes written around the save signals), then
+    refreshes the full materialized view. Retries only the MV refresh.
+    """
+    if not self.request.retries:
+        queued = analytics_rollup.mark_all_dirty()
+        logger.info(f"Analytics reconciliation: {queued} tournament snapshots queued")
+
+    try:
+        call_command('refresh_analytics', verbosity=0)
+    except Exception as exc:
+        logger.error(
+            f"Analytics MV reconciliation failed (attempt {self.request.retries + 1}/3): {exc}",
+            exc_info=True
+        )
+        raise self.retry(exc=exc, countdown=60 * (5 ** self.request.retries))
+
+    return {'status': 'success', 'task_id': str(self.request.id)}
@@ -10,6 +10,8 @@ Tasks:
     auto_advance_tournaments  — Every 5 minutes: PUBLISHED → REG_OPEN → REG_CLOSED → LIVE
     check_tournament_wrapup   — Every hour: detect LIVE tournaments with all matches complete
     auto_archive_tournaments  — Daily 4 AM: COMPLETED (>7 days) → ARCHIVED
+    process_lifecycle_deadlines — Every minute: dispatch due LifecycleDeadline rows
+    resync_lifecycle_deadlines  — Every hour: re-seed the deadline index
 """
 
 from __future__ import annotations
@@ -223,3 +225,49 @@ def reconcile_group_playoff_transitions(self):
     if fixed_count:
         logger.info("[reconcile] Fixed %d stuck tournament(s)", fixed_count)
     return {'fixed': fixed_count}
+
+
+@shared_task(
+    name='apps.tournaments.tasks.process_lifecycle_deadlines',
+    bind=True,
+    max_retries=0,
+    ignore_result=True,
+)
+def process_lifecycle_deadlines(self):
+    """
+    Dispatch due LifecycleDeadline rows (no-shows, lobby closes, payment
+    expiry, registration windows, auto-confirm, dispute SLAs).
+
+    Runs every minute via Celery Beat; cost scales with the number of due
+    rows, not with the number of live tournaments.
+    """
+    from apps.tournaments.services import lifecycle_scheduler
+
+    if not lifecycle_scheduler.enabled():
+        return {'claimed': 0}
+    result = lifecycle_scheduler.run_due()
+    if result['claimed']:
+        logger.info("[deadlines] %s", result)
+    return result
+
+
+@shared_task(
+    name='apps.tournaments.tasks.resync_lifecycle_deadlines',
+    bind=True,
+    max_retries=1,
+    ignore_result=True,
+)
+def resync_lifecycle_deadlines(self):
+    """
+    Re-seed the LifecycleDeadline index from every object with a pending
+    deadline (covers bulk writes that bypass post_save).
+
+    Runs every hour at :50 via Celery Beat.
+    """
+    from apps.tournaments.services import lifecycle_scheduler
+
+    if not lifecycle_scheduler.enabled():
+        return {}
+    counts = lifecycle_scheduler.resync_all()
+    logger.info("[deadlines] Re-seeded index: %s", counts)
+    return counts
@@ -40,7 +40,7 @@ def expire_overdue_payments(self):
 
     Runs every 15 minutes via Celery Beat.
     """
-    from apps.tournaments.models import Payment, Registration
+    from apps.tournaments.models import Payment
     from apps.tournaments.models.tournament import Tournament
 
     now = timezone.now()
@@ -65,46 +65,15 @@ def expire_overdue_payments(self):
         for payment in overdue_payments:
             try:
                 with transaction.atomic():
-                    # 1. Expire the payment
-                    payment.status = Payment.EXPIRED
-                    payment.notes = payment.notes if isinstance(payment.notes, dict) else {}
-                    payment.notes['expired_by'] = 'system_auto_expiry'
-                    payment.notes['expired_at'] = now.isoformat()
-                    payment.notes['deadline_hours'] = deadline_hours
-                    payment.last_action_reason = (
-                        f'Auto-expired: payment not verified within {deadline_hours}h'
-                    )
-                    payment.save(update_fields=[
-                        'status', 'notes', 'last_action_reason', 'updated_at',
-                    ])
-
-                    # Dual-write
-                    from apps.tournaments.services.payment_service import (
-                        _sync_to_payment_verification,
-                    )
-                    _sync_to_payment_verification(payment)
-
-                    # 2. Cancel the registration
-                    reg = payment.registration
-                    reg.status = Registration.CANCELLED
-                    reg.save(update_fields=['status', 'updated_at'])
-
-                    expired_count += 1
-
-                    # 3. Auto-promote next waitlisted participant
-                    promoted = _promote_next_waitlisted(reg.tournament)
-                    if promoted:
-                        promoted_count += 1
-
-                    logger.info(
-                        "[expire_overdue] Expired payment %s for reg %s "
-                        "(tournament %s)",
-                        payment.id, reg.id, tournament_id,
-                    )
+                    promoted = _expire_payment(payment, deadline_hours, now)
             except Exception:
                 logger.exception(
                     "[expire_overdue] Failed to expire payment %s", payment.id,
                 )
+                continue
+            expired_count += 1
+            if promoted:
+                promoted_count += 1
 
     if expired_count:
         logger.info(
@@ -115,6 +84,47 @@ def expire_overdue_payments(self):
     return {'expired': expired_count, 'promoted': promoted_count}
 
 
+def _expire_payment(payment, deadline_hours: int, now) -> bool:
+    """Expire one overdue payment, cancel its registration and promote the
+    next waitlisted participant.  Call inside ``transaction.atomic()``.
+    Returns True if a promotion happened."""
+    from apps.tournaments.models import Payment, Registration
+
+    # 1. Expire the payment
+    payment.status = Payment.EXPIRED
+    payment.notes = payment.notes if isinstance(payment.notes, dict) else {}
+    payment.notes['expired_by'] = 'system_auto_expiry'
+    payment.notes['expired_at'] = now.isoformat()
+    payment.notes['deadline_hours'] = deadline_hours
+    payment.last_action_reason = (
+        f'Auto-expired: payment not verified within {deadline_hours}h'
+    )
+    payment.save(update_fields=[
+        'status', 'notes', 'last_action_reason', 'updated_at',
+    ])
+
+    # Dual-write
+    from apps.tournaments.services.payment_service import (
+        _sync_to_payment_verification,
+    )
+    _sync_to_payment_verification(payment)
+
+    # 2. Cancel the registration
+    reg = payment.registration
+    reg.status = Registration.CANCELLED
+    reg.save(update_fields=['status', 'updated_at'])
+
+    # 3. Auto-promote next waitlisted participant
+    promoted = _promote_next_waitlisted(reg.tournament)
+
+    logger.info(
+        "[expire_overdue] Expired payment %s for reg %s "
+        "(tournament %s)",
+        payment.id, reg.id, reg.tournament_id,
+    )
+    return promoted
+
+
 def _promote_next_waitlisted(tournament) -> bool:
     """Promote the next waitlisted registration to ``pending`` (or ``confirmed``
     for free tournaments).  Returns True if a promotion happened."""
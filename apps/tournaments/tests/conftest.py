@@ -4,14 +4,14 @@ Test fixtures for tournament API tests.
 
 Provides centralized fixtures for:
 - Game creation (all 8 supported titles)
-- Tournament factories (solo + team)
 - User/profile management
+
+game_factory, tournament_factory and live_tournament_factory come from
+tests/tournament_fixtures.py (loaded by the root conftest) so suites
+outside apps/tournaments can use them too.
 """
 import pytest
-from decimal import Decimal
 from django.contrib.auth import get_user_model
-from django.utils import timezone
-from apps.tournaments.models import Game, Tournament
 
 
 def _ensure_profile(user):
@@ -72,26 +72,6 @@ def member_with_profile(db):
 
 # ========== Game Fixtures (8 Supported Titles) ==========
 
-@pytest.fixture
-def game_factory(db):
-    """
-    Factory to create Game instances.
-    Usage: game_factory(slug='valorant', name='Valorant', team_size=5)
-    """
-    def _make(slug: str, name: str = None, team_size: int = 5, **kwargs):
-        defaults = {
-            'name': name or slug.replace('-', ' ').title(),
-            'slug': slug,
-            'default_team_size': team_size,
-            'profile_id_field': kwargs.get('profile_id_field', 'riot_id'),
-            'default_result_type': kwargs.get('default_result_type', 'map_score'),
-            'is_active': kwargs.get('is_active', True),
-        }
-        defaults.update(kwargs)
-        return Game.objects.create(**defaults)
-    return _make
-
-
 @pytest.fixture
 def all_games(game_factory):
     """
@@ -130,59 +110,6 @@ def game(request, game_factory):
     return game_factory(slug=slug, name=slug.upper(), team_size=team_size, profile_id_field=profile_field)
 
 
-# ========== Tournament Fixtures ==========
-
-@pytest.fixture
-def tournament_factory(db):
-    """
-    Factory to create Tournament instances.
-    Usage: tournament_factory(game=game_instance, participation_type='solo')
-    """
-    from apps.accounts.models import User
-    
-    def _make(game, participation_type: str = None, **kwargs):
-        # Determine participation type from game if not provided
-        if participation_type is None:
-            participation_type = 'solo' if game.default_team_size == 1 else 'team'
-        
-        # Create organizer if not provided
-        organizer = kwargs.pop('organizer', None)
-        if not organizer:
-            timestamp = int(timezone.now().timestamp() * 1000000)  # Microsecond precision
-            organizer = User.objects.create_user(
-                username=f'org_{game.slug}_{timestamp}',
-                email=f'org_{game.slug}_{timestamp}@test.com',
-                password='pass123'
-            )
-        
-        # Map common kwargs to actual field names
-        entry_fee = kwargs.pop('entry_fee', None)
-        if entry_fee:
-            kwargs['has_entry_fee'] = True
-            kwargs['entry_fee_amount'] = Decimal(str(entry_fee))
-        
-        defaults = {
-            'name': kwargs.get('name', f'{game.name} Tournament'),
-            'slug': kwargs.get('slug', f'{game.slug}-cup-{int(timezone.now().timestamp() * 1000000)}'),
-            'description': kwargs.get('description', f'Test tournament for {game.name}'),
-            'game': game,
-            'organizer': organizer,
-            'format': kwargs.get('format', 'single_elimination'),
-            'participation_type': participation_type,
-            'min_participants': kwargs.get('min_participants', 4),
-            'max_participants': kwargs.get('max_participants', 16),
-            'prize_pool': kwargs.get('prize_pool', Decimal('1000.00')),
-            'registration_start': kwargs.get('registration_start', timezone.now()),
-            'registration_end': kwargs.get('registration_end', timezone.now() + timezone.timedelta(days=7)),
-            'tournament_start': kwargs.get('tournament_start', timezone.now() + timezone.timedelta(days=10)),
-            'status': kwargs.get('status', 'registration_open'),
-        }
-        defaults.update({k: v for k, v in kwargs.items() if k not in defaults})
-        return Tournament.objects.create(**defaults)
-    
-    return _make
-
-
 # ========== API Client Fixtures ==========
 
 @pytest.fixture
@@ -0,0 +1,143 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.tournaments.models import Match, Registration, Tournament, TournamentAnalyticsSnapshot
+from apps.tournaments.services import analytics_rollup
+from apps.tournaments.services.analytics_service import AnalyticsService
+
+
+User = get_user_model()
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _register(tournament, username, checked_in=False):
+    user = User.objects.create_user(username=username, email=f'{username}@test.com', password='pass123')
+    return Registration.objects.create(
+        tournament=tournament, user=user, status=Registration.CONFIRMED, checked_in=checked_in,
+    )
+
+
+def _snapshot(tournament):
+    return TournamentAnalyticsSnapshot.objects.get(tournament_id=tournament.id)
+
+
+def test_events_mark_only_changed_tournaments(live_tournament_factory, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        busy = live_tournament_factory('rollup-busy')
+        quiet = live_tournament_factory('rollup-quiet')
+    analytics_rollup.refresh_dirty()
+    assert _snapshot(busy).dirty_at is None and _snapshot(quiet).dirty_at is None
+
+    with django_capture_on_commit_callbacks(execute=True):
+        registration = _register(busy, 'rollup-p1')
+    with django_capture_on_commit_callbacks(execute=True):
+        registration.check_in_participant()
+
+    assert _snapshot(busy).dirty_at is not None
+    assert _snapshot(quiet).dirty_at is None
+
+    summary = analytics_rollup.refresh_dirty()
+
+    assert summary['refreshed'] == 1
+    snapshot = _snapshot(busy)
+    assert (snapshot.total_participants, snapshot.checked_in_count, snapshot.dirty_at) == (1, 1, None)
+
+
+def test_rolled_back_change_marks_nothing(live_tournament_factory, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        tournament = live_tournament_factory('rollup-rollback')
+    analytics_rollup.refresh_dirty()
+
+    with django_capture_on_commit_callbacks(execute=False):
+        Match.objects.create(
+            tournament=tournament, round_number=1, match_number=1,
+            participant1_id=1, participant1_name='P1', participant2_id=2, participant2_name='P2',
+        )
+
+    assert _snapshot(tournament).dirty_at is None
+
+
+def test_marks_in_one_transaction_are_written_once(live_tournament_factory, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        first = live_tournament_factory('rollup-batch-a')
+        second = live_tournament_factory('rollup-batch-b')
+    analytics_rollup.refresh_dirty()
+
+    with patch.object(analytics_rollup, 'mark_many_dirty', wraps=analytics_rollup.mark_many_dirty) as mark:
+        with django_capture_on_commit_callbacks(execute=True):
+            for username in ('rollup-b1', 'rollup-b2', 'rollup-b3'):
+                _register(first, username)
+            _register(second, 'rollup-b4')
+
+    mark.assert_called_once()
+    assert set(mark.call_args.args[0]) == {first.id, second.id}
+    assert _snapshot(first).dirty_at is not None
+    assert _snapshot(second).dirty_at is not None
+
+
+def test_change_during_refresh_keeps_row_dirty(live_tournament_factory):
+    tournament = live_tournament_factory('rollup-race')
+    analytics_rollup.mark_dirty(tournament.id)
+    original = AnalyticsService.compute_tournament_metrics
+
+    def compute_then_change(target):
+        metrics = original(target)
+        analytics_rollup.mark_dirty(target.id)
+        return metrics
+
+    with patch.object(AnalyticsService, 'compute_tournament_metrics', side_effect=compute_then_change):
+        analytics_rollup.refresh(tournament.id)
+
+    snapshot = _snapshot(tournament)
+    assert snapshot.refreshed_at is not None
+    assert snapshot.dirty_at == snapshot.refreshed_at
+
+
+def test_organizer_analytics_served_from_snapshot(live_tournament_factory):
+    tournament = live_tournament_factory('rollup-served', prize_pool=Decimal('500.00'))
+    _register(tournament, 'rollup-a', checked_in=True)
+    _register(tournament, 'rollup-b')
+    analytics_rollup.refresh(tournament.id)
+
+    with patch.object(AnalyticsService, 'compute_tournament_metrics') as live:
+        result = AnalyticsService.calculate_organizer_analytics(tournament.id)
+
+    live.assert_not_called()
+    assert result['cache']['source'] == 'incremental'
+    assert (result['total_participants'], result['checked_in_count']) == (2, 1)
+    assert result['prize_pool_total'] == '500.00'
+
+
+def test_long_pending_snapshot_is_not_served(live_tournament_factory):
+    tournament = live_tournament_factory('rollup-behind')
+    analytics_rollup.refresh(tournament.id)
+    TournamentAnalyticsSnapshot.objects.filter(tournament_id=tournament.id).update(
+        dirty_at=timezone.now() - timedelta(hours=1),
+    )
+
+    result = AnalyticsService.calculate_organizer_analytics(tournament.id)
+
+    assert result['cache']['source'] != 'incremental'
+
+
+def test_reconciliation_marks_open_tournaments(live_tournament_factory):
+    open_tournament = live_tournament_factory('rollup-open')
+    archived = live_tournament_factory('rollup-archived', status=Tournament.ARCHIVED)
+
+    analytics_rollup.mark_all_dirty()
+
+    assert _snapshot(open_tournament).dirty_at is not None
+    assert not TournamentAnalyticsSnapshot.objects.filter(tournament_id=archived.id).exists()
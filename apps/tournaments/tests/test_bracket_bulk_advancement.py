@@ -0,0 +1,144 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import transaction
+
+from apps.tournaments.models import Bracket, BracketNode, Match
+from apps.tournaments.services.bracket_service import BracketService
+
+
+pytestmark = pytest.mark.django_db
+
+_BROADCAST = 'apps.tournaments.services.bracket_service.broadcast_bracket_updated'
+
+
+@pytest.fixture
+def bulk_tournament(live_tournament_factory):
+    return live_tournament_factory('bulk-bracket-cup')
+
+
+def _node(bracket, position, round_number, number, parent=None, slot=None, **extra):
+    return BracketNode.objects.create(
+        bracket=bracket,
+        position=position,
+        round_number=round_number,
+        match_number_in_round=number,
+        parent_node=parent,
+        parent_slot=slot,
+        **extra,
+    )
+
+
+def _first_round_match(tournament, node, p1, p2, state=Match.LIVE):
+    match = Match.objects.create(
+        tournament=tournament,
+        round_number=node.round_number,
+        match_number=node.match_number_in_round,
+        participant1_id=p1,
+        participant1_name=f'P{p1}',
+        participant2_id=p2,
+        participant2_name=f'P{p2}',
+        participant1_score=2,
+        participant2_score=0,
+        state=state,
+        **({'winner_id': p1, 'loser_id': p2} if state == Match.COMPLETED else {}),
+    )
+    node.participant1_id, node.participant1_name = p1, f'P{p1}'
+    node.participant2_id, node.participant2_name = p2, f'P{p2}'
+    node.match = match
+    node.save()
+    return match
+
+
+@pytest.fixture
+def quarterfinals(bulk_tournament):
+    """8-player single elimination: 4 completed quarterfinals, empty semis/final."""
+    bracket = Bracket.objects.create(tournament=bulk_tournament, format=Bracket.SINGLE_ELIMINATION)
+    final = _node(bracket, 1, 3, 1)
+    semis = [_node(bracket, 2 + n, 2, n + 1, parent=final, slot=n + 1) for n in range(2)]
+    matches = []
+    for n in range(4):
+        node = _node(bracket, 4 + n, 1, n + 1, parent=semis[n // 2], slot=n % 2 + 1)
+        matches.append(_first_round_match(bulk_tournament, node, 10 + 2 * n, 11 + 2 * n, Match.COMPLETED))
+    return bracket, semis, matches
+
+
+def test_round_advances_with_one_broadcast(quarterfinals):
+    bracket, semis, matches = quarterfinals
+
+    with patch(_BROADCAST) as broadcast:
+        payloads = BracketService.advance_matches(matches)
+
+    for semi in semis:
+        semi.refresh_from_db()
+    assert [(s.participant1_id, s.participant2_id) for s in semis] == [(10, 14), (18, 22)]
+    assert [(s.participant1_name, s.participant2_name) for s in semis] == [('P10', 'P14'), ('P18', 'P22')]
+    assert all(s.match_id for s in semis)
+    assert Match.objects.get(pk=semis[0].match_id).state == Match.SCHEDULED
+
+    broadcast.assert_called_once()
+    data = payloads[bracket.id]
+    assert broadcast.call_args.kwargs['bracket_data'] == data
+    assert sorted(data['advanced_matches']) == sorted(m.id for m in matches)
+    assert {s.id for s in semis} <= set(data['updated_nodes'])
+    assert sorted(m['match_id'] for m in data['next_matches']) == sorted(s.match_id for s in semis)
+    assert BracketNode.objects.filter(bracket=bracket, round_number=1, winner_id__isnull=True).count() == 0
+
+
+def test_bulk_matches_sequential_advancement(quarterfinals):
+    bracket, semis, matches = quarterfinals
+
+    with patch(_BROADCAST):
+        BracketService.advance_matches(matches[:3])
+        BracketService.advance_matches(matches[3:] + matches[:1])  # re-advancing is idempotent
+
+    semis[1].refresh_from_db()
+    assert (semis[1].participant1_id, semis[1].participant2_id) == (18, 22)
+    assert Match.objects.filter(tournament=bracket.tournament, round_number=2).count() == 2
+
+
+def test_double_elimination_loser_drops(bulk_tournament):
+    bracket = Bracket.objects.create(
+        tournament=bulk_tournament,
+        format=Bracket.DOUBLE_ELIMINATION,
+        bracket_structure={'loser_drops': {
+            'main_R1_M1': {'lb_round': 1, 'lb_match': 1, 'lb_slot': 1},
+            'main_R1_M2': {'lb_round': 1, 'lb_match': 1, 'lb_slot': 2},
+        }},
+    )
+    wb_final = _node(bracket, 1, 2, 1)
+    wb = [_node(bracket, 2 + n, 1, n + 1, parent=wb_final, slot=n + 1) for n in range(2)]
+    lb = _node(bracket, 10, 1, 1, bracket_type=BracketNode.LOSERS)
+    matches = [_first_round_match(bulk_tournament, wb[n], 1 + 2 * n, 2 + 2 * n, Match.COMPLETED) for n in range(2)]
+
+    with patch(_BROADCAST) as broadcast:
+        BracketService.advance_matches(matches)
+
+    lb.refresh_from_db()
+    wb_final.refresh_from_db()
+    assert (wb_final.participant1_id, wb_final.participant2_id) == (1, 3)
+    assert (lb.participant1_id, lb.participant2_id, lb.participant1_name) == (2, 4, 'P2')
+    assert lb.match_id and wb_final.match_id
+    assert broadcast.call_count == 1
+
+
+def test_batched_advancement_collects_signal_driven_completions(bulk_tournament):
+    bracket = Bracket.objects.create(tournament=bulk_tournament, format=Bracket.SINGLE_ELIMINATION)
+    final = _node(bracket, 1, 2, 1)
+    nodes = [_node(bracket, 2 + n, 1, n + 1, parent=final, slot=n + 1) for n in range(2)]
+    matches = [_first_round_match(bulk_tournament, nodes[n], 1 + 2 * n, 2 + 2 * n) for n in range(2)]
+
+    with patch(_BROADCAST) as broadcast, patch.object(
+        BracketService, 'advance_matches', wraps=BracketService.advance_matches,
+    ) as advance:
+        with transaction.atomic(), BracketService.batched_advancement():
+            for match in matches:
+                match.state = Match.COMPLETED
+                match.winner_id, match.loser_id = match.participant1_id, match.participant2_id
+                match.save()
+            assert BracketNode.objects.get(pk=final.pk).participant1_id is None
+
+    advance.assert_called_once()
+    assert broadcast.call_count == 1
+    final.refresh_from_db()
+    assert (final.participant1_id, final.participant2_id) == (1, 3)
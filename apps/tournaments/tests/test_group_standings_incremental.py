@@ -0,0 +1,145 @@
+"""
+Tests for incremental group standings (GroupStageService.apply_match_result).
+
+Completing a group match folds its result into the group's standings and
+head-to-head ledger; the full rebuild (calculate_group_standings) must agree.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.organizations.models import Team
+from apps.tournaments.models import Game, Group, GroupStanding, Match, Tournament
+from apps.tournaments.services.group_stage_service import GroupStageService
+
+User = get_user_model()
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def tournament(db):
+    game = Game.objects.create(name="Incremental Game", slug="incremental-game", is_active=True)
+    organizer = User.objects.create_user(
+        username="incremental-org", email="incremental-org@test.com", password="pass123"
+    )
+    return Tournament.objects.create(
+        name="Incremental Cup",
+        game=game,
+        organizer=organizer,
+        max_participants=16,
+        registration_start=timezone.now(),
+        registration_end=timezone.now() + timedelta(days=7),
+        tournament_start=timezone.now() + timedelta(days=8),
+        tournament_end=timezone.now() + timedelta(days=10),
+    )
+
+
+@pytest.fixture
+def group_setup(tournament):
+    teams = [
+        Team.objects.create(name=f"Inc Team {i}", tag=f"I{i}", game=tournament.game.slug)
+        for i in range(1, 5)
+    ]
+    stage = GroupStageService.create_groups(tournament_id=tournament.id, num_groups=1, group_size=4)
+    GroupStageService.auto_balance_groups(stage.id, [t.id for t in teams], is_team=True)
+    group = Group.objects.get(tournament=tournament)
+    return stage, group, teams
+
+
+def _scheduled(tournament, group, number, p1, p2):
+    return Match.objects.create(
+        tournament=tournament,
+        group=group,
+        round_number=1,
+        match_number=number,
+        participant1_id=p1.id,
+        participant2_id=p2.id,
+        state=Match.SCHEDULED,
+        lobby_info={"group_id": group.id},
+    )
+
+
+def _complete(match, score1, score2):
+    match.participant1_score = score1
+    match.participant2_score = score2
+    if score1 != score2:
+        winner, loser = (
+            (match.participant1_id, match.participant2_id)
+            if score1 > score2
+            else (match.participant2_id, match.participant1_id)
+        )
+        match.winner_id, match.loser_id = winner, loser
+    match.state = Match.COMPLETED
+    match.save()
+
+
+def _snapshot(group):
+    return {
+        s.team_id: (s.matches_played, s.matches_won, s.matches_drawn, s.matches_lost,
+                    s.points, s.goals_for, s.goals_against, s.rank)
+        for s in GroupStanding.objects.filter(group=group, is_deleted=False)
+    }
+
+
+def test_incremental_standings_match_full_rebuild(tournament, group_setup):
+    stage, group, teams = group_setup
+    results = [(0, 1, 2, 1), (2, 3, 0, 0), (0, 2, 3, 0), (1, 3, 1, 2), (0, 3, 1, 1), (1, 2, 2, 0)]
+    for number, (a, b, s1, s2) in enumerate(results, start=1):
+        _complete(_scheduled(tournament, group, number, teams[a], teams[b]), s1, s2)
+
+    incremental = _snapshot(group)
+    group.refresh_from_db()
+    assert len(group.head_to_head) == len(results)
+
+    GroupStageService.calculate_group_standings(stage.id)
+
+    assert _snapshot(group) == incremental
+    assert incremental[teams[0].id][4] == 7  # W, W, D
+
+
+def test_reapplying_result_is_noop(tournament, group_setup):
+    _, group, teams = group_setup
+    match = _scheduled(tournament, group, 1, teams[0], teams[1])
+    _complete(match, 2, 0)
+
+    assert GroupStageService.apply_match_result(match) is None
+    assert GroupStanding.objects.get(group=group, team_id=teams[0].id).matches_played == 1
+
+
+def test_reverted_result_is_subtracted(tournament, group_setup):
+    _, group, teams = group_setup
+    first = _scheduled(tournament, group, 1, teams[0], teams[1])
+    second = _scheduled(tournament, group, 2, teams[0], teams[2])
+    _complete(first, 2, 0)
+    _complete(second, 1, 0)
+
+    second.state = Match.SCHEDULED
+    second.participant1_score = second.participant2_score = 0
+    second.winner_id = second.loser_id = None
+    second.save()
+
+    leader = GroupStanding.objects.get(group=group, team_id=teams[0].id)
+    assert (leader.matches_played, leader.points, leader.goals_for) == (1, 3, 2)
+    group.refresh_from_db()
+    assert list(group.head_to_head) == [str(first.id)]
+
+
+def test_corrected_result_replaces_the_old_one(tournament, group_setup):
+    stage, group, teams = group_setup
+    match = _scheduled(tournament, group, 1, teams[0], teams[1])
+    _complete(match, 2, 0)
+
+    _complete(match, 0, 3)  # COMPLETED -> COMPLETED with the winner flipped
+
+    standings = _snapshot(group)
+    # played, won, drawn, lost, points, goals for, goals against
+    assert standings[teams[0].id][:7] == (1, 0, 0, 1, 0, 0, 3)
+    assert standings[teams[1].id][:7] == (1, 1, 0, 0, 3, 3, 0)
+    group.refresh_from_db()
+    assert group.head_to_head[str(match.id)][2:5] == [0, 3, teams[1].id]
+
+    GroupStageService.calculate_group_standings(stage.id)
+    assert _snapshot(group) == standings
@@ -0,0 +1,162 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.tournaments.models import LifecycleDeadline, Match, Tournament
+from apps.tournaments.services import lifecycle_scheduler
+
+
+pytestmark = pytest.mark.django_db
+
+
+def _match(tournament, number, scheduled_time, state=Match.READY):
+    return Match.objects.create(
+        tournament=tournament,
+        round_number=1,
+        match_number=number,
+        participant1_id=10 + number,
+        participant1_name='P1',
+        participant2_id=20 + number,
+        participant2_name='P2',
+        state=state,
+        scheduled_time=scheduled_time,
+    )
+
+
+def _row(kind, object_id):
+    return LifecycleDeadline.objects.filter(kind=kind, object_id=object_id).first()
+
+
+def test_match_save_maintains_timeout_row(live_tournament_factory):
+    tournament = live_tournament_factory('deadline-sync-cup', enable_no_show_timer=True, no_show_timeout_minutes=10)
+    start = timezone.now() + timedelta(hours=1)
+    match = _match(tournament, 1, start)
+
+    row = _row(LifecycleDeadline.MATCH_TIMEOUT, match.id)
+    assert (row.due_at, row.tournament_id) == (start + timedelta(minutes=10), tournament.id)
+
+    match.state = Match.COMPLETED
+    match.winner_id, match.loser_id = match.participant1_id, match.participant2_id
+    match.save()
+
+    assert _row(LifecycleDeadline.MATCH_TIMEOUT, match.id) is None
+
+
+def test_timeout_settings_change_reschedules_matches(live_tournament_factory):
+    tournament = live_tournament_factory('deadline-toggle-cup')
+    match = _match(tournament, 1, timezone.now() + timedelta(hours=1))
+    assert _row(LifecycleDeadline.MATCH_TIMEOUT, match.id) is None
+
+    tournament.enable_no_show_timer = True
+    tournament.save(update_fields=['enable_no_show_timer'])
+
+    assert _row(LifecycleDeadline.MATCH_TIMEOUT, match.id) is not None
+
+
+def test_run_due_dispatches_only_due_rows(live_tournament_factory):
+    tournament = live_tournament_factory('deadline-run-cup', enable_no_show_timer=True, no_show_timeout_minutes=10)
+    now = timezone.now()
+    overdue = _match(tournament, 1, now - timedelta(minutes=30))
+    upcoming = _match(tournament, 2, now + timedelta(minutes=30))
+
+    result = lifecycle_scheduler.run_due(concurrency=1)
+
+    overdue.refresh_from_db()
+    upcoming.refresh_from_db()
+    assert overdue.state == Match.CANCELLED  # neither side checked in
+    assert upcoming.state == Match.READY
+    assert _row(LifecycleDeadline.MATCH_TIMEOUT, overdue.id) is None
+    assert _row(LifecycleDeadline.MATCH_TIMEOUT, upcoming.id).claimed_until is None
+    assert result['outcomes'].get('timed_out') == 1
+
+
+def test_tournament_advance_moves_to_next_threshold(live_tournament_factory):
+    now = timezone.now()
+    tournament = live_tournament_factory(
+        'deadline-advance-cup',
+        status=Tournament.PUBLISHED,
+        registration_start=now - timedelta(minutes=5),
+        registration_end=now + timedelta(days=1),
+        tournament_start=now + timedelta(days=2),
+    )
+    assert _row(LifecycleDeadline.TOURNAMENT_ADVANCE, tournament.id).due_at == tournament.registration_start
+
+    lifecycle_scheduler.run_due(concurrency=1)
+
+    tournament.refresh_from_db()
+    assert tournament.status == Tournament.REGISTRATION_OPEN
+    row = _row(LifecycleDeadline.TOURNAMENT_ADVANCE, tournament.id)
+    assert (row.due_at, row.attempts) == (tournament.registration_end, 0)
+
+
+def test_still_overdue_rows_back_off(live_tournament_factory, monkeypatch):
+    tournament = live_tournament_factory('deadline-retry-cup', enable_no_show_timer=True)
+    match = _match(tournament, 1, timezone.now() - timedelta(hours=1))
+
+    def fail(match, now):
+        raise RuntimeError('lobby service down')
+
+    monkeypatch.setitem(
+        lifecycle_scheduler.KINDS, LifecycleDeadline.MATCH_TIMEOUT,
+        lifecycle_scheduler.KINDS[LifecycleDeadline.MATCH_TIMEOUT][:2] + (fail,),
+    )
+    result = lifecycle_scheduler.run_due(concurrency=1)
+
+    row = _row(LifecycleDeadline.MATCH_TIMEOUT, match.id)
+    assert result['outcomes'] == {'error': 1}
+    assert row.attempts == 1 and row.due_at > timezone.now()
+    assert lifecycle_scheduler.run_due(concurrency=1)['claimed'] == 0
+
+
+def test_resync_all_reseeds_missing_rows(live_tournament_factory):
+    tournament = live_tournament_factory('deadline-resync-cup', enable_no_show_timer=True)
+    match = _match(tournament, 1, timezone.now() + timedelta(hours=1))
+    LifecycleDeadline.objects.all().delete()
+
+    counts = lifecycle_scheduler.resync_all()
+
+    assert counts[LifecycleDeadline.MATCH_TIMEOUT] == 1
+    assert _row(LifecycleDeadline.MATCH_TIMEOUT, match.id) is not None
+    assert _row(LifecycleDeadline.TOURNAMENT_ADVANCE, tournament.id) is None  # LIVE without tournament_end
+
+
+def test_cron_full_sweep_runs_once_per_window():
+    from deltacrown.lifecycle_cron import _FULL_SWEEP_KEY, _full_sweep_due
+
+    cache.delete(_FULL_SWEEP_KEY)
+
+    assert _full_sweep_due() is True
+    assert _full_sweep_due() is False
+
+
+def test_cron_runs_completion_checks_between_full_sweeps(monkeypatch, rf):
+    from deltacrown import lifecycle_cron
+
+    ran = []
+    for name in ('_run_due_deadlines', '_run_wrapup', '_run_group_playoff_reconcile', '_run_auto_advance'):
+        monkeypatch.setattr(lifecycle_cron, name, lambda name=name: ran.append(name) or {'ok': True})
+    monkeypatch.setattr(lifecycle_cron, '_full_sweep_due', lambda: False)
+    monkeypatch.setattr(lifecycle_cron, '_CRON_SECRET', 'cron-secret')
+
+    response = lifecycle_cron.lifecycle_cron(
+        rf.post('/api/lifecycle/cron/', HTTP_AUTHORIZATION='Bearer cron-secret')
+    )
+
+    assert response.status_code == 200
+    assert ran == ['_run_due_deadlines', '_run_wrapup', '_run_group_playoff_reconcile']
+
+
+def test_bulk_shift_moves_timeout_rows(live_tournament_factory, monkeypatch):
+    from apps.tournaments.api.toc.brackets_service import TOCBracketsService
+
+    tournament = live_tournament_factory('deadline-shift-cup', enable_no_show_timer=True, no_show_timeout_minutes=10)
+    start = timezone.now() + timedelta(hours=1)
+    match = _match(tournament, 1, start)
+    monkeypatch.setattr(TOCBracketsService, '_fire_schedule_generated_event', staticmethod(lambda *a, **kw: None))
+
+    result = TOCBracketsService.bulk_shift(tournament, {'shift_minutes': 30}, user=None)
+
+    assert result['shifted'] == 1
+    assert _row(LifecycleDeadline.MATCH_TIMEOUT, match.id).due_at == start + timedelta(minutes=40)
@@ -0,0 +1,162 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.organizations.choices import MembershipRole, MembershipStatus, TeamStatus
+from apps.organizations.models import Team, TeamMembership
+from apps.tournaments.models import Match, MatchParticipantIndex, Tournament
+from apps.tournaments.services import match_participant_index as participant_index
+
+
+User = get_user_model()
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def index_game(game_factory):
+    return game_factory('index-test-game', name='Index Test Game', team_size=1, profile_id_field='ingame_id')
+
+
+@pytest.fixture
+def index_users(db):
+    return [
+        User.objects.create_user(username=f'pidx-{i}', email=f'pidx-{i}@test.com', password='pass123')
+        for i in range(4)
+    ]
+
+
+@pytest.fixture
+def index_tournament(live_tournament_factory, index_game):
+    return live_tournament_factory(
+        'participant-index-cup', game=index_game, tournament_start=timezone.now() + timedelta(hours=3),
+    )
+
+
+@pytest.fixture
+def index_team_tournament(live_tournament_factory, index_game):
+    return live_tournament_factory(
+        'participant-index-team-cup', game=index_game, participation_type=Tournament.TEAM,
+        tournament_start=timezone.now() + timedelta(hours=3),
+    )
+
+
+def _match(tournament, p1, p2, number, **extra):
+    return Match.objects.create(
+        tournament=tournament,
+        round_number=1,
+        match_number=number,
+        participant1_id=p1,
+        participant1_name=f'P{p1}',
+        participant2_id=p2,
+        participant2_name=f'P{p2}',
+        state=Match.SCHEDULED,
+        scheduled_time=timezone.now() + timedelta(hours=number),
+        **extra,
+    )
+
+
+def _team(owner, game, slug):
+    team = Team.objects.create(
+        name=slug.title(),
+        slug=slug,
+        tag=slug[:3].upper(),
+        game_id=game.id,
+        region='Global',
+        created_by=owner,
+        status=TeamStatus.ACTIVE,
+        visibility='PUBLIC',
+    )
+    TeamMembership.objects.create(
+        team=team, user=owner, role=MembershipRole.OWNER, status=MembershipStatus.ACTIVE,
+    )
+    return team
+
+
+def test_solo_match_creation_indexes_both_players(index_tournament, index_users):
+    _, p1, p2, _ = index_users
+    match = _match(index_tournament, p1.id, p2.id, 1)
+
+    rows = MatchParticipantIndex.objects.filter(match=match).order_by('side')
+    assert [(row.user_id, row.side) for row in rows] == [(p1.id, 1), (p2.id, 2)]
+    assert list(participant_index.matches_for_user(p1)) == [match]
+
+
+def test_state_change_updates_rows_in_place(index_tournament, index_users):
+    _, p1, p2, _ = index_users
+    match = _match(index_tournament, p1.id, p2.id, 1)
+
+    match.state = Match.LIVE
+    match.save(update_fields=['state'])
+
+    assert set(MatchParticipantIndex.objects.filter(match=match).values_list('state', flat=True)) == {Match.LIVE}
+
+
+def test_roster_join_makes_team_matches_visible(index_team_tournament, index_game, index_users):
+    owner, rival, _, newcomer = index_users
+    team = _team(owner, index_game, 'index-team')
+    opponent = _team(rival, index_game, 'index-rival')
+    match = _match(index_team_tournament, team.id, opponent.id, 1)
+
+    assert not participant_index.matches_for_user(newcomer).exists()
+
+    TeamMembership.objects.create(
+        team=team, user=newcomer, role=MembershipRole.PLAYER, status=MembershipStatus.ACTIVE,
+    )
+
+    assert list(participant_index.matches_for_user(newcomer)) == [match]
+
+
+def test_upcoming_matches_are_ordered_by_schedule(index_tournament, index_users):
+    _, p1, p2, p3 = index_users
+    later = _match(index_tournament, p1.id, p2.id, 3)
+    sooner = _match(index_tournament, p3.id, p1.id, 1)
+
+    upcoming = participant_index.upcoming_matches_for_user(p1, states=[Match.SCHEDULED])
+
+    assert [m.id for m in upcoming] == [sooner.id, later.id]
+
+
+def test_consistency_check_detects_and_repairs_drift(index_tournament, index_users):
+    _, p1, p2, _ = index_users
+    match = _match(index_tournament, p1.id, p2.id, 1)
+    MatchParticipantIndex.objects.filter(match=match, user=p2).delete()
+
+    report = participant_index.check_consistency(repair=True)
+
+    assert report['missing'] == 1
+    assert report['repaired_matches'] == 1
+    assert participant_index.check_consistency()['missing'] == 0
+
+
+def test_team_slot_never_indexes_a_user_with_the_same_id(index_team_tournament, index_game, index_users):
+    owner, rival, _, _ = index_users
+    team = _team(owner, index_game, 'index-team')
+    opponent = _team(rival, index_game, 'index-rival')
+    clashing_user = User.objects.filter(id=team.id).first()
+    match = _match(index_team_tournament, team.id, opponent.id, 1)
+
+    rows = set(MatchParticipantIndex.objects.filter(match=match).values_list('user_id', 'via'))
+
+    assert rows == {(owner.id, MatchParticipantIndex.VIA_TEAM), (rival.id, MatchParticipantIndex.VIA_TEAM)}
+    if clashing_user is not None and clashing_user not in (owner, rival):
+        assert not participant_index.matches_for_user(clashing_user).exists()
+
+
+def test_full_save_reindexes_only_when_slots_change(index_tournament, index_users):
+    _, p1, p2, p3 = index_users
+    match = _match(index_tournament, p1.id, p2.id, 1)
+
+    with mock.patch.object(participant_index, 'reindex_matches', wraps=participant_index.reindex_matches) as reindex:
+        match.state = Match.LIVE
+        match.save()
+        assert not reindex.called
+        assert set(MatchParticipantIndex.objects.filter(match=match).values_list('state', flat=True)) == {Match.LIVE}
+
+        match.participant2_id = p3.id
+        match.save()
+        reindex.assert_called_once_with([match.id])
+
+    assert set(MatchParticipantIndex.objects.filter(match=match).values_list('user_id', flat=True)) == {p1.id, p3.id}
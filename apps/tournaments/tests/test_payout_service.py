@@ -2,10 +2,12 @@ from decimal import Decimal
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
-from apps.economy.models import DeltaCrownTransaction, DeltaCrownWallet
+from apps.economy.models import DeltaCrownTransaction, DeltaCrownWallet, WalletLedgerTotals
 from apps.tournaments.models import (
     Game,
     Payment,
@@ -16,6 +18,7 @@ from apps.tournaments.models import (
 )
 from apps.tournaments.services.payout_service import PayoutService
 from apps.user_profile.models import UserProfile
+from apps.user_profile.models.activity import EventType, UserActivity
 
 
 User = get_user_model()
@@ -279,3 +282,92 @@ class PayoutServiceTests(TestCase):
             ).count(),
             1,
         )
+
+    def _cancelled_with_payers(self, count):
+        tournament = self._tournament(status=Tournament.CANCELLED)
+        wallets = []
+        for i in range(count):
+            user = self._user(f"bulk-refund-{tournament.id}-{i}")
+            registration = self._registration(tournament, user)
+            wallets.append(self._original_dc_payment(tournament, registration, debit_amount=100, wallet_balance=400))
+        return tournament, wallets
+
+    def test_distribute_refunds_digest_matches_written_rows(self):
+        tournament, wallets = self._cancelled_with_payers(4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            digest = PayoutService.distribute_refunds(tournament.id, processed_by=self.organizer)
+
+        self.assertTrue(digest.is_reconciled)
+        self.assertEqual((digest.ledger_lines, digest.wallet_count), (4, 4))
+        self.assertEqual((digest.ledger_total, digest.balance_delta), (400, 400))
+        for wallet in wallets:
+            wallet.refresh_from_db()
+            self.assertEqual(wallet.cached_balance, 500)
+            self.assertEqual(wallet.profile.deltacoin_balance, Decimal("500"))
+            self.assertEqual(WalletLedgerTotals.objects.get(wallet=wallet).credit_count, 1)
+        self.assertEqual(
+            PrizeTransaction.objects.filter(tournament=tournament, status=PrizeTransaction.Status.REFUNDED).count(),
+            4,
+        )
+
+    def test_bulk_payout_records_coins_earned_activity_after_commit(self):
+        tournament = self._tournament()
+        winner = self._registration(tournament, self.winner_user)
+        TournamentResult.objects.create(
+            tournament=tournament,
+            winner=winner,
+            rules_applied={"determination": "test"},
+        )
+        self._wallet(self.winner_user, 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tx_ids = PayoutService.process_payouts(tournament.id, processed_by=self.organizer)
+        with self.captureOnCommitCallbacks(execute=True):
+            PayoutService.process_payouts(tournament.id, processed_by=self.organizer)
+
+        events = UserActivity.objects.filter(source_model="economy", source_id=tx_ids[0])
+        self.assertEqual(
+            list(events.values_list("event_type", "user_id")),
+            [(EventType.COINS_EARNED, self.winner_user.id)],
+        )
+        self.assertEqual(events.get().metadata["amount"], 250.0)
+
+    def test_refund_query_count_does_not_grow_with_field_size(self):
+        small, _ = self._cancelled_with_payers(2)
+        large, _ = self._cancelled_with_payers(8)
+
+        with CaptureQueriesContext(connection) as small_queries:
+            PayoutService.process_refunds(small.id, processed_by=self.organizer)
+        with CaptureQueriesContext(connection) as large_queries:
+            PayoutService.process_refunds(large.id, processed_by=self.organizer)
+
+        self.assertEqual(len(large_queries), len(small_queries))
+
+    def test_unpayable_refund_is_recorded_as_failed(self):
+        tournament, _ = self._cancelled_with_payers(1)
+        team_registration = Registration.objects.create(
+            tournament=tournament, team_id=4242, status=Registration.CONFIRMED,
+        )
+        DeltaCrownTransaction.objects.create(
+            wallet=self._wallet(self.organizer, 200),
+            amount=-100,
+            reason=DeltaCrownTransaction.Reason.ENTRY_FEE_DEBIT,
+            idempotency_key=f"tournament_entry_{tournament.id}_reg_{team_registration.id}",
+        )
+        Payment.objects.create(
+            registration=team_registration,
+            payment_method=Payment.DELTACOIN,
+            amount=Decimal("100.00"),
+            transaction_id="DC-team",
+            status=Payment.VERIFIED,
+        )
+
+        digest = PayoutService.distribute_refunds(tournament.id, processed_by=self.organizer)
+
+        self.assertFalse(digest.is_reconciled)
+        self.assertEqual([f["registration_id"] for f in digest.failed], [team_registration.id])
+        self.assertEqual(len(digest.transaction_ids), 1)
+        self.assertEqual(
+            PrizeTransaction.objects.get(participant=team_registration).status, PrizeTransaction.Status.FAILED,
+        )
@@ -0,0 +1,154 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.tournaments.models import Registration, RegistrationSlotCounter, Tournament
+from apps.tournaments.services import registration_slots
+from apps.tournaments.services.registration_service import RegistrationService
+
+
+User = get_user_model()
+pytestmark = pytest.mark.django_db(transaction=True)
+
+SERVICE = 'apps.tournaments.services.registration_service'
+
+
+@pytest.fixture
+def make_tournament(live_tournament_factory):
+    def _make(max_participants, slug='slots-cup'):
+        now = timezone.now()
+        return live_tournament_factory(
+            slug,
+            status=Tournament.REGISTRATION_OPEN,
+            max_participants=max_participants,
+            registration_start=now - timedelta(days=1),
+            registration_end=now + timedelta(days=7),
+            tournament_start=now + timedelta(days=8),
+        )
+    return _make
+
+
+@pytest.fixture(autouse=True)
+def quiet_side_effects():
+    with patch(f'{SERVICE}._publish_registration_event'), \
+            patch(f'{SERVICE}.on_registration_status_change'):
+        yield
+
+
+def _players(count, prefix='slot'):
+    User.objects.bulk_create([
+        User(username=f'{prefix}-{i}', email=f'{prefix}-{i}@test.com') for i in range(count)
+    ])
+    return list(User.objects.filter(username__startswith=f'{prefix}-').order_by('id'))
+
+
+def _register(tournament, user):
+    return RegistrationService.register_participant(
+        tournament_id=tournament.id,
+        user=user,
+        registration_data={'game_id': f'{user.username}#TAG'},
+    )
+
+
+def _reserved(tournament):
+    return RegistrationSlotCounter.objects.get(tournament=tournament).reserved
+
+
+def test_counter_follows_register_cancel_and_promote(make_tournament):
+    tournament = make_tournament(max_participants=2)
+    first, second, third = (_register(tournament, user) for user in _players(3))
+
+    assert [first.status, second.status, third.status] == [
+        Registration.PENDING, Registration.PENDING, Registration.WAITLISTED,
+    ]
+    assert third.waitlist_position == 1
+    assert _reserved(tournament) == 2
+
+    first.status = Registration.CANCELLED
+    first.save(update_fields=['status'])
+    assert _reserved(tournament) == 1
+
+    promoted = RegistrationService.auto_promote_waitlist(tournament.id)
+    assert promoted.id == third.id
+    assert _reserved(tournament) == 2
+
+    second.soft_delete()
+    assert _reserved(tournament) == 1
+
+
+def test_failed_claim_recounts_drifted_counter(make_tournament):
+    tournament = make_tournament(max_participants=2)
+    _register(tournament, _players(1)[0])
+    # A bypassed release (e.g. QuerySet.update) leaves the counter high
+    RegistrationSlotCounter.objects.filter(tournament=tournament).update(reserved=2)
+
+    with transaction.atomic():
+        assert registration_slots.reserve_slot(tournament.id, tournament.max_participants) is True
+
+    assert _reserved(tournament) == 2
+
+
+def test_rollback_returns_the_slot(make_tournament):
+    tournament = make_tournament(max_participants=1)
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            assert registration_slots.reserve_slot(tournament.id, 1)
+            raise RuntimeError('boom')
+
+    assert registration_slots.check_counters([tournament.id])['drifted'] == 0
+    assert _register(tournament, _players(1)[0]).status == Registration.PENDING
+
+
+def test_check_counters_reports_and_repairs_drift(make_tournament):
+    tournament = make_tournament(max_participants=4)
+    for user in _players(3):
+        _register(tournament, user)
+    Registration.objects.filter(tournament=tournament).update(status=Registration.CANCELLED)
+
+    report = registration_slots.check_counters([tournament.id])
+    assert (report['drifted'], report['repaired']) == (1, 0)
+
+    registration_slots.check_counters([tournament.id], repair=True)
+    assert _reserved(tournament) == 0
+
+
+@pytest.mark.slow
+def test_concurrent_registrations_never_overbook(make_tournament):
+    """500 simultaneous registrants for 64 slots: exactly 64 get in, the rest queue in order."""
+    capacity, registrants, workers = 64, 500, 32
+    tournament = make_tournament(max_participants=capacity, slug='slots-load-cup')
+    players = _players(registrants, prefix='load')
+
+    def register(user):
+        try:
+            return _register(tournament, user).status
+        finally:
+            connection.close()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        statuses = list(pool.map(register, players))
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"\n{registrants} registrations / {workers} workers in {elapsed:.2f}s "
+        f"({registrants / elapsed:.0f} registrations/s)"
+    )
+    assert statuses.count(Registration.PENDING) == capacity
+    assert statuses.count(Registration.WAITLISTED) == registrants - capacity
+
+    active = Registration.objects.filter(tournament=tournament, status__in=registration_slots.ACTIVE_STATUSES)
+    assert active.count() == capacity
+    assert _reserved(tournament) == capacity
+    positions = sorted(
+        Registration.objects.filter(tournament=tournament, status=Registration.WAITLISTED)
+        .values_list('waitlist_position', flat=True)
+    )
+    assert positions == list(range(1, registrants - capacity + 1))
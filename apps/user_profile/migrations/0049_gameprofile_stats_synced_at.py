@@ -0,0 +1,45 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Q, Subquery
+
+
+def backfill_stats_synced_at(apps, schema_editor):
+    """Seed from the linked OAuth connection so existing passports are not all due at once."""
+    GameProfile = apps.get_model("user_profile", "GameProfile")
+    GameOAuthConnection = apps.get_model("user_profile", "GameOAuthConnection")
+
+    last_synced = (
+        GameOAuthConnection.objects.filter(
+            Q(game_profile_id=OuterRef("pk")) | Q(passport_id=OuterRef("pk")),
+            last_synced_at__isnull=False,
+        )
+        .order_by("-last_synced_at")
+        .values("last_synced_at")[:1]
+    )
+    GameProfile.objects.filter(stats_synced_at__isnull=True).update(
+        stats_synced_at=Subquery(last_synced)
+    )
+
+
+def noop_reverse(apps, schema_editor):
+    return None
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user_profile", "0048_alter_communitypreferences_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gameprofile",
+            name="stats_synced_at",
+            field=models.DateTimeField(
+                blank=True,
+                db_index=True,
+                help_text="When a provider sync last refreshed this passport's stats. Null = never synced.",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(backfill_stats_synced_at, noop_reverse),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user_profile", "0049_gameprofile_stats_synced_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gameprofile",
+            name="stats_sync_retry_at",
+            field=models.DateTimeField(
+                blank=True,
+                db_index=True,
+                help_text="Earliest time a failed or unsyncable passport is tried again. Null = no back-off.",
+                null=True,
+            ),
+        ),
+    ]
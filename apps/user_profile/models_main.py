@@ -1926,6 +1926,20 @@ class GameProfile(models.Model):
         help_text="Cumulative verification attempts (for retry throttling and admin triage).",
     )
 
+    # Provider stats sync (services/passport_stats_sync.py)
+    stats_synced_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text="When a provider sync last refreshed this passport's stats. Null = never synced.",
+    )
+    stats_sync_retry_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text="Earliest time a failed or unsyncable passport is tried again. Null = no back-off.",
+    )
+
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
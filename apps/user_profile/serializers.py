@@ -4,6 +4,7 @@ from django.utils import timezone
 from rest_framework import serializers
 
 from apps.user_profile.models import GameProfile
+from apps.user_profile.services import passport_stats_sync
 
 
 def _safe_image_url(field):
@@ -326,10 +327,16 @@ class GameProfileSerializer(serializers.ModelSerializer):
 
         main_role = str(snapshot.get("most_played_role") or obj.main_role or "").strip()
 
-        synced_at = snapshot.get("synced_at") or metadata.get("riot_last_match_sync_at")
+        synced_at = (
+            snapshot.get("synced_at")
+            or metadata.get("riot_last_match_sync_at")
+            or obj.stats_synced_at
+        )
         if synced_at and hasattr(synced_at, "isoformat"):
             synced_at = synced_at.isoformat()
 
+        freshness = getattr(obj, "stats_freshness", None) or passport_stats_sync.freshness(obj)
+
         has_stats = bool(
             kd_ratio is not None
             or win_rate_pct is not None
@@ -352,4 +359,6 @@ class GameProfileSerializer(serializers.ModelSerializer):
             "deaths": self._coerce_int(snapshot.get("deaths")),
             "assists": self._coerce_int(snapshot.get("assists")),
             "synced_at": synced_at,
+            "stale": freshness.stale if freshness else None,
+            "refreshing": freshness.refreshing if freshness else False,
         }
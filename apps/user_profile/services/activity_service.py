@@ -35,10 +35,11 @@ Usage:
     )
 """
 
+from django.apps import apps
 from django.db import transaction
 from django.utils import timezone
 from apps.user_profile.models.activity import UserActivity, EventType
-from typing import Optional
+from typing import Iterable, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -273,6 +274,46 @@ class UserActivityService:
             timestamp=timestamp
         )
     
+    @classmethod
+    def record_economy_transactions(cls, transaction_ids: Iterable[int]) -> int:
+        """
+        Bulk form of record_economy_transaction for ledger lines written with
+        bulk_create, which never fires the on_economy_transaction signal.
+        
+        One read for the lines and their owners, one insert for the events;
+        lines that already have an event are skipped by the
+        unique_source_event constraint.
+        
+        Args:
+            transaction_ids: DeltaCrownTransaction IDs
+            
+        Returns:
+            Number of events submitted for insert
+        """
+        DeltaCrownTransaction = apps.get_model('economy', 'DeltaCrownTransaction')
+        rows = (
+            DeltaCrownTransaction.objects
+            .filter(pk__in=set(transaction_ids), wallet__profile__user__isnull=False)
+            .values_list('id', 'amount', 'reason', 'wallet__profile__user_id')
+        )
+        events = [
+            UserActivity(
+                event_type=EventType.COINS_EARNED if amount > 0 else EventType.COINS_SPENT,
+                user_id=user_id,
+                source_model='economy',
+                source_id=transaction_id,
+                metadata={
+                    'transaction_id': transaction_id,
+                    'amount': abs(float(amount)),
+                    'reason': reason,
+                },
+            )
+            for transaction_id, amount, reason, user_id in rows
+        ]
+        UserActivity.objects.bulk_create(events, batch_size=500, ignore_conflicts=True)
+        logger.info(f"Recorded {len(events)} economy events in bulk")
+        return len(events)
+    
     @classmethod
     def record_achievement_unlocked(
         cls,
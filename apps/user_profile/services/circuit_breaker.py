@@ -43,6 +43,10 @@ _STATE_HALF_OPEN = "half_open"
 class CircuitBreaker:
     """Redis-backed circuit breaker for external API calls.
 
+    The whole breaker (state, failure count, window start, open time) lives in
+    one cache entry, so the common CLOSED path costs a single read per call
+    and a healthy success adds no writes.
+
     Args:
         provider: Provider identifier (used as Redis key prefix).
         failure_threshold: Number of failures within *window_seconds* before opening.
@@ -61,9 +65,7 @@ class CircuitBreaker:
         self.failure_threshold = failure_threshold
         self.window_seconds = window_seconds
         self.cooldown_seconds = cooldown_seconds
-        self._state_key = f"dc:cb:{provider}:state"
-        self._fail_key = f"dc:cb:{provider}:failures"
-        self._open_at_key = f"dc:cb:{provider}:open_at"
+        self._key = f"dc:cb:{provider}"
 
     # ------------------------------------------------------------------
     # Public interface
@@ -71,15 +73,15 @@ class CircuitBreaker:
 
     def allow_request(self) -> bool:
         """Return ``True`` if a request should be allowed through."""
-        state = cache.get(self._state_key, _STATE_CLOSED)
+        state = self._load()
 
-        if state == _STATE_CLOSED:
+        if state["state"] == _STATE_CLOSED:
             return True
 
-        if state == _STATE_OPEN:
-            open_at = cache.get(self._open_at_key, 0.0)
-            if time.time() - open_at >= self.cooldown_seconds:
-                self._set_state(_STATE_HALF_OPEN)
+        if state["state"] == _STATE_OPEN:
+            if time.time() - state["open_at"] >= self.cooldown_seconds:
+                state["state"] = _STATE_HALF_OPEN
+                self._save(state)
                 logger.info("CircuitBreaker(%s): HALF_OPEN — allowing probe", self.provider)
                 return True
             return False
@@ -89,36 +91,48 @@ class CircuitBreaker:
 
     def record_success(self) -> None:
         """Call after a successful API response to reset the breaker."""
-        state = cache.get(self._state_key, _STATE_CLOSED)
-        if state in (_STATE_HALF_OPEN, _STATE_OPEN):
+        state = self._load()
+        if state["state"] == _STATE_CLOSED and not state["failures"]:
+            return
+        if state["state"] in (_STATE_HALF_OPEN, _STATE_OPEN):
             logger.info("CircuitBreaker(%s): probe succeeded — resetting to CLOSED", self.provider)
-        self._set_state(_STATE_CLOSED)
-        cache.delete(self._fail_key)
-        cache.delete(self._open_at_key)
+        cache.delete(self._key)
 
     def record_failure(self) -> None:
         """Call after a failed API call to increment the failure counter."""
-        failures = cache.get(self._fail_key, 0) + 1
-        cache.set(self._fail_key, failures, timeout=self.window_seconds)
-
-        state = cache.get(self._state_key, _STATE_CLOSED)
-        if state == _STATE_HALF_OPEN:
+        now = time.time()
+        state = self._load()
+        if now - state["window_start"] >= self.window_seconds:
+            state["failures"] = 0
+            state["window_start"] = now
+        state["failures"] += 1
+
+        if state["state"] == _STATE_HALF_OPEN:
             logger.warning("CircuitBreaker(%s): probe failed — re-opening", self.provider)
-            self._trip()
-        elif failures >= self.failure_threshold:
+            self._trip(state, now)
+        elif state["failures"] >= self.failure_threshold:
             logger.warning(
                 "CircuitBreaker(%s): %d failures in %ds — OPEN",
-                self.provider, failures, self.window_seconds,
+                self.provider, state["failures"], self.window_seconds,
             )
-            self._trip()
+            self._trip(state, now)
+        self._save(state)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _trip(self) -> None:
-        self._set_state(_STATE_OPEN)
-        cache.set(self._open_at_key, time.time(), timeout=self.cooldown_seconds * 2)
+    def _load(self) -> dict:
+        return cache.get(self._key) or {
+            "state": _STATE_CLOSED,
+            "failures": 0,
+            "window_start": 0.0,
+            "open_at": 0.0,
+        }
+
+    def _save(self, state: dict) -> None:
+        cache.set(self._key, state, timeout=self.cooldown_seconds * 4)
 
-    def _set_state(self, state: str) -> None:
-        cache.set(self._state_key, state, timeout=self.cooldown_seconds * 4)
+    def _trip(self, state: dict, now: float) -> None:
+        state["state"] = _STATE_OPEN
+        state["open_at"] = now
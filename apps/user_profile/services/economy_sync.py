@@ -9,6 +9,7 @@ Synchronizes wallet balance → profile caches:
 
 Called by:
 - economy signals (post_save DeltaCrownTransaction)
+- bulk ledger writers (sync_wallets_to_profiles, after bulk_create)
 - reconcile_economy management command
 - stats update workflows
 
@@ -22,7 +23,7 @@ Related: apps/user_profile/signals/activity_signals.py (creates UserActivity eve
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Optional
+from typing import Iterable, Optional
 
 from django.db import transaction
 from django.db.models import Sum, Q
@@ -101,6 +102,40 @@ def sync_wallet_to_profile(wallet_id: int) -> dict:
         }
 
 
+def sync_wallets_to_profiles(wallet_ids: Iterable[int]) -> int:
+    """
+    Bulk form of sync_wallet_to_profile for ledger lines written with
+    bulk_create, which never fires the post_save sync.
+    
+    Lifetime earnings come from the wallets' running ledger totals, so the
+    whole batch costs a fixed handful of queries.
+    
+    Returns:
+        Number of profiles updated
+    """
+    DeltaCrownWallet = apps.get_model('economy', 'DeltaCrownWallet')
+    UserProfile = apps.get_model('user_profile', 'UserProfile')
+    
+    wallets = list(
+        DeltaCrownWallet.objects.filter(pk__in=set(wallet_ids), profile__isnull=False)
+        .select_related('profile', 'ledger_totals')
+    )
+    profiles = []
+    for wallet in wallets:
+        totals = getattr(wallet, 'ledger_totals', None)
+        earnings = totals.total_credits if totals is not None else wallet.lifetime_earnings
+        wallet.lifetime_earnings = earnings
+        profile = wallet.profile
+        profile.deltacoin_balance = Decimal(str(wallet.cached_balance))
+        profile.lifetime_earnings = Decimal(str(earnings))
+        profiles.append(profile)
+    
+    with transaction.atomic():
+        DeltaCrownWallet.objects.bulk_update(wallets, ['lifetime_earnings'], batch_size=500)
+        UserProfile.objects.bulk_update(profiles, ['deltacoin_balance', 'lifetime_earnings'], batch_size=500)
+    return len(profiles)
+
+
 def sync_profile_by_user_id(user_id: int) -> Optional[dict]:
     """
     Sync profile economy fields for a given user ID.
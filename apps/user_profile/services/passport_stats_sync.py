@@ -0,0 +1,568 @@
+"""
+Passport stats sync scheduler.
+
+API-synced passports (Riot, Steam, Epic) keep their stats on the
+GameProfile row and ``GameProfile.stats_synced_at`` records when a provider
+last refreshed them. Profile views read those stored stats only, through
+``annotate_passport_stats``, which reports their age and whether a refresh
+is running. They never call a third-party API.
+
+Refreshes run in Celery:
+
+* ``refresh_stale_passports`` (beat) syncs passports older than their
+  provider's ``stale_after``. Due passports are ranked by profile traffic
+  before the batch is cut, so the busiest profiles go first, up to each
+  provider's hourly quota.
+* ``request_sync`` queues one passport's identity on demand; the public
+  profile view calls it for the stale passports it renders.
+
+A failed sync, or a passport with no upstream identity, gets
+``stats_sync_retry_at`` pushed out so it drops out of both paths until the
+back-off ends instead of taking a batch slot on every run.
+
+Both paths first claim an in-flight key for the upstream identity (Riot
+PUUID, Steam ID, Epic account). Concurrent triggers for the same identity
+therefore collapse into one upstream sync, which refreshes every passport
+linked to that identity. A provider's quota and its 429 back-off share one
+cache entry, so admitting a batch costs one cache read and one write.
+
+Tests register ``StubStatsProvider`` in ``PROVIDERS`` so the scheduler can
+run without network access.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Q
+from django.utils import timezone
+
+from apps.user_profile.models import GameOAuthConnection, GameProfile
+
+logger = logging.getLogger(__name__)
+
+QUOTA_WINDOW_SECONDS = 3600
+INFLIGHT_TTL_SECONDS = 600
+FAILURE_BACKOFF_SECONDS = 900
+UNSYNCABLE_BACKOFF_SECONDS = 86400
+CANDIDATE_SCAN_LIMIT = 5000
+TRAFFIC_TTL_SECONDS = 86400
+DEFAULT_RETRY_AFTER_SECONDS = 120
+BATCH_LOCK_KEY = "passport_stats:batch_lock"
+
+# request_sync / sync_identity outcomes
+QUEUED = "queued"
+COALESCED = "coalesced"
+UNSUPPORTED = "unsupported"
+SYNCED = "synced"
+DEFERRED = "deferred"
+FAILED = "failed"
+
+
+@dataclass
+class StatsProvider:
+    """How one provider's passports are identified, refreshed and throttled.
+
+    ``identity`` maps a passport to the upstream account it syncs from
+    (empty string when it cannot be synced). ``sync`` refreshes and persists
+    every passport sharing one identity. It raises on upstream failure, and
+    an exception whose ``status_code`` is 429 pauses the whole provider.
+    ``eligible`` narrows the batch candidates for this provider.
+    """
+
+    name: str
+    identity: Callable[[GameProfile], str]
+    sync: Callable[[str, list], None]
+    stale_after: int
+    hourly_quota: int
+    eligible: Callable[[], Q] = field(default=lambda: Q())
+
+    @property
+    def stale_seconds(self) -> int:
+        return int(getattr(settings, f"PASSPORT_STATS_{self.name.upper()}_STALE_SECONDS", self.stale_after))
+
+    @property
+    def quota(self) -> int:
+        return int(getattr(settings, f"PASSPORT_STATS_{self.name.upper()}_HOURLY_QUOTA", self.hourly_quota))
+
+
+class ProviderQuota:
+    """Hourly sync allowance for one provider, shared by every worker.
+
+    Token bucket refilled continuously at ``quota / hour``. An upstream 429
+    sets ``paused_until`` in the same entry, so no grant is made until the
+    provider's Retry-After has passed.
+    """
+
+    def __init__(self, provider: StatsProvider) -> None:
+        self.name = provider.name
+        self.capacity = max(1, provider.quota)
+        self.rate = self.capacity / QUOTA_WINDOW_SECONDS
+        self._key = f"passport_stats:quota:{provider.name}"
+
+    def _load(self, now: float) -> dict[str, float]:
+        state = cache.get(self._key) or {"tokens": float(self.capacity), "at": now, "paused_until": 0.0}
+        elapsed = max(0.0, now - state["at"])
+        state["tokens"] = min(float(self.capacity), state["tokens"] + elapsed * self.rate)
+        state["at"] = now
+        return state
+
+    def reserve(self, wanted: int) -> int:
+        """Take up to *wanted* syncs from the allowance; returns how many were granted."""
+        now = time.time()
+        state = self._load(now)
+        if state["paused_until"] > now:
+            return 0
+        granted = max(0, min(wanted, int(state["tokens"])))
+        if granted:
+            state["tokens"] -= granted
+            cache.set(self._key, state, timeout=QUOTA_WINDOW_SECONDS * 2)
+        return granted
+
+    def refund(self, count: int) -> None:
+        if count <= 0:
+            return
+        state = self._load(time.time())
+        state["tokens"] = min(float(self.capacity), state["tokens"] + count)
+        cache.set(self._key, state, timeout=QUOTA_WINDOW_SECONDS * 2)
+
+    def pause(self, seconds: float) -> None:
+        now = time.time()
+        state = self._load(now)
+        state["paused_until"] = max(state["paused_until"], now + seconds)
+        cache.set(self._key, state, timeout=QUOTA_WINDOW_SECONDS * 2)
+
+
+@dataclass(frozen=True)
+class StatsFreshness:
+    """Staleness metadata served next to a passport's cached stats."""
+
+    provider: str
+    synced_at: Optional[datetime]
+    stale_after: int
+    refreshing: bool = False
+
+    def age_seconds(self, now: Optional[datetime] = None) -> Optional[int]:
+        if self.synced_at is None:
+            return None
+        return max(0, int(((now or timezone.now()) - self.synced_at).total_seconds()))
+
+    @property
+    def stale(self) -> bool:
+        age = self.age_seconds()
+        return age is None or age >= self.stale_after
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "synced_at": self.synced_at.isoformat() if self.synced_at else None,
+            "age_seconds": self.age_seconds(),
+            "stale": self.stale,
+            "refreshing": self.refreshing,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Provider adapters
+# ---------------------------------------------------------------------------
+
+def _connection(passport: GameProfile, provider: str) -> Optional[GameOAuthConnection]:
+    return (
+        GameOAuthConnection.objects
+        .filter(Q(game_profile=passport) | Q(passport=passport), provider=provider)
+        .order_by("-updated_at")
+        .first()
+    )
+
+
+def _riot_identity(passport: GameProfile) -> str:
+    from apps.user_profile.tasks import _resolve_puuid_and_region
+
+    return _resolve_puuid_and_region(passport)[0]
+
+
+def _riot_sync(puuid: str, passports: list) -> None:
+    from apps.user_profile.tasks import _sync_single_passport
+
+    for passport in passports:
+        _sync_single_passport(passport)
+
+
+def _riot_eligible() -> Q:
+    eligible = Q(game__slug__iexact="valorant")
+    if bool(getattr(settings, "RIOT_SYNC_REQUIRE_VERIFIED", True)):
+        eligible &= Q(verification_status=GameProfile.VERIFICATION_VERIFIED)
+    return eligible
+
+
+def _steam_identity(passport: GameProfile) -> str:
+    metadata = passport.metadata if isinstance(passport.metadata, dict) else {}
+    steam_id = str(metadata.get("steam_id") or "").strip()
+    if steam_id:
+        return steam_id
+    conn = _connection(passport, GameOAuthConnection.Provider.STEAM)
+    return conn.provider_account_id if conn else ""
+
+
+def _steam_sync(steam_id: str, passports: list) -> None:
+    from apps.user_profile.services.oauth_steam_service import fetch_player_summary
+    from apps.user_profile.tasks import _apply_steam_summary
+
+    # One persona lookup covers the CS2 and Dota 2 passports of the account.
+    player = fetch_player_summary(steam_id)
+    for passport in passports:
+        _apply_steam_summary(passport, steam_id, player)
+
+
+def _epic_identity(passport: GameProfile) -> str:
+    metadata = passport.metadata if isinstance(passport.metadata, dict) else {}
+    account_id = str(metadata.get("epic_account_id") or "").strip()
+    if account_id:
+        return account_id
+    conn = _connection(passport, GameOAuthConnection.Provider.EPIC)
+    return conn.provider_account_id if conn else ""
+
+
+def _epic_sync(account_id: str, passports: list) -> None:
+    from apps.user_profile.services.epic_rl_stats_service import EpicStatsError, fetch_epic_profile
+    from apps.user_profile.tasks import _apply_epic_profile
+
+    conn = _connection(passports[0], GameOAuthConnection.Provider.EPIC)
+    if conn is None:
+        raise EpicStatsError("EPIC_NOT_CONNECTED", "No Epic connection for passport", 401, provider="epic")
+    profile = fetch_epic_profile(conn)
+    for passport in passports:
+        _apply_epic_profile(passport, profile)
+
+
+PROVIDERS: dict[str, StatsProvider] = {
+    "riot": StatsProvider(
+        name="riot",
+        identity=_riot_identity,
+        sync=_riot_sync,
+        stale_after=1800,
+        hourly_quota=300,
+        eligible=_riot_eligible,
+    ),
+    "steam": StatsProvider(
+        name="steam",
+        identity=_steam_identity,
+        sync=_steam_sync,
+        stale_after=4 * 3600,
+        hourly_quota=600,
+    ),
+    "epic": StatsProvider(
+        name="epic",
+        identity=_epic_identity,
+        sync=_epic_sync,
+        stale_after=4 * 3600,
+        hourly_quota=600,
+    ),
+}
+
+
+class StubStatsProvider(StatsProvider):
+    """Local provider for tests: records calls and writes canned stats.
+
+    Identity is ``metadata["stub_id"]``. Set ``error`` to make every sync
+    raise it instead.
+    """
+
+    def __init__(self, name: str = "stub", *, stats: Optional[dict] = None, stale_after: int = 600,
+                 hourly_quota: int = 100, error: Optional[Exception] = None) -> None:
+        super().__init__(
+            name=name,
+            identity=lambda passport: str((passport.metadata or {}).get("stub_id") or ""),
+            sync=self._sync,
+            stale_after=stale_after,
+            hourly_quota=hourly_quota,
+        )
+        self.stats = stats or {"kd_ratio": 1.25, "win_rate": 55}
+        self.error = error
+        self.calls: list[tuple[str, list[int]]] = []
+
+    def _sync(self, identity: str, passports: list) -> None:
+        self.calls.append((identity, [passport.id for passport in passports]))
+        if self.error is not None:
+            raise self.error
+        for passport in passports:
+            passport.kd_ratio = self.stats["kd_ratio"]
+            passport.win_rate = self.stats["win_rate"]
+            passport.save(update_fields=["kd_ratio", "win_rate", "updated_at"])
+
+
+# ---------------------------------------------------------------------------
+# Single flight
+# ---------------------------------------------------------------------------
+
+def _inflight_key(provider: str, identity: str) -> str:
+    return f"passport_stats:inflight:{provider}:{identity}"
+
+
+def _refreshing_key(passport_id: int) -> str:
+    return f"passport_stats:refreshing:{passport_id}"
+
+
+def _claim(provider: str, identity: str, passport_ids: Iterable[int]) -> bool:
+    """Claim the identity for one sync; ``False`` if another sync holds it."""
+    if not cache.add(_inflight_key(provider, identity), 1, timeout=INFLIGHT_TTL_SECONDS):
+        return False
+    cache.set_many({_refreshing_key(pid): 1 for pid in passport_ids}, timeout=INFLIGHT_TTL_SECONDS)
+    return True
+
+
+def _release(provider: str, identity: str, passport_ids: Iterable[int], *, backoff: int = 0) -> None:
+    cache.delete_many([_refreshing_key(pid) for pid in passport_ids])
+    if backoff:
+        # Keep the identity claimed so neither path retries it before the back-off ends.
+        cache.set(_inflight_key(provider, identity), 1, timeout=backoff)
+    else:
+        cache.delete(_inflight_key(provider, identity))
+
+
+def provider_for(passport: GameProfile) -> Optional[StatsProvider]:
+    metadata = passport.metadata if isinstance(passport.metadata, dict) else {}
+    return PROVIDERS.get(str(metadata.get("oauth_provider") or "").lower())
+
+
+def _back_off(passport_ids: Iterable[int], seconds: int) -> None:
+    GameProfile.objects.filter(id__in=list(passport_ids)).update(
+        stats_sync_retry_at=timezone.now() + timedelta(seconds=seconds),
+    )
+
+
+def request_sync(passport: GameProfile) -> str:
+    """Queue a background refresh of *passport*'s identity unless one is already running."""
+    if passport.stats_sync_retry_at and passport.stats_sync_retry_at > timezone.now():
+        return DEFERRED
+    provider = provider_for(passport)
+    identity = provider.identity(passport) if provider else ""
+    if not identity:
+        if provider is not None:
+            _back_off([passport.id], UNSYNCABLE_BACKOFF_SECONDS)
+        return UNSUPPORTED
+    if not _claim(provider.name, identity, [passport.id]):
+        return COALESCED
+
+    from apps.user_profile.tasks import sync_passport_stats
+
+    sync_passport_stats.delay(provider.name, identity, [passport.id])
+    return QUEUED
+
+
+def sync_identity(provider_name: str, identity: str, passport_ids: list[int], *, reserved: bool = False) -> str:
+    """Run one claimed identity sync and release the claim.
+
+    The caller must hold the in-flight claim. ``reserved`` means the quota
+    was already taken for this sync (the batch reserves in bulk).
+    """
+    provider = PROVIDERS.get(provider_name)
+    if provider is None:
+        _release(provider_name, identity, passport_ids)
+        return UNSUPPORTED
+
+    if not reserved and not ProviderQuota(provider).reserve(1):
+        _release(provider.name, identity, passport_ids)
+        return DEFERRED
+
+    passports = list(
+        GameProfile.objects.select_related("game", "oauth_connection").filter(id__in=passport_ids)
+    )
+    if not passports:
+        _release(provider.name, identity, passport_ids)
+        return FAILED
+
+    try:
+        provider.sync(identity, passports)
+    except Exception as exc:
+        status_code = getattr(exc, "status_code", None)
+        if status_code == 429:
+            metadata = getattr(exc, "metadata", None) or {}
+            retry_after = metadata.get("retry_after") or DEFAULT_RETRY_AFTER_SECONDS
+            ProviderQuota(provider).pause(float(retry_after))
+            logger.warning("Passport stats sync rate limited by %s; pausing %ss", provider.name, retry_after)
+            _release(provider.name, identity, passport_ids)
+            return DEFERRED
+        logger.warning(
+            "Passport stats sync failed for %s identity=%s passports=%s: %s",
+            provider.name, identity, passport_ids, exc,
+        )
+        _back_off(passport_ids, FAILURE_BACKOFF_SECONDS)
+        _release(provider.name, identity, passport_ids, backoff=FAILURE_BACKOFF_SECONDS)
+        return FAILED
+
+    now = timezone.now()
+    GameProfile.objects.filter(id__in=passport_ids).update(stats_synced_at=now, stats_sync_retry_at=None)
+    GameOAuthConnection.objects.filter(
+        Q(game_profile_id__in=passport_ids) | Q(passport_id__in=passport_ids),
+        provider=provider.name,
+    ).update(last_synced_at=now)
+    _release(provider.name, identity, passport_ids)
+    return SYNCED
+
+
+# ---------------------------------------------------------------------------
+# Profile traffic and staleness
+# ---------------------------------------------------------------------------
+
+def _traffic_key(user_id: int) -> str:
+    return f"passport_stats:traffic:{user_id}"
+
+
+def record_profile_traffic(user_id: int) -> None:
+    """Count a profile view; busier profiles get their passports refreshed first."""
+    key = _traffic_key(user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, timeout=TRAFFIC_TTL_SECONDS)
+
+
+def freshness(passport: GameProfile, *, refreshing: bool = False) -> Optional[StatsFreshness]:
+    """Staleness metadata for an API-synced passport, or ``None`` for manual ones."""
+    provider = provider_for(passport)
+    if provider is None:
+        return None
+    return StatsFreshness(
+        provider=provider.name,
+        synced_at=passport.stats_synced_at,
+        stale_after=provider.stale_seconds,
+        refreshing=refreshing,
+    )
+
+
+def annotate_passport_stats(
+    passports: Iterable[GameProfile],
+    *,
+    profile_user_id: Optional[int] = None,
+    request_stale: bool = False,
+) -> None:
+    """Attach ``stats_freshness`` to each passport for rendering.
+
+    Reads the cache only: one counter bump for the profile view and one
+    ``get_many`` for in-flight refreshes. With ``request_stale`` each stale
+    passport that is not already refreshing is queued through
+    ``request_sync``; nothing is fetched inline.
+    """
+    passports = list(passports)
+    if profile_user_id is not None:
+        record_profile_traffic(profile_user_id)
+
+    synced = [passport for passport in passports if provider_for(passport) is not None]
+    running = cache.get_many([_refreshing_key(passport.id) for passport in synced]) if synced else {}
+    for passport in passports:
+        refreshing = _refreshing_key(passport.id) in running
+        stats_freshness = freshness(passport, refreshing=refreshing)
+        if request_stale and stats_freshness is not None and stats_freshness.stale and not refreshing:
+            try:
+                if request_sync(passport) == QUEUED:
+                    stats_freshness = freshness(passport, refreshing=True)
+            except Exception:
+                logger.warning("Could not queue stats refresh for passport %s", passport.id, exc_info=True)
+        passport.stats_freshness = stats_freshness
+
+
+# ---------------------------------------------------------------------------
+# Background batch
+# ---------------------------------------------------------------------------
+
+def _due_passports(now: datetime, limit: int) -> list[GameProfile]:
+    """Stale passports outside any back-off, busiest profiles first.
+
+    Ranking needs the traffic counters in the cache, so up to
+    ``CANDIDATE_SCAN_LIMIT`` due rows are read as bare ids first, ranked,
+    and only the top ``limit`` are loaded.
+    """
+    due = Q()
+    for provider in PROVIDERS.values():
+        cutoff = now - timedelta(seconds=provider.stale_seconds)
+        due |= (
+            Q(metadata__oauth_provider=provider.name)
+            & provider.eligible()
+            & (Q(stats_synced_at__isnull=True) | Q(stats_synced_at__lt=cutoff))
+        )
+    rows = list(
+        GameProfile.objects
+        .filter(due, status=GameProfile.STATUS_ACTIVE)
+        .filter(Q(stats_sync_retry_at__isnull=True) | Q(stats_sync_retry_at__lte=now))
+        .order_by(F("stats_synced_at").asc(nulls_first=True), "id")
+        .values_list("id", "user_id", "stats_synced_at")[:CANDIDATE_SCAN_LIMIT]
+    )
+    if not rows:
+        return []
+
+    traffic = cache.get_many({_traffic_key(user_id) for _, user_id, _ in rows})
+    epoch = now - timedelta(days=36500)
+    rows.sort(key=lambda row: (-int(traffic.get(_traffic_key(row[1])) or 0), row[2] or epoch, row[0]))
+    ids = [row[0] for row in rows[:limit]]
+    by_id = GameProfile.objects.select_related("game", "oauth_connection").in_bulk(ids)
+    return [by_id[passport_id] for passport_id in ids if passport_id in by_id]
+
+
+def refresh_stale_passports(batch_size: Optional[int] = None) -> dict[str, Any]:
+    """Sync the stale passports of the busiest profiles within each provider's quota."""
+    if batch_size is None:
+        batch_size = int(getattr(settings, "PASSPORT_STATS_BATCH_SIZE", 50))
+    summary: dict[str, Any] = {"candidates": 0, SYNCED: 0, FAILED: 0, DEFERRED: 0, COALESCED: 0}
+
+    if not cache.add(BATCH_LOCK_KEY, 1, timeout=INFLIGHT_TTL_SECONDS):
+        summary["skipped"] = "locked"
+        return summary
+
+    try:
+        candidates = _due_passports(timezone.now(), batch_size * 4)
+        summary["candidates"] = len(candidates)
+        if not candidates:
+            return summary
+
+        # Group by upstream identity, keeping traffic order of first appearance.
+        groups: dict[tuple[str, str], list[int]] = defaultdict(list)
+        unsyncable: list[int] = []
+        for passport in candidates:
+            provider = provider_for(passport)
+            identity = provider.identity(passport) if provider else ""
+            if identity:
+                groups[(provider.name, identity)].append(passport.id)
+            else:
+                unsyncable.append(passport.id)
+        if unsyncable:
+            _back_off(unsyncable, UNSYNCABLE_BACKOFF_SECONDS)
+            summary[UNSUPPORTED] = len(unsyncable)
+
+        by_provider: dict[str, list[tuple[str, list[int]]]] = defaultdict(list)
+        for (provider_name, identity), passport_ids in list(groups.items())[:batch_size]:
+            by_provider[provider_name].append((identity, passport_ids))
+
+        for provider_name, pending in by_provider.items():
+            quota = ProviderQuota(PROVIDERS[provider_name])
+            granted = quota.reserve(len(pending))
+            summary[DEFERRED] += len(pending) - granted
+            used = 0
+            admitted = pending[:granted]
+            for position, (identity, passport_ids) in enumerate(admitted):
+                if not _claim(provider_name, identity, passport_ids):
+                    summary[COALESCED] += 1
+                    continue
+                used += 1
+                outcome = sync_identity(provider_name, identity, passport_ids, reserved=True)
+                summary[outcome] = summary.get(outcome, 0) + 1
+                if outcome == DEFERRED:
+                    # Provider paused mid-batch; leave the rest for a later run.
+                    summary[DEFERRED] += len(admitted) - position - 1
+                    break
+            quota.refund(granted - used)
+    finally:
+        cache.delete(BATCH_LOCK_KEY)
+
+    logger.info(
+        "Passport stats batch: candidates=%s synced=%s failed=%s deferred=%s coalesced=%s",
+        summary["candidates"], summary[SYNCED], summary[FAILED], summary[DEFERRED], summary[COALESCED],
+    )
+    return summary
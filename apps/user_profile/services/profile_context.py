@@ -26,6 +26,7 @@ import logging
 from apps.user_profile.models import UserProfile, UserProfileStats, UserActivity, PrivacySettings
 from apps.user_profile.services.privacy_policy import ProfileVisibilityPolicy
 from apps.user_profile.utils import get_user_profile_safe
+from apps.common import cache_tags
 from apps.common.media_urls import field_file_url
 
 User = get_user_model()
@@ -37,39 +38,24 @@ logger = logging.getLogger(__name__)
 #
 # `build_public_profile_context` returns SAFE primitives only — pickle-friendly.
 # Cache key: profile:ctx:{username}:{version}:{viewer_role}:{sections}:{page}.
-# Invalidation uses a per-username version counter so a single cache.incr()
-# evicts every variant atomically.
+# Invalidation bumps the `profile:{username}` cache tag so a single
+# cache.incr() evicts every variant atomically (see apps.common.cache_tags).
 # -----------------------------------------------------------------------------
 
-_PROFILE_CTX_VERSION_KEY = 'profile:ctx:ver:{username}'
 _PROFILE_CTX_TTL_SECONDS = 300  # 5 min — bursty profile traffic, slow drift.
 
 
 def _profile_cache_version(username: str) -> int:
-    """Return the current invalidation counter for this username, init=1."""
-    key = _PROFILE_CTX_VERSION_KEY.format(username=username)
-    v = cache.get(key)
-    if v is None:
-        # No expiry — version persists across cache GC of payload entries.
-        cache.set(key, 1, None)
-        return 1
-    try:
-        return int(v)
-    except (TypeError, ValueError):
-        cache.set(key, 1, None)
-        return 1
+    """Return the current generation of this username's profile tag."""
+    tag = cache_tags.profile_tag(username)
+    return cache_tags.tag_versions([tag])[tag]
 
 
 def invalidate_public_profile_cache(username: str) -> None:
-    """Bump the profile's cache version. O(1) eviction of every cached entry."""
+    """Bump the profile's cache tag. O(1) eviction of every cached entry."""
     if not username:
         return
-    key = _PROFILE_CTX_VERSION_KEY.format(username=username)
-    try:
-        cache.incr(key)
-    except ValueError:
-        # Key didn't exist (first invalidation before any cache miss).
-        cache.set(key, 2, None)
+    cache_tags.invalidate(cache_tags.profile_tag(username))
 
 
 def build_public_profile_context_cached(
@@ -60,7 +60,9 @@ class RateLimiter:
         Returns:
             ``True`` if tokens were available and consumed; ``False`` if rate-limited.
         """
-        now = time.monotonic()
+        # Wall clock, not monotonic: the bucket is shared by every worker
+        # process and monotonic clocks are not comparable across them.
+        now = time.time()
         state = cache.get(self._key) or {"tokens": float(self.burst), "last": now}
 
         elapsed = max(0.0, now - state["last"])
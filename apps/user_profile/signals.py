@@ -75,6 +75,14 @@ def _connect_receivers() -> None:
     def _userprofile_changed(sender, instance, **kwargs):  # noqa: ANN001
         _safe_invalidate(_username_from_user_profile(instance))
 
+    @receiver(post_save, sender=UserProfile, dispatch_uid='request_principal:userprofile_save')
+    @receiver(post_delete, sender=UserProfile, dispatch_uid='request_principal:userprofile_delete')
+    def _userprofile_prefs_changed(sender, instance, **kwargs):  # noqa: ANN001
+        # Platform preferences live on UserProfile; drop the cached principal.
+        from apps.accounts.request_principal import invalidate_principal
+
+        invalidate_principal(instance.user_id)
+
     @receiver(post_save, sender=UserProfileStats, dispatch_uid='profile_cache:stats_save')
     def _stats_changed(sender, instance, **kwargs):  # noqa: ANN001
         _safe_invalidate(_username_from_user_profile(instance))
@@ -733,6 +733,56 @@ def sync_all_active_riot_passports(self) -> dict[str, Any]:
     return summary
 
 
+def _apply_steam_summary(passport: GameProfile, steam_id: str, player) -> None:
+    """Persist a Steam player summary (and CS2 stats for CS2 passports) onto *passport*."""
+    metadata = passport.metadata.copy() if isinstance(passport.metadata, dict) else {}
+    metadata.update({
+        "steam_persona_name": player.personaname,
+        "steam_avatar": player.avatar,
+        "steam_avatar_medium": player.avatar_medium,
+        "steam_avatar_full": player.avatar_full,
+        "steam_profile_url": player.profile_url,
+    })
+
+    # Fetch CS2 aggregate stats for CS2 passports (best-effort; non-fatal)
+    game = getattr(passport, "game", None)
+    game_slug = getattr(game, "slug", "").lower() if game else ""
+    cs2_stats = None
+    if game_slug == "cs2":
+        try:
+            from apps.user_profile.services.steam_cs2_stats_service import fetch_cs2_stats
+            cs2_stats = fetch_cs2_stats(steam_id)
+            metadata["cs2_stats"] = cs2_stats
+        except Exception:
+            pass  # Stats are best-effort; persona sync still succeeds
+
+    passport.ign = player.personaname
+    passport.in_game_name = player.personaname
+    passport.metadata = metadata
+    if cs2_stats is not None:
+        passport.kd_ratio = cs2_stats.get("kd_ratio")
+        passport.win_rate = int(round(cs2_stats.get("win_rate", 0)))
+        secs = cs2_stats.get("total_time_played_seconds") or 0
+        passport.hours_played = (secs // 3600) or None
+    update_fields = ["ign", "in_game_name", "metadata", "updated_at"]
+    if cs2_stats is not None:
+        update_fields += ["kd_ratio", "win_rate", "hours_played"]
+    passport.save(update_fields=update_fields)
+
+
+def _apply_epic_profile(passport: GameProfile, profile: dict[str, Any]) -> None:
+    """Persist the Epic display name from a userinfo *profile* onto *passport*."""
+    display_name = profile.get("display_name", "")
+    if not display_name:
+        return
+    metadata = passport.metadata.copy() if isinstance(passport.metadata, dict) else {}
+    metadata["epic_display_name"] = display_name
+    passport.ign = display_name
+    passport.in_game_name = display_name
+    passport.metadata = metadata
+    passport.save(update_fields=["ign", "in_game_name", "metadata", "updated_at"])
+
+
 @shared_task(bind=True, name="user_profile.sync_all_active_steam_passports")
 def sync_all_active_steam_passports(self) -> dict[str, Any]:
     """Periodic sync: refresh Steam persona name and avatar for linked passports."""
@@ -792,40 +842,7 @@ def sync_all_active_steam_passports(self) -> dict[str, Any]:
             _sleep(per_conn_delay)
             continue
 
-        passport = conn.passport
-        metadata = passport.metadata.copy() if isinstance(passport.metadata, dict) else {}
-        metadata.update({
-            "steam_persona_name": player.personaname,
-            "steam_avatar": player.avatar,
-            "steam_avatar_medium": player.avatar_medium,
-            "steam_avatar_full": player.avatar_full,
-            "steam_profile_url": player.profile_url,
-        })
-
-        # Fetch CS2 aggregate stats for CS2 passports (best-effort; non-fatal)
-        game_slug = getattr(getattr(conn, "passport", None), "game", None)
-        game_slug = getattr(game_slug, "slug", "").lower() if game_slug else ""
-        cs2_stats = None
-        if game_slug == "cs2":
-            try:
-                from apps.user_profile.services.steam_cs2_stats_service import fetch_cs2_stats, CS2StatsError
-                cs2_stats = fetch_cs2_stats(steam_id)
-                metadata["cs2_stats"] = cs2_stats
-            except Exception:
-                pass  # Stats are best-effort; persona sync still succeeds
-
-        passport.ign = player.personaname
-        passport.in_game_name = player.personaname
-        passport.metadata = metadata
-        if cs2_stats is not None:
-            passport.kd_ratio = cs2_stats.get("kd_ratio")
-            passport.win_rate = int(round(cs2_stats.get("win_rate", 0)))
-            secs = cs2_stats.get("total_time_played_seconds") or 0
-            passport.hours_played = (secs // 3600) or None
-        update_fields = ["ign", "in_game_name", "metadata", "updated_at"]
-        if cs2_stats is not None:
-            update_fields += ["kd_ratio", "win_rate", "hours_played"]
-        passport.save(update_fields=update_fields)
+        _apply_steam_summary(conn.passport, steam_id, player)
 
         conn.last_synced_at = timezone.now()
         conn.save(update_fields=["last_synced_at"])
@@ -887,16 +904,7 @@ def sync_all_active_epic_passports(self) -> dict[str, Any]:
             # Best-effort: refresh Epic display name via userinfo endpoint
             try:
                 from apps.user_profile.services.epic_rl_stats_service import fetch_epic_profile
-                profile = fetch_epic_profile(conn)
-                display_name = profile.get("display_name", "")
-                if display_name:
-                    passport = conn.passport
-                    metadata = passport.metadata.copy() if isinstance(passport.metadata, dict) else {}
-                    metadata["epic_display_name"] = display_name
-                    passport.ign = display_name
-                    passport.in_game_name = display_name
-                    passport.metadata = metadata
-                    passport.save(update_fields=["ign", "in_game_name", "metadata", "updated_at"])
+                _apply_epic_profile(conn.passport, fetch_epic_profile(conn))
             except Exception:
                 pass  # Display name refresh is best-effort; token refresh still counted
         except EpicOAuthError as exc:
@@ -940,4 +948,25 @@ def sync_all_active_epic_passports(self) -> dict[str, Any]:
         summary["total_candidates"], summary["refreshed"], len(summary["requires_reauth"]),
         summary["failed"], summary["duration_seconds"],
     )
-    return summary
\ No newline at end of file
+    return summary
+
+@shared_task(bind=True, name="user_profile.sync_passport_stats")
+def sync_passport_stats(self, provider: str, identity: str, passport_ids: list[int]) -> dict[str, Any]:
+    """Run one coalesced identity sync claimed by ``passport_stats_sync.request_sync``."""
+    from apps.user_profile.services.passport_stats_sync import sync_identity
+
+    return {
+        "status": sync_identity(provider, identity, passport_ids),
+        "provider": provider,
+        "passport_ids": passport_ids,
+    }
+
+
+@shared_task(bind=True, name="user_profile.refresh_stale_passport_stats")
+def refresh_stale_passport_stats(self) -> dict[str, Any]:
+    """Periodic batch: refresh stale passports, busiest profiles first, within provider quotas."""
+    from apps.user_profile.services.passport_stats_sync import refresh_stale_passports
+
+    if not bool(getattr(settings, "PASSPORT_STATS_SCHEDULER_ENABLED", True)):
+        return {"status": "skipped", "reason": "scheduler_disabled"}
+    return refresh_stale_passports()
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.user_profile.models import GameProfile
+from apps.user_profile.services import passport_stats_sync
+from apps.user_profile.services.base_game_api import GameAPIError
+from apps.user_profile.services.passport_stats_sync import (
+    COALESCED,
+    DEFERRED,
+    FAILED,
+    QUEUED,
+    SYNCED,
+    UNSUPPORTED,
+    StubStatsProvider,
+    annotate_passport_stats,
+    record_profile_traffic,
+    refresh_stale_passports,
+    request_sync,
+    sync_identity,
+)
+
+
+@pytest.fixture
+def stub_provider():
+    cache.clear()
+    stub = StubStatsProvider(hourly_quota=2)
+    with patch.dict(passport_stats_sync.PROVIDERS, {"stub": stub}, clear=True):
+        yield stub
+    cache.clear()
+
+
+@pytest.fixture
+def games(game_factory):
+    return [
+        game_factory(f"stub-game-{n}", name=f"Stub Game {n}", short_code=f"SG{n}", category="FPS", platforms=["PC"])
+        for n in (1, 2)
+    ]
+
+
+def _passport(user, game, stub_id, synced_at=None):
+    return GameProfile.objects.create(
+        user=user,
+        game=game,
+        ign=f"{user.username}-{game.slug}",
+        in_game_name=f"{user.username}-{game.slug}",
+        identity_key=f"{user.username}-{game.slug}",
+        status=GameProfile.STATUS_ACTIVE,
+        metadata={"oauth_provider": "stub", "stub_id": stub_id},
+        stats_synced_at=synced_at,
+    )
+
+
+def _user(django_user_model, username):
+    return django_user_model.objects.create_user(
+        username=username, email=f"{username}@example.com", password="pass1234",
+    )
+
+
+@pytest.mark.django_db
+def test_concurrent_requests_for_one_identity_are_coalesced(stub_provider, games, django_user_model):
+    passport = _passport(_user(django_user_model, "single_flight"), games[0], "acct-1")
+
+    with patch("apps.user_profile.tasks.sync_passport_stats.delay") as delay:
+        assert request_sync(passport) == QUEUED
+        assert request_sync(passport) == COALESCED
+        delay.assert_called_once_with("stub", "acct-1", [passport.id])
+
+        assert sync_identity("stub", "acct-1", [passport.id]) == SYNCED
+        assert request_sync(passport) == QUEUED
+
+    passport.refresh_from_db()
+    assert stub_provider.calls == [("acct-1", [passport.id])]
+    assert passport.stats_synced_at is not None
+    assert passport.kd_ratio == 1.25
+
+
+@pytest.mark.django_db
+def test_batch_refreshes_busiest_profiles_first_within_quota(stub_provider, games, django_user_model):
+    quiet, busy, busiest = (_user(django_user_model, name) for name in ("quiet", "busy", "busiest"))
+    stale = timezone.now() - timedelta(hours=2)
+    _passport(quiet, games[0], "quiet-acct", synced_at=stale - timedelta(hours=1))
+    _passport(busy, games[0], "busy-acct", synced_at=stale)
+    _passport(busiest, games[0], "busiest-acct", synced_at=stale)
+    _passport(django_user_model.objects.create_user(username="fresh", password="x"), games[0], "fresh-acct",
+              synced_at=timezone.now())
+    for _ in range(3):
+        record_profile_traffic(busiest.id)
+    record_profile_traffic(busy.id)
+
+    summary = refresh_stale_passports()
+
+    assert [identity for identity, _ in stub_provider.calls] == ["busiest-acct", "busy-acct"]
+    assert summary[SYNCED] == 2
+    assert summary[DEFERRED] == 1
+
+
+@pytest.mark.django_db
+def test_passports_sharing_an_identity_sync_in_one_call(stub_provider, games, django_user_model):
+    user = _user(django_user_model, "two_games")
+    first = _passport(user, games[0], "shared-acct")
+    second = _passport(user, games[1], "shared-acct")
+
+    refresh_stale_passports()
+
+    assert stub_provider.calls == [("shared-acct", sorted([first.id, second.id]))]
+    assert GameProfile.objects.filter(stats_synced_at__isnull=False).count() == 2
+
+
+@pytest.mark.django_db
+def test_rate_limited_provider_is_paused(stub_provider, games, django_user_model):
+    _passport(_user(django_user_model, "throttled"), games[0], "throttled-acct")
+    stub_provider.error = GameAPIError("STUB_RATE_LIMITED", "slow down", 429, provider="stub")
+
+    assert refresh_stale_passports()[DEFERRED] == 1
+
+    stub_provider.error = None
+    refresh_stale_passports()
+    assert len(stub_provider.calls) == 1
+
+
+@pytest.mark.django_db
+def test_profile_annotation_serves_staleness_without_syncing(stub_provider, games, django_user_model):
+    user = _user(django_user_model, "viewed")
+    fresh = _passport(user, games[0], "fresh-acct", synced_at=timezone.now())
+    stale = _passport(user, games[1], "stale-acct", synced_at=timezone.now() - timedelta(days=1))
+
+    with patch("apps.user_profile.tasks.sync_passport_stats.delay"):
+        request_sync(stale)
+    annotate_passport_stats([fresh, stale], profile_user_id=user.id)
+
+    assert stub_provider.calls == []
+    assert fresh.stats_freshness.as_dict()["stale"] is False
+    assert stale.stats_freshness.stale is True
+    assert stale.stats_freshness.refreshing is True
+    assert cache.get(f"passport_stats:traffic:{user.id}") == 1
+
+
+@pytest.mark.django_db
+def test_traffic_ranking_happens_before_the_batch_is_cut(stub_provider, games, django_user_model):
+    stale = timezone.now() - timedelta(hours=2)
+    for n in range(3):
+        _passport(_user(django_user_model, f"oldest_{n}"), games[0], f"old-{n}", synced_at=stale - timedelta(hours=1))
+    busy = _user(django_user_model, "busy_recent")
+    _passport(busy, games[0], "busy-acct", synced_at=stale)
+    record_profile_traffic(busy.id)
+
+    refresh_stale_passports(batch_size=1)
+
+    assert stub_provider.calls[0][0] == "busy-acct"
+
+
+@pytest.mark.django_db
+def test_unsyncable_and_failing_passports_back_off(stub_provider, games, django_user_model):
+    blank = _passport(_user(django_user_model, "no_identity"), games[0], "")
+    broken = _passport(_user(django_user_model, "upstream_down"), games[1], "broken-acct")
+    stub_provider.error = GameAPIError("STUB_DOWN", "upstream error", 500, provider="stub")
+
+    summary = refresh_stale_passports()
+    assert summary[UNSUPPORTED] == 1
+    assert summary[FAILED] == 1
+
+    blank.refresh_from_db()
+    broken.refresh_from_db()
+    assert blank.stats_sync_retry_at > timezone.now()
+    assert broken.stats_sync_retry_at > timezone.now()
+    assert blank.stats_synced_at is None and broken.stats_synced_at is None
+
+    stub_provider.error = None
+    assert refresh_stale_passports()["candidates"] == 0
+    assert request_sync(broken) == DEFERRED
+
+
+@pytest.mark.django_db
+def test_profile_annotation_queues_stale_passports(stub_provider, games, django_user_model):
+    user = _user(django_user_model, "viewed_stale")
+    fresh = _passport(user, games[0], "fresh-acct", synced_at=timezone.now())
+    stale = _passport(user, games[1], "stale-acct", synced_at=timezone.now() - timedelta(days=1))
+
+    with patch("apps.user_profile.tasks.sync_passport_stats.delay") as delay:
+        annotate_passport_stats([fresh, stale], profile_user_id=user.id, request_stale=True)
+        annotate_passport_stats([fresh, stale], profile_user_id=user.id, request_stale=True)
+
+    delay.assert_called_once_with("stub", "stale-acct", [stale.id])
+    assert stale.stats_freshness.refreshing is True
+    assert fresh.stats_freshness.refreshing is False
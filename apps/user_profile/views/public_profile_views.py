@@ -494,6 +494,11 @@ def public_profile_view(request: HttpRequest, username: str) -> HttpResponse:
                 else:
                     passport.current_team = None
         
+        # Stored stats plus staleness only — stale passports are queued for a
+        # background refresh, never synced inline with the page render.
+        from apps.user_profile.services.passport_stats_sync import annotate_passport_stats
+        annotate_passport_stats(all_passports, profile_user_id=profile_user.id, request_stale=True)
+        
         # Separate pinned and unpinned
         pinned_passports = [p for p in all_passports if p.is_pinned]
         unpinned_passports = [p for p in all_passports if not p.is_pinned]
@@ -4,8 +4,8 @@
 import os
 import sys
 
-# Import Redis fixtures for Module 6.8 rate limit tests
-pytest_plugins = ['tests.redis_fixtures']
+# Redis fixtures for Module 6.8 rate limit tests; shared game/tournament factories
+pytest_plugins = ['tests.redis_fixtures', 'tests.tournament_fixtures']
 
 # ── Apply model compatibility shims GLOBALLY ──
 # Must run before ANY test module imports so patches cover apps/ AND tests/.
@@ -40,6 +40,9 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 
 # Auto-discover tasks in all installed apps
 app.autodiscover_tasks()
+# apps.common.events is a sub-package, not an app — register its tasks
+# (dispatch_event_task, outbox relay) on workers explicitly.
+app.autodiscover_tasks(['apps.common.events'])
 
 # ---------------------------------------------------------------------------
 # Feature flag: set ENABLE_CELERY_BEAT=1 in Render env vars to activate the
@@ -49,6 +52,25 @@ app.autodiscover_tasks()
 _beat_enabled = os.getenv('ENABLE_CELERY_BEAT', '0') == '1'
 _media_cleanup_beat_enabled = os.getenv('ENABLE_MEDIA_CLEANUP_BEAT', '0') == '1'
 
+# With the lifecycle deadline index on (default), process-lifecycle-deadlines
+# dispatches due no-shows / lobby closes / payment expiries / status advances
+# every minute and the scans that used to find them run hourly as a safety net.
+_deadline_index_enabled = os.getenv('LIFECYCLE_DEADLINE_INDEX_ENABLED', '1').strip().lower() in {
+    '1', 'true', 'yes', 'on',
+}
+
+# With the passport stats scheduler on (default), refresh-stale-passport-stats
+# syncs stale Riot / Steam passports within provider quotas every few minutes
+# and the full-fleet sweeps only run nightly as a safety net.
+_passport_stats_scheduler_enabled = os.getenv('PASSPORT_STATS_SCHEDULER_ENABLED', '1').strip().lower() in {
+    '1', 'true', 'yes', 'on',
+}
+
+# The EventBus outbox relay sweep only runs when the outbox is on.
+_events_outbox_enabled = os.getenv('EVENTS_OUTBOX_ENABLED', '0').strip().lower() in {
+    '1', 'true', 'yes', 'on',
+}
+
 # ---------------------------------------------------------------------------
 # Lightweight tasks — always scheduled (cheap, infrequent)
 #
@@ -59,6 +81,7 @@ _media_cleanup_beat_enabled = os.getenv('ENABLE_MEDIA_CLEANUP_BEAT', '0') == '1'
 #   2:00 AM  (reserved for inactivity decay in heavy schedule)
 #   2:30 AM  (reserved for org rankings in heavy schedule)
 #   3:00 AM  (reserved for auto-archive in heavy schedule)
+#   3:45 AM  LFT discovery index rebuild
 #   8:00 AM  digest emails
 # ---------------------------------------------------------------------------
 _base_schedule = {
@@ -72,6 +95,13 @@ _base_schedule = {
         'task': 'apps.notifications.tasks.send_daily_digest',
         'schedule': crontab(hour=8, minute=0),
     },
+    # Rebuild the LFT discovery index nightly at 3:45 AM (signals keep it
+    # current; this repairs rows written around them)
+    'rebuild-player-discovery-index': {
+        'task': 'apps.organizations.tasks.rebuild_player_discovery_index',
+        'schedule': crontab(hour=3, minute=45),
+        'options': {'expires': 3600},
+    },
     # Clean expired invites every 6 hours
     'clean-expired-invites': {
         'task': 'apps.organizations.tasks.clean_expired_invites',
@@ -96,12 +126,28 @@ _heavy_schedule = {
     # Auto-advance tournament statuses every 5 minutes
     'auto-advance-tournaments': {
         'task': 'apps.tournaments.tasks.auto_advance_tournaments',
-        'schedule': crontab(minute='*/5'),
+        'schedule': crontab(minute=5) if _deadline_index_enabled else crontab(minute='*/5'),
         'options': {
             'expires': 300,
         },
     },
 
+    # Dispatch due lifecycle deadlines every minute; re-seed the index hourly
+    'process-lifecycle-deadlines': {
+        'task': 'apps.tournaments.tasks.process_lifecycle_deadlines',
+        'schedule': crontab(minute='*'),
+        'options': {
+            'expires': 60,
+        },
+    },
+    'resync-lifecycle-deadlines': {
+        'task': 'apps.tournaments.tasks.resync_lifecycle_deadlines',
+        'schedule': crontab(minute=50),
+        'options': {
+            'expires': 3600,
+        },
+    },
+
     # Auto-archive completed/cancelled tournaments daily at 3:00 AM (moved from 4 AM)
     'auto-archive-tournaments': {
         'task': 'apps.tournaments.tasks.auto_archive_tournaments',
@@ -114,7 +160,7 @@ _heavy_schedule = {
     # P4-T02: Expire overdue (unpaid) payments every 15 minutes
     'expire-overdue-payments': {
         'task': 'apps.tournaments.tasks.expire_overdue_payments',
-        'schedule': crontab(minute='*/15'),
+        'schedule': crontab(minute=25) if _deadline_index_enabled else crontab(minute='*/15'),
         'options': {
             'expires': 900,
         },
@@ -123,7 +169,7 @@ _heavy_schedule = {
     # No-show auto-DQ every 2 minutes
     'check-no-show-matches': {
         'task': 'apps.tournaments.tasks.check_no_show_matches',
-        'schedule': crontab(minute='*/2'),
+        'schedule': crontab(minute=35) if _deadline_index_enabled else crontab(minute='*/2'),
         'options': {
             'expires': 120,
         },
@@ -157,7 +203,7 @@ _heavy_schedule = {
     # Auto-close expired match lobbies every 2 minutes
     'auto-close-expired-lobbies': {
         'task': 'apps.tournaments.tasks.auto_close_expired_lobbies',
-        'schedule': crontab(minute='*/2'),
+        'schedule': crontab(minute=40) if _deadline_index_enabled else crontab(minute='*/2'),
         'options': {
             'expires': 120,
         },
@@ -172,10 +218,33 @@ _heavy_schedule = {
         },
     },
 
+    # Recompute organizer analytics of tournaments changed in the last minute;
+    # the full materialized view refresh only runs in the nightly reconciliation
+    'refresh-dirty-tournament-analytics': {
+        'task': 'apps.tournaments.tasks.analytics_refresh.refresh_dirty_tournament_analytics',
+        'schedule': crontab(minute='*'),
+        'options': {'expires': 60},
+    },
+    'reconcile-tournament-analytics': {
+        'task': 'apps.tournaments.tasks.analytics_refresh.reconcile_tournament_analytics',
+        'schedule': crontab(hour=5, minute=45),
+        'options': {'expires': 3600},
+    },
+
+    # Refresh stale API-synced passport stats, busiest profiles first
+    'refresh-stale-passport-stats': {
+        'task': 'user_profile.refresh_stale_passport_stats',
+        'schedule': crontab(minute='*/5'),
+        'options': {'expires': 300},
+    },
+
     # Phase 10: Sync Riot-backed Valorant passport stats
     'sync-all-active-riot-passports': {
         'task': 'user_profile.sync_all_active_riot_passports',
-        'schedule': crontab(minute=os.getenv('RIOT_SYNC_SCHEDULE_MINUTE', '*/20')),
+        'schedule': (
+            crontab(hour=4, minute=20) if _passport_stats_scheduler_enabled
+            else crontab(minute=os.getenv('RIOT_SYNC_SCHEDULE_MINUTE', '*/20'))
+        ),
         'options': {
             # Prevent overlaps when queues are congested.
             'expires': int(os.getenv('RIOT_SYNC_TASK_EXPIRES_SECONDS', '900')),
@@ -185,7 +254,7 @@ _heavy_schedule = {
     # Steam persona name / avatar refresh every 4 hours (conservative — Steam API rate limits)
     'sync-all-active-steam-passports': {
         'task': 'user_profile.sync_all_active_steam_passports',
-        'schedule': crontab(hour='*/4', minute=10),
+        'schedule': crontab(hour=4, minute=10) if _passport_stats_scheduler_enabled else crontab(hour='*/4', minute=10),
         'options': {'expires': 3600},
     },
 
@@ -336,6 +405,13 @@ _heavy_schedule = {
         'options': {'expires': 7200},
     },
 
+    # Prune expired mobile sync tombstones daily at 03:40 UTC
+    'prune-mobile-sync-tombstones': {
+        'task': 'mobile_api.prune_sync_tombstones',
+        'schedule': crontab(hour=3, minute=40),
+        'options': {'expires': 3600},
+    },
+
     # Seasonal rollover — first of each month at 00:00 UTC
     'seasonal-rollover': {
         'task': 'apps.leaderboards.tasks.seasonal_rollover',
@@ -353,6 +429,16 @@ if _beat_enabled and _media_cleanup_beat_enabled:
         'options': {'expires': 3600},
     }
 
+# Sweep EventBus outbox rows whose post-commit relay kick was lost (one
+# indexed query when the outbox is empty). Nothing writes to the outbox
+# unless EVENTS_OUTBOX_ENABLED is on.
+if _events_outbox_enabled:
+    _base_schedule['relay-event-outbox'] = {
+        'task': 'apps.common.events.tasks.relay_event_outbox',
+        'schedule': crontab(minute='*'),
+        'options': {'expires': 60},
+    }
+
 # Assemble the final beat schedule
 if _beat_enabled:
     app.conf.beat_schedule = {**_base_schedule, **_heavy_schedule}
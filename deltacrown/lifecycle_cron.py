@@ -11,15 +11,27 @@ Security:
     Requires ``Authorization: Bearer <CRON_SECRET>`` header.
     The CRON_SECRET env var must be set in Render dashboard.
 
-Tasks executed (in order):
+Due deadlines (every run):
+    ``lifecycle_scheduler.run_due`` pops only the LifecycleDeadline rows that
+    are due (registration windows, no-show / lobby deadlines, payment expiry,
+    result auto-confirm, dispute SLAs) and dispatches them with bounded
+    concurrency, so a run costs O(due work) rather than O(live tournaments).
+
+Completion checks (every run) — these react to match results rather than
+to a due time, so the deadline index has no rows for them:
+    - check_tournament_wrapup — LIVE → COMPLETED when all matches done
+    - reconcile_group_playoff_transitions — fix stuck GROUP_PLAYOFF tournaments
+
+Full sweep (at most once per LIFECYCLE_FULL_SWEEP_SECONDS, default 1 h, or
+every run when LIFECYCLE_DEADLINE_INDEX_ENABLED is off) — the safety net for
+anything the index missed, followed by a re-seed of the index:
     1. auto_advance_tournaments — status transitions based on date thresholds
-    2. check_tournament_wrapup — LIVE → COMPLETED when all matches done
-    3. check_no_show_matches — auto-forfeit no-show matches
-    4. auto_close_expired_lobbies — close expired match lobbies
-    5. expire_overdue_payments — cancel unpaid registrations
-    6. reconcile_group_playoff_transitions — fix stuck GROUP_PLAYOFF tournaments
-    7. auto_confirm_stale_submissions — auto-confirm unresponded results past deadline
-    8. dispute_escalation — escalate overdue disputes
+    2. check_no_show_matches — auto-forfeit no-show matches
+    3. auto_close_expired_lobbies — close expired match lobbies
+    4. expire_overdue_payments — cancel unpaid registrations
+    5. auto_confirm_stale_submissions — auto-confirm unresponded results past deadline
+    6. dispute_escalation — escalate overdue disputes
+    7. deadline_resync — re-seed the LifecycleDeadline index
 
 Beat-only daily tasks (auto_archive, ranking snapshots, analytics) are
 intentionally excluded — they are low-priority and can run when Beat is
@@ -57,6 +69,7 @@ logger = logging.getLogger(__name__)
 
 _CRON_SECRET = os.environ.get('CRON_SECRET', '')
 _LOCK_KEY = 'lifecycle_cron:running'
+_FULL_SWEEP_KEY = 'lifecycle_cron:last_full_sweep'
 _LOCK_TTL_SECONDS = int(os.environ.get('CRON_LOCK_TTL', '240'))  # 4 min default
 _SLOW_THRESHOLD_MS = 5000
 
@@ -143,15 +156,20 @@ def lifecycle_cron(request):
     try:
         results = {}
         tasks = [
-            ('auto_advance', _run_auto_advance),
+            ('due_deadlines', _run_due_deadlines),
             ('wrapup', _run_wrapup),
-            ('no_show', _run_no_show),
-            ('lobby_close', _run_lobby_close),
-            ('payment_expiry', _run_payment_expiry),
             ('group_playoff_reconcile', _run_group_playoff_reconcile),
-            ('auto_confirm_submissions', _run_auto_confirm_submissions),
-            ('dispute_escalation', _run_dispute_escalation),
         ]
+        if _full_sweep_due():
+            tasks += [
+                ('auto_advance', _run_auto_advance),
+                ('no_show', _run_no_show),
+                ('lobby_close', _run_lobby_close),
+                ('payment_expiry', _run_payment_expiry),
+                ('auto_confirm_submissions', _run_auto_confirm_submissions),
+                ('dispute_escalation', _run_dispute_escalation),
+                ('deadline_resync', _run_deadline_resync),
+            ]
 
         for name, runner in tasks:
             task_t0 = time.monotonic()
@@ -194,6 +212,42 @@ def lifecycle_cron(request):
 # so one failure doesn't block the rest.
 
 
+def _full_sweep_due() -> bool:
+    """True when the full-scan runners should run on this call.
+
+    ``cache.add`` is atomic, so exactly one run per sweep window claims it.
+    """
+    from django.conf import settings
+    from apps.tournaments.services import lifecycle_scheduler
+
+    if not lifecycle_scheduler.enabled():
+        return True
+    interval = getattr(settings, 'LIFECYCLE_FULL_SWEEP_SECONDS', 3600)
+    return cache.add(_FULL_SWEEP_KEY, True, timeout=interval)
+
+
+def _run_due_deadlines():
+    try:
+        from apps.tournaments.services import lifecycle_scheduler
+        if not lifecycle_scheduler.enabled():
+            return {'ok': True, 'skipped': 'index disabled'}
+        return {'ok': True, **lifecycle_scheduler.run_due()}
+    except Exception as exc:
+        logger.exception('[lifecycle_cron] due_deadlines failed')
+        return {'ok': False, 'error': str(exc)}
+
+
+def _run_deadline_resync():
+    try:
+        from apps.tournaments.services import lifecycle_scheduler
+        if not lifecycle_scheduler.enabled():
+            return {'ok': True, 'skipped': 'index disabled'}
+        return {'ok': True, 'seeded': lifecycle_scheduler.resync_all()}
+    except Exception as exc:
+        logger.exception('[lifecycle_cron] deadline_resync failed')
+        return {'ok': False, 'error': str(exc)}
+
+
 def _run_auto_advance():
     try:
         from apps.tournaments.services.lifecycle_service import TournamentLifecycleService
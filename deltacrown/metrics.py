@@ -2,6 +2,8 @@
 Prometheus metrics for monitoring (Module 9.5).
 Tracks error counts, WebSocket errors, and close reasons.
 """
+from contextlib import contextmanager
+
 from prometheus_client import Counter, Histogram, Gauge
 import time
 
@@ -18,6 +20,21 @@ http_request_duration_seconds = Histogram(
     ['method', 'endpoint']
 )
 
+# Fixed per-request overhead: time spent inside each middleware before the
+# view runs (inner middleware and the view itself excluded)
+middleware_duration_seconds = Histogram(
+    'middleware_duration_seconds',
+    'Time spent in middleware request processing, excluding the view',
+    ['middleware'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+
+request_principal_cache_total = Counter(
+    'request_principal_cache_total',
+    'Request principal snapshot lookups by result',
+    ['result']
+)
+
 # Error Metrics
 error_count = Counter(
     'error_count',
@@ -105,3 +122,13 @@ def track_ws_close(close_code, reason=None):
 def track_ws_message(message_type, endpoint):
     """Track WebSocket message."""
     ws_message_count.labels(message_type=message_type, endpoint=endpoint).inc()
+
+
+@contextmanager
+def middleware_timer(name):
+    """Observe the wrapped middleware step in middleware_duration_seconds."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        middleware_duration_seconds.labels(middleware=name).observe(time.perf_counter() - started)
@@ -12,6 +12,7 @@ from django.core.exceptions import PermissionDenied, SuspiciousOperation
 from django.http import Http404
 from django.utils.deprecation import MiddlewareMixin
 
+from deltacrown.metrics import middleware_timer
 from deltacrown.middleware.bot_probe import is_bot_probe_path
 
 logger = logging.getLogger('deltacrown.requests')
@@ -37,7 +38,10 @@ class RequestLoggingMiddleware(MiddlewareMixin):
         """Log request completion with structured data."""
         if not hasattr(request, 'start_time'):
             return response
-        
+        with middleware_timer('request_logging'):
+            return self._log_response(request, response)
+    
+    def _log_response(self, request, response):
         # Skip logging for /media/ 404s — MediaProxyMiddleware converts
         # these to 302 redirects to Cloudinary CDN after this middleware runs.
         if response.status_code == 404 and request.path.startswith(_MEDIA_PREFIX):
@@ -6,14 +6,19 @@ GLOBAL WIRING: Activates user preferences on every request.
 - Sets language per user preference
 - Injects request.user_platform_prefs for use in views/templates
 
+Preferences come from request.principal (RequestPrincipalMiddleware), a
+cached per-user snapshot, so no profile query runs per request.
+
 SAFE FOR ANONYMOUS USERS: Falls back to defaults if no profile exists.
 """
 
 import logging
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from django.utils import timezone, translation
-from apps.user_profile.services.platform_prefs_service import get_user_platform_prefs, DEFAULT_PREFS
+from apps.accounts.request_principal import get_principal
+from apps.user_profile.services.platform_prefs_service import DEFAULT_PREFS
 from django.conf import settings
+from deltacrown.metrics import middleware_timer
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +28,7 @@ class UserPlatformPrefsMiddleware:
     Middleware to activate user platform preferences globally.
     
     On each request:
-    1. Load user preferences (or defaults for anonymous)
+    1. Load user preferences from request.principal (defaults for anonymous)
     2. Activate timezone
     3. Activate language
     4. Set request.user_platform_prefs for access in views/templates
@@ -35,13 +40,20 @@ class UserPlatformPrefsMiddleware:
         self.get_response = get_response
     
     def __call__(self, request):
-        # Get user profile (if authenticated)
-        profile = None
-        if hasattr(request, 'user') and request.user.is_authenticated:
-            profile = getattr(request.user, 'profile', None)
+        with middleware_timer('platform_prefs'):
+            self._activate(request)
+        
+        response = self.get_response(request)
         
+        # Deactivate for next request (thread safety)
+        timezone.deactivate()
+        translation.deactivate()
+        
+        return response
+    
+    def _activate(self, request):
         # Load preferences (defaults if anonymous)
-        prefs = get_user_platform_prefs(profile)
+        prefs = get_principal(request).prefs
         
         # Attach to request for use in views/templates
         request.user_platform_prefs = prefs
@@ -65,11 +77,3 @@ class UserPlatformPrefsMiddleware:
         lang = prefs.get('preferred_language', DEFAULT_PREFS['preferred_language'])
         translation.activate(lang)
         request.LANGUAGE_CODE = lang
-        
-        response = self.get_response(request)
-        
-        # Deactivate for next request (thread safety)
-        timezone.deactivate()
-        translation.deactivate()
-        
-        return response
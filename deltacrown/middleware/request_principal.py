@@ -0,0 +1,25 @@
+"""
+Request Principal Middleware
+
+Loads the per-user principal snapshot (platform preferences, deletion
+status, staff flags) once per request and attaches it as
+``request.principal`` for the middleware and views that follow.
+
+MUST be placed AFTER AuthenticationMiddleware in settings.MIDDLEWARE.
+See apps.accounts.request_principal for caching and invalidation.
+"""
+
+from apps.accounts.request_principal import load_principal
+from deltacrown.metrics import middleware_timer
+
+
+class RequestPrincipalMiddleware:
+    """Attach ``request.principal`` (one cache read for authenticated users)."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with middleware_timer('request_principal'):
+            request.principal = load_principal(getattr(request, 'user', None))
+        return self.get_response(request)
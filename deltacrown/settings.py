@@ -423,6 +423,7 @@ MIDDLEWARE = [
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "deltacrown.middleware.logging.RequestLoggingMiddleware",  # Module 9.5: Request logging (AFTER auth)
+    "deltacrown.middleware.request_principal.RequestPrincipalMiddleware",  # Cached per-user prefs / deletion snapshot
     "deltacrown.middleware.platform_prefs_middleware.UserPlatformPrefsMiddleware",  # PHASE-5A: Global platform preferences
     "apps.accounts.deletion_middleware.BlockScheduledDeletionMiddleware",  # Phase 3B: Block scheduled deletions
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -1160,6 +1161,9 @@ WS_MAX_PAYLOAD_BYTES = int(os.getenv('WS_MAX_PAYLOAD_BYTES', str(16 * 1024)))  #
 # Example: "https://deltacrown.com,https://www.deltacrown.com"
 WS_ALLOWED_ORIGINS = os.getenv('WS_ALLOWED_ORIGINS', '')  # Empty = allow all origins (dev only)
 
+# Resumable room stream: recent tournament-room events kept for ?last_seq= replay
+WS_ROOM_REPLAY_BUFFER = int(os.getenv('WS_ROOM_REPLAY_BUFFER', '256'))  # Events per room; larger gaps resync
+
 # -----------------------------------------------------------------------------
 # Celery Configuration
 # -----------------------------------------------------------------------------
@@ -1305,6 +1309,102 @@ DISCORD_LINKED_ROLE_ID = os.getenv('DISCORD_LINKED_ROLE_ID', '')  # @Linked role
 DISCORD_TOURNAMENT_ANNOUNCEMENTS_CHANNEL_ID = os.getenv('DISCORD_TOURNAMENT_ANNOUNCEMENTS_CHANNEL_ID', '')
 DISCORD_MATCH_RESULTS_CHANNEL_ID = os.getenv('DISCORD_MATCH_RESULTS_CHANNEL_ID', '')
 
+# -----------------------------------------------------------------------------
+# Mobile Push (apps.notifications.services.push_service)
+# -----------------------------------------------------------------------------
+NOTIFICATIONS_PUSH_ENABLED = _env_bool('NOTIFICATIONS_PUSH_ENABLED', default=False)
+NOTIFICATIONS_PUSH_TRANSPORT = os.getenv(
+    'NOTIFICATIONS_PUSH_TRANSPORT',
+    'apps.notifications.services.push_service.LoggingPushTransport',
+)
+NOTIFICATIONS_PUSH_BATCH_SIZES = {
+    'android': int(os.getenv('NOTIFICATIONS_PUSH_BATCH_ANDROID', '500')),
+    'ios': int(os.getenv('NOTIFICATIONS_PUSH_BATCH_IOS', '100')),
+}
+NOTIFICATIONS_PUSH_COALESCE_SECONDS = int(os.getenv('NOTIFICATIONS_PUSH_COALESCE_SECONDS', '10'))
+
+# -----------------------------------------------------------------------------
+# Mobile Sync (apps.mobile_api.sync.services)
+# -----------------------------------------------------------------------------
+# Hard-delete tombstones are pruned after this many days; a /sync/ cursor
+# older than the window gets a full snapshot instead of a delta.
+MOBILE_SYNC_TOMBSTONE_RETENTION_DAYS = int(os.getenv('MOBILE_SYNC_TOMBSTONE_RETENTION_DAYS', '30'))
+
+# -----------------------------------------------------------------------------
+# Event Bus Outbox (apps.common.events.outbox)
+# -----------------------------------------------------------------------------
+EVENTS_OUTBOX_ENABLED = _env_bool('EVENTS_OUTBOX_ENABLED', default=False)
+EVENTS_OUTBOX_INSERT_BATCH_SIZE = int(os.getenv('EVENTS_OUTBOX_INSERT_BATCH_SIZE', '1000'))
+EVENTS_OUTBOX_RELAY_BATCH_SIZE = int(os.getenv('EVENTS_OUTBOX_RELAY_BATCH_SIZE', '500'))
+# Claimed rows not marked relayed within this window are claimed again
+EVENTS_OUTBOX_CLAIM_LEASE_SECONDS = int(os.getenv('EVENTS_OUTBOX_CLAIM_LEASE_SECONDS', '300'))
+
+# -----------------------------------------------------------------------------
+# Realtime Broadcast Queue (apps.tournaments.realtime.broadcast_queue)
+# -----------------------------------------------------------------------------
+# The background sender needs a cross-process channel layer; with the
+# in-memory layer (dev) batches are sent inline right after commit.
+REALTIME_BROADCAST_BACKGROUND = _env_bool('REALTIME_BROADCAST_BACKGROUND', default=_USE_REDIS_CHANNELS)
+REALTIME_BROADCAST_COALESCE_MS = int(os.getenv('REALTIME_BROADCAST_COALESCE_MS', '100'))
+
+# -----------------------------------------------------------------------------
+# Spectator Fan-out (apps.tournaments.realtime.spectator_fanout)
+# -----------------------------------------------------------------------------
+# Spectator sockets share one channel-layer subscription per tournament per
+# ASGI process instead of one Redis channel each; slow sockets get a bounded,
+# conflating send queue of WS_SPECTATOR_QUEUE_SIZE frames.
+WS_SPECTATOR_FANOUT = _env_bool('WS_SPECTATOR_FANOUT', default=_USE_REDIS_CHANNELS)
+WS_SPECTATOR_QUEUE_SIZE = int(os.getenv('WS_SPECTATOR_QUEUE_SIZE', '64'))
+
+# -----------------------------------------------------------------------------
+# Lifecycle Deadline Index (apps.tournaments.services.lifecycle_scheduler)
+# -----------------------------------------------------------------------------
+# Due-time rows for registration windows, no-show / lobby deadlines, payment
+# expiry, result auto-confirm and dispute SLAs; the lifecycle cron dispatches
+# only due rows and runs the full scans once per LIFECYCLE_FULL_SWEEP_SECONDS.
+LIFECYCLE_DEADLINE_INDEX_ENABLED = _env_bool('LIFECYCLE_DEADLINE_INDEX_ENABLED', default=True)
+LIFECYCLE_DEADLINE_BATCH_SIZE = int(os.getenv('LIFECYCLE_DEADLINE_BATCH_SIZE', '200'))
+LIFECYCLE_DEADLINE_CONCURRENCY = int(os.getenv('LIFECYCLE_DEADLINE_CONCURRENCY', '4'))
+LIFECYCLE_FULL_SWEEP_SECONDS = int(os.getenv('LIFECYCLE_FULL_SWEEP_SECONDS', '3600'))
+
+# -----------------------------------------------------------------------------
+# LFT Player Discovery Index (apps.organizations.services.player_discovery)
+# -----------------------------------------------------------------------------
+# Each process serves Scouting Grounds player filters from in-memory posting
+# lists, catching up on changed rows per read; this bounds how long it goes
+# before reloading them in full.
+PLAYER_DISCOVERY_RELOAD_SECONDS = int(os.getenv('PLAYER_DISCOVERY_RELOAD_SECONDS', '900'))
+
+# -----------------------------------------------------------------------------
+# Passport Stats Sync (apps.user_profile.services.passport_stats_sync)
+# -----------------------------------------------------------------------------
+# Profile views only read stored passport stats; a beat batch refreshes stale
+# Riot / Steam / Epic passports (busiest profiles first) within these hourly
+# per-provider allowances. Staleness windows can be tuned per provider with
+# PASSPORT_STATS_<PROVIDER>_STALE_SECONDS.
+PASSPORT_STATS_SCHEDULER_ENABLED = _env_bool('PASSPORT_STATS_SCHEDULER_ENABLED', default=True)
+PASSPORT_STATS_BATCH_SIZE = int(os.getenv('PASSPORT_STATS_BATCH_SIZE', '50'))
+PASSPORT_STATS_RIOT_HOURLY_QUOTA = int(os.getenv('PASSPORT_STATS_RIOT_HOURLY_QUOTA', '300'))
+PASSPORT_STATS_STEAM_HOURLY_QUOTA = int(os.getenv('PASSPORT_STATS_STEAM_HOURLY_QUOTA', '600'))
+PASSPORT_STATS_EPIC_HOURLY_QUOTA = int(os.getenv('PASSPORT_STATS_EPIC_HOURLY_QUOTA', '600'))
+
+# -----------------------------------------------------------------------------
+# Tournament Analytics Snapshots (apps.tournaments.services.analytics_rollup)
+# -----------------------------------------------------------------------------
+# Organizer analytics are served from per-tournament rows that registration,
+# payment, check-in, match and prize saves mark dirty; a per-minute beat task
+# recomputes up to this many dirty tournaments per run.
+ANALYTICS_SNAPSHOTS_ENABLED = _env_bool('ANALYTICS_SNAPSHOTS_ENABLED', default=True)
+ANALYTICS_SNAPSHOT_BATCH_SIZE = int(os.getenv('ANALYTICS_SNAPSHOT_BATCH_SIZE', '200'))
+
+# -----------------------------------------------------------------------------
+# Request Principal (apps.accounts.request_principal)
+# -----------------------------------------------------------------------------
+# Per-user snapshot of platform preferences and deletion status read by the
+# global middleware. Profile / deletion-request saves invalidate it; the TTL
+# only bounds how long an idle user's entry stays in the cache.
+REQUEST_PRINCIPAL_TTL_SECONDS = int(os.getenv('REQUEST_PRINCIPAL_TTL_SECONDS', '600'))
+
 # -----------------------------------------------------------------------------
 # Notification Preferences
 # -----------------------------------------------------------------------------
@@ -1718,6 +1818,9 @@ LEADERBOARDS_CACHE_ENABLED = os.getenv('LEADERBOARDS_CACHE_ENABLED', 'False').lo
 # Requires COMPUTE_ENABLED=True for non-empty responses
 LEADERBOARDS_API_ENABLED = os.getenv('LEADERBOARDS_API_ENABLED', 'False').lower() == 'true'
 
+# Nightly analytics batch refresh: stats rows per chunk task (one bulk upsert each)
+ANALYTICS_BATCH_CHUNK_SIZE = int(os.getenv('ANALYTICS_BATCH_CHUNK_SIZE', '500'))
+
 # -----------------------------------------------------------------------------
 # User Profile Integration Feature Flags
 # -----------------------------------------------------------------------------
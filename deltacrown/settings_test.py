@@ -118,6 +118,8 @@ CHANNEL_LAYERS = {
         "BACKEND": "channels.layers.InMemoryChannelLayer"
     }
 }
+# In-memory layer is loop-bound: send queued broadcasts inline at commit
+REALTIME_BROADCAST_BACKGROUND = False
 
 # Disable rate limiting in tests
 WS_RATE_ENABLED = False
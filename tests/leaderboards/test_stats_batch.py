@@ -0,0 +1,162 @@
+"""
+Tests for the batched completed-match stats applier.
+
+Covers ELO parity with one-by-one application, per-match idempotency,
+a query count independent of batch size and on-commit batching from the
+match.completed handler.
+"""
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.core.events.events import MatchCompletedEvent
+from apps.leaderboards.event_handlers import handle_match_completed_for_stats
+from apps.leaderboards.models import TeamMatchHistory, TeamRanking, TeamStats, UserMatchHistory, UserStats
+from apps.leaderboards.stats_batch import apply_completed_matches, pending_count
+from apps.organizations.choices import TeamStatus
+from apps.organizations.models import Team
+from apps.tournament_ops.services.team_stats_service import TeamStatsService
+from apps.tournaments.models import Match, Tournament
+
+
+User = get_user_model()
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def batch_game(game_factory):
+    return game_factory('batch-stats-game', name='Batch Stats Game', team_size=5, profile_id_field='ingame_id')
+
+
+@pytest.fixture
+def batch_tournament(live_tournament_factory, batch_game):
+    def _make(slug, participation_type):
+        return live_tournament_factory(
+            slug, game=batch_game, participation_type=participation_type, max_participants=64,
+        )
+    return _make
+
+
+def _teams(game, organizer, count):
+    return [
+        Team.objects.create(
+            name=f'Batch Team {n}',
+            slug=f'batch-team-{n}',
+            tag=f'BT{n}',
+            game_id=game.id,
+            region='Global',
+            created_by=organizer,
+            status=TeamStatus.ACTIVE,
+            visibility='PUBLIC',
+        )
+        for n in range(count)
+    ]
+
+
+def _completed(tournament, p1, p2, number, winner=None):
+    loser = None
+    if winner is not None:
+        loser = p2 if winner == p1 else p1
+    return Match.objects.create(
+        tournament=tournament,
+        round_number=1,
+        match_number=number,
+        participant1_id=p1,
+        participant1_name=f'P{p1}',
+        participant2_id=p2,
+        participant2_name=f'P{p2}',
+        participant1_score=13 if winner == p1 else 7,
+        participant2_score=13 if winner == p2 else 7,
+        winner_id=winner,
+        loser_id=loser,
+        state=Match.COMPLETED,
+        completed_at=timezone.now() - timedelta(minutes=100 - number),
+    )
+
+
+def test_team_batch_matches_sequential_elo(batch_game, batch_tournament, tournament_organizer):
+    tournament = batch_tournament('batch-team-cup', Tournament.TEAM)
+    a, b, c = (team.id for team in _teams(batch_game, tournament_organizer, 3))
+    matches = [
+        _completed(tournament, a, b, 1, winner=a),
+        _completed(tournament, b, c, 2, winner=c),
+        _completed(tournament, a, c, 3, winner=c),
+    ]
+
+    # Apply out of order: the batch sorts by completed_at
+    result = apply_completed_matches([{'match_id': m.id} for m in reversed(matches)])
+
+    service = TeamStatsService(team_stats_adapter=None, team_ranking_adapter=None)
+    elo = {a: 1200, b: 1200, c: 1200}
+    for match in matches:
+        p1, p2 = match.participant1_id, match.participant2_id
+        d1 = service.calculate_elo_change(elo[p1], elo[p2], match.winner_id == p1, False)
+        d2 = service.calculate_elo_change(elo[p2], elo[p1], match.winner_id == p2, False)
+        elo[p1], elo[p2] = elo[p1] + d1, elo[p2] + d2
+
+    assert sorted(result.applied) == sorted(m.id for m in matches)
+    rankings = {r.team_id: r for r in TeamRanking.objects.filter(game_slug=batch_game.slug)}
+    assert {team_id: r.elo_rating for team_id, r in rankings.items()} == elo
+    assert (rankings[c].wins, rankings[c].losses, rankings[c].peak_elo) == (2, 0, elo[c])
+    stats_a = TeamStats.objects.get(team_id=a, game_slug=batch_game.slug)
+    assert (stats_a.matches_played, stats_a.matches_won, float(stats_a.win_rate)) == (2, 1, 50.0)
+    last = TeamMatchHistory.objects.get(match=matches[2], team_id=c)
+    assert (last.elo_after, last.elo_after - last.elo_before, last.score_summary) == (elo[c], last.elo_change, '7-13')
+
+
+def test_reapplying_a_match_is_a_no_op(batch_game, batch_tournament):
+    tournament = batch_tournament('batch-solo-cup', Tournament.SOLO)
+    p1, p2 = (
+        User.objects.create_user(username=f'batch-p{n}', email=f'batch-p{n}@test.com', password='pass123')
+        for n in range(2)
+    )
+    match = _completed(tournament, p1.id, p2.id, 1, winner=p1.id)
+
+    first = apply_completed_matches([match.id, match.id])
+    second = apply_completed_matches([MatchCompletedEvent(data={'match_id': match.id, 'winner_id': p1.id})])
+
+    assert (first.applied, second.applied, second.already_applied) == ([match.id], [], [match.id])
+    assert UserMatchHistory.objects.filter(match=match).count() == 2
+    winner = UserStats.objects.get(user=p1, game_slug=batch_game.slug)
+    assert (winner.matches_played, winner.matches_won) == (1, 1)
+
+
+def test_query_count_does_not_grow_with_batch_size(batch_game, batch_tournament, tournament_organizer):
+    tournament = batch_tournament('batch-size-cup', Tournament.TEAM)
+    teams = [team.id for team in _teams(batch_game, tournament_organizer, 40)]
+    matches = [
+        _completed(tournament, teams[2 * n], teams[2 * n + 1], n + 1, winner=teams[2 * n])
+        for n in range(20)
+    ]
+
+    with CaptureQueriesContext(connection) as small:
+        apply_completed_matches([m.id for m in matches[:2]])
+    with CaptureQueriesContext(connection) as large:
+        apply_completed_matches([m.id for m in matches[2:]])
+
+    assert len(large) == len(small)
+    assert TeamMatchHistory.objects.count() == 40
+
+
+def test_handler_batches_matches_until_commit(
+    batch_game, batch_tournament, tournament_organizer, django_capture_on_commit_callbacks,
+):
+    tournament = batch_tournament('batch-commit-cup', Tournament.TEAM)
+    a, b, c, d = (team.id for team in _teams(batch_game, tournament_organizer, 4))
+    matches = [_completed(tournament, a, b, 1, winner=a), _completed(tournament, c, d, 2, winner=d)]
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with transaction.atomic():
+            for match in matches:
+                handle_match_completed_for_stats(
+                    MatchCompletedEvent(data={'match_id': match.id, 'winner_id': match.winner_id})
+                )
+            assert pending_count() == 2
+            assert not TeamMatchHistory.objects.exists()
+
+    assert len(callbacks) == 1
+    assert TeamMatchHistory.objects.count() == 4
@@ -0,0 +1,150 @@
+"""
+Leaderboard cache-hit benchmark (packed columnar vs list-of-dicts).
+
+Compares the Engine V2 cache format before and after apps.leaderboards.packed
+at 10k and 100k rows:
+
+- stored size (pickled value as the cache backend would write it)
+- cache-hit latency: unpickle + build DTOs for the full board, top 50 and
+  an "around me" window (p50 over N samples)
+- peak Python memory allocated while serving a top-50 hit
+
+No database or cache server is needed; values are round-tripped through
+pickle exactly as django-redis does.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=deltacrown.settings python tests/perf/leaderboard_cache_bench.py [--samples 20]
+"""
+
+import argparse
+import os
+import pickle
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict
+from datetime import timedelta
+from pathlib import Path
+
+
+def _setup_django():
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "deltacrown.settings")
+    import django
+    django.setup()
+
+
+def build_rankings(count):
+    from django.utils import timezone
+    from apps.leaderboards.engine import RankedParticipantDTO
+
+    now = timezone.now()
+    rankings = []
+    for i in range(count):
+        wins = i % 12
+        matches_played = 12
+        rankings.append(RankedParticipantDTO(
+            rank=i + 1,
+            participant_id=(i * 7919) % count + 1,
+            team_id=None,
+            points=count * 10 - i * 7,
+            kills=(count - i) % 400,
+            wins=wins,
+            losses=matches_played - wins,
+            matches_played=matches_played,
+            earliest_win=now - timedelta(minutes=i) if wins else None,
+            win_rate=(wins / matches_played * 100),
+            last_updated=now,
+        ))
+    return rankings
+
+
+def p50_ms(func, samples):
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def peak_kib(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def run(count, samples):
+    from apps.leaderboards.engine import RankedParticipantDTO
+    from apps.leaderboards.packed import PackedRankings
+
+    rankings = build_rankings(count)
+    legacy_value = pickle.dumps([asdict(r) for r in rankings], protocol=pickle.HIGHEST_PROTOCOL)
+    packed_value = pickle.dumps(PackedRankings.pack(rankings), protocol=pickle.HIGHEST_PROTOCOL)
+    target = rankings[count // 2].participant_id
+
+    def legacy_full():
+        return [RankedParticipantDTO(**r) for r in pickle.loads(legacy_value)]
+
+    def legacy_top50():
+        return legacy_full()[:50]
+
+    def legacy_around():
+        rows = legacy_full()
+        position = next(i for i, r in enumerate(rows) if r.participant_id == target)
+        return rows[position - 5:position + 6]
+
+    def packed_full():
+        return list(PackedRankings(pickle.loads(packed_value)))
+
+    def packed_top50():
+        return PackedRankings(pickle.loads(packed_value)).rank_range(1, 50)
+
+    def packed_around():
+        return PackedRankings(pickle.loads(packed_value)).around(participant_id=target, radius=5)
+
+    assert packed_top50() == legacy_top50()
+    assert packed_around() == legacy_around()
+
+    return {
+        "rows": count,
+        "legacy_bytes": len(legacy_value),
+        "packed_bytes": len(packed_value),
+        "legacy_full_ms": p50_ms(legacy_full, samples),
+        "packed_full_ms": p50_ms(packed_full, samples),
+        "legacy_top50_ms": p50_ms(legacy_top50, samples),
+        "packed_top50_ms": p50_ms(packed_top50, samples),
+        "legacy_around_ms": p50_ms(legacy_around, samples),
+        "packed_around_ms": p50_ms(packed_around, samples),
+        "legacy_top50_peak_kib": peak_kib(legacy_top50),
+        "packed_top50_peak_kib": peak_kib(packed_top50),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--rows", type=int, nargs="*", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    _setup_django()
+    for count in args.rows:
+        result = run(count, args.samples)
+        print(f"\n== {result['rows']:,} rows ==")
+        print(f"  stored size     legacy {result['legacy_bytes'] / 1024:10.1f} KiB   packed {result['packed_bytes'] / 1024:10.1f} KiB")
+        for label in ("full", "top50", "around"):
+            print(
+                f"  hit {label:<11} legacy {result[f'legacy_{label}_ms']:10.2f} ms    "
+                f"packed {result[f'packed_{label}_ms']:10.2f} ms"
+            )
+        print(
+            f"  top50 peak mem  legacy {result['legacy_top50_peak_kib']:10.1f} KiB   "
+            f"packed {result['packed_top50_peak_kib']:10.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
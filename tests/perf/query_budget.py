@@ -0,0 +1,225 @@
+"""
+Per-view query budgets for DeltaCrown's heaviest pages and APIs.
+
+Profiles one request and records:
+
+- total SQL queries;
+- duplicate-query fingerprints (the same statement shape run more than
+  once, which is how an N+1 shows up);
+- cache calls by operation;
+- wall time.
+
+The numbers are then compared against the budgets committed in
+fixtures/view_query_budgets.json. A failure prints a readable diff with
+every exceeded limit and the worst repeated statements.
+
+Budgets are only ever written by a recording run against PostgreSQL
+(the production engine; query counts differ on other backends). Re-record
+after an intentional change:
+
+    PERF_UPDATE_BUDGETS=1 pytest tests/perf/test_view_query_budgets.py
+
+Wall time is too machine-dependent to gate CI on, so it is only recorded
+and enforced when PERF_ENFORCE_WALL_TIME=1 is also set (for example when
+comparing two runs on the same box).
+"""
+
+import json
+import os
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+BUDGET_PATH = Path(__file__).parent / 'fixtures' / 'view_query_budgets.json'
+
+# Headroom given to freshly recorded budgets so small unrelated changes
+# do not churn the file; opt-in wall time only fails beyond
+# WALL_TOLERANCE x budget.
+RECORD_HEADROOM = 2
+WALL_TOLERANCE = 1.5
+RECORDING_VENDOR = 'postgresql'
+
+CACHE_OPERATIONS = (
+    'get', 'set', 'add', 'delete', 'get_many', 'set_many', 'delete_many',
+    'incr', 'decr', 'touch', 'get_or_set', 'has_key',
+)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\bIN \((?:\s*\?\s*,?)+\)', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+
+
+def fingerprint(sql: str) -> str:
+    """Normalize *sql* so statements differing only in literals compare equal."""
+    sql = _STRING_LITERAL.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _IN_LIST.sub('IN (...)', sql)
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+@dataclass
+class ViewProfile:
+    """What one request cost."""
+
+    status_code: int
+    queries: int
+    wall_ms: float
+    cache_calls: Counter = field(default_factory=Counter)
+    fingerprints: Counter = field(default_factory=Counter)
+
+    @property
+    def duplicate_queries(self) -> int:
+        """Queries beyond the first execution of each statement shape."""
+        return sum(count - 1 for count in self.fingerprints.values() if count > 1)
+
+    @property
+    def total_cache_calls(self) -> int:
+        return sum(self.cache_calls.values())
+
+    def repeated(self, limit: int = 5) -> List[tuple]:
+        return [(sql, count) for sql, count in self.fingerprints.most_common(limit) if count > 1]
+
+    def as_budget(self) -> Dict[str, float]:
+        budget = {
+            'max_queries': self.queries + RECORD_HEADROOM,
+            'max_duplicate_queries': self.duplicate_queries + RECORD_HEADROOM,
+            'max_cache_calls': self.total_cache_calls + RECORD_HEADROOM,
+        }
+        if enforcing_wall_time():
+            budget['max_wall_ms'] = round(max(self.wall_ms, 1.0) * 2, 1)
+        return budget
+
+
+@contextmanager
+def _count_cache_calls(counter: Counter):
+    """Count calls on the default cache backend (outermost call only)."""
+    backend = caches['default']
+    depth = {'value': 0}
+
+    def wrap(name, original):
+        def counted(*args, **kwargs):
+            if depth['value'] == 0:
+                counter[name] += 1
+            depth['value'] += 1
+            try:
+                return original(*args, **kwargs)
+            finally:
+                depth['value'] -= 1
+        return counted
+
+    patched = []
+    for name in CACHE_OPERATIONS:
+        original = getattr(backend, name, None)
+        if original is not None:
+            setattr(backend, name, wrap(name, original))
+            patched.append(name)
+    try:
+        yield
+    finally:
+        for name in patched:
+            delattr(backend, name)
+
+
+def profile_request(client, url: str, **extra) -> ViewProfile:
+    """GET *url* with the Django test *client* and return what it cost."""
+    cache_calls: Counter = Counter()
+    with CaptureQueriesContext(connection) as captured, _count_cache_calls(cache_calls):
+        started = time.perf_counter()
+        response = client.get(url, **extra)
+        wall_ms = (time.perf_counter() - started) * 1000
+
+    return ViewProfile(
+        status_code=response.status_code,
+        queries=len(captured.captured_queries),
+        wall_ms=wall_ms,
+        cache_calls=cache_calls,
+        fingerprints=Counter(fingerprint(query['sql']) for query in captured.captured_queries),
+    )
+
+
+def load_budgets() -> Dict[str, Dict[str, Dict[str, float]]]:
+    if not BUDGET_PATH.exists():
+        return {}
+    with BUDGET_PATH.open() as handle:
+        return json.load(handle).get('endpoints', {})
+
+
+def record_budget(endpoint: str, size: int, profile: ViewProfile) -> None:
+    """Write *profile* as the budget for (*endpoint*, *size*), keeping the other entries."""
+    if connection.vendor != RECORDING_VENDOR:
+        raise RuntimeError(
+            f'Query budgets must be recorded on {RECORDING_VENDOR}, not {connection.vendor}.'
+        )
+    budgets = load_budgets()
+    budgets.setdefault(endpoint, {})[str(size)] = profile.as_budget()
+    payload = {
+        'description': 'Per-view query budgets; regenerate with PERF_UPDATE_BUDGETS=1 (see tests/perf/query_budget.py).',
+        'recorded_on': RECORDING_VENDOR,
+        'endpoints': {name: dict(sorted(sizes.items(), key=lambda item: int(item[0])))
+                      for name, sizes in sorted(budgets.items())},
+    }
+    with BUDGET_PATH.open('w') as handle:
+        json.dump(payload, handle, indent=2)
+        handle.write('\n')
+
+
+def updating_budgets() -> bool:
+    return os.getenv('PERF_UPDATE_BUDGETS', '0') == '1'
+
+
+def enforcing_wall_time() -> bool:
+    return os.getenv('PERF_ENFORCE_WALL_TIME', '0') == '1'
+
+
+def compare(endpoint: str, size: int, profile: ViewProfile, budget: Optional[Dict[str, float]]) -> List[str]:
+    """Readable list of budget violations (empty when *profile* is within *budget*).
+
+    A missing budget is a violation: an endpoint nobody has budgeted is
+    exactly where an unnoticed N+1 would live.
+    """
+    if not budget:
+        return [
+            f'{endpoint} @ {size} participants',
+            '  no committed budget; record one with PERF_UPDATE_BUDGETS=1',
+        ]
+
+    rows = [
+        ('queries', profile.queries, budget.get('max_queries')),
+        ('duplicate queries', profile.duplicate_queries, budget.get('max_duplicate_queries')),
+        ('cache calls', profile.total_cache_calls, budget.get('max_cache_calls')),
+    ]
+    violations = [
+        f'  {label:<18} {actual:>8} > budget {limit:<8} (+{actual - limit})'
+        for label, actual, limit in rows
+        if limit is not None and actual > limit
+    ]
+    wall_limit = budget.get('max_wall_ms')
+    if enforcing_wall_time() and wall_limit is not None and profile.wall_ms > wall_limit * WALL_TOLERANCE:
+        violations.append(
+            f'  {"wall ms":<18} {profile.wall_ms:>8.1f} > budget {wall_limit:<8} (x{WALL_TOLERANCE} tolerance)'
+        )
+    if not violations:
+        return []
+    return [f'{endpoint} @ {size} participants'] + violations + describe_repeats(profile)
+
+
+def describe_repeats(profile: ViewProfile, width: int = 110) -> List[str]:
+    lines = []
+    for sql, count in profile.repeated():
+        shown = sql if len(sql) <= width else sql[:width - 3] + '...'
+        lines.append(f'    x{count:<5} {shown}')
+    if lines:
+        lines.insert(0, '  most repeated statements:')
+    if profile.cache_calls:
+        calls = ', '.join(f'{name}={count}' for name, count in profile.cache_calls.most_common())
+        lines.append(f'  cache calls: {calls}')
+    return lines
@@ -0,0 +1,181 @@
+"""
+Scaled fixtures for the per-view query budget suite.
+
+seed_full_tournament seeds a fixed, hand-written data set (about 100 users
+and 15 small tournaments). That is good for demos but too small to expose
+an N+1. ``seed_scaled_tournament`` builds one live solo tournament with an
+arbitrary number of confirmed participants, using the same field
+conventions as that command:
+
+- every participant has a profile and a game passport;
+- round one is fully drawn, and the first quarter of it is completed;
+- one team has a five-player roster and a completed league whose match
+  history grows with the tournament.
+
+Rows that nothing hooks into are bulk-created; users are saved one by one
+so that profile signals run, as they do in production.
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from decimal import Decimal
+from typing import List
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.organizations.models import Team, TeamMembership
+from apps.tournaments.models import Game, Match, Registration, Tournament
+from apps.user_profile.models import GameProfile
+
+User = get_user_model()
+
+TEAM_ROSTER_SIZE = 5
+
+
+@dataclass
+class ScaledTournament:
+    tournament: Tournament
+    organizer: User
+    players: List[User]
+    match: Match
+    team: Team
+
+
+def _users(prefix: str, count: int) -> List[User]:
+    users = []
+    for index in range(count):
+        user = User(username=f'{prefix}{index:05d}', email=f'{prefix}{index:05d}@perf.deltacrown.gg')
+        user.set_unusable_password()
+        user.save()
+        users.append(user)
+    return users
+
+
+def seed_scaled_tournament(participants: int, prefix: str = 'perf') -> ScaledTournament:
+    now = timezone.now()
+    game = Game.objects.create(
+        name=f'{prefix} Valorant',
+        slug=f'{prefix}-valorant',
+        short_code=f'{prefix[:3].upper()}V',
+        category='FPS',
+        platforms=['PC'],
+        is_active=True,
+    )
+    organizer = User.objects.create_user(
+        username=f'{prefix}-organizer', email=f'{prefix}-organizer@perf.deltacrown.gg', password='perfpass123',
+    )
+    tournament = Tournament.objects.create(
+        name=f'{prefix} Scale Cup {participants}',
+        slug=f'{prefix}-scale-cup-{participants}',
+        game=game,
+        organizer=organizer,
+        format=Tournament.SINGLE_ELIM,
+        participation_type=Tournament.SOLO,
+        platform='pc',
+        mode='online',
+        max_participants=participants,
+        min_participants=2,
+        registration_start=now - timedelta(days=14),
+        registration_end=now - timedelta(days=2),
+        tournament_start=now - timedelta(hours=2),
+        tournament_end=now + timedelta(days=2),
+        prize_pool=Decimal('10000.00'),
+        status=Tournament.LIVE,
+        description='Scaled fixture for per-view query budgets.',
+    )
+
+    players = _users(f'{prefix}-p', participants)
+    GameProfile.objects.bulk_create([
+        GameProfile(
+            user=player,
+            game=game,
+            ign=player.username,
+            in_game_name=f'{player.username}#PERF',
+            identity_key=f'{player.username}#perf',
+            platform='pc',
+            rank_name='Diamond 2',
+            status=GameProfile.STATUS_ACTIVE,
+            visibility=GameProfile.VISIBILITY_PUBLIC,
+        )
+        for player in players
+    ])
+    Registration.objects.bulk_create([
+        Registration(tournament=tournament, user=player, status=Registration.CONFIRMED, seed=seed)
+        for seed, player in enumerate(players, start=1)
+    ])
+
+    round_one = []
+    completed = participants // 8
+    for number, (first, second) in enumerate(zip(players[::2], players[1::2]), start=1):
+        done = number <= completed
+        round_one.append(Match(
+            tournament=tournament,
+            round_number=1,
+            match_number=number,
+            participant1_id=first.id,
+            participant1_name=first.username,
+            participant2_id=second.id,
+            participant2_name=second.username,
+            state=Match.COMPLETED if done else Match.SCHEDULED,
+            participant1_score=13 if done else 0,
+            participant2_score=7 if done else 0,
+            winner_id=first.id if done else None,
+            loser_id=second.id if done else None,
+            scheduled_time=now - timedelta(minutes=number) if done else now + timedelta(minutes=number),
+        ))
+    Match.objects.bulk_create(round_one)
+    match = Match.objects.get(tournament=tournament, round_number=1, match_number=completed + 1)
+
+    team = Team.objects.create(name=f'{prefix} Roster', tag=prefix[:4].upper(), game=game.slug)
+    TeamMembership.objects.bulk_create([
+        TeamMembership(
+            team=team,
+            user=player,
+            game_id=game.id,
+            status=TeamMembership.Status.ACTIVE,
+            role=TeamMembership.Role.OWNER if slot == 0 else TeamMembership.Role.PLAYER,
+        )
+        for slot, player in enumerate(players[:TEAM_ROSTER_SIZE])
+    ])
+    opponents = [
+        Team(name=f'{prefix} Opponent {index}', slug=f'{prefix}-opponent-{index}', tag=f'O{index}', game=game.slug)
+        for index in range(max(1, participants // 32))
+    ]
+    Team.objects.bulk_create(opponents)
+    league = Tournament.objects.create(
+        name=f'{prefix} Team League {participants}',
+        slug=f'{prefix}-team-league-{participants}',
+        game=game,
+        organizer=organizer,
+        format=Tournament.ROUND_ROBIN,
+        participation_type=Tournament.TEAM,
+        max_participants=len(opponents) + 1,
+        registration_start=now - timedelta(days=60),
+        registration_end=now - timedelta(days=45),
+        tournament_start=now - timedelta(days=40),
+        tournament_end=now - timedelta(days=1),
+        status=Tournament.COMPLETED,
+    )
+    Match.objects.bulk_create([
+        Match(
+            tournament=league,
+            round_number=index + 1,
+            match_number=1,
+            participant1_id=team.id,
+            participant1_name=team.name,
+            participant2_id=opponent.id,
+            participant2_name=opponent.name,
+            state=Match.COMPLETED,
+            participant1_score=2,
+            participant2_score=index % 2,
+            winner_id=team.id,
+            loser_id=opponent.id,
+            scheduled_time=now - timedelta(days=1, minutes=index),
+        )
+        for index, opponent in enumerate(Team.objects.filter(slug__startswith=f'{prefix}-opponent-'))
+    ])
+
+    return ScaledTournament(
+        tournament=tournament, organizer=organizer, players=players, match=match, team=team,
+    )
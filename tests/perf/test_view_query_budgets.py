@@ -0,0 +1,139 @@
+"""
+Query budgets for the heaviest tournament, TOC, profile and team surfaces.
+
+test_views_stay_within_budget profiles every endpoint at each fixture size
+and compares it with fixtures/view_query_budgets.json; once budgets have
+been recorded, an endpoint or size without one fails. Until the first
+PostgreSQL recording is committed the budget checks skip rather than
+compare against guessed numbers.
+test_query_counts_do_not_grow_with_participants needs no committed
+numbers: an endpoint whose query count rises between 64 and 512
+participants has an N+1, and the test names the statements that grew.
+
+The 2048-participant run is marked slow (deselect with -m "not slow").
+Record or refresh budgets (against PostgreSQL) with:
+
+    PERF_UPDATE_BUDGETS=1 pytest tests/perf/test_view_query_budgets.py
+"""
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from tests.perf.query_budget import (
+    ViewProfile,
+    compare,
+    load_budgets,
+    profile_request,
+    record_budget,
+    updating_budgets,
+)
+from tests.perf.scale_fixtures import seed_scaled_tournament
+
+pytestmark = pytest.mark.django_db
+
+SIZES = [64, 512, pytest.param(2048, marks=pytest.mark.slow)]
+
+# Extra queries tolerated between the small and large fixture (for example
+# a pagination count) before the growth is treated as an N+1.
+SCALE_SLACK = 3
+
+NOT_RECORDED = 'no budgets recorded yet; run with PERF_UPDATE_BUDGETS=1 on PostgreSQL'
+
+
+ENDPOINTS = {
+    'tournament_detail': (lambda fx: reverse('tournaments:detail', args=[fx.tournament.slug]), None),
+    'hub': (lambda fx: reverse('tournaments:tournament_hub', args=[fx.tournament.slug]), 'player'),
+    'hub_matches_api': (lambda fx: reverse('tournaments:hub_matches_api', args=[fx.tournament.slug]), 'player'),
+    'hub_participants_api': (
+        lambda fx: reverse('tournaments:hub_participants_api', args=[fx.tournament.slug]), 'player',
+    ),
+    'match_room': (
+        lambda fx: reverse('tournaments:match_room', args=[fx.tournament.slug, fx.match.id]), 'player',
+    ),
+    'toc_overview': (lambda fx: reverse('toc_api:overview', args=[fx.tournament.slug]), 'organizer'),
+    'toc_participants': (lambda fx: reverse('toc_api:participants', args=[fx.tournament.slug]), 'organizer'),
+    'toc_matches': (lambda fx: reverse('toc_api:matches', args=[fx.tournament.slug]), 'organizer'),
+    'public_profile': (
+        lambda fx: reverse('user_profile:public_profile', args=[fx.players[0].username]), None,
+    ),
+    'team_detail': (lambda fx: reverse('organizations:team_detail', args=[fx.team.slug]), None),
+}
+
+
+def _profile_all(client, fx):
+    users = {
+        'player': next(user for user in fx.players if user.id == fx.match.participant1_id),
+        'organizer': fx.organizer,
+    }
+    profiles = {}
+    for name, (url_for, actor) in ENDPOINTS.items():
+        client.logout()
+        if actor:
+            client.force_login(users[actor])
+        url = url_for(fx)
+        # Warm-up request: budgets describe the steady state, not a cold cache.
+        client.get(url, follow=True)
+        profiles[name] = profile_request(client, url, follow=True)
+    return profiles
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_views_stay_within_budget(client, size):
+    budgets = load_budgets()
+    if not budgets and not updating_budgets():
+        pytest.skip(NOT_RECORDED)
+    cache.clear()
+    fx = seed_scaled_tournament(size)
+
+    failures = []
+    for name, profile in _profile_all(client, fx).items():
+        if profile.status_code >= 400:
+            failures.append(f'{name} @ {size} participants\n  status {profile.status_code}')
+            continue
+        if updating_budgets():
+            record_budget(name, size, profile)
+            continue
+        violations = compare(name, size, profile, budgets.get(name, {}).get(str(size)))
+        if violations:
+            failures.append('\n'.join(violations))
+
+    assert not failures, 'View budgets exceeded:\n' + '\n'.join(failures)
+
+
+def test_missing_budget_is_a_violation():
+    assert compare('unbudgeted', 64, ViewProfile(status_code=200, queries=1, wall_ms=1.0), None)
+
+
+def test_every_endpoint_has_a_budget_at_every_size():
+    budgets = load_budgets()
+    if not budgets:
+        pytest.skip(NOT_RECORDED)
+    sizes = [getattr(size, 'values', [size])[0] for size in SIZES]
+    missing = [f'{name} @ {size}' for name in ENDPOINTS for size in sizes
+               if str(size) not in budgets.get(name, {})]
+    assert not missing, 'No committed budget for: ' + ', '.join(missing)
+
+
+def test_query_counts_do_not_grow_with_participants(client):
+    cache.clear()
+    small = _profile_all(client, seed_scaled_tournament(64, prefix='small'))
+    cache.clear()
+    large = _profile_all(client, seed_scaled_tournament(512, prefix='large'))
+
+    failures = []
+    for name in ENDPOINTS:
+        before, after = small[name], large[name]
+        if after.queries <= before.queries + SCALE_SLACK:
+            continue
+        grown = [
+            f'    +{after.fingerprints[sql] - before.fingerprints.get(sql, 0):<5} {sql[:107]}'
+            for sql, _ in after.fingerprints.most_common()
+            if after.fingerprints[sql] > before.fingerprints.get(sql, 0)
+        ][:5]
+        failures.append(
+            f'{name}: {before.queries} queries @ 64 -> {after.queries} @ 512\n'
+            + '\n'.join(['  statements that grew:'] + grown)
+        )
+
+    assert not failures, 'Query count scales with participants (N+1):\n' + '\n'.join(failures)
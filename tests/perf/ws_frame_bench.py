@@ -0,0 +1,180 @@
+"""
+WebSocket frame benchmark (JSON text vs dc.msgpack.v1 compact frames).
+
+Encodes representative realtime frames the way the consumers send them:
+
+- JSON: ``json.dumps`` as AsyncJsonWebsocketConsumer.encode_json does
+- compact: apps.tournaments.realtime.wire.FrameEncoder (msgpack + field
+  codes), both for a single frame and for a stream of successive state
+  frames where the client acknowledges each version, so later frames go
+  out as patches
+
+Reports bytes on the wire per frame and p50 encode time. No database,
+channel layer or Django settings are needed.
+
+Usage:
+    python tests/perf/ws_frame_bench.py [--samples 200] [--frames 30]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+def _setup_path():
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+
+def rank_update(tournament_id, standings):
+    return {
+        "type": "rank_update",
+        "event_type": "rank_update",
+        "tournament_id": tournament_id,
+        "seq": 100,
+        "changes": [
+            {
+                "participant_id": pid,
+                "previous_rank": rank + 1,
+                "current_rank": rank,
+                "rank_change": -1,
+                "points": points,
+            }
+            for rank, (pid, points) in enumerate(standings, start=1)
+        ],
+    }
+
+
+def bracket_updated(tournament_id, round_number, winners):
+    return {
+        "type": "bracket_updated",
+        "seq": 101,
+        "data": {
+            "tournament_id": tournament_id,
+            "action": "refresh",
+            "updated_nodes": list(range(1, 33)),
+            "next_matches": [
+                {
+                    "match_id": 9000 + n,
+                    "round_number": round_number,
+                    "match_number": n,
+                    "participant1_id": winners.get(2 * n),
+                    "participant2_id": winners.get(2 * n + 1),
+                    "state": "scheduled",
+                }
+                for n in range(16)
+            ],
+        },
+    }
+
+
+def match_presence(match_id, online):
+    return {
+        "type": "match_presence",
+        "data": {
+            "match_id": match_id,
+            "participants": [
+                {"user_id": uid, "username": f"player_{uid}", "online": uid in online, "status": "ready"}
+                for uid in range(1, 11)
+            ],
+        },
+    }
+
+
+def score_updated(match_id, s1, s2):
+    return {
+        "type": "score_updated",
+        "seq": 102,
+        "data": {"match_id": match_id, "participant1_score": s1, "participant2_score": s2, "sequence": 7},
+    }
+
+
+def streams(frames):
+    rng = random.Random(7)
+    standings = [(pid, 2000 - pid * 10) for pid in range(1, 51)]
+    winners = {}
+    online = set(range(1, 11))
+    rank_frames, bracket_frames, presence_frames = [], [], []
+    for n in range(frames):
+        i = rng.randrange(len(standings))
+        pid, points = standings[i]
+        standings[i] = (pid, points + rng.randrange(5, 30))
+        standings.sort(key=lambda row: -row[1])
+        rank_frames.append(rank_update(12, standings))
+        winners[n % 32] = 500 + n
+        bracket_frames.append(bracket_updated(12, 2, dict(winners)))
+        online ^= {rng.randrange(1, 11)}
+        presence_frames.append(match_presence(77, set(online)))
+    return {"rank_update": rank_frames, "bracket_updated": bracket_frames, "match_presence": presence_frames}
+
+
+def p50_us(func, samples):
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(timings)
+
+
+def run(samples, frames):
+    from apps.tournaments.realtime.wire import FrameEncoder, pack
+
+    results = []
+    singles = {
+        "score_updated": score_updated(77, 10, 8),
+        "rank_update (50)": streams(1)["rank_update"][0],
+        "bracket_updated": streams(1)["bracket_updated"][0],
+    }
+    for label, frame in singles.items():
+        results.append({
+            "label": label,
+            "json_bytes": len(json.dumps(frame)),
+            "compact_bytes": len(pack(frame)),
+            "json_us": p50_us(lambda: json.dumps(frame), samples),
+            "compact_us": p50_us(lambda: pack(frame), samples),
+        })
+
+    for label, stream in streams(frames).items():
+        encoder = FrameEncoder()
+        compact_bytes = 0
+        started = time.perf_counter()
+        for frame in stream:
+            compact_bytes += len(encoder.encode(frame))
+            encoder.ack(frame["type"], encoder.version(frame["type"]))
+        compact_us = (time.perf_counter() - started) * 1_000_000 / len(stream)
+
+        started = time.perf_counter()
+        json_bytes = sum(len(json.dumps(frame)) for frame in stream)
+        json_us = (time.perf_counter() - started) * 1_000_000 / len(stream)
+        results.append({
+            "label": f"{label} x{len(stream)} acked",
+            "json_bytes": json_bytes / len(stream),
+            "compact_bytes": compact_bytes / len(stream),
+            "json_us": json_us,
+            "compact_us": compact_us,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=30)
+    args = parser.parse_args()
+
+    _setup_path()
+    print(f"{'frame':<30} {'json B':>9} {'compact B':>10} {'saved':>7} {'json us':>9} {'compact us':>11}")
+    for row in run(args.samples, args.frames):
+        saved = 1 - row["compact_bytes"] / row["json_bytes"]
+        print(
+            f"{row['label']:<30} {row['json_bytes']:9.0f} {row['compact_bytes']:10.0f} {saved:7.0%} "
+            f"{row['json_us']:9.1f} {row['compact_us']:11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
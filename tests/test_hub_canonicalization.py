@@ -203,7 +203,8 @@ class TestHubCacheInvalidation:
         assert teams == []
         
         # With dummy cache backend in this test module, no cache storage is expected.
-        cache_key = 'featured_teams_all_12'
+        from apps.common import cache_tags
+        cache_key = cache_tags.tagged_key('featured_teams_all_12', [cache_tags.HUB_TAG])
         assert cache.get(cache_key) is None
     
     def test_cache_invalidated_after_team_creation(self, client):
@@ -0,0 +1,131 @@
+"""
+Tests for the post-commit coalescing broadcast queue.
+
+Covers coalescing rules, release on commit / discard on rollback, and the
+background sender's time-window coalescing across transactions.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+from django.db import transaction
+from django.test import override_settings
+
+from apps.tournaments.realtime import broadcast_queue
+from apps.tournaments.realtime.broadcast_queue import BackgroundSender, coalesce
+
+
+class RecordingLayer:
+    def __init__(self, expected=0):
+        self.sent = []
+        self.done = threading.Event()
+        self.expected = expected
+
+    async def group_send(self, group, message):
+        self.sent.append((group, message))
+        if self.expected and len(self.sent) >= self.expected:
+            self.done.set()
+
+
+@pytest.fixture
+def layer():
+    recorder = RecordingLayer()
+    with patch("channels.layers.get_channel_layer", return_value=recorder):
+        yield recorder
+
+
+def _score(match_id, s1, s2, room="tournament_1"):
+    return (room, {"type": "score_updated", "data": {"match_id": match_id, "participant1_score": s1, "participant2_score": s2}})
+
+
+class TestCoalesce:
+    def test_scores_latest_wins_per_match(self):
+        messages = [_score(1, 1, 0), _score(2, 0, 1), _score(1, 2, 0), _score(1, 3, 0)]
+
+        result = coalesce(messages)
+
+        assert [m["data"]["match_id"] for _, m in result] == [2, 1]
+        assert result[1][1]["data"]["participant1_score"] == 3
+
+    def test_bracket_shapes_merge_into_one_refresh(self):
+        room = "tournament_1"
+        messages = [
+            (room, {"type": "bracket_updated", "data": {"updated_nodes": [1], "next_matches": [{"match_id": 9}]}}),
+            (room, {"type": "match_completed", "data": {"match_id": 5}}),
+            (room, {"type": "tournament_event", "event_type": "bracket_updated", "tournament_id": 1}),
+            (room, {"type": "bracket_updated", "data": {"tournament_id": 1, "action": "refresh", "updated_nodes": [2, 1]}}),
+        ]
+
+        result = coalesce(messages)
+
+        assert [m["type"] for _, m in result] == ["match_completed", "bracket_updated"]
+        merged = result[1][1]["data"]
+        assert merged["updated_nodes"] == [1, 2]
+        assert merged["next_matches"] == [{"match_id": 9}]
+        assert merged["action"] == "refresh"
+        assert merged["coalesced"] == 3
+
+    def test_rank_updates_merge_per_participant_and_rooms_stay_apart(self):
+        def rank(room, *changes):
+            return (room, {"type": "tournament_event", "event_type": "rank_update", "changes": list(changes)})
+
+        messages = [
+            rank("tournament_1", {"participant_id": 1, "current_rank": 3}),
+            rank("tournament_2", {"participant_id": 1, "current_rank": 8}),
+            rank("tournament_1", {"participant_id": 1, "current_rank": 2}, {"participant_id": 4, "current_rank": 5}),
+        ]
+
+        result = coalesce(messages)
+
+        assert [group for group, _ in result] == ["tournament_2", "tournament_1"]
+        assert result[1][1]["changes"] == [{"participant_id": 1, "current_rank": 2}, {"participant_id": 4, "current_rank": 5}]
+
+    def test_other_events_pass_through(self):
+        messages = [("tournament_1", {"type": "match_started", "data": {"match_id": 1}})] * 2
+        assert coalesce(messages) == messages
+
+
+@pytest.mark.django_db
+class TestTransactionalRelease:
+    def test_released_once_after_commit(self, layer, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            with transaction.atomic():
+                broadcast_queue.broadcast_score_updated(1, {"match_id": 7, "participant1_score": 1})
+                broadcast_queue.broadcast_score_updated(1, {"match_id": 7, "participant1_score": 2})
+                broadcast_queue.broadcast_bracket_updated(1, {"updated_nodes": [3]})
+                assert broadcast_queue.pending_count() == 3
+                assert layer.sent == []
+
+        assert [m["type"] for _, m in layer.sent] == ["score_updated", "bracket_updated"]
+        assert layer.sent[0][1]["data"]["participant1_score"] == 2
+
+    def test_rollback_discards_buffer(self, layer, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            with pytest.raises(RuntimeError):
+                with transaction.atomic():
+                    broadcast_queue.broadcast_event(1, "checkin_updated", {"match_id": 3})
+                    raise RuntimeError("boom")
+
+        assert callbacks == []
+        assert layer.sent == []
+
+        with django_capture_on_commit_callbacks(execute=True):
+            with transaction.atomic():
+                broadcast_queue.broadcast_event(1, "checkin_updated", {"match_id": 4})
+
+        assert [m["match_id"] for _, m in layer.sent] == [4]
+
+
+@override_settings(REALTIME_BROADCAST_BACKGROUND=True, REALTIME_BROADCAST_COALESCE_MS=50)
+def test_background_sender_coalesces_across_batches():
+    recorder = RecordingLayer(expected=2)
+    sender = BackgroundSender()
+
+    with patch("channels.layers.get_channel_layer", return_value=recorder):
+        sender.submit([_score(1, 1, 0), ("tournament_1", {"type": "match_started", "data": {"match_id": 2}})])
+        sender.submit([_score(1, 5, 0)])
+        assert recorder.done.wait(timeout=5)
+
+    assert [m["type"] for _, m in recorder.sent] == ["match_started", "score_updated"]
+    assert recorder.sent[1][1]["data"]["participant1_score"] == 5
@@ -0,0 +1,169 @@
+"""
+Tests for the resumable tournament room stream.
+
+Covers sequencing and the replay ring buffer (room_stream), replay / resync
+on reconnect with ``?last_seq=`` and a reconnect storm against one room.
+"""
+
+import asyncio
+import time
+
+import pytest
+from channels.testing import WebsocketCommunicator
+from django.core.cache import cache
+from django.test import override_settings
+
+from apps.tournaments.realtime import room_stream
+from apps.tournaments.realtime.utils import broadcast_tournament_event
+from tests.test_auth_middleware import create_test_websocket_app, get_test_user_role
+
+
+ws_test_application = create_test_websocket_app()
+
+TOURNAMENT_ID = 4242
+
+
+@pytest.fixture(autouse=True)
+def clean_stream(monkeypatch):
+    monkeypatch.setattr(
+        'apps.tournaments.realtime.consumers.get_user_tournament_role',
+        get_test_user_role,
+    )
+    cache.clear()
+    with override_settings(WS_ROOM_REPLAY_BUFFER=32, WS_RATE_ENABLED=False):
+        yield
+    cache.clear()
+
+
+def _publish(count, tournament_id=TOURNAMENT_ID):
+    return [
+        room_stream.stamp(tournament_id, {'type': 'score_updated', 'data': {'match_id': 1, 'score': n}})
+        for n in range(count)
+    ]
+
+
+class TestRoomStream:
+    def test_stamps_monotonic_sequence_per_room(self):
+        first = _publish(3)
+        other = _publish(1, tournament_id=TOURNAMENT_ID + 1)
+
+        assert [m['seq'] for m in first] == [1, 2, 3]
+        assert other[0]['seq'] == 1
+        assert room_stream.latest_seq(TOURNAMENT_ID) == 3
+
+    def test_since_returns_only_missed_events(self):
+        _publish(10)
+
+        events = room_stream.since(TOURNAMENT_ID, 7)
+
+        assert [e['seq'] for e in events] == [8, 9, 10]
+        assert [e['data']['score'] for e in events] == [7, 8, 9]
+        assert room_stream.since(TOURNAMENT_ID, 10) == []
+
+    def test_gap_beyond_buffer_or_ahead_requires_resync(self):
+        _publish(40)
+
+        assert room_stream.since(TOURNAMENT_ID, 7) is None  # 33 missed > 32 buffered
+        assert [e['seq'] for e in room_stream.since(TOURNAMENT_ID, 8)] == list(range(9, 41))
+        assert room_stream.since(TOURNAMENT_ID, 41) is None  # sequence restarted
+
+    def test_evicted_slot_requires_resync(self):
+        _publish(10)
+        cache.delete(room_stream._slot_key(TOURNAMENT_ID, 5))
+
+        assert room_stream.since(TOURNAMENT_ID, 3) is None
+
+
+async def _connect(user, last_seq=None):
+    path = f"/ws/tournament/{TOURNAMENT_ID}/?user_id={user.id}"
+    if last_seq is not None:
+        path += f"&last_seq={last_seq}"
+    communicator = WebsocketCommunicator(ws_test_application, path)
+    connected, _ = await communicator.connect()
+    assert connected
+    welcome = await communicator.receive_json_from()
+    assert welcome['type'] == 'connection_established'
+    return communicator, welcome
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_reconnect_replays_missed_events_then_live(user_factory):
+    from channels.db import database_sync_to_async
+
+    user = await database_sync_to_async(user_factory)()
+    communicator, welcome = await _connect(user)
+    await broadcast_tournament_event(TOURNAMENT_ID, 'score_updated', {'match_id': 1, 'score': 1})
+    live = await communicator.receive_json_from()
+    assert (live['type'], live['seq']) == ('score_updated', welcome['data']['seq'] + 1)
+    await communicator.disconnect()
+
+    for score in (2, 3):
+        await broadcast_tournament_event(TOURNAMENT_ID, 'score_updated', {'match_id': 1, 'score': score})
+
+    communicator, welcome = await _connect(user, last_seq=live['seq'])
+    replayed = [await communicator.receive_json_from() for _ in range(2)]
+    assert [m['data']['score'] for m in replayed] == [2, 3]
+    assert welcome['data']['seq'] == replayed[-1]['seq']
+
+    await broadcast_tournament_event(TOURNAMENT_ID, 'score_updated', {'match_id': 1, 'score': 4})
+    assert (await communicator.receive_json_from())['data']['score'] == 4
+    assert await communicator.receive_nothing()
+    await communicator.disconnect()
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_reconnect_beyond_buffer_gets_resync(user_factory):
+    from channels.db import database_sync_to_async
+
+    user = await database_sync_to_async(user_factory)()
+    _publish(40)
+
+    communicator, _ = await _connect(user, last_seq=2)
+    message = await communicator.receive_json_from()
+
+    assert message['type'] == 'resync'
+    assert message['data']['latest_seq'] == 40
+    assert await communicator.receive_nothing()
+    await communicator.disconnect()
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_reconnect_storm(user_factory):
+    """200 clients reconnect at once from scattered positions; each gets exactly its gap."""
+    from channels.db import database_sync_to_async
+
+    clients, published, buffered = 200, 48, 32
+    user = await database_sync_to_async(user_factory)()
+    _publish(published)
+
+    async def reconnect(last_seq):
+        communicator, _ = await _connect(user, last_seq=last_seq)
+        try:
+            missed = published - last_seq
+            if missed > buffered:
+                assert (await communicator.receive_json_from())['type'] == 'resync'
+                return 'resync', 1
+            frames = [await communicator.receive_json_from() for _ in range(missed)]
+            assert [f['seq'] for f in frames] == list(range(last_seq + 1, published + 1))
+            assert await communicator.receive_nothing(timeout=0.05)
+            return 'replayed', missed
+        finally:
+            await communicator.disconnect()
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(reconnect(n % (published + 1)) for n in range(clients)))
+    elapsed = time.perf_counter() - started
+
+    replayed = [count for outcome, count in results if outcome == 'replayed']
+    print(
+        f"\n{clients} reconnects in {elapsed:.2f}s ({clients / elapsed:.0f}/s): "
+        f"{sum(replayed)} events replayed to {len(replayed)} clients, "
+        f"{len(results) - len(replayed)} resyncs"
+    )
+    positions = [n % (published + 1) for n in range(clients)]
+    assert len(replayed) == sum(1 for p in positions if published - p <= buffered)
+    assert sum(replayed) == sum(published - p for p in positions if published - p <= buffered)
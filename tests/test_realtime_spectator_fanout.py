@@ -0,0 +1,178 @@
+"""
+Tests for the process-local spectator fan-out tier.
+
+Covers the bounded conflating send queue, one room subscription per process
+regardless of spectator count, consumer integration and a fan-out load run.
+"""
+
+import asyncio
+import time
+
+import pytest
+from channels.layers import InMemoryChannelLayer, get_channel_layer
+from channels.testing import WebsocketCommunicator
+from django.test import override_settings
+
+from apps.tournaments.realtime import metrics
+from apps.tournaments.realtime.spectator_fanout import SendQueue, SpectatorHub, SpectatorSocket, get_hub
+from apps.tournaments.realtime.utils import broadcast_tournament_event
+from tests.test_auth_middleware import create_test_websocket_app, get_test_user_role
+
+
+ws_test_application = create_test_websocket_app()
+
+ROOM = 'tournament_7'
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    metrics.reset_metrics()
+    yield
+    metrics.reset_metrics()
+
+
+def _score(match_id, score, seq):
+    return {'type': 'score_updated', 'data': {'match_id': match_id, 'score': score}, 'seq': seq}
+
+
+def _drain(queue):
+    return [queue._entries.popitem(last=False)[1][0] for _ in range(len(queue))]
+
+
+class TestSendQueue:
+    def test_superseded_scores_conflate_and_keep_seq_order(self):
+        queue = SendQueue(ROOM, maxsize=8)
+        queue.put(_score(1, 1, seq=1), 0.0)
+        queue.put({'type': 'match_started', 'data': {'match_id': 2}, 'seq': 2}, 0.0)
+        queue.put(_score(1, 2, seq=3), 0.0)
+
+        frames = _drain(queue)
+
+        assert [f['seq'] for f in frames] == [2, 3]
+        assert frames[1]['data']['score'] == 2
+        assert metrics.get_metrics_snapshot()['fanout_events_total'] == {('conflated',): 1}
+
+    def test_overflow_drops_oldest_score_first(self):
+        queue = SendQueue(ROOM, maxsize=2)
+        queue.put({'type': 'match_started', 'data': {'match_id': 9}, 'seq': 1}, 0.0)
+        queue.put(_score(1, 1, seq=2), 0.0)
+        queue.put(_score(2, 1, seq=3), 0.0)
+
+        assert [f['seq'] for f in _drain(queue)] == [1, 3]
+
+    def test_overflow_without_droppable_frame_requests_resync(self):
+        queue = SendQueue(ROOM, maxsize=2)
+        for seq in (1, 2, 3):
+            queue.put({'type': 'match_started', 'data': {'match_id': seq}, 'seq': seq}, 0.0)
+
+        frames = _drain(queue)
+
+        assert [f['type'] for f in frames] == ['spectator_resync', 'match_started']
+        assert frames[1]['seq'] == 3
+        assert metrics.get_metrics_snapshot()['fanout_events_total'][('resync',)] == 1
+
+
+@pytest.mark.asyncio
+async def test_one_subscription_per_room_for_many_sockets():
+    layer = InMemoryChannelLayer()
+    hub = SpectatorHub(channel_layer=layer)
+    received = {n: [] for n in range(5)}
+
+    def recorder(n):
+        async def deliver(message):
+            received[n].append(message)
+        return deliver
+
+    sockets = [SpectatorSocket(7, recorder(n)) for n in range(5)]
+    for socket in sockets:
+        await hub.join(7, socket)
+        socket.start()
+
+    assert len(layer.groups[ROOM]) == 1
+
+    await layer.group_send(ROOM, _score(1, 3, seq=1))
+    for _ in range(50):
+        if all(received.values()):
+            break
+        await asyncio.sleep(0.01)
+
+    assert all(frames == [_score(1, 3, seq=1)] for frames in received.values())
+    assert ('delivery',) in metrics.get_metrics_snapshot()['fanout_latency_p50']
+
+    for socket in sockets:
+        await hub.leave(7, socket)
+    assert not layer.groups.get(ROOM)
+    assert hub.socket_count(7) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+@override_settings(WS_SPECTATOR_FANOUT=True, WS_RATE_ENABLED=False)
+async def test_spectators_share_subscription_players_keep_group(user_factory, monkeypatch):
+    from channels.db import database_sync_to_async
+
+    monkeypatch.setattr('apps.tournaments.realtime.consumers.get_user_tournament_role', get_test_user_role)
+    users = [await database_sync_to_async(user_factory)() for _ in range(3)]
+    paths = [
+        f"/ws/tournament/7/?user_id={users[0].id}&role=spectator",
+        f"/ws/tournament/7/?user_id={users[1].id}&role=spectator",
+        f"/ws/tournament/7/?user_id={users[2].id}&role=player",
+    ]
+    communicators = [WebsocketCommunicator(ws_test_application, path) for path in paths]
+    for communicator in communicators:
+        connected, _ = await communicator.connect()
+        assert connected
+        assert (await communicator.receive_json_from())['type'] == 'connection_established'
+
+    assert get_hub().socket_count(7) == 2
+    assert len(get_channel_layer().groups[ROOM]) == 2  # hub channel + player channel
+
+    await broadcast_tournament_event(7, 'score_updated', {'match_id': 1, 'score': 5})
+
+    for communicator in communicators:
+        frame = await communicator.receive_json_from()
+        assert (frame['type'], frame['data']['score']) == ('score_updated', 5)
+        await communicator.disconnect()
+
+    assert get_hub().socket_count(7) == 0
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_fanout_load():
+    """5000 local spectators, 100 events: one channel-layer receive per event."""
+    sockets_count, events = 5000, 100
+    layer = InMemoryChannelLayer(capacity=events * 2)
+    hub = SpectatorHub(channel_layer=layer)
+    delivered = 0
+    done = asyncio.Event()
+
+    async def deliver(message):
+        nonlocal delivered
+        delivered += 1
+        if delivered == sockets_count * events:
+            done.set()
+
+    sockets = [SpectatorSocket(7, deliver, maxsize=events) for _ in range(sockets_count)]
+    for socket in sockets:
+        await hub.join(7, socket)
+        socket.start()
+
+    started = time.perf_counter()
+    for n in range(events):
+        await layer.group_send(ROOM, {'type': 'match_started', 'data': {'match_id': n}, 'seq': n + 1})
+    await asyncio.wait_for(done.wait(), timeout=60)
+    elapsed = time.perf_counter() - started
+
+    snapshot = metrics.get_metrics_snapshot()
+    print(
+        f"\n{sockets_count * events} frames to {sockets_count} sockets in {elapsed:.2f}s "
+        f"({sockets_count * events / elapsed:.0f} frames/s); "
+        f"dispatch p95={snapshot['fanout_latency_p95'][('dispatch',)]:.2f}ms, "
+        f"delivery p95={snapshot['fanout_latency_p95'][('delivery',)]:.2f}ms"
+    )
+    assert len(layer.groups[ROOM]) == 1
+    assert 'fanout_events_total' in snapshot and not snapshot['fanout_events_total']
+
+    for socket in sockets:
+        await hub.leave(7, socket)
@@ -0,0 +1,113 @@
+"""
+Tests for dc.msgpack.v1 compact WebSocket frames.
+
+Covers field-code round trips, JSON-patch diffs, acknowledged-state
+diffing in FrameEncoder and subprotocol negotiation on the tournament
+consumer.
+"""
+
+import json
+
+import pytest
+from channels.testing import WebsocketCommunicator
+
+from apps.tournaments.realtime.wire import (
+    MSGPACK_SUBPROTOCOL,
+    FrameEncoder,
+    apply_patch,
+    diff,
+    pack,
+    unpack,
+)
+from tests.test_auth_middleware import create_test_websocket_app, get_test_user_role
+
+
+ws_test_application = create_test_websocket_app()
+
+
+def _rank_update(points):
+    return {
+        'type': 'rank_update',
+        'event_type': 'rank_update',
+        'tournament_id': 3,
+        'changes': [
+            {'participant_id': pid, 'current_rank': rank, 'points': pts, 'custom_field': 'x'}
+            for rank, (pid, pts) in enumerate(points, start=1)
+        ],
+    }
+
+
+def test_pack_round_trips_and_shrinks_frames():
+    frame = _rank_update([(10, 900), (11, 850), (12, 700)])
+
+    packed = pack(frame)
+
+    assert unpack(packed) == frame
+    assert len(packed) < len(json.dumps(frame)) / 2
+
+
+def test_diff_apply_round_trip():
+    old = {'a': 1, 'b': [1, 2, {'c': 'x'}], 'gone': True, 'p/q': 1}
+    new = {'a': 2, 'b': [1, 2, {'c': 'y'}], 'added': [1], 'p/q': 2}
+
+    ops = diff(old, new)
+
+    assert apply_patch(old, ops) == new
+    assert {'op': 'replace', 'path': '/b/2/c', 'value': 'y'} in ops
+    assert {'op': 'replace', 'path': '/p~1q', 'value': 2} in ops
+    assert diff(new, new) == []
+
+
+class TestFrameEncoder:
+    def test_patches_against_acknowledged_state(self):
+        encoder = FrameEncoder()
+        first = unpack(encoder.encode(_rank_update([(10, 900), (11, 850)])))
+        assert (first['v'], 'patch' in first) == (1, False)
+        assert encoder.ack('rank_update', 1)
+
+        second = unpack(encoder.encode(_rank_update([(10, 920), (11, 850)])))
+
+        assert (second['base'], second['v']) == (1, 2)
+        assert second['patch'] == [{'op': 'replace', 'path': '/changes/0/points', 'value': 920}]
+        body = {k: v for k, v in first.items() if k not in ('type', 'v')}
+        assert apply_patch(body, second['patch'])['changes'][0]['points'] == 920
+
+    def test_unacknowledged_streams_and_other_types_send_full_frames(self):
+        encoder = FrameEncoder()
+        encoder.encode(_rank_update([(10, 900)]))
+        again = unpack(encoder.encode(_rank_update([(10, 901)])))
+        score = unpack(encoder.encode({'type': 'score_updated', 'data': {'match_id': 1}}))
+
+        assert 'patch' not in again and again['v'] == 2
+        assert score == {'type': 'score_updated', 'data': {'match_id': 1}}
+        assert not encoder.ack('rank_update', 99)
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_tournament_consumer_negotiates_msgpack(user_factory, monkeypatch):
+    from channels.db import database_sync_to_async
+    from apps.tournaments.realtime.utils import broadcast_tournament_event
+
+    monkeypatch.setattr('apps.tournaments.realtime.consumers.get_user_tournament_role', get_test_user_role)
+    user = await database_sync_to_async(user_factory)()
+    path = f"/ws/tournament/3/?user_id={user.id}"
+
+    compact = WebsocketCommunicator(ws_test_application, path, subprotocols=[MSGPACK_SUBPROTOCOL])
+    connected, subprotocol = await compact.connect()
+    assert connected and subprotocol == MSGPACK_SUBPROTOCOL
+    welcome = unpack(await compact.receive_from())
+    assert welcome['type'] == 'connection_established'
+
+    plain = WebsocketCommunicator(ws_test_application, path)
+    connected, subprotocol = await plain.connect()
+    assert connected and subprotocol is None
+    assert (await plain.receive_json_from())['type'] == 'connection_established'
+
+    await broadcast_tournament_event(3, 'bracket_updated', {'updated_nodes': [1, 2]})
+
+    assert unpack(await compact.receive_from())['data']['updated_nodes'] == [1, 2]
+    assert (await plain.receive_json_from())['data']['updated_nodes'] == [1, 2]
+
+    await compact.disconnect()
+    await plain.disconnect()
@@ -0,0 +1,139 @@
+"""
+Tournament test fixtures shared across suites.
+
+Loaded from the root conftest (``pytest_plugins``) so tests under apps/
+and tests/ build games and tournaments the same way:
+
+- game_factory / tournament_factory: one Game or Tournament with overrides
+- tournament_organizer: a single organizer account
+- live_tournament_factory: a tournament already past registration, on a
+  shared single-player game, for tests that only need *a* running event
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+
+from apps.tournaments.models import Game, Tournament
+
+
+@pytest.fixture
+def game_factory(db):
+    """
+    Factory to create Game instances.
+    Usage: game_factory(slug='valorant', name='Valorant', team_size=5)
+    """
+    def _make(slug: str, name: str = None, team_size: int = 5, **kwargs):
+        defaults = {
+            'name': name or slug.replace('-', ' ').title(),
+            'slug': slug,
+            'default_team_size': team_size,
+            'profile_id_field': kwargs.get('profile_id_field', 'riot_id'),
+            'default_result_type': kwargs.get('default_result_type', 'map_score'),
+            'is_active': kwargs.get('is_active', True),
+        }
+        defaults.update(kwargs)
+        return Game.objects.create(**defaults)
+    return _make
+
+
+@pytest.fixture
+def tournament_factory(db):
+    """
+    Factory to create Tournament instances.
+    Usage: tournament_factory(game=game_instance, participation_type='solo')
+    """
+    from apps.accounts.models import User
+
+    def _make(game, participation_type: str = None, **kwargs):
+        # Determine participation type from game if not provided
+        if participation_type is None:
+            participation_type = 'solo' if game.default_team_size == 1 else 'team'
+        
+        # Create organizer if not provided
+        organizer = kwargs.pop('organizer', None)
+        if not organizer:
+            timestamp = int(timezone.now().timestamp() * 1000000)  # Microsecond precision
+            organizer = User.objects.create_user(
+                username=f'org_{game.slug}_{timestamp}',
+                email=f'org_{game.slug}_{timestamp}@test.com',
+                password='pass123'
+            )
+        
+        # Map common kwargs to actual field names
+        entry_fee = kwargs.pop('entry_fee', None)
+        if entry_fee:
+            kwargs['has_entry_fee'] = True
+            kwargs['entry_fee_amount'] = Decimal(str(entry_fee))
+        
+        defaults = {
+            'name': kwargs.get('name', f'{game.name} Tournament'),
+            'slug': kwargs.get('slug', f'{game.slug}-cup-{int(timezone.now().timestamp() * 1000000)}'),
+            'description': kwargs.get('description', f'Test tournament for {game.name}'),
+            'game': game,
+            'organizer': organizer,
+            'format': kwargs.get('format', 'single_elimination'),
+            'participation_type': participation_type,
+            'min_participants': kwargs.get('min_participants', 4),
+            'max_participants': kwargs.get('max_participants', 16),
+            'prize_pool': kwargs.get('prize_pool', Decimal('1000.00')),
+            'registration_start': kwargs.get('registration_start', timezone.now()),
+            'registration_end': kwargs.get('registration_end', timezone.now() + timezone.timedelta(days=7)),
+            'tournament_start': kwargs.get('tournament_start', timezone.now() + timezone.timedelta(days=10)),
+            'status': kwargs.get('status', 'registration_open'),
+        }
+        defaults.update({k: v for k, v in kwargs.items() if k not in defaults})
+        return Tournament.objects.create(**defaults)
+    
+    return _make
+
+
+@pytest.fixture
+def tournament_organizer(db):
+    """Organizer account for tests that do not care who runs the event."""
+    from apps.accounts.models import User
+
+    return User.objects.create_user(
+        username='tournament-org', email='tournament-org@test.com', password='pass123',
+    )
+
+
+@pytest.fixture
+def live_tournament_factory(game_factory, tournament_factory, tournament_organizer):
+    """
+    Factory for tournaments whose registration has already closed.
+    Usage: live_tournament_factory('bulk-cup', status=Tournament.COMPLETED, game=team_game)
+
+    Defaults to a LIVE single-elimination solo event for 2-8 players on one
+    shared single-player game, run by tournament_organizer. Any Tournament
+    field can be overridden.
+    """
+    shared = {}
+
+    def _make(slug: str, *, game=None, participation_type: str = Tournament.SOLO,
+              status: str = Tournament.LIVE, **kwargs):
+        if game is None:
+            if 'game' not in shared:
+                shared['game'] = game_factory(
+                    slug='solo-test-game', name='Solo Test Game', team_size=1, profile_id_field='ingame_id',
+                )
+            game = shared['game']
+        now = timezone.now()
+        fields = {
+            'name': slug.title(),
+            'slug': slug,
+            'organizer': tournament_organizer,
+            'format': Tournament.SINGLE_ELIM,
+            'max_participants': 8,
+            'min_participants': 2,
+            'status': status,
+            'registration_start': now - timedelta(days=2),
+            'registration_end': now - timedelta(days=1),
+            'tournament_start': now - timedelta(hours=1),
+        }
+        fields.update(kwargs)
+        return tournament_factory(game, participation_type, **fields)
+
+    return _make
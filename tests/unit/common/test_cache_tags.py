@@ -0,0 +1,124 @@
+"""
+Unit tests for tag-based cache invalidation (apps.common.cache_tags).
+
+Tests generation-suffixed keys, O(1) invalidation and the organization /
+profile / TOC callers that moved off delete_pattern scans.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from apps.common import cache_tags
+
+
+LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'cache-tags-tests'}}
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache():
+    with override_settings(CACHES=LOCMEM):
+        cache.clear()
+        yield
+        cache.clear()
+
+
+class TestTaggedKeys:
+    """tagged_key / get / set round trips."""
+
+    def test_key_is_stable_until_invalidated(self):
+        first = cache_tags.tagged_key('hub:featured', [cache_tags.HUB_TAG])
+        assert first.startswith('hub:featured@')
+        assert cache_tags.tagged_key('hub:featured', [cache_tags.HUB_TAG]) == first
+
+    def test_no_tags_returns_base_key(self):
+        assert cache_tags.tagged_key('plain', []) == 'plain'
+
+    def test_invalidate_changes_only_dependent_keys(self):
+        team_key = cache_tags.tagged_key('team_detail:alpha', [cache_tags.team_tag(1)])
+        other_key = cache_tags.tagged_key('team_detail:beta', [cache_tags.team_tag(2)])
+
+        cache_tags.invalidate(cache_tags.team_tag(1))
+
+        assert cache_tags.tagged_key('team_detail:alpha', [cache_tags.team_tag(1)]) != team_key
+        assert cache_tags.tagged_key('team_detail:beta', [cache_tags.team_tag(2)]) == other_key
+
+    def test_get_set_round_trip_and_invalidation(self):
+        tags = [cache_tags.HUB_TAG, cache_tags.game_tag(3)]
+        cache_tags.set('hub_leaderboard_3_50', ['row'], 60, tags)
+        assert cache_tags.get('hub_leaderboard_3_50', tags) == ['row']
+
+        cache_tags.invalidate(cache_tags.game_tag(3))
+        assert cache_tags.get('hub_leaderboard_3_50', tags) is None
+
+    def test_get_or_set_calls_producer_once(self):
+        calls = []
+
+        def producer():
+            calls.append(1)
+            return {'value': 42}
+
+        tags = [cache_tags.org_tag('acme')]
+        assert cache_tags.get_or_set('org_hub_context:acme', tags, producer, 60) == {'value': 42}
+        assert cache_tags.get_or_set('org_hub_context:acme', tags, producer, 60) == {'value': 42}
+        assert len(calls) == 1
+
+
+class TestInvalidate:
+    """invalidate() generation handling."""
+
+    def test_invalidate_before_first_read_seeds_generation(self):
+        bumped = cache_tags.invalidate(cache_tags.user_tag(7))
+        assert bumped[cache_tags.user_tag(7)] > 0
+
+    def test_invalidate_is_monotonic(self):
+        tag = cache_tags.team_tag(5)
+        before = cache_tags.tag_versions([tag])[tag]
+        after = cache_tags.invalidate(tag)[tag]
+        assert after > before
+
+    def test_invalidate_dedupes_tags(self):
+        bumped = cache_tags.invalidate(cache_tags.HUB_TAG, cache_tags.HUB_TAG, '')
+        assert list(bumped) == [cache_tags.HUB_TAG]
+
+
+class TestCallers:
+    """Callers migrated from delete_pattern / literal key lists."""
+
+    def test_hub_invalidation_covers_per_user_carousel(self):
+        from apps.organizations.services.hub_cache import invalidate_hub_cache
+
+        key = cache_tags.tagged_key('hero_carousel_11', [cache_tags.HUB_TAG])
+        cache.set(key, {'teams': []}, 60)
+
+        invalidate_hub_cache(game_id=2)
+
+        assert cache.get(cache_tags.tagged_key('hero_carousel_11', [cache_tags.HUB_TAG])) is None
+
+    def test_team_invalidation_with_id_skips_lookup(self):
+        from apps.organizations.services.cache_invalidation import invalidate_team_cache
+
+        key = cache_tags.tagged_key('team_detail:alpha:public:1', [cache_tags.team_tag(9)])
+        invalidate_team_cache(team_id=9)
+        assert cache_tags.tagged_key('team_detail:alpha:public:1', [cache_tags.team_tag(9)]) != key
+
+    def test_toc_scope_bump_changes_keys(self):
+        from apps.tournaments.api.toc.cache_utils import bump_toc_scopes, toc_cache_key
+
+        overview = toc_cache_key('overview', 4, 'summary')
+        lobby = toc_cache_key('lobby', 4, 'summary')
+
+        bump_toc_scopes(4, 'overview')
+
+        assert toc_cache_key('overview', 4, 'summary') != overview
+        assert toc_cache_key('lobby', 4, 'summary') == lobby
+
+    def test_profile_invalidation_bumps_version(self):
+        from apps.user_profile.services.profile_context import (
+            _profile_cache_version,
+            invalidate_public_profile_cache,
+        )
+
+        before = _profile_cache_version('neo')
+        invalidate_public_profile_cache('neo')
+        assert _profile_cache_version('neo') > before
@@ -0,0 +1,54 @@
+"""
+Unit tests for the shared on-commit batch buffer (apps.common.commit_buffer).
+
+Covers batching per transaction, the no-transaction fallback and rollback.
+"""
+
+import pytest
+from django.db import transaction
+
+from apps.common.commit_buffer import OnCommitBuffer
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def released():
+    batches = []
+    return batches, OnCommitBuffer(batches.append)
+
+
+def test_items_are_released_once_per_commit(released, django_capture_on_commit_callbacks):
+    batches, buffer = released
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with transaction.atomic():
+            assert buffer.add(1)
+            assert buffer.extend([2, 3])
+            assert len(buffer) == 3
+
+    assert len(callbacks) == 1
+    assert batches == [[1, 2, 3]]
+    assert len(buffer) == 0
+
+
+def test_add_outside_a_transaction_buffers_nothing(released):
+    batches, buffer = released
+
+    assert buffer.add(1) is False
+    assert len(buffer) == 0
+    assert batches == []
+
+
+def test_rollback_discards_items(released, django_capture_on_commit_callbacks):
+    batches, buffer = released
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                buffer.add("lost")
+                raise RuntimeError
+        with transaction.atomic():
+            buffer.add("kept")
+
+    assert batches == [["kept"]]
@@ -0,0 +1,150 @@
+"""
+Unit Tests for the packed leaderboard cache format
+
+Tests apps.leaderboards.packed round trips, rank-range / "around me" reads,
+and RankingEngine cache hits that materialize only the requested rows.
+"""
+
+import pickle
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.leaderboards.engine import RankDeltaDTO, RankedParticipantDTO, RankingEngine
+from apps.leaderboards.packed import PackedDeltas, PackedRankings
+
+
+def _rankings(count, team_based=False):
+    now = timezone.now()
+    rows = []
+    for i in range(count):
+        wins = i % 4
+        rows.append(RankedParticipantDTO(
+            rank=i + 1,
+            participant_id=None if team_based else (i * 37) % count + 1,
+            team_id=(i * 37) % count + 1 if team_based else None,
+            points=1000 - i,
+            kills=i % 9,
+            wins=wins,
+            losses=4 - wins,
+            matches_played=4,
+            earliest_win=now - timedelta(hours=i) if wins else None,
+            win_rate=wins / 4 * 100,
+            last_updated=now,
+        ))
+    return rows
+
+
+class TestPackedRankings:
+    """PackedRankings encode/decode and indexed reads."""
+
+    def test_round_trip_preserves_every_field(self):
+        rows = _rankings(25)
+        packed = PackedRankings(pickle.loads(pickle.dumps(PackedRankings.pack(rows))))
+
+        assert len(packed) == 25
+        assert list(packed) == rows
+        assert packed[-1] == rows[-1]
+        assert [r.to_dict() for r in packed[3:6]] == [r.to_dict() for r in rows[3:6]]
+
+    def test_rank_range_is_inclusive(self):
+        rows = _rankings(100)
+        packed = PackedRankings(PackedRankings.pack(rows))
+
+        assert packed.rank_range(1, 10) == rows[:10]
+        assert packed.rank_range(95, 200) == rows[94:]
+        assert packed.rank_range(150, 200) == []
+
+    def test_around_participant_and_team(self):
+        rows = _rankings(50)
+        packed = PackedRankings(PackedRankings.pack(rows))
+        target = rows[20].participant_id
+
+        assert packed.around(participant_id=target, radius=2) == rows[18:23]
+        assert packed.around(participant_id=rows[0].participant_id, radius=2) == rows[:3]
+        assert packed.around(participant_id=999_999) == []
+
+        teams = _rankings(50, team_based=True)
+        packed_teams = PackedRankings(PackedRankings.pack(teams))
+        assert packed_teams.around(team_id=teams[49].team_id, radius=1) == teams[48:]
+
+    def test_rank_map_matches_rows(self):
+        rows = _rankings(30)
+        packed = PackedRankings(PackedRankings.pack(rows))
+        assert packed.rank_map() == {(r.participant_id, r.team_id): r.rank for r in rows}
+
+    def test_load_rejects_legacy_and_foreign_values(self):
+        assert PackedRankings.load(None) is None
+        assert PackedRankings.load([{"rank": 1}]) is None
+        assert PackedRankings.load(PackedDeltas.pack([])) is None
+        assert PackedRankings.load(PackedRankings.pack(_rankings(3))[:-1]) is None
+
+
+class TestPackedDeltas:
+    """PackedDeltas encode/decode."""
+
+    def test_round_trip_and_top_filter(self):
+        now = timezone.now()
+        deltas = [
+            RankDeltaDTO(participant_id=7, team_id=None, previous_rank=None, current_rank=1,
+                         rank_change=0, points=90, last_updated=now),
+            RankDeltaDTO(participant_id=None, team_id=3, previous_rank=2, current_rank=5,
+                         rank_change=3, points=40, last_updated=now),
+        ]
+        packed = PackedDeltas(PackedDeltas.pack(deltas))
+
+        assert list(packed) == deltas
+        assert packed.up_to_rank(2) == deltas[:1]
+
+
+LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'packed-rankings-tests'}}
+
+
+@override_settings(CACHES=LOCMEM, LEADERBOARDS_CACHE_ENABLED=True, LEADERBOARDS_ENGINE_V2_ENABLED=True)
+class TestEngineCacheHits:
+    """RankingEngine reads the packed format without a database."""
+
+    def setup_method(self):
+        cache.clear()
+
+    def _seed(self, rows, deltas=()):
+        engine = RankingEngine()
+        engine._write_cache("tournament", 42, rows, list(deltas), timeout=60)
+        return engine
+
+    def test_cache_hit_with_limit_materializes_top_rows(self):
+        rows = _rankings(200)
+        engine = self._seed(rows)
+
+        response = engine.compute_tournament_rankings(42, limit=50)
+
+        assert response.metadata["source"] == "cache"
+        assert response.metadata["count"] == 50
+        assert response.metadata["total_count"] == 200
+        assert response.rankings == rows[:50]
+
+    def test_cache_hit_with_no_deltas_is_still_a_hit(self):
+        engine = self._seed(_rankings(5))
+
+        response = engine.compute_tournament_rankings(42)
+
+        assert response.metadata["source"] == "cache"
+        assert len(response.deltas) == 0
+
+    def test_window_and_around_reads(self):
+        rows = _rankings(120)
+        engine = self._seed(rows)
+
+        assert engine.get_tournament_rank_window(42, 11, 20) == rows[10:20]
+        target = rows[60].participant_id
+        assert engine.get_tournament_rankings_around(42, participant_id=target, radius=3) == rows[57:64]
+
+    def test_previous_rankings_read_from_packed_cache(self):
+        rows = _rankings(10)
+        engine = self._seed(rows)
+
+        previous = engine._get_previous_rankings("tournament", 42)
+
+        assert previous == {(r.participant_id, r.team_id): r.rank for r in rows}
@@ -0,0 +1,261 @@
+"""
+Epic 8.5 Batch Pipeline Tests - chunked nightly analytics refresh.
+
+Service tests use mocked adapters (NO ORM); the task tests run the Celery
+fan-out against a locmem cache with the service mocked.
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from apps.tournament_ops.dtos import AnalyticsQueryDTO, EloDistributionDTO, UserAnalyticsDTO
+from apps.tournament_ops.services.analytics_engine_service import (
+    AnalyticsEngineService,
+    _summarize_results,
+)
+
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=dt_timezone.utc)
+
+
+def _ago(days):
+    return NOW - timedelta(days=days)
+
+
+@pytest.fixture
+def adapters():
+    analytics = Mock()
+    match_history = Mock()
+    histograms = {"user": [(1000, 1), (1200, 1), (1400, 1), (1600, 1)], "team": [(1300, 1), (1500, 1)]}
+    analytics.get_elo_distribution.side_effect = (
+        lambda subject, game, rebuild=False: EloDistributionDTO.from_histogram(subject, game, histograms[subject])
+    )
+    analytics.bulk_upsert_user_snapshots.side_effect = lambda game, snaps: len(snaps)
+    analytics.bulk_upsert_team_snapshots.side_effect = lambda game, snaps: len(snaps)
+    service = AnalyticsEngineService(
+        analytics_adapter=analytics,
+        user_stats_adapter=Mock(),
+        team_stats_adapter=Mock(),
+        team_ranking_adapter=Mock(),
+        match_history_adapter=match_history,
+    )
+    return service, analytics, match_history
+
+
+class TestSummarizeResults:
+    """Per-owner rolling metrics over one chunk of results."""
+
+    def test_windows_and_streaks(self):
+        rows = [
+            # user 1: W W L W W (oldest first), last three within 7 days
+            (1, True, False, _ago(20)),
+            (1, True, False, _ago(15)),
+            (1, False, False, _ago(6)),
+            (1, True, False, _ago(3)),
+            (1, True, False, _ago(1)),
+            # user 2: W L L
+            (2, True, False, _ago(10)),
+            (2, False, False, _ago(5)),
+            (2, False, False, _ago(2)),
+        ]
+
+        summaries = _summarize_results(rows, _ago(7))
+
+        assert summaries[1]["matches_30d"] == 5
+        assert summaries[1]["matches_7d"] == 3
+        assert summaries[1]["wins_7d"] == 2
+        assert summaries[1]["current_streak"] == 2
+        assert summaries[1]["longest_win_streak"] == 2
+        assert summaries[2]["current_streak"] == -2
+        assert summaries[2]["longest_win_streak"] == 1
+
+    def test_draw_ends_streak_and_elo_changes_collected(self):
+        rows = [
+            (7, True, False, 12, _ago(4)),
+            (7, False, True, None, _ago(2)),
+        ]
+
+        summary = _summarize_results(rows, _ago(7))[7]
+
+        assert summary["current_streak"] == 0
+        assert summary["elo_changes"] == [12]
+
+
+class TestUserChunk:
+    """refresh_user_analytics_chunk issues chunk-level queries only."""
+
+    def test_chunk_computes_and_bulk_upserts(self, adapters):
+        service, analytics, match_history = adapters
+        analytics.list_user_stats_chunk.return_value = [
+            {"id": 10, "user_id": 1, "matches_played": 50, "win_rate": Decimal("60.0"), "kd_ratio": Decimal("1.5")},
+            {"id": 11, "user_id": 2, "matches_played": 0, "win_rate": Decimal("0.0"), "kd_ratio": Decimal("0.0")},
+        ]
+        match_history.list_recent_user_results.return_value = [
+            (1, True, False, _ago(2)),
+            (1, True, False, _ago(1)),
+        ]
+
+        result = service.refresh_user_analytics_chunk("valorant", after_id=9, upto_id=11, now=NOW)
+
+        assert result["rows"] == 2
+        assert result["last_id"] == 11
+        match_history.list_recent_user_results.assert_called_once_with([1, 2], "valorant", _ago(30))
+        analytics.get_elo_distribution.assert_called_once_with("user", "valorant", rebuild=False)
+        game, snapshots = analytics.bulk_upsert_user_snapshots.call_args.args
+        assert game == "valorant"
+        assert snapshots[1]["elo_snapshot"] == 2000
+        assert snapshots[1]["tier"] == "diamond"
+        assert snapshots[1]["current_streak"] == 2
+        assert snapshots[1]["win_rate_7d"] == Decimal("100.0")
+        assert snapshots[1]["percentile_rank"] == Decimal("100.0")
+        assert snapshots[2]["elo_snapshot"] == 1200
+        assert snapshots[2]["matches_last_30d"] == 0
+        assert snapshots[2]["percentile_rank"] == Decimal("25.0")
+
+    def test_empty_chunk_keeps_cursor(self, adapters):
+        service, analytics, match_history = adapters
+        analytics.list_user_stats_chunk.return_value = []
+
+        result = service.refresh_user_analytics_chunk("valorant", after_id=42, now=NOW)
+
+        assert (result["rows"], result["last_id"]) == (0, 42)
+        match_history.list_recent_user_results.assert_not_called()
+        analytics.bulk_upsert_user_snapshots.assert_not_called()
+
+
+class TestTeamChunk:
+    """refresh_team_analytics_chunk."""
+
+    def test_team_without_ranking_gets_default_snapshot(self, adapters):
+        service, analytics, match_history = adapters
+        analytics.list_team_stats_chunk.return_value = [
+            {"id": 3, "team_id": 30, "matches_played": 6, "win_rate": Decimal("50.0"), "elo_rating": 1500},
+            {"id": 4, "team_id": 40, "matches_played": 0, "win_rate": Decimal("0.0"), "elo_rating": None},
+        ]
+        match_history.list_recent_team_results.return_value = [
+            (30, True, False, 20, _ago(3)),
+            (30, False, False, -20, _ago(2)),
+        ]
+
+        service.refresh_team_analytics_chunk("valorant", now=NOW)
+
+        _, snapshots = analytics.bulk_upsert_team_snapshots.call_args.args
+        assert snapshots[30]["elo_volatility"] == Decimal("20.0")
+        assert snapshots[30]["matches_last_7d"] == 2
+        assert snapshots[30]["percentile_rank"] == Decimal("50.0")
+        assert snapshots[40]["tier"] == "bronze"
+        assert snapshots[40]["elo_snapshot"] == 1200
+
+
+class TestRefreshAll:
+    """refresh_all_user_analytics walks chunks until a short one."""
+
+    def test_walks_chunks_and_reports_checkpoints(self, adapters):
+        service, analytics, match_history = adapters
+        analytics.list_stats_game_slugs.return_value = ["valorant"]
+        pages = {
+            0: [{"id": i, "user_id": i, "matches_played": 1, "win_rate": Decimal("0.0"), "kd_ratio": Decimal("0.0")} for i in (1, 2)],
+            2: [{"id": 3, "user_id": 3, "matches_played": 1, "win_rate": Decimal("0.0"), "kd_ratio": Decimal("0.0")}],
+        }
+        analytics.list_user_stats_chunk.side_effect = lambda game, after_id, upto_id=None, limit=None: pages.get(after_id, [])
+        match_history.list_recent_user_results.return_value = []
+        checkpoints = []
+
+        total = service.refresh_all_user_analytics(
+            chunk_size=2, on_chunk=lambda game, result: checkpoints.append((game, result["last_id"]))
+        )
+
+        assert total == 3
+        assert checkpoints == [("valorant", 2), ("valorant", 3)]
+        analytics.list_stats_game_slugs.assert_called_once_with("user")
+        # Distribution rebuilt once for the refresh, then memoized for every chunk
+        analytics.get_elo_distribution.assert_called_once_with("user", "valorant", rebuild=True)
+
+
+class TestEloDistributionLookups:
+    """Percentiles and tier leaderboards read the cached distribution."""
+
+    def test_percentile_is_memoized_per_game(self, adapters):
+        service, analytics, _ = adapters
+
+        assert service._calculate_user_percentile(1, "valorant", 1500) == Decimal("75.0")
+        assert service._calculate_user_percentile(2, "valorant", 900) == Decimal("0.0")
+        assert service._calculate_team_percentile(3, "valorant", 1500) == Decimal("50.0")
+        assert analytics.get_elo_distribution.call_count == 2
+        analytics.list_user_snapshots.assert_not_called()
+
+    def test_tier_leaderboard_asks_each_tier_for_the_remaining_limit(self, adapters):
+        service, analytics, _ = adapters
+        population = {"crown": 1, "diamond": 0, "gold": 0, "silver": 5, "bronze": 5}
+
+        def list_user_snapshots(query: AnalyticsQueryDTO):
+            elo = 2500 if query.tier == "crown" else 1300
+            return [
+                UserAnalyticsDTO(user_id=i, game_slug="valorant", elo_snapshot=elo, win_rate=Decimal("50.0"),
+                                 tier=query.tier, percentile_rank=Decimal("50.0"), recalculated_at=NOW)
+                for i in range(min(query.limit, population[query.tier]))
+            ]
+        analytics.list_user_snapshots.side_effect = list_user_snapshots
+
+        entries = service.generate_leaderboard("tier", game_slug="valorant", limit=3)
+
+        queried = [(c.args[0].tier, c.args[0].limit) for c in analytics.list_user_snapshots.call_args_list]
+        assert queried == [("crown", 3), ("diamond", 2), ("gold", 2), ("silver", 2)]
+        assert [e.payload["tier"] for e in entries] == ["crown", "silver", "silver"]
+        assert [e.rank for e in entries] == [1, 2, 3]
+        analytics.get_elo_distribution.assert_not_called()
+
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "analytics-batch-tests"}}
+
+
+@override_settings(CACHES=LOCMEM, ANALYTICS_BATCH_CHUNK_SIZE=2)
+class TestNightlyFanOut:
+    """nightly_user_analytics_refresh fan-out, inline fallback and resume."""
+
+    def setup_method(self):
+        cache.clear()
+
+    def _service(self):
+        service = Mock()
+        service.analytics_adapter.list_stats_game_slugs.return_value = ["valorant"]
+        service.analytics_adapter.get_stats_chunk_bounds.return_value = [(0, 2), (2, 4), (4, 5)]
+        service.refresh_user_analytics_chunk.return_value = {
+            "rows": 2, "last_id": 0, "duration_ms": 1, "rows_per_second": 2000.0,
+        }
+        return service
+
+    def test_queues_one_task_per_chunk(self):
+        from apps.leaderboards import tasks
+
+        with patch.object(tasks, "_build_analytics_service", return_value=self._service()), \
+                patch.object(tasks, "_publish_analytics_event"), \
+                patch.object(tasks.refresh_analytics_chunk, "apply_async") as apply_async:
+            result = tasks.nightly_user_analytics_refresh(run_id="r1")
+
+        assert result["chunks_queued"] == 3
+        assert [c.kwargs["args"][2:4] for c in apply_async.call_args_list] == [[0, 2], [2, 4], [4, 5]]
+
+    def test_inline_fallback_checkpoints_and_resume_skips_done_chunks(self):
+        from apps.leaderboards import tasks
+
+        service = self._service()
+        with patch.object(tasks, "_build_analytics_service", return_value=service), \
+                patch.object(tasks, "_publish_analytics_event"):
+            with patch.object(tasks.refresh_analytics_chunk, "apply_async", side_effect=ConnectionError):
+                first = tasks.nightly_user_analytics_refresh(run_id="r2")
+            with patch.object(tasks.refresh_analytics_chunk, "apply_async") as apply_async:
+                second = tasks.nightly_user_analytics_refresh(run_id="r2")
+
+        assert first["chunks_inline"] == 3
+        assert service.refresh_user_analytics_chunk.call_count == 3
+        assert second["chunks_resumed"] == 3
+        apply_async.assert_not_called()
+        progress = tasks.analytics_batch_progress("user", "r2")
+        assert progress["rows"] == 6
+        assert progress["chunks_done"] == progress["chunks_total"] == 3
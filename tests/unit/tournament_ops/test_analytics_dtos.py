@@ -15,6 +15,7 @@ from apps.tournament_ops.dtos.analytics import (
     LeaderboardEntryDTO,
     SeasonDTO,
     AnalyticsQueryDTO,
+    EloDistributionDTO,
     TierBoundaries,
 )
 
@@ -243,3 +244,27 @@ class TestAnalyticsQueryDTO:
         )
         with pytest.raises(ValueError, match="order_by must be one of"):
             dto.validate()
+
+
+class TestEloDistributionDTO:
+    """Test EloDistributionDTO lookups."""
+    
+    def test_percentile_counts_strictly_lower(self):
+        """Percentile uses snapshots strictly below the ELO."""
+        dto = EloDistributionDTO.from_histogram("user", "valorant", [(1000, 2), (1200, 1), (1600, 1)])
+        
+        assert dto.total == 4
+        assert dto.percentile(1200) == Decimal("50.0")
+        assert dto.percentile(1201) == Decimal("75.0")
+        assert dto.percentile(500) == Decimal("0.0")
+        assert dto.percentile(3000) == Decimal("100.0")
+    
+    def test_empty_distribution_defaults_to_median(self):
+        """No snapshots yet gives the 50th percentile."""
+        assert EloDistributionDTO(subject="team", game_slug="valorant").percentile(1500) == Decimal("50.0")
+    
+    def test_validate_rejects_unsorted_values(self):
+        """Values must be strictly ascending."""
+        dto = EloDistributionDTO(subject="user", game_slug="valorant", values=(1200, 1000), below=(0, 1, 2))
+        with pytest.raises(ValueError, match="strictly ascending"):
+            dto.validate()